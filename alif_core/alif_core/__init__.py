@@ -0,0 +1,12 @@
+"""Language-agnostic scheduling core shared by the Alif and Polyglot backends.
+
+- `alif_core.fsrs` — FSRS-6 review math over NumPy arrays (py-fsrs parity).
+- `alif_core.leitner` — acquisition 3-box movement rules.
+- `alif_core.card_store` — struct-of-arrays `CardStore`.
+- `alif_core.replay` — columnar review-log replay and parameter sweeps.
+- `alif_core.orm` — load/persist a `CardStore` from a ``UserLemmaKnowledge`` model.
+"""
+from alif_core.card_store import CardStore
+from alif_core.fsrs import FsrsParams
+
+__all__ = ["CardStore", "FsrsParams"]
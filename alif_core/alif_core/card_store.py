@@ -0,0 +1,231 @@
+"""Struct-of-arrays store for scheduling state.
+
+One row per lemma, one NumPy column per field (stability, difficulty, due,
+last_review, state, step, acquisition box/due). Loading converts each
+``fsrs_card_json`` dict exactly once; after that, scheduling, due
+projection and batched review application are array operations with no
+per-card JSON parse/serialise or py-fsrs object churn. Rows are written
+back as py-fsrs-compatible card dicts only when a caller persists them.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from alif_core import fsrs, leitner
+
+NAN = float("nan")
+
+
+def to_epoch(dt: datetime | str | None) -> float:
+    """UTC POSIX seconds; naive datetimes (SQLite) are treated as UTC."""
+    if dt is None or dt == "":
+        return NAN
+    if isinstance(dt, str):
+        dt = datetime.fromisoformat(dt)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def from_epoch(ts: float) -> datetime | None:
+    if ts is None or np.isnan(ts):
+        return None
+    return datetime.fromtimestamp(float(ts), tz=timezone.utc)
+
+
+def _isoformat(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt is not None else None
+
+
+@dataclass
+class CardStore:
+    """Columnar scheduling state for ``len(lemma_id)`` cards.
+
+    ``has_card`` is False for rows with no FSRS card yet (acquiring or
+    assumed-known scaffold); their FSRS columns are NaN / Learning step 0,
+    matching a fresh ``fsrs.Card()``.
+    """
+
+    lemma_id: np.ndarray
+    card_id: np.ndarray
+    has_card: np.ndarray
+    state: np.ndarray
+    step: np.ndarray
+    stability: np.ndarray
+    difficulty: np.ndarray
+    due: np.ndarray
+    last_review: np.ndarray
+    box: np.ndarray
+    acquisition_due: np.ndarray
+    _index: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._index:
+            self._index = {int(lid): i for i, lid in enumerate(self.lemma_id)}
+
+    def __len__(self) -> int:
+        return len(self.lemma_id)
+
+    # ── construction ────────────────────────────────────────────────────
+
+    @classmethod
+    def empty(cls, n: int = 0) -> "CardStore":
+        return cls(
+            lemma_id=np.zeros(n, dtype=np.int64),
+            card_id=np.zeros(n, dtype=np.int64),
+            has_card=np.zeros(n, dtype=bool),
+            state=np.full(n, fsrs.LEARNING, dtype=np.int8),
+            step=np.zeros(n, dtype=np.int8),
+            stability=np.full(n, NAN),
+            difficulty=np.full(n, NAN),
+            due=np.full(n, NAN),
+            last_review=np.full(n, NAN),
+            box=np.zeros(n, dtype=np.int8),
+            acquisition_due=np.full(n, NAN),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "CardStore":
+        """Build from ``(lemma_id, card_dict | None, box | None, acquisition_due)``
+        tuples — the shape the ORM adapters select."""
+        rows = list(rows)
+        store = cls.empty(len(rows))
+        for i, (lemma_id, card, box, acq_due) in enumerate(rows):
+            store.lemma_id[i] = lemma_id
+            store.box[i] = box or 0
+            store.acquisition_due[i] = to_epoch(acq_due)
+            if card:
+                store._set_card(i, card)
+        store._index = {int(lid): i for i, lid in enumerate(store.lemma_id)}
+        return store
+
+    def _set_card(self, i: int, card: Mapping) -> None:
+        self.has_card[i] = True
+        self.card_id[i] = int(card.get("card_id") or 0)
+        self.state[i] = int(card.get("state") or fsrs.LEARNING)
+        step = card.get("step")
+        self.step[i] = -1 if step is None else int(step)
+        # py-fsrs treats a falsy stability/difficulty as "no value".
+        self.stability[i] = float(card["stability"]) if card.get("stability") else NAN
+        self.difficulty[i] = float(card["difficulty"]) if card.get("difficulty") else NAN
+        self.due[i] = to_epoch(card.get("due"))
+        self.last_review[i] = to_epoch(card.get("last_review"))
+
+    def card_dict(self, i: int) -> dict | None:
+        """py-fsrs ``Card.to_dict()`` shape for row ``i`` (None without a card)."""
+        if not self.has_card[i]:
+            return None
+        step = int(self.step[i])
+        return {
+            "card_id": int(self.card_id[i]),
+            "state": int(self.state[i]),
+            "step": None if step < 0 else step,
+            "stability": None if np.isnan(self.stability[i]) else float(self.stability[i]),
+            "difficulty": None if np.isnan(self.difficulty[i]) else float(self.difficulty[i]),
+            "due": _isoformat(from_epoch(self.due[i])),
+            "last_review": _isoformat(from_epoch(self.last_review[i])),
+        }
+
+    def index_of(self, lemma_ids: Iterable[int]) -> np.ndarray:
+        return np.fromiter((self._index[int(lid)] for lid in lemma_ids), dtype=np.int64)
+
+    # ── queries ─────────────────────────────────────────────────────────
+
+    def due_mask(self, at) -> np.ndarray:
+        """Rows due at ``at``: FSRS cards by ``due``, acquiring rows by box due."""
+        at = float(at)
+        fsrs_due = self.has_card & (self.box == 0) & (self.due <= at)
+        acq_due = (self.box > 0) & (np.isnan(self.acquisition_due) | (self.acquisition_due <= at))
+        return fsrs_due | acq_due
+
+    def retrievability(self, p: fsrs.FsrsParams, at) -> np.ndarray:
+        r = fsrs.retrievability(p, self.stability, self.last_review, at)
+        return np.where(self.has_card, r, 0.0)
+
+    def project_due(self, p: fsrs.FsrsParams, rating: int = 3, at=None) -> np.ndarray:
+        """Due time each card would get if reviewed with ``rating`` at ``at``
+        (default: at its own due time). Read-only, un-fuzzed."""
+        when = self.due if at is None else at
+        *_, due = fsrs.review(
+            p, state=self.state, step=self.step, stability=self.stability,
+            difficulty=self.difficulty, last_review=self.last_review,
+            rating=np.full(len(self), rating), at=when,
+        )
+        return np.where(self.has_card, due, np.nan)
+
+    # ── mutation ────────────────────────────────────────────────────────
+
+    def apply_reviews(
+        self,
+        p: fsrs.FsrsParams,
+        rows: np.ndarray,
+        ratings: np.ndarray,
+        at,
+        *,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        """Apply one FSRS review to each of ``rows`` (indices, unique within a
+        call) in place. Rows without a card start from a fresh card, exactly
+        like ``Card()`` on first review. Ordered multi-review histories are
+        applied as successive calls (see `replay`)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.size == 0:
+            return
+        state, step, s, d, due = fsrs.review(
+            p,
+            state=self.state[rows], step=self.step[rows],
+            stability=self.stability[rows], difficulty=self.difficulty[rows],
+            last_review=self.last_review[rows], rating=ratings, at=at, rng=rng,
+        )
+        self.state[rows] = state
+        self.step[rows] = step
+        self.stability[rows] = s
+        self.difficulty[rows] = d
+        self.due[rows] = due
+        self.last_review[rows] = np.broadcast_to(np.asarray(at, dtype=np.float64), rows.shape)
+        self.has_card[rows] = True
+
+    def apply_acquisition_reviews(
+        self, rows: np.ndarray, ratings: np.ndarray, times_correct: np.ndarray, at,
+    ) -> None:
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.size == 0:
+            return
+        box, due = leitner.step(
+            box=self.box[rows], next_due=self.acquisition_due[rows],
+            times_correct=times_correct, rating=ratings, at=at,
+        )
+        self.box[rows] = box
+        self.acquisition_due[rows] = due
+
+    def replay(
+        self,
+        p: fsrs.FsrsParams,
+        rows: np.ndarray,
+        ratings: np.ndarray,
+        times: np.ndarray,
+        *,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        """Apply an event log (possibly many reviews per row) in time order.
+
+        Events are grouped into "waves" — the k-th review of every row is
+        applied in one vectorised call — so cost scales with the longest
+        single history, not the total number of reviews.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=np.int64)
+        times = np.asarray(times, dtype=np.float64)
+        order = np.lexsort((times, rows))
+        rows, ratings, times = rows[order], ratings[order], times[order]
+        # rank of each event within its row's history
+        starts = np.r_[0, np.flatnonzero(np.diff(rows)) + 1]
+        counts = np.diff(np.r_[starts, rows.size])
+        rank = np.arange(rows.size) - np.repeat(starts, counts)
+        for k in range(int(rank.max()) + 1 if rows.size else 0):
+            wave = rank == k
+            self.apply_reviews(p, rows[wave], ratings[wave], times[wave], rng=rng)
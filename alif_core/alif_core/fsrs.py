@@ -0,0 +1,268 @@
+"""FSRS-6 scheduling math over NumPy arrays.
+
+A line-for-line port of py-fsrs 6.x ``Scheduler.review_card`` (the version
+both backends pin), evaluated for many cards at once instead of one
+``Card`` object at a time. Every branch of the scalar scheduler — new-card
+initialisation, same-day short-term stability, learning/relearning steps,
+the Review-state lapse path, interval rounding and fuzz — is expressed as a
+masked array operation, so a review batch of any size costs a fixed number
+of NumPy calls.
+
+Times are float64 POSIX seconds (UTC). Missing values (a new card's
+stability/difficulty, a never-reviewed card's ``last_review``) are NaN and
+a card in the Review state has ``step == -1`` (py-fsrs ``None``).
+
+Parity with py-fsrs is exact when fuzzing is disabled; with fuzzing the
+interval range and distribution match but draws come from the supplied
+``numpy.random.Generator``.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+LEARNING = 1
+REVIEW = 2
+RELEARNING = 3
+
+DAY_SECONDS = 86400.0
+STABILITY_MIN = 0.001
+MIN_DIFFICULTY = 1.0
+MAX_DIFFICULTY = 10.0
+
+# py-fsrs 6.x defaults (FSRS-6, 21 weights).
+DEFAULT_PARAMETERS: tuple[float, ...] = (
+    0.212, 1.2931, 2.3065, 8.2956, 6.4133, 0.8334, 3.0194, 0.001, 1.8722,
+    0.1666, 0.796, 1.4835, 0.0614, 0.2629, 1.6483, 0.6014, 1.8729, 0.5425,
+    0.0912, 0.0658, 0.1542,
+)
+
+# (start, end, factor) — py-fsrs FUZZ_RANGES.
+_FUZZ_RANGES = ((2.5, 7.0, 0.15), (7.0, 20.0, 0.1), (20.0, math.inf, 0.05))
+
+
+@dataclass(frozen=True)
+class FsrsParams:
+    """Scheduler configuration; mirrors ``fsrs.Scheduler``'s constructor."""
+
+    parameters: tuple[float, ...] = DEFAULT_PARAMETERS
+    desired_retention: float = 0.9
+    learning_steps: tuple[float, ...] = (60.0, 600.0)  # seconds
+    relearning_steps: tuple[float, ...] = (600.0,)
+    maximum_interval: int = 36500
+    enable_fuzzing: bool = True
+    _w: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.parameters) != 21:
+            raise ValueError(f"Expected 21 parameters, got {len(self.parameters)}.")
+        object.__setattr__(self, "_w", np.asarray(self.parameters, dtype=np.float64))
+
+    @classmethod
+    def from_scheduler(cls, scheduler) -> "FsrsParams":
+        """Build from a py-fsrs ``Scheduler`` so each backend keeps one source
+        of truth for its scheduling policy."""
+        return cls(
+            parameters=tuple(scheduler.parameters),
+            desired_retention=scheduler.desired_retention,
+            learning_steps=tuple(s.total_seconds() for s in scheduler.learning_steps),
+            relearning_steps=tuple(s.total_seconds() for s in scheduler.relearning_steps),
+            maximum_interval=scheduler.maximum_interval,
+            enable_fuzzing=scheduler.enable_fuzzing,
+        )
+
+    @property
+    def decay(self) -> float:
+        return -self.parameters[20]
+
+    @property
+    def factor(self) -> float:
+        return 0.9 ** (1 / self.decay) - 1
+
+
+def _clamp_d(d):
+    return np.clip(d, MIN_DIFFICULTY, MAX_DIFFICULTY)
+
+
+def elapsed_days(last_review: np.ndarray, at) -> np.ndarray:
+    """Whole days between ``last_review`` and ``at`` (``timedelta.days``
+    semantics: floor). NaN where the card was never reviewed."""
+    return np.floor((np.asarray(at, dtype=np.float64) - last_review) / DAY_SECONDS)
+
+
+def retrievability(p: FsrsParams, stability: np.ndarray, last_review: np.ndarray, at) -> np.ndarray:
+    """Predicted recall probability at ``at``; 0 for never-reviewed cards."""
+    days = np.maximum(0.0, elapsed_days(last_review, at))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (1 + p.factor * days / stability) ** p.decay
+    return np.where(np.isnan(last_review) | np.isnan(stability), 0.0, r)
+
+
+def interval_days(p: FsrsParams, stability: np.ndarray, desired_retention=None) -> np.ndarray:
+    """Un-fuzzed next interval in whole days. ``desired_retention`` may be an
+    array (one retention per card or per parameter sweep row)."""
+    dr = p.desired_retention if desired_retention is None else desired_retention
+    ivl = (stability / p.factor) * (np.power(dr, 1 / p.decay) - 1)
+    return np.clip(np.round(ivl), 1, p.maximum_interval)
+
+
+def initial_stability(p: FsrsParams, rating: np.ndarray) -> np.ndarray:
+    return np.maximum(p._w[rating - 1], STABILITY_MIN)
+
+
+def initial_difficulty(p: FsrsParams, rating, clamp: bool = True):
+    w = p._w
+    d = w[4] - np.exp(w[5] * (np.asarray(rating, dtype=np.float64) - 1)) + 1
+    return _clamp_d(d) if clamp else d
+
+
+def short_term_stability(p: FsrsParams, stability, rating):
+    w = p._w
+    inc = np.exp(w[17] * (rating - 3 + w[18])) * np.power(stability, -w[19])
+    inc = np.where(rating >= 3, np.maximum(inc, 1.0), inc)
+    return np.maximum(stability * inc, STABILITY_MIN)
+
+
+def next_difficulty(p: FsrsParams, difficulty, rating):
+    w = p._w
+    delta = -(w[6] * (rating - 3))
+    damped = difficulty + (10.0 - difficulty) * delta / 9.0
+    easy = initial_difficulty(p, 4, clamp=False)
+    return _clamp_d(w[7] * easy + (1 - w[7]) * damped)
+
+
+def next_stability(p: FsrsParams, difficulty, stability, r, rating):
+    w = p._w
+    forget_long = (
+        w[11]
+        * np.power(difficulty, -w[12])
+        * (np.power(stability + 1, w[13]) - 1)
+        * np.exp((1 - r) * w[14])
+    )
+    forget_short = stability / math.exp(w[17] * w[18])
+    forget = np.minimum(forget_long, forget_short)
+    hard_penalty = np.where(rating == 2, w[15], 1.0)
+    easy_bonus = np.where(rating == 4, w[16], 1.0)
+    recall = stability * (
+        1
+        + math.exp(w[8])
+        * (11 - difficulty)
+        * np.power(stability, -w[9])
+        * (np.exp((1 - r) * w[10]) - 1)
+        * hard_penalty
+        * easy_bonus
+    )
+    return np.maximum(np.where(rating == 1, forget, recall), STABILITY_MIN)
+
+
+def fuzz_interval_days(p: FsrsParams, days: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """py-fsrs ``_get_fuzzed_interval`` over an array of whole-day intervals."""
+    delta = np.ones_like(days)
+    for start, end, factor in _FUZZ_RANGES:
+        delta += factor * np.maximum(np.minimum(days, end) - start, 0.0)
+    min_ivl = np.maximum(2, np.round(days - delta))
+    max_ivl = np.minimum(np.round(days + delta), p.maximum_interval)
+    min_ivl = np.minimum(min_ivl, max_ivl)
+    fuzzed = rng.random(days.shape) * (max_ivl - min_ivl + 1) + min_ivl
+    fuzzed = np.minimum(np.round(fuzzed), p.maximum_interval)
+    return np.where(days < 2.5, days, fuzzed)
+
+
+def _step_seconds(steps: Sequence[float], idx: np.ndarray) -> np.ndarray:
+    if not steps:
+        return np.zeros(idx.shape)
+    table = np.asarray(steps, dtype=np.float64)
+    return table[np.clip(idx, 0, len(table) - 1)]
+
+
+def _hard_step_seconds(steps: Sequence[float], step: np.ndarray) -> np.ndarray:
+    if len(steps) == 1:
+        first = steps[0] * 1.5
+    elif len(steps) >= 2:
+        first = (steps[0] + steps[1]) / 2.0
+    else:
+        first = 0.0
+    return np.where(step == 0, first, _step_seconds(steps, step))
+
+
+def review(
+    p: FsrsParams,
+    *,
+    state: np.ndarray,
+    step: np.ndarray,
+    stability: np.ndarray,
+    difficulty: np.ndarray,
+    last_review: np.ndarray,
+    rating: np.ndarray,
+    at,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Apply one rating to each card. ``at`` is a scalar or per-card array of
+    review times. Returns ``(state, step, stability, difficulty, due)``; the
+    new ``last_review`` is ``at``.
+
+    Pass ``rng`` to fuzz Review-state intervals when ``p.enable_fuzzing`` is
+    set; without one, intervals are left un-fuzzed (deterministic replay).
+    """
+    rating = np.asarray(rating, dtype=np.int64)
+    state = np.asarray(state, dtype=np.int64)
+    step = np.asarray(step, dtype=np.int64)
+    at = np.broadcast_to(np.asarray(at, dtype=np.float64), rating.shape)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        days = elapsed_days(last_review, at)
+        same_day = days < 1  # NaN (never reviewed) compares False
+        r = retrievability(p, stability, last_review, at)
+        is_new = np.isnan(stability) | np.isnan(difficulty)
+        new_s = np.where(
+            is_new,
+            initial_stability(p, rating),
+            np.where(same_day, short_term_stability(p, stability, rating),
+                     next_stability(p, difficulty, stability, r, rating)),
+        )
+        new_d = np.where(is_new, initial_difficulty(p, rating), next_difficulty(p, difficulty, rating))
+
+    ivl_s = interval_days(p, new_s) * DAY_SECONDS
+    new_state = state.copy()
+    new_step = step.copy()
+    interval = np.zeros(rating.shape)
+
+    for phase, steps in ((LEARNING, p.learning_steps), (RELEARNING, p.relearning_steps)):
+        m = state == phase
+        if not m.any():
+            continue
+        n = len(steps)
+        graduate = m & (
+            (n == 0)
+            | ((step >= n) & (rating >= 2))
+            | (rating == 4)
+            | ((rating == 3) & (step + 1 == n))
+        )
+        again = m & ~graduate & (rating == 1)
+        hard = m & ~graduate & (rating == 2)
+        good = m & ~graduate & (rating == 3)
+        new_state[graduate] = REVIEW
+        new_step[graduate] = -1
+        interval[graduate] = ivl_s[graduate]
+        new_step[again] = 0
+        interval[again] = _step_seconds(steps, np.zeros(int(again.sum()), dtype=np.int64))
+        interval[hard] = _hard_step_seconds(steps, step[hard])
+        new_step[good] = step[good] + 1
+        interval[good] = _step_seconds(steps, step[good] + 1)
+
+    m = state == REVIEW
+    lapse = m & (rating == 1) & (len(p.relearning_steps) > 0)
+    interval[m] = ivl_s[m]
+    new_state[lapse] = RELEARNING
+    new_step[lapse] = 0
+    interval[lapse] = p.relearning_steps[0] if p.relearning_steps else 0.0
+
+    if p.enable_fuzzing and rng is not None:
+        fuzz = new_state == REVIEW
+        if fuzz.any():
+            interval[fuzz] = fuzz_interval_days(p, interval[fuzz] / DAY_SECONDS, rng) * DAY_SECONDS
+
+    return new_state, new_step, new_s, new_d, at + interval
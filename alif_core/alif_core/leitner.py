@@ -0,0 +1,73 @@
+"""Acquisition Leitner boxes over NumPy arrays.
+
+Both backends run the same 3-box acquisition phase (4h / 1d / 3d) before a
+word graduates into FSRS. This module holds the box-movement rules that are
+identical across them; graduation *policy* (first-correct, accuracy tiers,
+calendar-day spans, intro-card gap) stays in each backend's
+``acquisition_service`` because it reads review history and learner state.
+
+Box 0 means "not acquiring" (the ORM's NULL ``acquisition_box``).
+"""
+from __future__ import annotations
+
+import numpy as np
+
+HOUR_SECONDS = 3600.0
+DAY_SECONDS = 86400.0
+
+BOX_INTERVAL_SECONDS = {
+    1: 4 * HOUR_SECONDS,
+    2: 1 * DAY_SECONDS,
+    3: 3 * DAY_SECONDS,
+}
+# Retry spacing before the word has ever been answered correctly.
+FIRST_AGAIN_SECONDS = 5 * 60.0
+FIRST_HARD_SECONDS = 10 * 60.0
+
+_BOX_TABLE = np.array([0.0, *BOX_INTERVAL_SECONDS.values()])
+
+
+def box_interval_seconds(box: np.ndarray) -> np.ndarray:
+    return _BOX_TABLE[np.clip(np.asarray(box, dtype=np.int64), 0, 3)]
+
+
+def step(
+    *,
+    box: np.ndarray,
+    next_due: np.ndarray,
+    times_correct: np.ndarray,
+    rating: np.ndarray,
+    at,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Move each acquiring card one review through the boxes.
+
+    ``times_correct`` is the count *after* this review. Mirrors the shared
+    rules of ``submit_acquisition_review``: Good/Easy advance one box when
+    due (Box 3 refreshes), not-due exposures keep box and timer, Hard stays
+    and refreshes when due, Again resets to Box 1. Returns ``(box, next_due)``.
+    """
+    box = np.where(np.asarray(box) < 1, 1, np.asarray(box, dtype=np.int64))
+    rating = np.asarray(rating, dtype=np.int64)
+    at = np.broadcast_to(np.asarray(at, dtype=np.float64), rating.shape)
+    next_due = np.asarray(next_due, dtype=np.float64)
+    never_correct = np.asarray(times_correct) == 0
+    is_due = np.isnan(next_due) | (next_due <= at)
+
+    new_box = box.copy()
+    new_due = next_due.copy()
+
+    good = (rating >= 3) & is_due
+    new_box[good] = np.minimum(box[good] + 1, 3)
+    new_due[good] = at[good] + box_interval_seconds(new_box[good])
+
+    hard = (rating == 2) & is_due
+    new_due[hard] = at[hard] + np.where(
+        never_correct[hard], FIRST_HARD_SECONDS, box_interval_seconds(box[hard])
+    )
+
+    again = rating == 1
+    new_box[again] = 1
+    new_due[again] = at[again] + np.where(
+        never_correct[again], FIRST_AGAIN_SECONDS, BOX_INTERVAL_SECONDS[1]
+    )
+    return new_box, new_due
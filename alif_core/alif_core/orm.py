@@ -0,0 +1,80 @@
+"""Load/persist a `CardStore` against a backend's ``UserLemmaKnowledge`` model.
+
+Both backends share the column names this needs (``lemma_id``,
+``fsrs_card_json``, ``acquisition_box``, ``acquisition_next_due``), so the
+adapter is generic over the model class; each backend passes its own.
+SQLAlchemy is imported lazily so the array core stays dependency-free.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from alif_core.card_store import CardStore, from_epoch
+
+
+def _parse_card(value) -> dict | None:
+    # Mirrors the backends' ``parse_json_column``: JSON columns are usually
+    # dicts but legacy rows hold JSON-encoded strings.
+    if value is None:
+        return None
+    if isinstance(value, str):
+        import json
+
+        value = json.loads(value)
+    return value or None
+
+
+def load_card_store(db, model, lemma_ids: Iterable[int] | None = None) -> CardStore:
+    """One SELECT over the scheduling columns; no ORM objects are built."""
+    from sqlalchemy import select
+
+    stmt = select(
+        model.lemma_id,
+        model.fsrs_card_json,
+        model.acquisition_box,
+        model.acquisition_next_due,
+    ).order_by(model.lemma_id)
+    if lemma_ids is not None:
+        stmt = stmt.where(model.lemma_id.in_(list(lemma_ids)))
+    rows = db.execute(stmt).all()
+    return CardStore.from_rows(
+        (lid, _parse_card(card), box, acq_due) for lid, card, box, acq_due in rows
+    )
+
+
+def write_card_store(db, model, store: CardStore, rows: np.ndarray | None = None) -> int:
+    """Persist ``rows`` (default: all) back to the model with one executemany.
+
+    Only scheduling columns are written; ``knowledge_state`` transitions stay
+    with the backend services that own them. Returns the number of rows.
+    """
+    from sqlalchemy import bindparam, update
+
+    idx = np.arange(len(store)) if rows is None else np.asarray(rows, dtype=np.int64)
+    if idx.size == 0:
+        return 0
+    params = []
+    for i in idx:
+        box = int(store.box[i])
+        acq_due = from_epoch(store.acquisition_due[i]) if box else None
+        params.append({
+            "b_lemma_id": int(store.lemma_id[i]),
+            "b_fsrs_card_json": store.card_dict(i),
+            "b_acquisition_box": box or None,
+            # Both schemas store naive UTC datetimes.
+            "b_acquisition_next_due": acq_due.replace(tzinfo=None) if acq_due else None,
+        })
+    table = model.__table__
+    stmt = (
+        update(table)
+        .where(table.c.lemma_id == bindparam("b_lemma_id"))
+        .values(
+            fsrs_card_json=bindparam("b_fsrs_card_json"),
+            acquisition_box=bindparam("b_acquisition_box"),
+            acquisition_next_due=bindparam("b_acquisition_next_due"),
+        )
+    )
+    db.execute(stmt, params)
+    return len(params)
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from alif_core import CardStore, FsrsParams, leitner
+from alif_core.card_store import to_epoch
+
+T0 = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+P = FsrsParams(desired_retention=0.95, enable_fuzzing=False)
+
+
+def _store(n: int) -> CardStore:
+    return CardStore.from_rows((i + 1, None, None, None) for i in range(n))
+
+
+def test_due_mask_splits_fsrs_and_acquisition_rows():
+    store = CardStore.from_rows([
+        (1, None, 1, T0 - timedelta(hours=1)),   # acquiring, due
+        (2, None, 2, T0 + timedelta(hours=1)),   # acquiring, not due
+        (3, None, None, None),                   # no card yet
+    ])
+    store.apply_reviews(P, np.array([2]), np.array([3]), T0.timestamp() - 3600)
+    mask = store.due_mask(T0.timestamp())
+    # Row 2 got a 10-minute Learning step an hour ago → due.
+    assert mask.tolist() == [True, False, True]
+
+
+def test_apply_reviews_starts_fresh_cards_like_py_fsrs():
+    store = _store(4)
+    store.apply_reviews(P, np.arange(4), np.array([1, 2, 3, 4]), T0.timestamp())
+    assert store.has_card.all()
+    # Again/Hard/Good stay in Learning, Easy graduates.
+    assert store.state.tolist() == [1, 1, 1, 2]
+    assert store.step.tolist() == [0, 0, 1, -1]
+    np.testing.assert_allclose(store.stability, P.parameters[:4])
+
+
+def test_replay_is_order_independent_across_rows():
+    times = T0.timestamp() + np.array([0, 86400, 0, 3 * 86400, 86400 * 2], dtype=float)
+    rows = np.array([0, 0, 1, 1, 0])
+    ratings = np.array([3, 3, 4, 1, 3])
+
+    a = _store(2)
+    a.replay(P, rows, ratings, times)
+    perm = np.array([4, 2, 0, 3, 1])
+    b = _store(2)
+    b.replay(P, rows[perm], ratings[perm], times[perm])
+    np.testing.assert_array_equal(a.stability, b.stability)
+    np.testing.assert_array_equal(a.due, b.due)
+
+
+def test_project_due_does_not_mutate():
+    store = _store(3)
+    store.apply_reviews(P, np.arange(3), np.array([4, 4, 4]), T0.timestamp())
+    before = store.due.copy()
+    projected = store.project_due(P, rating=3)
+    np.testing.assert_array_equal(store.due, before)
+    assert (projected > before).all()
+
+
+def test_card_dict_round_trip():
+    store = _store(1)
+    store.apply_reviews(P, np.array([0]), np.array([3]), T0.timestamp())
+    card = store.card_dict(0)
+    again = CardStore.from_rows([(1, card, None, None)])
+    assert again.card_dict(0) == card
+    assert to_epoch(card["last_review"]) == T0.timestamp()
+
+
+
+@pytest.mark.parametrize("due", [None, "", float("nan")])
+def test_card_dict_without_due(due):
+    card = {"card_id": 7, "state": 2, "step": None, "stability": 3.0, "difficulty": 5.0, "due": None}
+    store = CardStore.from_rows([(1, card, None, None)])
+    if isinstance(due, float):
+        store.due[0] = due
+    else:
+        store._set_card(0, {**card, "due": due})
+    assert store.card_dict(0)["due"] is None
+    assert store.card_dict(0)["last_review"] is None
+
+@pytest.mark.parametrize(
+    "box,times_correct,rating,due_in,expected_box,expected_interval",
+    [
+        (1, 1, 3, -1, 2, leitner.BOX_INTERVAL_SECONDS[2]),
+        (3, 5, 3, -1, 3, leitner.BOX_INTERVAL_SECONDS[3]),
+        (2, 3, 3, +3600, 2, None),  # not due: keep box and timer
+        (2, 3, 2, -1, 2, leitner.BOX_INTERVAL_SECONDS[2]),
+        (1, 0, 2, -1, 1, leitner.FIRST_HARD_SECONDS),
+        (3, 4, 1, +3600, 1, leitner.BOX_INTERVAL_SECONDS[1]),
+        (1, 0, 1, -1, 1, leitner.FIRST_AGAIN_SECONDS),
+    ],
+)
+def test_leitner_step(box, times_correct, rating, due_in, expected_box, expected_interval):
+    at = T0.timestamp()
+    next_due = at + due_in
+    new_box, new_due = leitner.step(
+        box=np.array([box]), next_due=np.array([next_due]),
+        times_correct=np.array([times_correct]), rating=np.array([rating]), at=at,
+    )
+    assert new_box[0] == expected_box
+    if expected_interval is None:
+        assert new_due[0] == next_due
+    else:
+        assert new_due[0] == at + expected_interval
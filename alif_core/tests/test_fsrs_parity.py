@@ -0,0 +1,100 @@
+"""Array FSRS must reproduce py-fsrs card-for-card (fuzz off)."""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+fsrs = pytest.importorskip("fsrs")
+
+from alif_core import CardStore, FsrsParams  # noqa: E402
+from alif_core.card_store import to_epoch  # noqa: E402
+
+T0 = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _random_histories(n_cards: int, n_reviews: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    # Mix of same-day steps, multi-day gaps and long absences.
+    gaps = rng.choice(
+        [60, 600, 3600 * 5, 86400, 86400 * 3, 86400 * 12, 86400 * 60],
+        size=(n_cards, n_reviews),
+    )
+    times = T0.timestamp() + np.cumsum(gaps, axis=1).astype(np.float64)
+    ratings = rng.choice([1, 2, 3, 4], size=(n_cards, n_reviews), p=[0.15, 0.15, 0.6, 0.1])
+    return times, ratings
+
+
+def _py_fsrs_replay(scheduler, times, ratings):
+    cards = []
+    for row_t, row_r in zip(times, ratings):
+        card = fsrs.Card()
+        for t, r in zip(row_t, row_r):
+            at = datetime.fromtimestamp(float(t), tz=timezone.utc)
+            card, _ = scheduler.review_card(card, fsrs.Rating(int(r)), review_datetime=at)
+        cards.append(card.to_dict())
+    return cards
+
+
+@pytest.mark.parametrize(
+    "scheduler_kwargs",
+    [
+        {"desired_retention": 0.95},
+        {"desired_retention": 0.90, "relearning_steps": ()},
+        {"learning_steps": (timedelta(minutes=5),)},
+        {"learning_steps": ()},
+    ],
+)
+def test_replay_matches_py_fsrs(scheduler_kwargs):
+    scheduler = fsrs.Scheduler(enable_fuzzing=False, **scheduler_kwargs)
+    params = FsrsParams.from_scheduler(scheduler)
+    times, ratings = _random_histories(40, 12)
+
+    expected = _py_fsrs_replay(scheduler, times, ratings)
+
+    store = CardStore.from_rows((i, None, None, None) for i in range(len(times)))
+    rows = np.repeat(np.arange(len(times)), times.shape[1])
+    store.replay(params, rows, ratings.ravel(), times.ravel())
+
+    for i, exp in enumerate(expected):
+        got = store.card_dict(i)
+        assert got["state"] == exp["state"], i
+        assert got["step"] == exp["step"], i
+        assert got["stability"] == pytest.approx(exp["stability"], rel=1e-9)
+        assert got["difficulty"] == pytest.approx(exp["difficulty"], rel=1e-9)
+        assert to_epoch(got["due"]) == pytest.approx(to_epoch(exp["due"]), abs=1e-3)
+        assert to_epoch(got["last_review"]) == pytest.approx(to_epoch(exp["last_review"]))
+
+
+def test_card_dict_round_trips_through_py_fsrs():
+    scheduler = fsrs.Scheduler(enable_fuzzing=False)
+    card, _ = scheduler.review_card(fsrs.Card(), fsrs.Rating.Good, review_datetime=T0)
+    card, _ = scheduler.review_card(
+        card, fsrs.Rating.Good, review_datetime=T0 + timedelta(days=1)
+    )
+    store = CardStore.from_rows([(1, card.to_dict(), None, None)])
+    restored = fsrs.Card.from_dict(store.card_dict(0))
+    assert restored.state == card.state
+    assert restored.step == card.step
+    assert restored.stability == pytest.approx(card.stability)
+    assert restored.due == card.due
+
+
+def test_fuzzed_intervals_stay_in_py_fsrs_range():
+    scheduler = fsrs.Scheduler()
+    params = FsrsParams.from_scheduler(scheduler)
+    card, _ = scheduler.review_card(fsrs.Card(), fsrs.Rating.Easy, review_datetime=T0)
+    at = card.due + timedelta(days=2)
+    reference = {
+        scheduler.review_card(card, fsrs.Rating.Good, review_datetime=at)[0].due
+        for _ in range(300)
+    }
+    lo, hi = min(reference), max(reference)
+
+    store = CardStore.from_rows([(i, card.to_dict(), None, None) for i in range(300)])
+    store.apply_reviews(
+        params, np.arange(300), np.full(300, 3), at.timestamp(),
+        rng=np.random.default_rng(0),
+    )
+    assert store.due.min() >= lo.timestamp()
+    assert store.due.max() <= hi.timestamp()
+    assert len(np.unique(store.due)) > 1
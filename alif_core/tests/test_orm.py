@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import JSON, Column, DateTime, Integer, create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session, declarative_base  # noqa: E402
+
+from alif_core import FsrsParams  # noqa: E402
+from alif_core.orm import load_card_store, write_card_store  # noqa: E402
+
+Base = declarative_base()
+
+
+class Knowledge(Base):
+    # Same scheduling columns as both backends' UserLemmaKnowledge.
+    __tablename__ = "user_lemma_knowledge"
+    id = Column(Integer, primary_key=True)
+    lemma_id = Column(Integer, unique=True, nullable=False)
+    fsrs_card_json = Column(JSON)
+    acquisition_box = Column(Integer, nullable=True)
+    acquisition_next_due = Column(DateTime, nullable=True)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def test_load_apply_write_round_trip(db):
+    now = datetime(2026, 1, 1, 9, 0)
+    db.add_all([
+        Knowledge(lemma_id=i, acquisition_box=1, acquisition_next_due=now - timedelta(hours=1))
+        for i in range(1, 51)
+    ])
+    db.commit()
+
+    store = load_card_store(db, Knowledge)
+    assert len(store) == 50
+    rows = np.arange(50)
+    store.apply_acquisition_reviews(rows, np.full(50, 3), np.ones(50), now.timestamp())
+    store.box[:10] = 0  # graduate ten into FSRS
+    store.apply_reviews(FsrsParams(enable_fuzzing=False), rows[:10], np.full(10, 3), now.timestamp())
+
+    statements = []
+    event.listen(db.bind, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    assert write_card_store(db, Knowledge, store) == 50
+    db.commit()
+    assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+
+    graduated = db.query(Knowledge).filter_by(lemma_id=1).one()
+    assert graduated.acquisition_box is None
+    assert graduated.fsrs_card_json["state"] == 1
+    acquiring = db.query(Knowledge).filter_by(lemma_id=20).one()
+    assert acquiring.acquisition_box == 2
+    assert acquiring.acquisition_next_due == now + timedelta(days=1)
+    assert acquiring.fsrs_card_json is None
+
+    reloaded = load_card_store(db, Knowledge, lemma_ids=[1, 20])
+    assert reloaded.card_dict(0) == store.card_dict(0)
+    assert reloaded.box.tolist() == [0, 2]
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from alif_core import FsrsParams
+from alif_core.replay import ReviewColumns, evaluate, perturbed_parameters, replay, sweep
+
+fsrs = pytest.importorskip("fsrs")
+
+T0 = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _log(n_cards=30, max_reviews=15, seed=3):
+    rng = np.random.default_rng(seed)
+    keys, ratings, times = [], [], []
+    for card in range(n_cards):
+        n = int(rng.integers(1, max_reviews))
+        gaps = rng.choice([600, 86400, 3 * 86400, 10 * 86400, 40 * 86400], size=n)
+        keys += [1000 + card] * n
+        ratings += rng.choice([1, 2, 3, 4], size=n, p=[0.15, 0.1, 0.65, 0.1]).tolist()
+        times += (T0 + np.cumsum(gaps)).tolist()
+    # Shuffle: the loader must not rely on input order.
+    perm = rng.permutation(len(keys))
+    return (np.array(keys)[perm], np.array(ratings)[perm], np.array(times, dtype=float)[perm])
+
+
+def test_trace_matches_py_fsrs_review_by_review():
+    keys, ratings, times = _log()
+    cols = ReviewColumns.from_events(keys, ratings, times)
+    scheduler = fsrs.Scheduler(desired_retention=0.95, enable_fuzzing=False)
+    trace = replay(FsrsParams.from_scheduler(scheduler), cols)
+
+    card = None
+    for i in range(len(cols)):
+        if i == 0 or cols.card[i] != cols.card[i - 1]:
+            card = fsrs.Card()
+            assert np.isnan(trace.predicted[i])
+        else:
+            at = datetime.fromtimestamp(cols.t[i], tz=timezone.utc)
+            assert trace.predicted[i] == pytest.approx(scheduler.get_card_retrievability(card, at))
+        at = datetime.fromtimestamp(cols.t[i], tz=timezone.utc)
+        card, _ = scheduler.review_card(card, fsrs.Rating(int(cols.rating[i])), review_datetime=at)
+        assert trace.stability[i] == pytest.approx(card.stability, rel=1e-9)
+        assert trace.due[i] == pytest.approx(card.due.timestamp(), abs=1e-3)
+
+
+def test_evaluate_reports_metrics_and_intervals():
+    cols = ReviewColumns.from_events(*_log())
+    result = evaluate(FsrsParams(desired_retention=0.9), cols)
+    assert result["reviews"] == len(cols)
+    assert 0 < result["evaluated"] < len(cols)
+    assert result["log_loss"] > 0
+    assert 0 <= result["rmse_bins"] <= 1
+    assert sum(result["interval_distribution"].values()) == len(cols)
+
+
+def test_lower_retention_lengthens_intervals():
+    cols = ReviewColumns.from_events(*_log())
+    hi, lo = (evaluate(FsrsParams(desired_retention=dr), cols) for dr in (0.97, 0.80))
+    # Retention only moves intervals, never predictions.
+    assert hi["log_loss"] == lo["log_loss"]
+    assert lo["median_interval_days"] > hi["median_interval_days"]
+
+
+def test_sweep_pool_matches_inline():
+    cols = ReviewColumns.from_events(*_log(n_cards=10))
+    sets = [FsrsParams(parameters=w) for w in perturbed_parameters(FsrsParams().parameters, 4)]
+    assert sweep(cols, sets, workers=2) == sweep(cols, sets, workers=1)
+
+
+def test_empty_log():
+    cols = ReviewColumns.from_events([], [], [])
+    assert evaluate(FsrsParams(), cols)["log_loss"] is None
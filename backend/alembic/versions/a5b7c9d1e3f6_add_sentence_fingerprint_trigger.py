@@ -0,0 +1,37 @@
+"""Reset stored sentence fingerprints when arabic_text is edited by raw SQL.
+
+ORM writes recompute ``text_fingerprint``/``text_minhash`` in the same
+UPDATE; a raw-SQL edit of ``arabic_text`` leaves them describing the old
+text. ``sentences_fp_au`` NULLs both in that case, and readers recompute
+NULL fingerprints in memory until scripts/backfill_sentence_fingerprints.py
+stores them. The DDL is a frozen copy of
+services/sentence_fingerprint.fingerprint_trigger_ddl().
+
+Revision ID: a5b7c9d1e3f6
+Revises: f4a6b8c0d2e5
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = "a5b7c9d1e3f6"
+down_revision = "f4a6b8c0d2e5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS sentences_fp_au "
+        "AFTER UPDATE OF arabic_text ON sentences "
+        "WHEN NEW.arabic_text IS NOT OLD.arabic_text "
+        "AND NEW.text_fingerprint IS OLD.text_fingerprint "
+        "AND NEW.text_fingerprint IS NOT NULL "
+        "BEGIN UPDATE sentences SET text_fingerprint = NULL, text_minhash = NULL "
+        "WHERE id = NEW.id; END"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS sentences_fp_au")
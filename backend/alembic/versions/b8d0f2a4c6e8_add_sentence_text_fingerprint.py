@@ -0,0 +1,33 @@
+"""Add stored text fingerprint and MinHash signature to sentences.
+
+Existing rows start NULL; readers compute their fingerprints in memory and
+scripts/backfill_sentence_fingerprints.py stores them (run once after
+deploying, in batches, outside any app transaction).
+
+Revision ID: b8d0f2a4c6e8
+Revises: a7c9e1f3b5d7
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b8d0f2a4c6e8"
+down_revision = "a7c9e1f3b5d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sentences") as batch_op:
+        batch_op.add_column(sa.Column("text_fingerprint", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("text_minhash", sa.JSON(), nullable=True))
+        batch_op.create_index("ix_sentences_text_fingerprint", ["text_fingerprint"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sentences") as batch_op:
+        batch_op.drop_index("ix_sentences_text_fingerprint")
+        batch_op.drop_column("text_minhash")
+        batch_op.drop_column("text_fingerprint")
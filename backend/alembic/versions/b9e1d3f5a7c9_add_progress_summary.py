@@ -0,0 +1,162 @@
+"""Add materialized root_progress / pattern_progress tables.
+
+One row per root and per wazn: canonical lemma count, counts by ULK
+knowledge state, covered_words (acquiring+learning+known), known_ratio and
+last_activity_at. Kept current by delta triggers on lemmas and
+user_lemma_knowledge, and backfilled here.
+
+The trigger SQL is a frozen copy of services/progress_summary.py at the
+time of this migration; the app re-installs any missing trigger (and
+rebuilds both tables) at startup.
+
+Revision ID: b9e1d3f5a7c9
+Revises: f6b8d0e2a4c6
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "b9e1d3f5a7c9"
+down_revision = "f6b8d0e2a4c6"
+branch_labels = None
+depends_on = None
+
+
+_STATES = ("encountered", "acquiring", "learning", "known", "lapsed", "suspended")
+_COVERED = "'acquiring', 'learning', 'known'"
+_TARGETS = (
+    ("root_progress", "root_id", "root_id", False),
+    ("pattern_progress", "wazn", "wazn", True),
+)
+
+
+def _count_columns() -> list:
+    return [
+        sa.Column("total_words", sa.Integer(), nullable=False, server_default="0"),
+        *[
+            sa.Column(f"{s}_count", sa.Integer(), nullable=False, server_default="0")
+            for s in _STATES
+        ],
+        sa.Column("covered_words", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("known_ratio", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def _apply(table, key_col, key, sign, state_expr, total, last=None, meaning=None):
+    state = f"coalesce({state_expr}, '')"
+    sets = [f"total_words = total_words {sign} 1"] if total else []
+    sets += [f"{s}_count = {s}_count {sign} ({state} = '{s}')" for s in _STATES]
+    sets.append(f"covered_words = covered_words {sign} ({state} IN ({_COVERED}))")
+    if last:
+        sets.append(
+            f"last_activity_at = CASE WHEN {last} > coalesce(last_activity_at, '') "
+            f"THEN {last} ELSE last_activity_at END"
+        )
+    if meaning:
+        sets.append(
+            f"wazn_meaning = CASE WHEN {meaning} > coalesce(wazn_meaning, '') "
+            f"THEN {meaning} ELSE wazn_meaning END"
+        )
+    out = []
+    if sign == "+" and total:
+        out.append(f"INSERT OR IGNORE INTO {table} ({key_col}) SELECT {key} WHERE {key} IS NOT NULL;")
+    out.append(f"UPDATE {table} SET {', '.join(sets)} WHERE {key_col} = {key};")
+    out.append(
+        f"UPDATE {table} SET known_ratio = CASE WHEN total_words > 0 "
+        f"THEN CAST(covered_words AS REAL) / total_words ELSE 0 END WHERE {key_col} = {key};"
+    )
+    return " ".join(out)
+
+
+def _ulk(lemma_ref, col):
+    return f"(SELECT {col} FROM user_lemma_knowledge WHERE lemma_id = {lemma_ref})"
+
+
+def _lemma_delta(row, sign):
+    return " ".join(
+        _apply(
+            table, key_col,
+            f"(CASE WHEN {row}.canonical_lemma_id IS NULL THEN {row}.{col} END)",
+            sign, _ulk(f"{row}.lemma_id", "knowledge_state"), True,
+            last=_ulk(f"{row}.lemma_id", "last_reviewed") if sign == "+" else None,
+            meaning=f"{row}.wazn_meaning" if has_meaning and sign == "+" else None,
+        )
+        for table, key_col, col, has_meaning in _TARGETS
+    )
+
+
+def _knowledge_delta(row, sign):
+    return " ".join(
+        _apply(
+            table, key_col,
+            f"(SELECT {col} FROM lemmas WHERE lemma_id = {row}.lemma_id "
+            f"AND canonical_lemma_id IS NULL)",
+            sign, f"{row}.knowledge_state", False,
+            last=f"{row}.last_reviewed" if sign == "+" else None,
+        )
+        for table, key_col, col, _ in _TARGETS
+    )
+
+
+_TRIGGERS = {
+    "lemmas_progress_ai": ("AFTER INSERT ON lemmas", lambda: _lemma_delta("new", "+")),
+    "lemmas_progress_ad": ("AFTER DELETE ON lemmas", lambda: _lemma_delta("old", "-")),
+    "lemmas_progress_au": (
+        "AFTER UPDATE OF root_id, wazn, wazn_meaning, canonical_lemma_id ON lemmas",
+        lambda: f"{_lemma_delta('old', '-')} {_lemma_delta('new', '+')}",
+    ),
+    "user_lemma_knowledge_progress_ai": (
+        "AFTER INSERT ON user_lemma_knowledge", lambda: _knowledge_delta("new", "+"),
+    ),
+    "user_lemma_knowledge_progress_ad": (
+        "AFTER DELETE ON user_lemma_knowledge", lambda: _knowledge_delta("old", "-"),
+    ),
+    "user_lemma_knowledge_progress_au": (
+        "AFTER UPDATE OF knowledge_state, last_reviewed, lemma_id ON user_lemma_knowledge",
+        lambda: f"{_knowledge_delta('old', '-')} {_knowledge_delta('new', '+')}",
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "root_progress",
+        sa.Column("root_id", sa.Integer(), sa.ForeignKey("roots.root_id"),
+                  primary_key=True, autoincrement=False),
+        *_count_columns(),
+    )
+    op.create_table(
+        "pattern_progress",
+        sa.Column("wazn", sa.String(30), primary_key=True),
+        sa.Column("wazn_meaning", sa.Text(), nullable=True),
+        *_count_columns(),
+    )
+    for name, (event, body) in _TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body()} END")
+
+    state = "coalesce(k.knowledge_state, '')"
+    counts = ", ".join(f"sum({state} = '{s}')" for s in _STATES)
+    covered = f"sum({state} IN ({_COVERED}))"
+    columns = ", ".join(f"{s}_count" for s in _STATES)
+    for table, key_col, col, has_meaning in _TARGETS:
+        meaning_col = ", wazn_meaning" if has_meaning else ""
+        meaning_val = ", max(l.wazn_meaning)" if has_meaning else ""
+        op.execute(
+            f"INSERT INTO {table} ({key_col}{meaning_col}, total_words, {columns}, "
+            f"covered_words, known_ratio, last_activity_at) "
+            f"SELECT l.{col}{meaning_val}, count(*), {counts}, {covered}, "
+            f"CAST({covered} AS REAL) / count(*), max(k.last_reviewed) "
+            f"FROM lemmas l LEFT JOIN user_lemma_knowledge k ON k.lemma_id = l.lemma_id "
+            f"WHERE l.canonical_lemma_id IS NULL AND l.{col} IS NOT NULL "
+            f"GROUP BY l.{col}"
+        )
+
+
+def downgrade() -> None:
+    for name in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table("pattern_progress")
+    op.drop_table("root_progress")
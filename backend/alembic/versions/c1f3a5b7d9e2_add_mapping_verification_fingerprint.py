@@ -0,0 +1,33 @@
+"""Add mappings_verified_fingerprint to sentences.
+
+Hash of the verifier inputs (word mappings, referenced lemma fields and the
+verifier version) at the sentence's last clean verification pass. The
+full-corpus reverify skips sentences whose fingerprint still matches.
+
+Plain ADD/DROP COLUMN rather than a batch rebuild, so the search, knowledge
+version and progress triggers on sentences survive.
+
+Revision ID: c1f3a5b7d9e2
+Revises: b9e1d3f5a7c9
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "c1f3a5b7d9e2"
+down_revision = "b9e1d3f5a7c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sentences",
+        sa.Column("mappings_verified_fingerprint", sa.String(32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sentences DROP COLUMN mappings_verified_fingerprint")
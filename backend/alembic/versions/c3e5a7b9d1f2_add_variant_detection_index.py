@@ -0,0 +1,54 @@
+"""Add the variant-detection index.
+
+Cached CAMeL analyses per lemma, a lex -> lemma reverse table
+(variant_lex_index) and an index on lemma_ar_bare. Legacy lemma_ar_bare
+values written before the alef-normalizing validator are normalized here so
+indexed equality lookups see every lemma. Analyses are filled lazily by
+services/variant_detection.refresh_variant_index().
+
+Revision ID: c3e5a7b9d1f2
+Revises: b8d0f2a4c6e8
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c3e5a7b9d1f2"
+down_revision = "b8d0f2a4c6e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE lemmas SET lemma_ar_bare = "
+        "replace(replace(replace(replace(lemma_ar_bare, 'أ', 'ا'), 'إ', 'ا'), 'آ', 'ا'), 'ٱ', 'ا') "
+        "WHERE lemma_ar_bare GLOB '*[أإآٱ]*'"
+    )
+    with op.batch_alter_table("lemmas") as batch_op:
+        batch_op.add_column(sa.Column("variant_analyses_json", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("variants_checked_at", sa.DateTime(), nullable=True))
+        batch_op.create_index("ix_lemmas_variants_checked_at", ["variants_checked_at"])
+        batch_op.create_index("ix_lemmas_lemma_ar_bare", ["lemma_ar_bare"])
+
+    op.create_table(
+        "variant_lex_index",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("lemma_id", sa.Integer(), sa.ForeignKey("lemmas.lemma_id"), nullable=False),
+        sa.Column("lex_norm", sa.Text(), nullable=False),
+    )
+    op.create_index("ix_variant_lex_index_lemma_id", "variant_lex_index", ["lemma_id"])
+    op.create_index("ix_variant_lex_index_lex_norm", "variant_lex_index", ["lex_norm"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_variant_lex_index_lex_norm", table_name="variant_lex_index")
+    op.drop_index("ix_variant_lex_index_lemma_id", table_name="variant_lex_index")
+    op.drop_table("variant_lex_index")
+    with op.batch_alter_table("lemmas") as batch_op:
+        batch_op.drop_index("ix_lemmas_lemma_ar_bare")
+        batch_op.drop_index("ix_lemmas_variants_checked_at")
+        batch_op.drop_column("variants_checked_at")
+        batch_op.drop_column("variant_analyses_json")
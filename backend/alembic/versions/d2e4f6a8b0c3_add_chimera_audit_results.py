@@ -0,0 +1,37 @@
+"""Add chimera_audit_results for the incremental chimera audit.
+
+One row per canonical lemma with the D1..D5 verdict and the D6 etymology
+verdict, each keyed by a hash of the fields that check reads. The cron audit
+re-runs only lemmas whose hash changed. Starts empty; the first audit run
+populates it.
+
+Revision ID: d2e4f6a8b0c3
+Revises: c1f3a5b7d9e2
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "d2e4f6a8b0c3"
+down_revision = "c1f3a5b7d9e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chimera_audit_results",
+        sa.Column("lemma_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("structural_hash", sa.String(32), nullable=False),
+        sa.Column("category", sa.String(4), nullable=True),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column("etymology_hash", sa.String(32), nullable=True),
+        sa.Column("etymology_note", sa.Text(), nullable=True),
+        sa.Column("audited_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chimera_audit_results")
@@ -0,0 +1,40 @@
+"""Add the write-behind review journal.
+
+Sentence reviews accepted while ALIF_REVIEW_WRITE_BEHIND=1 are appended to
+review_journal and applied later, in id order, by
+services/review_journal.py.
+
+Revision ID: d4f6a8b0c2e3
+Revises: c3e5a7b9d1f2
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d4f6a8b0c2e3"
+down_revision = "c3e5a7b9d1f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_journal",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("client_review_id", sa.String(50), nullable=True, unique=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("source", sa.String(20), nullable=False, server_default="submit"),
+        sa.Column("payload_json", sa.JSON(), nullable=False),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+        sa.Column("applied_at", sa.DateTime(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_review_journal_status", "review_journal", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_journal_status", table_name="review_journal")
+    op.drop_table("review_journal")
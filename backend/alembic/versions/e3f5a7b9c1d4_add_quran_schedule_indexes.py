@@ -0,0 +1,53 @@
+"""Index verse scheduling queries and add the verse backlog counter.
+
+- ix_quranic_verses_due (next_due, srs_level): due-verse range scan.
+- ix_quranic_verses_queue (srs_level, surah, ayah, lemmatized_at): next
+  unseen lemmatized verse in reading order, and the bounded look-ahead count.
+- ix_quranic_verses_introduced_at: the new-verses-per-day cap.
+- quran_schedule_state: one row holding the non-understood backlog count,
+  seeded here and adjusted by submit_verse_review.
+
+Revision ID: e3f5a7b9c1d4
+Revises: d2e4f6a8b0c3
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "e3f5a7b9c1d4"
+down_revision = "d2e4f6a8b0c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_quranic_verses_due", "quranic_verses", ["next_due", "srs_level"]
+    )
+    op.create_index(
+        "ix_quranic_verses_queue",
+        "quranic_verses",
+        ["srs_level", "surah", "ayah", "lemmatized_at"],
+    )
+    op.create_index(
+        "ix_quranic_verses_introduced_at", "quranic_verses", ["introduced_at"]
+    )
+    op.create_table(
+        "quran_schedule_state",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("backlog_count", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO quran_schedule_state (id, backlog_count) "
+        "SELECT 1, COUNT(*) FROM quranic_verses "
+        "WHERE srs_level BETWEEN 1 AND 7 AND last_rating != 'got_it'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("quran_schedule_state")
+    op.drop_index("ix_quranic_verses_introduced_at", table_name="quranic_verses")
+    op.drop_index("ix_quranic_verses_queue", table_name="quranic_verses")
+    op.drop_index("ix_quranic_verses_due", table_name="quranic_verses")
@@ -0,0 +1,100 @@
+"""Add the FTS5 search index over lemmas, sentences and stories.
+
+A single fts5 table, search_fts(arabic, english), kept in sync by
+insert/update/delete triggers on lemmas, sentences and stories. Rowids are
+source_id * 4 + kind (lemma=1, sentence=2, story=3). Arabic is folded in the
+trigger with replace() chains (Quranic→MSA, strip tashkeel/tatweel,
+normalize alef), so writers on a raw sqlite3 connection stay indexed.
+
+The DDL is a frozen copy of services/search_index.py at the time of this
+migration; the app re-installs any missing trigger at startup.
+
+Revision ID: e5a7c9d1f3b5
+Revises: d4f6a8b0c2e3
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+
+
+revision = "e5a7c9d1f3b5"
+down_revision = "d4f6a8b0c2e3"
+branch_labels = None
+depends_on = None
+
+
+_DIACRITIC_RANGES = [
+    (0x0610, 0x061A), (0x064B, 0x065F), (0x0670, 0x0670), (0x06D6, 0x06DC),
+    (0x06DF, 0x06E4), (0x06E7, 0x06E8), (0x06EA, 0x06ED),
+]
+_FOLD = [
+    ("ۥ", ""), ("ۦ", ""),
+    ("ٰ", "ا"),
+    ("اا", "ا"), ("ىا", "ى"), ("اى", "ى"),
+    *[(chr(cp), "") for lo, hi in _DIACRITIC_RANGES for cp in range(lo, hi + 1)],
+    ("ـ", ""),
+    ("أ", "ا"), ("إ", "ا"), ("آ", "ا"), ("ٱ", "ا"),
+]
+
+_SOURCES = [
+    ("lemmas", "lemma_id", 1,
+     "coalesce({t}.lemma_ar_bare, '')",
+     "coalesce({t}.gloss_en, '')",
+     ("lemma_ar_bare", "gloss_en")),
+    ("sentences", "id", 2,
+     "coalesce({t}.arabic_text, '')",
+     "coalesce({t}.english_translation, '')",
+     ("arabic_text", "english_translation")),
+    ("stories", "id", 3,
+     "coalesce({t}.title_ar, '') || ' ' || coalesce({t}.body_ar, '')",
+     "coalesce({t}.title_en, '') || ' ' || coalesce({t}.body_en, '')",
+     ("title_ar", "body_ar", "title_en", "body_en")),
+]
+
+
+def _folded_row_select(rowid: str, arabic: str, english: str, source: str = "") -> str:
+    # Stacked subqueries of 16 replace() steps: deeper nesting overflows
+    # SQLite's parser, and triggers can't use CTEs.
+    inner = f"SELECT {rowid} AS r, {arabic} AS s, {english} AS e{source}"
+    for start in range(0, len(_FOLD), 16):
+        expr = "s"
+        for old, new in _FOLD[start:start + 16]:
+            expr = f"replace({expr}, '{old}', '{new}')"
+        inner = f"SELECT r, {expr} AS s, e FROM ({inner})"
+    return inner
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5("
+        "arabic, english, tokenize='unicode61 remove_diacritics 2', prefix='3 4')"
+    )
+    for table, id_col, code, arabic, english, watched in _SOURCES:
+        new_row = "INSERT INTO search_fts(rowid, arabic, english) " + _folded_row_select(
+            f"new.{id_col} * 4 + {code}", arabic.format(t="new"), english.format(t="new"),
+        ) + ";"
+        delete_old = f"DELETE FROM search_fts WHERE rowid = old.{id_col} * 4 + {code};"
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} "
+            f"BEGIN {new_row} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} "
+            f"BEGIN {delete_old} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_au "
+            f"AFTER UPDATE OF {', '.join(watched)}, {id_col} ON {table} "
+            f"BEGIN {delete_old} {new_row} END"
+        )
+        op.execute("INSERT INTO search_fts(rowid, arabic, english) " + _folded_row_select(
+            f"{table}.{id_col} * 4 + {code}", arabic.format(t=table), english.format(t=table),
+            f" FROM {table}",
+        ))
+
+
+def downgrade() -> None:
+    for table, *_ in _SOURCES:
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_search_{suffix}")
+    op.execute("DROP TABLE IF EXISTS search_fts")
@@ -0,0 +1,79 @@
+"""Add per-table versions and the deep-analytics snapshot table.
+
+``table_versions`` holds one write counter per knowledge-version tracked
+table, bumped by ``{table}_tv_*`` triggers alongside the existing
+``{table}_kv_*`` ones. ``analytics_snapshots`` stores one precomputed
+deep-analytics section per row with the hash of the inputs it was computed
+from. Starts empty; the first request fills it.
+
+The trigger list is a frozen copy of services/knowledge_version.py at the
+time of this migration; the app re-installs any missing trigger at startup.
+
+Revision ID: f4a6b8c0d2e5
+Revises: e3f5a7b9c1d4
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "f4a6b8c0d2e5"
+down_revision = "e3f5a7b9c1d4"
+branch_labels = None
+depends_on = None
+
+
+_TRACKED = {
+    "user_lemma_knowledge": None,
+    "review_log": None,
+    "sentence_review_log": None,
+    "lemmas": None,
+    "roots": None,
+    "pattern_info": None,
+    "sentences": (
+        "arabic_text", "english_translation", "transliteration", "is_active",
+        "target_lemma_id", "root_focus_id", "kind", "mappings_verified_at",
+        "quality_reviewed_at", "quality_natural", "quality_translation_correct",
+    ),
+    "sentence_words": None,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "analytics_snapshots",
+        sa.Column("section", sa.String(50), primary_key=True),
+        sa.Column("inputs_key", sa.String(32), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+    )
+    for table, columns in _TRACKED.items():
+        bump = f"UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';"
+        update_of = f" OF {', '.join(columns)}" if columns else ""
+        op.execute(f"INSERT INTO table_versions (table_name, version) VALUES ('{table}', 0)")
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_ai AFTER INSERT ON {table} "
+            f"BEGIN {bump} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_ad AFTER DELETE ON {table} "
+            f"BEGIN {bump} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_au AFTER UPDATE{update_of} ON {table} "
+            f"BEGIN {bump} END"
+        )
+
+
+def downgrade() -> None:
+    for table in _TRACKED:
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_tv_{suffix}")
+    op.drop_table("analytics_snapshots")
+    op.drop_table("table_versions")
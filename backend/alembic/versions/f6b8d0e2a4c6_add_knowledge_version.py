@@ -0,0 +1,75 @@
+"""Add the knowledge_version counter and its bump triggers.
+
+One row (id=1) whose version is incremented by AFTER INSERT/UPDATE/DELETE
+triggers on the tables aggregate endpoints read. Sentences only bump on
+updates of content/eligibility columns, not times_shown churn. The counter
+is seeded from the wall clock so a recreated database never replays old
+versions (ETags embed it).
+
+The trigger list is a frozen copy of services/knowledge_version.py at the
+time of this migration; the app re-installs any missing trigger at startup.
+
+Revision ID: f6b8d0e2a4c6
+Revises: e5a7c9d1f3b5
+Create Date: 2026-10-19
+"""
+
+import time
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "f6b8d0e2a4c6"
+down_revision = "e5a7c9d1f3b5"
+branch_labels = None
+depends_on = None
+
+
+_TRACKED = {
+    "user_lemma_knowledge": None,
+    "review_log": None,
+    "sentence_review_log": None,
+    "lemmas": None,
+    "roots": None,
+    "pattern_info": None,
+    "sentences": (
+        "arabic_text", "english_translation", "transliteration", "is_active",
+        "target_lemma_id", "root_focus_id", "kind", "mappings_verified_at",
+        "quality_reviewed_at", "quality_natural", "quality_translation_correct",
+    ),
+    "sentence_words": None,
+}
+_BUMP = "UPDATE knowledge_version SET version = version + 1 WHERE id = 1;"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "knowledge_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        f"INSERT INTO knowledge_version (id, version) VALUES (1, {time.time_ns() // 1000})"
+    )
+    for table, columns in _TRACKED.items():
+        update_of = f" OF {', '.join(columns)}" if columns else ""
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_ai AFTER INSERT ON {table} "
+            f"BEGIN {_BUMP} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_ad AFTER DELETE ON {table} "
+            f"BEGIN {_BUMP} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_au AFTER UPDATE{update_of} ON {table} "
+            f"BEGIN {_BUMP} END"
+        )
+
+
+def downgrade() -> None:
+    for table in _TRACKED:
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_kv_{suffix}")
+    op.drop_table("knowledge_version")
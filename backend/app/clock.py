@@ -0,0 +1,62 @@
+"""Injectable wall clock for the review path.
+
+Services read the current time through `now()` instead of calling
+``datetime.now`` directly. Normally that is the real UTC time; inside
+`frozen_at(at)` — or a call to an entry point decorated with `honors_at`
+that was passed ``at=`` — every nested service sees ``at`` instead. The
+override is a ContextVar (like ``database.db_operation_context``), so it is
+scoped to the current thread/task and costs one lookup per call, unlike
+freezegun's process-wide patching of every ``datetime`` reference.
+"""
+import contextvars
+import functools
+import inspect
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+_frozen_at: contextvars.ContextVar[datetime | None] = contextvars.ContextVar(
+    "alif_clock_frozen_at", default=None
+)
+
+
+def now() -> datetime:
+    """Current time, timezone-aware UTC."""
+    at = _frozen_at.get()
+    return at if at is not None else datetime.now(timezone.utc)
+
+
+def utcnow() -> datetime:
+    """Current time as naive UTC, for columns historically written with
+    ``datetime.utcnow()``."""
+    return now().replace(tzinfo=None)
+
+
+@contextmanager
+def frozen_at(at: datetime):
+    """Pin `now()` to ``at`` (naive values are treated as UTC)."""
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    token = _frozen_at.set(at)
+    try:
+        yield at
+    finally:
+        _frozen_at.reset(token)
+
+
+def honors_at(fn):
+    """Run ``fn`` with the clock pinned to its ``at`` argument when given
+    (by keyword or position), so everything it calls agrees on the time.
+    ``fn`` still receives ``at``."""
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        at = kwargs.get("at")
+        if at is None and args:
+            at = signature.bind_partial(*args, **kwargs).arguments.get("at")
+        if at is None:
+            return fn(*args, **kwargs)
+        with frozen_at(at):
+            return fn(*args, **kwargs)
+
+    return wrapper
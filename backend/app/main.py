@@ -1,32 +1,63 @@
 import asyncio
 import os
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app import startup_profile
 from app.database import engine, Base
-from app.routers import words, review, analyze, stats, import_data, sentences, tts, learn, grammar, stories, chat, ocr, flags, activity, settings, books, patterns, roots, podcast, polyglot_proxy, discover
+from app.routers import words, review, analyze, stats, import_data, sentences, tts, learn, grammar, stories, chat, ocr, flags, activity, settings, books, patterns, roots, podcast, polyglot_proxy, discover, search
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    startup_profile.mark_lifespan_started()
     alembic_ini = Path(__file__).resolve().parent.parent / "alembic.ini"
     if alembic_ini.exists() and os.environ.get("ALIF_SKIP_MIGRATIONS") != "1":
         # Run in subprocess to avoid SQLite/WAL locking issues with uvicorn's event loop
+        import logging
         import subprocess, sys
-        result = subprocess.run(
-            [sys.executable, "-c",
-             "from alembic import command; from alembic.config import Config; "
-             f"c = Config('{alembic_ini}'); "
-             f"c.set_main_option('script_location', '{alembic_ini.parent / 'alembic'}'); "
-             "command.upgrade(c, 'head')"],
-            capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            import logging
-            logging.getLogger(__name__).error(f"Alembic failed: {result.stderr}")
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c",
+                 "from alembic import command; from alembic.config import Config; "
+                 f"c = Config('{alembic_ini}'); "
+                 f"c.set_main_option('script_location', '{alembic_ini.parent / 'alembic'}'); "
+                 "command.upgrade(c, 'head')"],
+                capture_output=True, text=True, timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            logging.getLogger(__name__).error("Alembic timed out after 30s; continuing startup")
+        except Exception:
+            logging.getLogger(__name__).exception("Alembic failed to run")
+        else:
+            if result.returncode != 0:
+                logging.getLogger(__name__).error(f"Alembic failed: {result.stderr}")
+        # Batch migrations that copy lemmas/sentences/stories drop their FTS,
+        # knowledge-version and progress triggers; re-create any missing.
+        # Best-effort, each in its own transaction: a failure is logged and
+        # the others still install.
+        from app.services.knowledge_version import install_knowledge_version
+        from app.services.progress_summary import install_progress_triggers
+        from app.services.search_index import install_search_index
+        from app.services.sentence_fingerprint import install_fingerprint_trigger
+        for _install in (
+            install_search_index,
+            install_knowledge_version,
+            install_fingerprint_trigger,
+            install_progress_triggers,
+        ):
+            try:
+                with engine.begin() as _conn:
+                    _install(_conn)
+            except Exception:
+                logging.getLogger(__name__).exception("Startup %s failed", _install.__name__)
     else:
         Base.metadata.create_all(bind=engine)
 
@@ -65,17 +96,24 @@ async def lifespan(app: FastAPI):
         import logging
         logging.getLogger(__name__).exception("OCR stuck-page recovery failed")
 
-    # Register LLM cost tracking (limbic mounted via PYTHONPATH)
-    try:
-        import litellm
-        from limbic.cerebellum.cost_log import cost_log
-        litellm.callbacks = [cost_log.callback("alif")]
-        import logging
-        logging.getLogger(__name__).info("LLM cost tracking active → %s", cost_log.db_path)
-    except ImportError:
-        pass
+    # Register LLM cost tracking (limbic mounted via PYTHONPATH). Applied
+    # when litellm is first imported, not here — see llm.enable_cost_tracking.
+    from app.services.llm import enable_cost_tracking
+    enable_cost_tracking("alif")
 
+    # Write-behind review ingestion: the writer also picks up anything
+    # journaled but not applied before a restart.
+    from app.services.review_journal import (
+        start_review_writer,
+        stop_review_writer,
+        write_behind_enabled,
+    )
+    if write_behind_enabled():
+        start_review_writer().notify()
+
+    startup_profile.mark_lifespan_done()
     yield
+    stop_review_writer()
 
 
 app = FastAPI(title="Alif Arabic Learning API", version="0.1.0", lifespan=lifespan)
@@ -113,6 +151,7 @@ app.include_router(podcast.router)
 # code coupling to polyglot.
 app.include_router(polyglot_proxy.router)
 app.include_router(discover.router)
+app.include_router(search.router)
 
 # Serve voice samples for comparison testing
 from pathlib import Path as _Path
@@ -125,3 +164,12 @@ if _voice_dir.exists():
 @app.get("/")
 def root():
     return {"app": "alif", "version": "0.1.0"}
+
+
+@app.get("/api/debug/startup")
+def debug_startup():
+    """Import/lifespan timings and which heavy dependencies are loaded."""
+    return startup_profile.report()
+
+
+startup_profile.mark_imported(_IMPORT_STARTED)
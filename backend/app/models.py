@@ -1,11 +1,11 @@
-from datetime import datetime, timezone
 from sqlalchemy import (
     Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Boolean,
-    UniqueConstraint,
+    Index, UniqueConstraint,
     event,
 )
 from sqlalchemy.orm import relationship, validates
 
+from app import clock
 from app.database import Base
 
 
@@ -26,7 +26,7 @@ class Lemma(Base):
 
     lemma_id = Column(Integer, primary_key=True, autoincrement=True)
     lemma_ar = Column(Text, nullable=False)        # diacritized
-    lemma_ar_bare = Column(Text, nullable=False)    # stripped
+    lemma_ar_bare = Column(Text, nullable=False, index=True)    # stripped, alef-normalized
     root_id = Column(Integer, ForeignKey("roots.root_id"), nullable=True)
     pos = Column(String(20))
     gloss_en = Column(Text)
@@ -59,14 +59,38 @@ class Lemma(Base):
     # for the standard MSA curriculum. register: neutral|literary|colloquial|vulgar|clinical
     register = Column(String(20), nullable=True)
     dialect = Column(String(20), nullable=True)  # msa|gulf|egyptian|levantine|mixed
+    # Variant-detection index (services/variant_detection.py): deduplicated
+    # CAMeL analyses as [lex_norm, lex_bare, enc0, lex] (NULL = not analysed
+    # yet), mirrored into variant_lex_index; variants_checked_at NULL marks the
+    # lemma for the next change-driven sweep. Both reset on relevant edits.
+    variant_analyses_json = Column(JSON(none_as_null=True), nullable=True)
+    variants_checked_at = Column(DateTime, nullable=True, index=True)
 
     @validates("lemma_ar_bare")
     def _normalize_bare(self, key, value):
         """Normalize alef variants (أإآٱ→ا) on write to prevent lookup mismatches."""
         if value:
             value = value.replace("أ", "ا").replace("إ", "ا").replace("آ", "ا").replace("ٱ", "ا")
+        self._invalidate_variants(key, value, reanalyse=True)
         return value
 
+    @validates("lemma_ar")
+    def _lemma_ar_changed(self, key, value):
+        self._invalidate_variants(key, value, reanalyse=True)
+        return value
+
+    @validates("gloss_en", "root_id", "canonical_lemma_id")
+    def _variant_inputs_changed(self, key, value):
+        self._invalidate_variants(key, value, reanalyse=False)
+        return value
+
+    def _invalidate_variants(self, key, value, *, reanalyse):
+        if getattr(self, key) == value:
+            return
+        self.variants_checked_at = None
+        if reanalyse:
+            self.variant_analyses_json = None
+
     root = relationship("Root", back_populates="lemmas")
     canonical_lemma = relationship("Lemma", remote_side="Lemma.lemma_id", foreign_keys=[canonical_lemma_id])
     source_story = relationship("Story", foreign_keys=[source_story_id])
@@ -151,8 +175,8 @@ class FrequencyCoreEntry(Base):
     gap_status = Column(String(30), nullable=True)
     source_flags_json = Column(JSON, nullable=True)
     excluded_reason = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
+    updated_at = Column(DateTime, default=clock.now)
 
     lemma = relationship("Lemma", foreign_keys=[lemma_id])
 
@@ -173,22 +197,42 @@ class MaterialJob(Base):
     lease_until = Column(DateTime, nullable=True, index=True)
     last_error = Column(Text, nullable=True)
     result_json = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime, default=clock.now, index=True)
     updated_at = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=clock.now,
+        onupdate=clock.now,
     )
     completed_at = Column(DateTime, nullable=True)
 
 
+class ReviewJournalEntry(Base):
+    """A sentence review accepted by the API but not yet applied.
+
+    Write-behind ingestion (services/review_journal.py): the request appends
+    here and returns; a single writer applies entries in ``id`` order.
+    """
+
+    __tablename__ = "review_journal"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    client_review_id = Column(String(50), nullable=True, unique=True)
+    status = Column(String(20), nullable=False, default="pending", index=True)  # pending/applied/duplicate/failed
+    source = Column(String(20), nullable=False, default="submit")  # submit/sync
+    payload_json = Column(JSON, nullable=False, default=dict)
+    received_at = Column(DateTime, nullable=False, default=clock.utcnow)
+    applied_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+
 class ReviewLog(Base):
     __tablename__ = "review_log"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     lemma_id = Column(Integer, ForeignKey("lemmas.lemma_id"), nullable=False, index=True)
     rating = Column(Integer, nullable=False)  # 1-4
-    reviewed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    reviewed_at = Column(DateTime, default=clock.now, index=True)
     response_ms = Column(Integer)
     context = Column(Text)
     session_id = Column(String(50), index=True)
@@ -284,7 +328,7 @@ class WordReviewEvidence(Base):
     failure_causes_json = Column(JSON, nullable=True)
     created_at = Column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=clock.now,
         nullable=False,
         index=True,
     )
@@ -313,12 +357,17 @@ class Sentence(Base):
     created_at = Column(DateTime, nullable=True)
     page_number = Column(Integer, nullable=True)
     mappings_verified_at = Column(DateTime, nullable=True)
+    mappings_verified_fingerprint = Column(String(32), nullable=True)  # verifier inputs at last clean pass (mapping_rescue)
     quality_reviewed_at = Column(DateTime, nullable=True)
     quality_natural = Column(Boolean, nullable=True)
     quality_translation_correct = Column(Boolean, nullable=True)
     quality_reason = Column(Text, nullable=True)
     root_focus_id = Column(Integer, ForeignKey("roots.root_id"), nullable=True, index=True)
     kind = Column(String(30), nullable=True, index=True)
+    # Normalized text + MinHash signature for near-duplicate lookups
+    # (services/sentence_fingerprint.py). Derived from arabic_text on write.
+    text_fingerprint = Column(Text, nullable=True, index=True)
+    text_minhash = Column(JSON, nullable=True)
 
     story = relationship("Story", foreign_keys=[story_id])
     root_focus = relationship("Root", foreign_keys=[root_focus_id])
@@ -326,6 +375,16 @@ class Sentence(Base):
     review_logs = relationship("SentenceReviewLog", back_populates="sentence")
     grammar_features = relationship("SentenceGrammarFeature", back_populates="sentence")
 
+    @validates("arabic_text")
+    def _derive_fingerprint(self, key, value):
+        """Keep text_fingerprint/text_minhash in step with arabic_text."""
+        from app.services.sentence_fingerprint import minhash_signature, text_fingerprint
+
+        fingerprint = text_fingerprint(value)
+        self.text_fingerprint = fingerprint
+        self.text_minhash = minhash_signature(fingerprint)
+        return value
+
 
 class SentenceWord(Base):
     __tablename__ = "sentence_words"
@@ -347,7 +406,7 @@ class SentenceReviewLog(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     sentence_id = Column(Integer, ForeignKey("sentences.id"), nullable=False)
     session_id = Column(String(50), nullable=True, index=True)
-    reviewed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    reviewed_at = Column(DateTime, default=clock.now, index=True)
     comprehension = Column(String(20), nullable=False)  # understood/partial/no_idea
     response_ms = Column(Integer, nullable=True)
     review_mode = Column(String(20), default="reading")
@@ -366,7 +425,7 @@ class ConfusionCapture(Base):
     # Product semantics: 1=missed, 2=recognized only after reveal, 3/4=unaided
     # recall. FSRS policy may translate the stored rating before scheduling.
     rating = Column(Integer, nullable=False)
-    captured_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    captured_at = Column(DateTime, default=clock.now, index=True)
 
     # Exactly one of these two is populated, governed by capture_method
     capture_method = Column(String(20), nullable=False)  # 'suggested_pick' | 'free_text'
@@ -456,7 +515,7 @@ class Story(Base):
     audio_filename = Column(String(100), nullable=True)
     voice_id = Column(String(50), nullable=True)
     metadata_json = Column(JSON, nullable=True)  # format-specific data (breakdown halves, arabic explanations)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
     completed_at = Column(DateTime, nullable=True)
 
     words = relationship("StoryWord", back_populates="story", order_by="StoryWord.position")
@@ -493,7 +552,7 @@ class PageUpload(Base):
     existing_words = Column(Integer, default=0)
     textbook_page_number = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
     completed_at = Column(DateTime, nullable=True)
 
 
@@ -506,7 +565,7 @@ class ChatMessage(Base):
     role = Column(String(20), nullable=False)  # user/assistant
     content = Column(Text, nullable=False)
     context_summary = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
 
 
 class ContentFlag(Base):
@@ -520,7 +579,7 @@ class ContentFlag(Base):
     original_value = Column(Text, nullable=True)
     corrected_value = Column(Text, nullable=True)
     resolution_note = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
     resolved_at = Column(DateTime, nullable=True)
 
     lemma = relationship("Lemma")
@@ -534,7 +593,7 @@ class ActivityLog(Base):
     event_type = Column(String(50), nullable=False, index=True)  # flag_resolved, sentences_generated, backfill_completed, etc.
     summary = Column(Text, nullable=False)
     detail_json = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=clock.now)
 
 
 class VariantDecision(Base):
@@ -545,7 +604,17 @@ class VariantDecision(Base):
     base_bare = Column(Text, nullable=False, index=True)
     is_variant = Column(Boolean, nullable=False)
     reason = Column(Text, nullable=True)
-    decided_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    decided_at = Column(DateTime, default=clock.now)
+
+
+class VariantLexIndex(Base):
+    """Reverse index lemma -> alef-normalized CAMeL lex of its analyses, so a
+    new lemma finds the existing words that could be its variants."""
+    __tablename__ = "variant_lex_index"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    lemma_id = Column(Integer, ForeignKey("lemmas.lemma_id"), nullable=False, index=True)
+    lex_norm = Column(Text, nullable=False, index=True)
 
 
 class PatternInfo(Base):
@@ -596,7 +665,7 @@ class QuranicVerse(Base):
     last_rating = Column(String(20), nullable=True)
     last_reviewed = Column(DateTime, nullable=True)
     times_reviewed = Column(Integer, default=0)
-    introduced_at = Column(DateTime, nullable=True)
+    introduced_at = Column(DateTime, nullable=True, index=True)
 
     # Lemmatization tracking
     lemmatized_at = Column(DateTime, nullable=True)
@@ -605,6 +674,10 @@ class QuranicVerse(Base):
 
     __table_args__ = (
         UniqueConstraint("surah", "ayah", name="uq_surah_ayah"),
+        # Due-verse scan: range on next_due, level checked in the index.
+        Index("ix_quranic_verses_due", "next_due", "srs_level"),
+        # Next unseen lemmatized verse in reading order.
+        Index("ix_quranic_verses_queue", "srs_level", "surah", "ayah", "lemmatized_at"),
     )
 
 
@@ -620,3 +693,119 @@ class QuranicVerseWord(Base):
 
     verse = relationship("QuranicVerse", back_populates="words")
     lemma = relationship("Lemma")
+
+
+class QuranScheduleState(Base):
+    """Single-row verse scheduling counters (services/quran_service.py).
+
+    ``backlog_count`` = learning verses (level 1-7) whose last rating was not
+    got_it; adjusted by submit_verse_review, recomputed if the row is missing.
+    """
+
+    __tablename__ = "quran_schedule_state"
+
+    id = Column(Integer, primary_key=True)
+    backlog_count = Column(Integer, nullable=False, default=0)
+
+
+class KnowledgeVersion(Base):
+    """Single-row counter bumped by triggers on every write to the tables
+    aggregate endpoints read (services/knowledge_version.py)."""
+
+    __tablename__ = "knowledge_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class TableVersion(Base):
+    """Per-table write counter for the same tracked tables, bumped by
+    sibling triggers (services/knowledge_version.py)."""
+
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class AnalyticsSnapshot(Base):
+    """One precomputed deep-analytics section, keyed by a hash of the
+    table versions and clock bucket it was computed from
+    (services/analytics_snapshot.py)."""
+
+    __tablename__ = "analytics_snapshots"
+
+    section = Column(String(50), primary_key=True)
+    inputs_key = Column(String(32), nullable=False)
+    payload = Column(JSON, nullable=True)
+    computed_at = Column(DateTime, nullable=False)
+
+
+class _ProgressCounts:
+    """Columns shared by the materialized progress tables
+    (services/progress_summary.py); maintained by triggers."""
+
+    total_words = Column(Integer, nullable=False, default=0, server_default="0")
+    encountered_count = Column(Integer, nullable=False, default=0, server_default="0")
+    acquiring_count = Column(Integer, nullable=False, default=0, server_default="0")
+    learning_count = Column(Integer, nullable=False, default=0, server_default="0")
+    known_count = Column(Integer, nullable=False, default=0, server_default="0")
+    lapsed_count = Column(Integer, nullable=False, default=0, server_default="0")
+    suspended_count = Column(Integer, nullable=False, default=0, server_default="0")
+    covered_words = Column(Integer, nullable=False, default=0, server_default="0")  # acquiring+learning+known
+    known_ratio = Column(Float, nullable=False, default=0.0, server_default="0")
+    last_activity_at = Column(DateTime, nullable=True)
+
+
+class RootProgress(_ProgressCounts, Base):
+    __tablename__ = "root_progress"
+
+    root_id = Column(Integer, ForeignKey("roots.root_id"), primary_key=True, autoincrement=False)
+
+
+class PatternProgress(_ProgressCounts, Base):
+    __tablename__ = "pattern_progress"
+
+    wazn = Column(String(30), primary_key=True)
+    wazn_meaning = Column(Text, nullable=True)
+
+
+class ChimeraAuditResult(Base):
+    """Stored chimera audit verdict per canonical lemma, keyed by hashes of
+    the fields each check reads (services/chimera_audit.py)."""
+
+    __tablename__ = "chimera_audit_results"
+
+    lemma_id = Column(Integer, primary_key=True, autoincrement=False)
+    structural_hash = Column(String(32), nullable=False)
+    category = Column(String(4), nullable=True)  # D1..D5, NULL=clean
+    note = Column(Text, nullable=True)
+    etymology_hash = Column(String(32), nullable=True)  # NULL=D6 not yet decided
+    etymology_note = Column(Text, nullable=True)  # LLM-confirmed D6 finding
+    audited_at = Column(DateTime, nullable=True)
+
+
+# The FTS5 search index (services/search_index.py), the knowledge-version
+# triggers (services/knowledge_version.py) and the progress-summary triggers
+# (services/progress_summary.py) are raw SQL, so create_all() (fresh and test
+# databases) installs them here; production gets them from alembic.
+@event.listens_for(Base.metadata, "after_create")
+def _install_search_index(target, connection, **kw):
+    from app.services.knowledge_version import install_knowledge_version
+    from app.services.progress_summary import install_progress_triggers
+    from app.services.search_index import install_search_index
+    from app.services.sentence_fingerprint import (
+        install_fingerprint_trigger,
+        reset_shared_index,
+    )
+    install_search_index(connection)
+    install_knowledge_version(connection)
+    install_progress_triggers(connection)
+    install_fingerprint_trigger(connection)
+    reset_shared_index()
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    from app.services.search_index import drop_search_index
+    drop_search_index(connection)
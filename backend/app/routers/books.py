@@ -34,12 +34,15 @@ def _save_uploads(images: list[bytes]) -> Path:
 async def import_book_endpoint(
     files: list[UploadFile] = File(...),
     title: str | None = Query(default=None),
+    resume_story_id: int | None = Query(default=None),
     db: Session = Depends(get_db),
 ):
     """Import a children's book from page photos.
 
     First image is treated as the cover/title page (for metadata extraction).
-    Remaining images are content pages in reading order.
+    Remaining images are content pages in reading order. Pages are committed
+    in chunks; re-upload the same images with ``resume_story_id`` to continue
+    an import that stopped part-way.
     """
     if len(files) < 2:
         raise HTTPException(
@@ -70,6 +73,7 @@ async def import_book_endpoint(
             cover_image=cover_image,
             page_images=page_images,
             title_override=title,
+            resume_story_id=resume_story_id,
         )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
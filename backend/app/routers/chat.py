@@ -1,13 +1,16 @@
 """AI chat endpoints for asking questions about Arabic learning."""
 
+import json
 import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import SessionLocal, get_db, set_session_context
 from app.models import ChatMessage
 from app.schemas import (
     AskQuestionIn,
@@ -17,7 +20,7 @@ from app.schemas import (
     ConversationSummary,
 )
 from app.services.interaction_logger import log_interaction
-from app.services.llm import generate_completion
+from app.services.llm import generate_completion, stream_completion
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/chat", tags=["chat"])
@@ -31,10 +34,7 @@ CHAT_SYSTEM_PROMPT = (
 )
 
 
-@router.post("/ask", response_model=AskQuestionOut)
-def ask_question(body: AskQuestionIn, db: Session = Depends(get_db)):
-    conversation_id = body.conversation_id or uuid.uuid4().hex
-
+def _build_chat_prompt(db: Session, body: AskQuestionIn, conversation_id: str) -> str:
     # Read conversation history
     previous = (
         db.query(ChatMessage)
@@ -50,19 +50,12 @@ def ask_question(body: AskQuestionIn, db: Session = Depends(get_db)):
         prefix = "User" if msg.role == "user" else "Assistant"
         parts.append(f"{prefix}: {msg.content}")
     parts.append(f"User: {body.question}")
-    prompt = "\n\n".join(parts)
+    return "\n\n".join(parts)
 
-    # LLM call — use Anthropic API directly (not Claude CLI) for fast interactive response
-    result = generate_completion(
-        prompt=prompt,
-        system_prompt=CHAT_SYSTEM_PROMPT,
-        json_mode=False,
-        temperature=0.7,
-        model_override="anthropic",
-        task_type="chat",
-    )
-    answer = result["content"]
 
+def _persist_exchange(
+    db: Session, body: AskQuestionIn, conversation_id: str, answer: str,
+) -> None:
     # Persist messages — best-effort so DB lock doesn't crash the response
     try:
         db.add(ChatMessage(
@@ -91,9 +84,89 @@ def ask_question(body: AskQuestionIn, db: Session = Depends(get_db)):
         context=body.context[:200] if body.context else None,
     )
 
+
+@router.post("/ask", response_model=AskQuestionOut)
+def ask_question(body: AskQuestionIn, db: Session = Depends(get_db)):
+    conversation_id = body.conversation_id or uuid.uuid4().hex
+    prompt = _build_chat_prompt(db, body, conversation_id)
+
+    # LLM call — use Anthropic API directly (not Claude CLI) for fast interactive response
+    result = generate_completion(
+        prompt=prompt,
+        system_prompt=CHAT_SYSTEM_PROMPT,
+        json_mode=False,
+        temperature=0.7,
+        model_override="anthropic",
+        task_type="chat",
+    )
+    answer = result["content"]
+
+    _persist_exchange(db, body, conversation_id, answer)
+
     return AskQuestionOut(answer=answer, conversation_id=conversation_id)
 
 
+def _with_chat_session(fn, *args):
+    # The streaming endpoint runs on the event loop; each DB step opens its
+    # own short session in the threadpool rather than holding a request one
+    # for the life of the stream.
+    db = SessionLocal()
+    set_session_context(db, "chat.ask_stream")
+    try:
+        return fn(db, *args)
+    finally:
+        db.close()
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/ask/stream")
+async def ask_question_stream(body: AskQuestionIn):
+    """Server-sent-events variant of `/ask`.
+
+    Emits ``start`` (conversation_id), one ``token`` per streamed delta,
+    then ``done`` with the full answer — or ``error`` if the model fails.
+    The exchange is persisted once, after the last token; a failed or
+    abandoned stream persists nothing, same as a failed `/ask`.
+    """
+    conversation_id = body.conversation_id or uuid.uuid4().hex
+    prompt = await run_in_threadpool(
+        _with_chat_session, _build_chat_prompt, body, conversation_id,
+    )
+
+    async def events():
+        yield _sse("start", {"conversation_id": conversation_id})
+        chunks: list[str] = []
+        try:
+            async for delta in stream_completion(
+                prompt=prompt,
+                system_prompt=CHAT_SYSTEM_PROMPT,
+                temperature=0.7,
+                model_override="anthropic",
+                task_type="chat",
+            ):
+                chunks.append(delta)
+                yield _sse("token", {"text": delta})
+        except Exception as e:
+            logger.warning("Chat stream failed for %s: %s", conversation_id, e)
+            yield _sse("error", {"conversation_id": conversation_id, "detail": str(e)})
+            return
+
+        answer = "".join(chunks)
+        await run_in_threadpool(
+            _with_chat_session, _persist_exchange, body, conversation_id, answer,
+        )
+        yield _sse("done", {"conversation_id": conversation_id, "answer": answer})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/conversations", response_model=list[ConversationSummary])
 def list_conversations(limit: int = 50, db: Session = Depends(get_db)):
     # Subquery: latest created_at per conversation
@@ -218,6 +218,7 @@ def quiz_result(req: QuizResultRequest, db: Session = Depends(get_db)):
         rating=rating,
         comprehension_signal="understood" if req.got_it else "no_idea",
     )
+    result.pop("review_log", None)
     return result
 
 
@@ -1,75 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
 from app.database import get_db
 from app.models import Lemma, PatternInfo, Root, UserLemmaKnowledge
+from app.services.knowledge_version import knowledge_cached
+from app.services.progress_summary import MAX_PAGE_SIZE, list_pattern_progress
 
 router = APIRouter(prefix="/api/patterns", tags=["patterns"])
 
 
 @router.get("")
-def list_patterns(db: Session = Depends(get_db)):
-    """List all wazn patterns with word counts and coverage stats."""
-    rows = (
-        db.query(
-            Lemma.wazn,
-            Lemma.wazn_meaning,
-            func.count(Lemma.lemma_id).label("total"),
+def list_patterns(
+    request: Request,
+    sort: str = Query("total"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: str | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    """List wazn patterns with word counts and coverage stats.
+
+    Served from pattern_progress. Without ``limit`` returns every pattern;
+    with it, pass the last ``wazn`` as ``after`` to get the next page.
+    """
+    try:
+        return knowledge_cached(
+            request, db, lambda: list_pattern_progress(db, sort=sort, limit=limit, after=after),
         )
-        .filter(Lemma.wazn.isnot(None), Lemma.canonical_lemma_id.is_(None))
-        .group_by(Lemma.wazn)
-        .order_by(func.count(Lemma.lemma_id).desc())
-        .all()
-    )
-
-    wazn_list = [r.wazn for r in rows]
-    known_counts: dict[str, int] = {}
-    if wazn_list:
-        known_rows = (
-            db.query(
-                Lemma.wazn,
-                func.count(Lemma.lemma_id).label("known"),
-            )
-            .join(UserLemmaKnowledge)
-            .filter(
-                Lemma.wazn.isnot(None),
-                Lemma.canonical_lemma_id.is_(None),
-                UserLemmaKnowledge.knowledge_state.in_(["known", "learning", "acquiring"]),
-            )
-            .group_by(Lemma.wazn)
-            .all()
-        )
-        known_counts = {r.wazn: r.known for r in known_rows}
-
-    enriched_wazns: set[str] = set()
-    if wazn_list:
-        enriched_rows = (
-            db.query(PatternInfo.wazn)
-            .filter(PatternInfo.wazn.in_(wazn_list), PatternInfo.enrichment_json.isnot(None))
-            .all()
-        )
-        enriched_wazns = {r.wazn for r in enriched_rows}
-
-    return [
-        {
-            "wazn": r.wazn,
-            "wazn_meaning": r.wazn_meaning,
-            "total_words": r.total,
-            "known_words": known_counts.get(r.wazn, 0),
-            "coverage_pct": round(known_counts.get(r.wazn, 0) / r.total * 100, 1) if r.total > 0 else 0,
-            "has_enrichment": r.wazn in enriched_wazns,
-        }
-        for r in rows
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{wazn}")
-def get_pattern(wazn: str, db: Session = Depends(get_db)):
+def get_pattern(wazn: str, request: Request, db: Session = Depends(get_db)):
     """Get all words with a specific wazn pattern."""
+    return knowledge_cached(request, db, lambda: _get_pattern(db, wazn))
+
+
+def _get_pattern(db: Session, wazn: str) -> dict:
     lemmas = (
         db.query(Lemma)
         .outerjoin(UserLemmaKnowledge)
+        .options(contains_eager(Lemma.knowledge), joinedload(Lemma.root))
         .filter(Lemma.wazn == wazn, Lemma.canonical_lemma_id.is_(None))
         .order_by(Lemma.frequency_rank.asc().nullslast())
         .all()
@@ -105,8 +76,12 @@ def get_pattern(wazn: str, db: Session = Depends(get_db)):
 
 
 @router.get("/roots/{root_id}/tree")
-def root_tree(root_id: int, db: Session = Depends(get_db)):
+def root_tree(root_id: int, request: Request, db: Session = Depends(get_db)):
     """Get full derivation tree for a root — all words grouped by pattern."""
+    return knowledge_cached(request, db, lambda: _root_tree(db, root_id))
+
+
+def _root_tree(db: Session, root_id: int) -> dict:
     root = db.query(Root).filter(Root.root_id == root_id).first()
     if not root:
         raise HTTPException(404, "Root not found")
@@ -114,6 +89,7 @@ def root_tree(root_id: int, db: Session = Depends(get_db)):
     lemmas = (
         db.query(Lemma)
         .outerjoin(UserLemmaKnowledge)
+        .options(contains_eager(Lemma.knowledge))
         .filter(Lemma.root_id == root_id, Lemma.canonical_lemma_id.is_(None))
         .order_by(Lemma.frequency_rank.asc().nullslast())
         .all()
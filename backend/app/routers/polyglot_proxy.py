@@ -25,7 +25,6 @@ from __future__ import annotations
 
 import os
 
-import httpx
 from fastapi import APIRouter, Request, Response
 
 router = APIRouter(prefix="/polyglot", tags=["polyglot-proxy"])
@@ -48,7 +47,8 @@ _HOP_BY_HOP = {
     "content-length",
 }
 
-# Single shared async client. FastAPI's lifespan would be the strict place
+# Single shared async client, created on the first proxied request so API
+# startup doesn't import httpx. FastAPI's lifespan would be the strict place
 # to manage this, but a module-level client is simpler and httpx handles
 # pooling internally. The connect timeout is short (5s) because polyglot
 # is on localhost — if it's not up, fail fast.
@@ -57,10 +57,19 @@ _HOP_BY_HOP = {
 # HTTPS_PROXY / ALL_PROXY env var in the shell that started uvicorn would
 # otherwise route loopback traffic through the proxy and break it (also
 # triggers a `socksio not installed` ImportError under tests).
-_client = httpx.AsyncClient(
-    timeout=httpx.Timeout(_PROXY_TIMEOUT_S, connect=5.0),
-    trust_env=False,
-)
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(_PROXY_TIMEOUT_S, connect=5.0),
+            trust_env=False,
+        )
+    return _client
 
 
 @router.api_route(
@@ -68,6 +77,8 @@ _client = httpx.AsyncClient(
     methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"],
 )
 async def proxy(request: Request, path: str) -> Response:
+    import httpx
+
     upstream_url = f"{POLYGLOT_UPSTREAM}/{path}"
     forwarded_headers = {
         k: v for k, v in request.headers.items()
@@ -76,7 +87,7 @@ async def proxy(request: Request, path: str) -> Response:
     body = await request.body()
 
     try:
-        upstream = await _client.request(
+        upstream = await _get_client().request(
             request.method,
             upstream_url,
             params=request.query_params,
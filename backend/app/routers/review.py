@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from pydantic import BaseModel as PydanticBaseModel
+from pydantic import BaseModel as PydanticBaseModel, ValidationError
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import case, func
@@ -31,9 +31,19 @@ from app.schemas import (
     RecapIn,
 )
 from app.services.listening import get_listening_candidates
+from app.services.review_journal import (
+    append_review,
+    apply_pending_reviews,
+    has_pending_reviews,
+    write_behind_enabled,
+)
 from app.services.interaction_logger import log_interaction
 from app.services.sentence_selector import build_session
-from app.services.sentence_review_service import submit_sentence_review, undo_sentence_review
+from app.services.sentence_review_service import (
+    submit_sentence_review,
+    submit_sentence_reviews_batch,
+    undo_sentence_review,
+)
 from app.services.sentence_eligibility import (
     MAPPING_VERIFICATION_HARDENED_AT,
     reviewable_sentence_clauses,
@@ -53,6 +63,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/review", tags=["review"])
 
 
+def _apply_journaled_reviews(db: Session) -> None:
+    """Read-your-writes for write-behind ingestion: apply any journaled
+    reviews before reading review state. With write-behind off nothing new
+    is journaled, so only leftovers from an earlier run take the apply
+    lock; an empty journal costs one indexed query and no lock."""
+    if not write_behind_enabled() and not has_pending_reviews(db):
+        return
+    apply_pending_reviews(db)
+
+
 def _review_card_key(log_id: int, client_review_id: str | None) -> str:
     """Collapse one passage card's child-sentence log IDs into one card key."""
     if not client_review_id:
@@ -215,6 +235,7 @@ def next_listening_cards(
     Only returns cards where the sentence words (excluding target)
     are well-known enough for the user to focus on aural recognition.
     """
+    _apply_journaled_reviews(db)
     return get_listening_candidates(
         db, limit=limit, max_word_count=max_words, min_confidence=min_confidence
     )
@@ -242,6 +263,7 @@ def next_sentences(
     )
     set_session_context(db, context_label)
     with db_operation_context(context_label):
+        _apply_journaled_reviews(db)
         base_exclude = set(exclude) if exclude else set()
         result = build_session(
             db, limit=limit, mode=mode,
@@ -326,14 +348,36 @@ def warm_sentences(background_tasks: BackgroundTasks):
     builds faster (sentences already in DB, no on-demand generation needed).
     Returns 202 immediately; generation runs in background.
     """
+    from app.routers.stats import DEEP_ANALYTICS_SECTIONS
+    from app.services.analytics_snapshot import refresh_snapshot
+    from app.services.material_daemon import nudge_material_daemon
     from app.services.material_generator import warm_sentence_cache
     background_tasks.add_task(warm_sentence_cache)
+    # End of a session: let the resident maintenance daemon (if deployed)
+    # start its pass now rather than at the next 3-hour tick.
+    background_tasks.add_task(nudge_material_daemon, "session_end")
+    # ...and bring the deep-analytics snapshot up to date with the session.
+    background_tasks.add_task(refresh_snapshot, DEEP_ANALYTICS_SECTIONS)
     return {"status": "warming"}
 
 
 @router.post("/submit-sentence", response_model=SentenceReviewSubmitOut)
 def submit_sentence(body: SentenceReviewSubmitIn, db: Session = Depends(get_db)):
-    """Submit a sentence-level review."""
+    """Submit a sentence-level review.
+
+    With write-behind ingestion on, the review is journaled and applied by
+    the review journal writer; the response has ``queued=True`` and no
+    word results.
+    """
+    if write_behind_enabled():
+        _entry, duplicate = append_review(
+            db,
+            body.model_dump(mode="json"),
+            client_review_id=body.client_review_id,
+            source="submit",
+        )
+        return {"word_results": [], "queued": not duplicate}
+
     result = submit_sentence_review(
         db,
         sentence_id=body.sentence_id,
@@ -589,6 +633,38 @@ def word_lookup(lemma_id: int, db: Session = Depends(get_db)):
     return result
 
 
+def _aware_utc(value: datetime | None) -> datetime:
+    if value is None:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _sync_review_kwargs(item) -> dict:
+    """`submit_sentence_review` kwargs for one offline-queued sentence review."""
+    payload = item.payload
+    raw_word_evidence = payload.get("word_review_evidence")
+    return dict(
+        sentence_id=payload.get("sentence_id"),
+        sentence_ids=payload.get("sentence_ids") or [],
+        primary_lemma_id=payload["primary_lemma_id"],
+        comprehension_signal=payload["comprehension_signal"],
+        missed_lemma_ids=payload.get("missed_lemma_ids", []),
+        confused_lemma_ids=payload.get("confused_lemma_ids", []),
+        confusion_candidate_lemma_ids=payload.get("confusion_candidate_lemma_ids", {}),
+        confusion_captures=payload.get("confusion_captures") or [],
+        response_ms=payload.get("response_ms"),
+        session_id=payload.get("session_id"),
+        review_mode=payload.get("review_mode", "reading"),
+        client_review_id=item.client_review_id,
+        word_evidence_protocol_version=payload.get(
+            "word_evidence_protocol_version"
+        ),
+        word_review_evidence=(
+            raw_word_evidence if isinstance(raw_word_evidence, list) else []
+        ),
+    )
+
+
 @router.post("/sync")
 def sync_reviews(body: BulkSyncIn, db: Session = Depends(get_db)):
     results = []
@@ -627,80 +703,101 @@ def sync_reviews(body: BulkSyncIn, db: Session = Depends(get_db)):
                     fast_count=fast_count,
                 )
 
-    for item in body.reviews:
-        if item.client_review_id in glitch_ids:
-            continue
-        try:
-            if item.type == "sentence":
-                payload = item.payload
-                raw_word_evidence = payload.get("word_review_evidence")
-                word_review_evidence = (
-                    raw_word_evidence
-                    if isinstance(raw_word_evidence, list)
-                    else []
-                )
-                result = submit_sentence_review(
-                    db,
+    journal = write_behind_enabled()
+    items = [item for item in body.reviews if item.client_review_id not in glitch_ids]
+    # Per-request-position result slots, filled in application order.
+    slots: list[dict | None] = [None] * len(items)
+    # Offline catch-up applies reviews in the order they were made (client
+    # created_at, else request order) across item types. Consecutive
+    # sentence reviews share one prefetch and are committed in bounded
+    # chunks; any other item first flushes the pending sentence run.
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (items[i].created_at is None, _aware_utc(items[i].created_at), i),
+    )
+    run: list[tuple[int, dict]] = []
+
+    def flush_run() -> None:
+        if not run:
+            return
+        outcomes = submit_sentence_reviews_batch(db, [kwargs for _i, kwargs in run])
+        for (i, kwargs), outcome in zip(run, outcomes):
+            item = items[i]
+            payload = item.payload
+            if outcome["status"] == "error":
+                slots[i] = {"client_review_id": item.client_review_id, "status": "error", "error": outcome["error"]}
+                continue
+            result = outcome["result"]
+            if outcome["status"] == "ok":
+                word_review_evidence = kwargs["word_review_evidence"]
+                log_interaction(
+                    event="sentence_review",
                     sentence_id=payload.get("sentence_id"),
                     sentence_ids=payload.get("sentence_ids") or [],
-                    primary_lemma_id=payload["primary_lemma_id"],
+                    lemma_id=payload["primary_lemma_id"],
                     comprehension_signal=payload["comprehension_signal"],
                     missed_lemma_ids=payload.get("missed_lemma_ids", []),
                     confused_lemma_ids=payload.get("confused_lemma_ids", []),
                     confusion_candidate_lemma_ids=payload.get("confusion_candidate_lemma_ids", {}),
-                    confusion_captures=payload.get("confusion_captures") or [],
                     response_ms=payload.get("response_ms"),
                     session_id=payload.get("session_id"),
                     review_mode=payload.get("review_mode", "reading"),
-                    client_review_id=item.client_review_id,
+                    words_reviewed=len(result.get("word_results", [])),
+                    collateral_count=len([w for w in result.get("word_results", []) if w.get("credit_type") == "collateral"]),
+                    word_ratings={w["lemma_id"]: w["rating"] for w in result.get("word_results", []) if "lemma_id" in w and "rating" in w},
+                    form_recovery_protected_lemma_ids=[
+                        w["lemma_id"]
+                        for w in result.get("word_results", [])
+                        if w.get("form_recovery_protected")
+                    ],
+                    audio_play_count=payload.get("audio_play_count"),
+                    lookup_count=payload.get("lookup_count"),
+                    parent_card_type=payload.get("parent_card_type"),
+                    rating2_prompt_shown_sentence_word_ids=payload.get(
+                        "rating2_prompt_shown_sentence_word_ids"
+                    )
+                    or [],
+                    failure_cause_prompt_shown_sentence_word_ids=payload.get(
+                        "failure_cause_prompt_shown_sentence_word_ids"
+                    )
+                    or [],
                     word_evidence_protocol_version=payload.get(
                         "word_evidence_protocol_version"
                     ),
-                    word_review_evidence=word_review_evidence,
+                    word_evidence_count=len(
+                        word_review_evidence
+                    ),
+                    word_evidence_saved=result.get("word_evidence_saved", 0),
+                    source="sync",
                 )
-                status = "duplicate" if result.get("duplicate") else "ok"
-                if status != "duplicate":
-                    log_interaction(
-                        event="sentence_review",
-                        sentence_id=payload.get("sentence_id"),
-                        sentence_ids=payload.get("sentence_ids") or [],
-                        lemma_id=payload["primary_lemma_id"],
-                        comprehension_signal=payload["comprehension_signal"],
-                        missed_lemma_ids=payload.get("missed_lemma_ids", []),
-                        confused_lemma_ids=payload.get("confused_lemma_ids", []),
-                        confusion_candidate_lemma_ids=payload.get("confusion_candidate_lemma_ids", {}),
-                        response_ms=payload.get("response_ms"),
-                        session_id=payload.get("session_id"),
-                        review_mode=payload.get("review_mode", "reading"),
-                        words_reviewed=len(result.get("word_results", [])),
-                        collateral_count=len([w for w in result.get("word_results", []) if w.get("credit_type") == "collateral"]),
-                        word_ratings={w["lemma_id"]: w["rating"] for w in result.get("word_results", []) if "lemma_id" in w and "rating" in w},
-                        form_recovery_protected_lemma_ids=[
-                            w["lemma_id"]
-                            for w in result.get("word_results", [])
-                            if w.get("form_recovery_protected")
-                        ],
-                        audio_play_count=payload.get("audio_play_count"),
-                        lookup_count=payload.get("lookup_count"),
-                        parent_card_type=payload.get("parent_card_type"),
-                        rating2_prompt_shown_sentence_word_ids=payload.get(
-                            "rating2_prompt_shown_sentence_word_ids"
-                        )
-                        or [],
-                        failure_cause_prompt_shown_sentence_word_ids=payload.get(
-                            "failure_cause_prompt_shown_sentence_word_ids"
-                        )
-                        or [],
-                        word_evidence_protocol_version=payload.get(
-                            "word_evidence_protocol_version"
-                        ),
-                        word_evidence_count=len(
-                            word_review_evidence
-                        ),
-                        word_evidence_saved=result.get("word_evidence_saved", 0),
-                        source="sync",
+            slots[i] = {"client_review_id": item.client_review_id, "status": outcome["status"]}
+        run.clear()
+
+    for i in order:
+        item = items[i]
+        if item.type == "sentence" and not journal:
+            try:
+                run.append((i, _sync_review_kwargs(item)))
+            except Exception as e:
+                slots[i] = {"client_review_id": item.client_review_id, "status": "error", "error": str(e)}
+            continue
+        flush_run()
+        try:
+            if item.type == "sentence":
+                try:
+                    review = SentenceReviewSubmitIn.model_validate(
+                        {**item.payload, "client_review_id": item.client_review_id}
                     )
-                results.append({"client_review_id": item.client_review_id, "status": status})
+                except ValidationError as e:
+                    slots[i] = {"client_review_id": item.client_review_id, "status": "error", "error": str(e)}
+                    continue
+                _entry, duplicate = append_review(
+                    db,
+                    review.model_dump(mode="json"),
+                    client_review_id=item.client_review_id,
+                    source="sync",
+                )
+                slots[i] = {"client_review_id": item.client_review_id, "status": "duplicate" if duplicate else "ok"}
             elif item.type == "verse":
                 from app.services.quran_service import submit_verse_review
                 payload = item.payload
@@ -710,12 +807,14 @@ def sync_reviews(body: BulkSyncIn, db: Session = Depends(get_db)):
                     rating=payload["rating"],
                     session_id=payload.get("session_id"),
                 )
-                results.append({"client_review_id": item.client_review_id, "status": "ok"})
+                slots[i] = {"client_review_id": item.client_review_id, "status": "ok"}
             else:
-                results.append({"client_review_id": item.client_review_id, "status": "error", "error": f"Unknown type: {item.type}"})
+                slots[i] = {"client_review_id": item.client_review_id, "status": "error", "error": f"Unknown type: {item.type}"}
         except Exception as e:
             db.rollback()
-            results.append({"client_review_id": item.client_review_id, "status": "error", "error": str(e)})
+            slots[i] = {"client_review_id": item.client_review_id, "status": "error", "error": str(e)}
+    flush_run()
+    results.extend(slot for slot in slots if slot is not None)
     return {"results": results}
 
 
@@ -861,6 +960,7 @@ def review_verse(body: VerseReviewIn, db: Session = Depends(get_db)):
 @router.post("/wrap-up", response_model=WrapUpOut)
 def wrap_up_quiz(body: WrapUpIn, db: Session = Depends(get_db)):
     """Get word-level recall cards for acquiring and missed words in current session."""
+    _apply_journaled_reviews(db)
     if not body.seen_lemma_ids and not body.missed_lemma_ids:
         return {"cards": []}
 
@@ -1018,6 +1118,7 @@ def wrap_up_quiz(body: WrapUpIn, db: Session = Depends(get_db)):
 @router.post("/recap")
 def get_recap_items(body: RecapIn, db: Session = Depends(get_db)):
     """Get sentence-level recap cards for acquisition words from last session."""
+    _apply_journaled_reviews(db)
     from app.models import Sentence, SentenceWord
 
     if not body.last_session_lemma_ids:
@@ -1172,6 +1273,7 @@ def undo_sentence(
     if not client_review_id:
         raise HTTPException(400, "client_review_id required")
 
+    _apply_journaled_reviews(db)
     result = undo_sentence_review(db, client_review_id)
 
     if result["undone"]:
@@ -1187,6 +1289,7 @@ def undo_sentence(
 @router.get("/session-summary/{session_id}", response_model=SessionSummaryOut)
 def get_session_summary(session_id: str, db: Session = Depends(get_db)):
     """Return per-word journey data and sentence stats for a completed session."""
+    _apply_journaled_reviews(db)
     review_logs = (
         db.query(ReviewLog, Lemma.lemma_ar, Lemma.gloss_en)
         .join(Lemma, Lemma.lemma_id == ReviewLog.lemma_id)
@@ -1273,6 +1376,7 @@ def get_session_summary(session_id: str, db: Session = Depends(get_db)):
 @router.get("/session-end/{session_id}", response_model=SessionEndOut)
 def get_session_end(session_id: str, db: Session = Depends(get_db)):
     """Lightweight endpoint returning everything the session-end card needs in one call."""
+    _apply_journaled_reviews(db)
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
@@ -1,64 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from app.database import get_db
 from app.models import Lemma, Root, Sentence, UserLemmaKnowledge
+from app.services.knowledge_version import knowledge_cached
+from app.services.progress_summary import MAX_PAGE_SIZE, list_root_progress
 from app.services.sentence_eligibility import reviewable_sentence_clauses
 
 router = APIRouter(prefix="/api/roots", tags=["roots"])
 
 
 @router.get("")
-def list_roots(db: Session = Depends(get_db)):
-    """List all roots with word counts and knowledge stats."""
-    rows = (
-        db.query(
-            Root.root_id,
-            Root.root,
-            Root.core_meaning_en,
-            Root.enrichment_json,
-            func.count(Lemma.lemma_id).label("total"),
-        )
-        .join(Lemma, Lemma.root_id == Root.root_id)
-        .filter(Lemma.canonical_lemma_id.is_(None))
-        .group_by(Root.root_id)
-        .order_by(func.count(Lemma.lemma_id).desc())
-        .all()
-    )
+def list_roots(
+    request: Request,
+    sort: str = Query("known"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    """List roots with word counts and knowledge stats.
 
-    root_ids = [r.root_id for r in rows]
-    known_counts: dict[int, int] = {}
-    if root_ids:
-        known_rows = (
-            db.query(
-                Lemma.root_id,
-                func.count(Lemma.lemma_id).label("known"),
-            )
-            .join(UserLemmaKnowledge)
-            .filter(
-                Lemma.root_id.in_(root_ids),
-                Lemma.canonical_lemma_id.is_(None),
-                UserLemmaKnowledge.knowledge_state.in_(["known", "learning", "acquiring"]),
-            )
-            .group_by(Lemma.root_id)
-            .all()
+    Served from root_progress. Without ``limit`` returns every root; with it,
+    pass the last ``root_id`` as ``after`` to get the next page.
+    """
+    try:
+        return knowledge_cached(
+            request, db, lambda: list_root_progress(db, sort=sort, limit=limit, after=after),
         )
-        known_counts = {r.root_id: r.known for r in known_rows}
-
-    result = [
-        {
-            "root_id": r.root_id,
-            "root": r.root,
-            "core_meaning_en": r.core_meaning_en,
-            "total_words": r.total,
-            "known_words": known_counts.get(r.root_id, 0),
-            "coverage_pct": round(known_counts.get(r.root_id, 0) / r.total * 100, 1) if r.total > 0 else 0,
-            "has_enrichment": r.enrichment_json is not None,
-        }
-        for r in rows
-    ]
-    return sorted(result, key=lambda r: (-r["known_words"], -r["total_words"]))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/search")
@@ -71,8 +41,12 @@ def search_root(q: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{root_id}")
-def get_root(root_id: int, db: Session = Depends(get_db)):
+def get_root(root_id: int, request: Request, db: Session = Depends(get_db)):
     """Get root detail with enrichment and derivation tree."""
+    return knowledge_cached(request, db, lambda: _get_root(db, root_id))
+
+
+def _get_root(db: Session, root_id: int) -> dict:
     root = db.query(Root).filter(Root.root_id == root_id).first()
     if not root:
         raise HTTPException(404, "Root not found")
@@ -80,6 +54,7 @@ def get_root(root_id: int, db: Session = Depends(get_db)):
     lemmas = (
         db.query(Lemma)
         .outerjoin(UserLemmaKnowledge)
+        .options(contains_eager(Lemma.knowledge))
         .filter(Lemma.root_id == root_id, Lemma.canonical_lemma_id.is_(None))
         .order_by(Lemma.frequency_rank.asc().nullslast())
         .all()
@@ -115,6 +90,7 @@ def get_root(root_id: int, db: Session = Depends(get_db)):
         }
         for s in (
             db.query(Sentence)
+            .options(selectinload(Sentence.words))
             .filter(
                 Sentence.root_focus_id == root_id,
                 Sentence.kind == "root_showcase",
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas import SearchOut
+from app.services.search_index import MAX_SEARCH_LIMIT, search
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@router.get("", response_model=SearchOut)
+def search_all(
+    q: str = Query(..., min_length=1, description="Arabic (any vocalization) or English"),
+    kind: Optional[list[str]] = Query(None, description="lemma|sentence|story; repeatable"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Ranked full-text search across lemmas, sentences and stories."""
+    return search(db, q, kinds=kind, limit=limit, offset=offset)
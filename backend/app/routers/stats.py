@@ -1,6 +1,7 @@
 import json
 from datetime import datetime, timezone, timedelta
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case, or_
 from collections import Counter
@@ -32,6 +33,17 @@ from app.services.acquisition_service import (
     true_new_acquisition_episode_filter,
     recovery_status,
 )
+from app.services.analytics_snapshot import (
+    Snapshot,
+    SnapshotSection,
+    read_snapshot,
+    refresh_sections,
+    refresh_snapshot,
+)
+from app.services.knowledge_version import (
+    STATS_CACHE_WINDOW_SECONDS,
+    knowledge_cached,
+)
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
@@ -1136,15 +1148,26 @@ def _get_unique_words_recognized(db: Session, days_start: int, days_end: int) ->
 
 
 @router.get("", response_model=StatsOut)
-def get_stats(db: Session = Depends(get_db)):
-    return _get_basic_stats(db)
+def get_stats(request: Request, db: Session = Depends(get_db)):
+    return knowledge_cached(
+        request, db, lambda: _get_basic_stats(db),
+        response_model=StatsOut, window_seconds=STATS_CACHE_WINDOW_SECONDS,
+    )
 
 
 @router.get("/analytics", response_model=AnalyticsOut)
 def get_analytics(
+    request: Request,
     days: int = Query(90, ge=7, le=365),
     db: Session = Depends(get_db),
 ):
+    return knowledge_cached(
+        request, db, lambda: _compute_analytics(db, days),
+        response_model=AnalyticsOut, window_seconds=STATS_CACHE_WINDOW_SECONDS,
+    )
+
+
+def _compute_analytics(db: Session, days: int) -> AnalyticsOut:
     basic = _get_basic_stats(db)
     first_known_dates = _get_first_known_dates(db)
     pace = _get_pace(db, first_known_dates=first_known_dates)
@@ -1224,7 +1247,13 @@ def get_analytics(
 
 
 @router.get("/cefr", response_model=CEFREstimate)
-def get_cefr(db: Session = Depends(get_db)):
+def get_cefr(request: Request, db: Session = Depends(get_db)):
+    return knowledge_cached(
+        request, db, lambda: _compute_cefr(db), response_model=CEFREstimate,
+    )
+
+
+def _compute_cefr(db: Session) -> CEFREstimate:
     known = _count_state(db, "known") + _count_state(db, "learning")
     acq_known = (
         db.query(func.count(UserLemmaKnowledge.id))
@@ -2102,34 +2131,83 @@ def _get_insights(db: Session) -> InsightsOut:
     )
 
 
-@router.get("/deep-analytics", response_model=DeepAnalyticsOut)
-def get_deep_analytics(db: Session = Depends(get_db)):
+def _get_book_coverage(db: Session) -> list:
     from app.services.book_coverage import compute_book_coverage
 
     try:
-        book_coverage = compute_book_coverage(db)
+        return compute_book_coverage(db)
     except Exception:
         # Coverage is decoration on this endpoint — a tokenmap or lookup
         # problem must not take down the whole deep-analytics panel.
         import logging
 
         logging.getLogger(__name__).exception("book coverage computation failed")
-        book_coverage = []
+        return []
+
+
+def _tokenmap_signature() -> list:
+    from app.services.book_coverage import tokenmap_signature
+
+    return tokenmap_signature()
+
+
+_ULK, _LEMMAS, _ROOTS = "user_lemma_knowledge", "lemmas", "roots"
+_REVIEWS, _SENTENCE_REVIEWS = "review_log", "sentence_review_log"
+_HOUR, _DAY = 3600, 86400
+
+# Each section of DeepAnalyticsOut with the tables it reads and the clock
+# bucket its time windows need (services/analytics_snapshot.py).
+DEEP_ANALYTICS_SECTIONS = (
+    SnapshotSection("stability_distribution", _get_stability_distribution, (_ULK,)),
+    SnapshotSection("retention_7d", lambda db: _get_retention_stats(db, 7), (_REVIEWS,), _HOUR),
+    SnapshotSection("retention_30d", lambda db: _get_retention_stats(db, 30), (_REVIEWS,), _HOUR),
+    SnapshotSection(
+        "primary_cold_recall_30d", lambda db: _get_primary_cold_recall(db, 30), (_REVIEWS,), _HOUR,
+    ),
+    SnapshotSection("transitions_today", lambda db: _get_state_transitions(db, 0), (_REVIEWS,), _DAY),
+    SnapshotSection("transitions_7d", lambda db: _get_state_transitions(db, 7), (_REVIEWS,), _HOUR),
+    SnapshotSection("transitions_30d", lambda db: _get_state_transitions(db, 30), (_REVIEWS,), _HOUR),
+    SnapshotSection(
+        "comprehension_7d", lambda db: _get_comprehension_breakdown(db, 7), (_SENTENCE_REVIEWS,), _HOUR,
+    ),
+    SnapshotSection(
+        "comprehension_30d", lambda db: _get_comprehension_breakdown(db, 30), (_SENTENCE_REVIEWS,), _HOUR,
+    ),
+    SnapshotSection("struggling_words", _get_struggling_words, (_ULK, _LEMMAS)),
+    SnapshotSection("root_coverage", _get_root_coverage, (_ROOTS, _LEMMAS, _ULK)),
+    SnapshotSection("recent_sessions", _get_recent_sessions, (_SENTENCE_REVIEWS,)),
+    # Due-now counts and today's box flow move with the clock.
+    SnapshotSection("acquisition_pipeline", _get_acquisition_pipeline, (_ULK, _LEMMAS, _REVIEWS), 300),
+    SnapshotSection(
+        "insights", _get_insights,
+        (_ULK, _LEMMAS, _ROOTS, _REVIEWS, _SENTENCE_REVIEWS, "sentences", "sentence_words"), _HOUR,
+    ),
+    SnapshotSection(
+        "book_coverage", _get_book_coverage, (_ULK, _LEMMAS), signature=_tokenmap_signature,
+    ),
+)
+
+
+@router.get("/deep-analytics", response_model=DeepAnalyticsOut)
+def get_deep_analytics(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Served from the analytics snapshot; sections whose inputs moved are
+    returned as stored and refreshed in the background."""
+    snapshot = read_snapshot(db, DEEP_ANALYTICS_SECTIONS)
+    try:
+        out = _deep_analytics_out(snapshot)
+    except ValidationError:
+        # Rows stored by code with a different payload shape.
+        refresh_sections(db, DEEP_ANALYTICS_SECTIONS, only_changed=False)
+        snapshot = read_snapshot(db, DEEP_ANALYTICS_SECTIONS)
+        out = _deep_analytics_out(snapshot)
+    if snapshot.stale:
+        background_tasks.add_task(refresh_snapshot, DEEP_ANALYTICS_SECTIONS)
+    return out
+
 
+def _deep_analytics_out(snapshot: Snapshot) -> DeepAnalyticsOut:
     return DeepAnalyticsOut(
-        stability_distribution=_get_stability_distribution(db),
-        retention_7d=_get_retention_stats(db, 7),
-        retention_30d=_get_retention_stats(db, 30),
-        primary_cold_recall_30d=_get_primary_cold_recall(db, 30),
-        transitions_today=_get_state_transitions(db, 0),
-        transitions_7d=_get_state_transitions(db, 7),
-        transitions_30d=_get_state_transitions(db, 30),
-        comprehension_7d=_get_comprehension_breakdown(db, 7),
-        comprehension_30d=_get_comprehension_breakdown(db, 30),
-        struggling_words=_get_struggling_words(db),
-        root_coverage=_get_root_coverage(db),
-        recent_sessions=_get_recent_sessions(db),
-        acquisition_pipeline=_get_acquisition_pipeline(db),
-        insights=_get_insights(db),
-        book_coverage=book_coverage,
+        **snapshot.payloads,
+        snapshot_computed_at=snapshot.computed_at,
+        stale_sections=snapshot.stale,
     )
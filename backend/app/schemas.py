@@ -450,6 +450,10 @@ class DeepAnalyticsOut(BaseModel):
     acquisition_pipeline: Optional[AcquisitionPipeline] = None
     insights: Optional[InsightsOut] = None
     book_coverage: list[BookCoverageOut] = []
+    # Served from analytics_snapshots: oldest section's compute time, and
+    # sections whose inputs moved since (refreshing in the background).
+    snapshot_computed_at: Optional[datetime] = None
+    stale_sections: list[str] = []
 
 
 class ImportResultOut(BaseModel):
@@ -699,6 +703,7 @@ class SentenceReviewSubmitIn(BaseModel):
 class SentenceReviewSubmitOut(BaseModel):
     word_results: list[dict]
     word_evidence_saved: int = 0
+    queued: bool = False  # journaled for write-behind; applied shortly after
 
 
 class WordJourneyItem(BaseModel):
@@ -770,6 +775,7 @@ class BulkSyncItem(BaseModel):
     type: str  # "sentence"
     payload: dict
     client_review_id: str
+    created_at: datetime | None = None  # when the client queued it; orders offline catch-up
 
 
 class BulkSyncIn(BaseModel):
@@ -1183,3 +1189,22 @@ class ConfusionAnalysisOut(BaseModel):
     similar_words: list[SimilarWord] = []
     phonetic_similar: list[PhoneticSimilarWord] = []
     prefix_hint: PrefixHint | None = None
+
+
+class SearchHitOut(BaseModel):
+    kind: str  # lemma | sentence | story
+    id: int
+    arabic: str | None = None
+    english: str | None = None
+    snippet: str = ""
+    score: float
+    pos: str | None = None  # lemma
+    canonical_lemma_id: int | None = None  # lemma
+    story_id: int | None = None  # sentence
+    status: str | None = None  # story
+
+
+class SearchOut(BaseModel):
+    query: str
+    results: list[SearchHitOut]
+    has_more: bool
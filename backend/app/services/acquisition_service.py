@@ -34,6 +34,7 @@ from typing import Optional
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import Lemma, ReviewLog, Root, UserLemmaKnowledge
 from app.services.fsrs_service import (
     FSRS_SCHEDULER_POLICY_VERSION,
@@ -381,7 +382,7 @@ def recovery_status(db: Session, now: datetime | None = None) -> dict:
     from app.services.leech_service import LEECH_REINTRO_BOX1_ADMISSION_LIMIT
 
     if now is None:
-        now = datetime.now(timezone.utc)
+        now = clock.now()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
     box1_actionable, box2_due = _recovery_backlog_counts(db, now)
@@ -505,7 +506,7 @@ def start_acquisition(
     if episode_kind not in _ACQUISITION_EPISODE_KINDS:
         raise ValueError(f"Unsupported acquisition episode kind: {episode_kind!r}")
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     next_due = now if due_immediately else now + BOX_INTERVALS[1]
 
     ulk = (
@@ -626,6 +627,7 @@ def submit_acquisition_review(
     review_mode: str = "reading",
     comprehension_signal: Optional[str] = None,
     client_review_id: Optional[str] = None,
+    check_duplicate: bool = True,
     commit: bool = True,
     was_confused: bool = False,
     effective_rating_int: Optional[int] = None,
@@ -638,9 +640,12 @@ def submit_acquisition_review(
                  mixed-up evidence stamps a total-lapse override
     Rating == 1: reset to box 1
 
-    Returns dict with new state info.
+    ``check_duplicate=False`` skips the client_review_id lookup when the
+    caller has already ruled out a stored duplicate.
+
+    Returns dict with new state info, including the new ``review_log`` row.
     """
-    if client_review_id:
+    if client_review_id and check_duplicate:
         existing = (
             db.query(ReviewLog)
             .filter(ReviewLog.client_review_id == client_review_id)
@@ -660,7 +665,7 @@ def submit_acquisition_review(
                 "duplicate": True,
             }
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
 
     ulk = (
         db.query(UserLemmaKnowledge)
@@ -676,6 +681,7 @@ def submit_acquisition_review(
             response_ms=response_ms, session_id=session_id,
             review_mode=review_mode, comprehension_signal=comprehension_signal,
             client_review_id=client_review_id,
+            check_duplicate=check_duplicate,
             commit=commit,
             was_confused=was_confused,
             effective_rating_int=effective_rating_int,
@@ -974,6 +980,7 @@ def submit_acquisition_review(
         "acquisition_box": ulk.acquisition_box,
         "graduated": graduated,
         "next_due": next_due,
+        "review_log": log_entry,
     }
 
 
@@ -1047,7 +1054,7 @@ def get_acquisition_due(
 ) -> list[int]:
     """Get lemma_ids of words due for acquisition review."""
     if now is None:
-        now = datetime.now(timezone.utc)
+        now = clock.now()
 
     rows = (
         db.query(UserLemmaKnowledge.lemma_id)
@@ -1075,7 +1082,7 @@ def get_acquisition_stats(db: Session) -> dict:
         if box in box_counts:
             box_counts[box] += 1
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     due_count = 0
     for ulk in acquiring:
         if ulk.acquisition_next_due:
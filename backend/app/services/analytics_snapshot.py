@@ -0,0 +1,161 @@
+"""Precomputed deep-analytics sections (``analytics_snapshots``).
+
+``/api/stats/deep-analytics`` used to run about fifteen aggregates per
+request, including full-table scans of ``review_log`` and the book
+coverage pass. Each section is now stored as one JSON row and the endpoint
+serves the stored rows (two small queries, whatever the table sizes).
+
+Every section declares what it reads:
+
+- ``tables`` — tracked tables whose ``table_versions`` counters
+  (services/knowledge_version.py) feed its key;
+- ``window_seconds`` — clock bucket for sections with rolling windows or
+  "today"/"due now" numbers (86400 buckets are UTC days);
+- ``signature`` — any other input, e.g. book tokenmap mtimes.
+
+A row's ``inputs_key`` hashes those inputs at compute time. A refresh
+recomputes only the sections whose current key differs, so a lemma import
+leaves the review-log sections alone and a review leaves root coverage
+alone until its tables move. Reads never recompute, apart from sections
+with no row yet (first request after deploy); stale sections are served
+with their ``computed_at`` and the caller schedules `refresh_snapshot()`
+in the background. Bump ``SNAPSHOT_VERSION`` when a payload shape changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app import clock
+from app.models import AnalyticsSnapshot
+from app.services.knowledge_version import table_versions
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_refresh_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SnapshotSection:
+    name: str
+    compute: Callable[[Session], Any]
+    tables: tuple[str, ...]
+    window_seconds: int | None = None
+    signature: Callable[[], Any] | None = None
+
+
+@dataclass
+class Snapshot:
+    payloads: dict[str, Any]
+    computed_at: datetime | None  # oldest section
+    stale: list[str] = field(default_factory=list)
+
+
+def _inputs_key(section: SnapshotSection, versions: dict[str, int]) -> str:
+    parts: list[Any] = [
+        SNAPSHOT_VERSION,
+        section.name,
+        [versions.get(table, 0) for table in section.tables],
+    ]
+    if section.window_seconds:
+        parts.append(int(clock.now().timestamp() // section.window_seconds))
+    if section.signature is not None:
+        parts.append(section.signature())
+    return hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+def _store(
+    db: Session, section: SnapshotSection, key: str, row: AnalyticsSnapshot | None,
+) -> AnalyticsSnapshot:
+    payload = jsonable_encoder(section.compute(db))
+    if row is None:
+        row = AnalyticsSnapshot(section=section.name)
+        db.add(row)
+    row.inputs_key = key
+    row.payload = payload
+    row.computed_at = clock.utcnow()
+    return row
+
+
+def _stored_rows(
+    db: Session, sections: Sequence[SnapshotSection],
+) -> dict[str, AnalyticsSnapshot]:
+    return {
+        row.section: row
+        for row in db.query(AnalyticsSnapshot).filter(
+            AnalyticsSnapshot.section.in_([s.name for s in sections])
+        )
+    }
+
+
+def refresh_sections(
+    db: Session,
+    sections: Sequence[SnapshotSection],
+    *,
+    only_changed: bool = True,
+) -> list[str]:
+    """Recompute sections whose inputs moved (all with ``only_changed=False``)
+    and commit. A failing section keeps its previous row. Returns the names
+    recomputed."""
+    versions = table_versions(db)
+    rows = _stored_rows(db, sections)
+    refreshed = []
+    for section in sections:
+        key = _inputs_key(section, versions)
+        row = rows.get(section.name)
+        if only_changed and row is not None and row.inputs_key == key:
+            continue
+        try:
+            _store(db, section, key, row)
+        except Exception:
+            logger.exception("analytics snapshot: section %s failed", section.name)
+            continue
+        refreshed.append(section.name)
+    db.commit()
+    return refreshed
+
+
+def read_snapshot(db: Session, sections: Sequence[SnapshotSection]) -> Snapshot:
+    """Stored payloads for ``sections``, computing only those with no row."""
+    versions = table_versions(db)
+    keys = {s.name: _inputs_key(s, versions) for s in sections}
+    rows = _stored_rows(db, sections)
+    missing = [s for s in sections if s.name not in rows]
+    for section in missing:
+        rows[section.name] = _store(db, section, keys[section.name], None)
+    if missing:
+        db.commit()
+
+    return Snapshot(
+        payloads={s.name: rows[s.name].payload for s in sections},
+        computed_at=min((rows[s.name].computed_at for s in sections), default=None),
+        stale=[s.name for s in sections if rows[s.name].inputs_key != keys[s.name]],
+    )
+
+
+def refresh_snapshot(sections: Sequence[SnapshotSection]) -> list[str]:
+    """Background task: refresh stale sections in a session of its own.
+    Skips when another refresh is already running."""
+    from app.database import SessionLocal
+
+    if not _refresh_lock.acquire(blocking=False):
+        return []
+    try:
+        db = SessionLocal()
+        try:
+            return refresh_sections(db, sections)
+        finally:
+            db.close()
+    finally:
+        _refresh_lock.release()
@@ -24,20 +24,25 @@ mapping invariant). ``unmapped_freq`` surfaces are re-resolved through that
 same path at request time — cached on (file mtime, lemma count) — so words
 imported after the scan (e.g. the Momo bookifier tranches) move from unmapped
 into live state buckets without rebuilding the file.
+
+Parsed tokenmaps and the lemma-table arrays (canonical map, inert/function
+flags) are cached too, so a request only reads knowledge states and buckets
+each book's token counts in one NumPy pass.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from collections import Counter
 from pathlib import Path
 
-from sqlalchemy import func
+import numpy as np
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from app.models import Lemma, UserLemmaKnowledge
 from app.schemas import BookCoverageOut, BookGapWord, BookSourceCohort
+from app.services.knowledge_version import table_versions
 
 logger = logging.getLogger(__name__)
 
@@ -80,9 +85,9 @@ def _resolve_unmapped_surfaces(
     return resolved
 
 
-def _load_tokenmaps(benchmarks_dir: Path) -> list[tuple[str, float, dict]]:
+def _read_tokenmaps(paths: list[Path]) -> list[tuple[str, float, dict]]:
     out = []
-    for path in sorted(benchmarks_dir.glob("book_*_tokenmap.json")):
+    for path in paths:
         try:
             data = json.loads(path.read_text())
         except (OSError, json.JSONDecodeError):
@@ -135,58 +140,136 @@ def compute_source_cohort(db: Session, source: str) -> BookSourceCohort | None:
     return cohort
 
 
-def compute_book_coverage(
-    db: Session,
-    benchmarks_dir: Path | None = None,
-    cohort_source: str = "bookifier",
-    top_gap_count: int = 8,
-) -> list[BookCoverageOut]:
-    """Live token-weighted coverage for every committed book tokenmap."""
-    from app.services.canonical_resolution import resolve_canonical_via_map
+# Per-file cache of parsed tokenmaps as (lemma_ids, counts) arrays.
+_tokenmap_cache: dict[str, tuple[float, dict, np.ndarray, np.ndarray]] = {}
+
+# Lemma-table arrays (canonical map, inert/function flags), keyed on an
+# aggregate signature of the lemma table so merges, new lemmas and
+# category changes invalidate it without re-reading every row per request.
+_lemma_arrays_cache: tuple[tuple, tuple[np.ndarray, np.ndarray]] | None = None
+
+# State codes for the knowledge vector; 0 = no ULK (gap).
+_STATE_CODE = {state: 1 for state in _KNOWN_STATES} | {state: 2 for state in _PROGRESS_STATES}
+
+
+def _tokenmap_arrays(cache_key: str, mtime: float, data: dict) -> tuple[np.ndarray, np.ndarray]:
+    cached = _tokenmap_cache.get(cache_key)
+    if cached and cached[0] == mtime:
+        return cached[2], cached[3]
+    ids = np.fromiter((int(lid) for lid in data["mapped"]), dtype=np.int64)
+    counts = np.fromiter((int(c) for c in data["mapped"].values()), dtype=np.int64)
+    _tokenmap_cache[cache_key] = (mtime, data, ids, counts)
+    return ids, counts
+
+
+def _load_tokenmaps(benchmarks_dir: Path) -> list[tuple[str, float, dict]]:
+    out = []
+    for path in sorted(benchmarks_dir.glob("book_*_tokenmap.json")):
+        cache_key = str(path)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        cached = _tokenmap_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            out.append((cache_key, mtime, cached[1]))
+            continue
+        out.extend(_read_tokenmaps([path]))
+    return out
+
+
+def tokenmap_signature(benchmarks_dir: Path | None = None) -> list[tuple[str, float]]:
+    """(file name, mtime) of every book tokenmap — changes when one is
+    added, removed or rewritten."""
+    out = []
+    for path in sorted((benchmarks_dir or _BENCHMARKS_DIR).glob("book_*_tokenmap.json")):
+        try:
+            out.append((path.name, path.stat().st_mtime))
+        except OSError:
+            continue
+    return out
+
+
+def _lemma_signature(db: Session) -> tuple:
+    """Changes whenever ``lemmas`` is written: the table's write counter
+    (edits to ``lemma_ar_bare`` and other columns the aggregates can't
+    see) plus cheap aggregates, so a counter reset on a fresh database
+    can't match an old cache entry."""
+    return (table_versions(db).get("lemmas"),) + tuple(
+        db.query(
+            func.count(Lemma.lemma_id),
+            func.max(Lemma.lemma_id),
+            func.count(Lemma.canonical_lemma_id),
+            func.sum(Lemma.canonical_lemma_id),
+            func.sum(case((Lemma.word_category.in_(_INERT_CATEGORIES), Lemma.lemma_id), else_=0)),
+            func.sum(case((Lemma.pos == "particle", Lemma.lemma_id), else_=0)),
+        ).one()
+    )
+
+
+def _lemma_arrays(db: Session) -> tuple[np.ndarray, np.ndarray]:
+    """``(canonical, inert_or_function)`` arrays indexed by lemma_id."""
+    global _lemma_arrays_cache
+    signature = _lemma_signature(db)
+    if _lemma_arrays_cache and _lemma_arrays_cache[0] == signature:
+        return _lemma_arrays_cache[1]
+
+    from app.services.corpus_store import canonical_array
     from app.services.sentence_validator import (
         _is_function_word,
         normalize_alef,
         strip_diacritics,
     )
 
-    tokenmaps = _load_tokenmaps(benchmarks_dir or _BENCHMARKS_DIR)
-    if not tokenmaps:
-        return []
-
-    lemma_rows = db.query(
+    rows = db.query(
         Lemma.lemma_id,
         Lemma.canonical_lemma_id,
-        Lemma.lemma_ar,
         Lemma.lemma_ar_bare,
-        Lemma.gloss_en,
         Lemma.pos,
         Lemma.word_category,
     ).all()
-    by_id = {row.lemma_id: row for row in lemma_rows}
-    canonical_by_id = {row.lemma_id: row.canonical_lemma_id for row in lemma_rows}
-    states = dict(
-        db.query(
-            UserLemmaKnowledge.lemma_id, UserLemmaKnowledge.knowledge_state
-        ).all()
-    )
-
-    def is_inert_or_function(lemma_id: int) -> bool:
-        row = by_id.get(lemma_id)
-        if row is None:
-            return False
+    size = max((row.lemma_id for row in rows), default=0) + 1
+    canonical = canonical_array({row.lemma_id: row.canonical_lemma_id for row in rows}, size)
+    inert = np.zeros(len(canonical), dtype=bool)
+    for row in rows:
         if row.word_category in _INERT_CATEGORIES or row.pos == "particle":
-            return True
-        bare = normalize_alef(strip_diacritics(row.lemma_ar_bare or ""))
-        return _is_function_word(bare)
+            inert[row.lemma_id] = True
+        elif _is_function_word(normalize_alef(strip_diacritics(row.lemma_ar_bare or ""))):
+            inert[row.lemma_id] = True
+    _lemma_arrays_cache = (signature, (canonical, inert))
+    return canonical, inert
+
+
+def compute_book_coverage(
+    db: Session,
+    benchmarks_dir: Path | None = None,
+    cohort_source: str = "bookifier",
+    top_gap_count: int = 8,
+) -> list[BookCoverageOut]:
+    """Live token-weighted coverage for every committed book tokenmap.
+
+    Tokenmaps and lemma-table arrays are cached; per request only the
+    knowledge states are read and every book is bucketed in one array pass.
+    """
+    tokenmaps = _load_tokenmaps(benchmarks_dir or _BENCHMARKS_DIR)
+    if not tokenmaps:
+        return []
+
+    canonical, inert = _lemma_arrays(db)
+    state_rows = db.query(
+        UserLemmaKnowledge.lemma_id, UserLemmaKnowledge.knowledge_state
+    ).all()
+    state_code = np.zeros(len(canonical), dtype=np.int8)
+    for lemma_id, state in state_rows:
+        if 0 <= lemma_id < len(state_code):
+            state_code[lemma_id] = _STATE_CODE.get(state, 0)
 
     results: list[BookCoverageOut] = []
     cohort = compute_source_cohort(db, cohort_source)
 
     for cache_key, mtime, data in tokenmaps:
         total = int(data["total"])
-        mapped_tokens: Counter[int] = Counter(
-            {int(lid): int(count) for lid, count in data["mapped"].items()}
-        )
+        ids, counts = _tokenmap_arrays(cache_key, mtime, data)
         unmapped_freq = {
             str(surface): int(count)
             for surface, count in (data.get("unmapped_freq") or {}).items()
@@ -199,41 +282,56 @@ def compute_book_coverage(
         )
         unmapped_tokens = 0
         unresolved_surfaces: list[tuple[str, int]] = []
+        late_ids: list[int] = []
+        late_counts: list[int] = []
         for surface, count in unmapped_freq.items():
             lemma_id = resolved.get(surface)
             if lemma_id is None:
                 unmapped_tokens += count
                 unresolved_surfaces.append((surface, count))
             else:
-                mapped_tokens[lemma_id] += count
-
-        covered = int(data.get("function") or 0)
-        in_progress = 0
-        gap_tokens = 0
-        gap_by_lemma: Counter[int] = Counter()
-        for lemma_id, count in mapped_tokens.items():
-            canonical_id = resolve_canonical_via_map(lemma_id, canonical_by_id)
-            if is_inert_or_function(canonical_id):
-                covered += count
-                continue
-            state = states.get(canonical_id)
-            if state in _KNOWN_STATES:
-                covered += count
-            elif state in _PROGRESS_STATES:
-                in_progress += count
-            else:
-                gap_tokens += count
-                gap_by_lemma[canonical_id] += count
-
+                late_ids.append(lemma_id)
+                late_counts.append(count)
+        if late_ids:
+            ids = np.concatenate([ids, np.asarray(late_ids, dtype=np.int64)])
+            counts = np.concatenate([counts, np.asarray(late_counts, dtype=np.int64)])
+
+        # Ids outside the lemma table (deleted lemmas) are gaps on themselves.
+        inside = ids < len(canonical)
+        canon = np.where(inside, canonical[np.where(inside, ids, 0)], ids)
+        inside = canon < len(canonical)
+        is_inert = inside & inert[np.where(inside, canon, 0)]
+        code = np.where(inside, state_code[np.where(inside, canon, 0)], 0)
+        covered_mask = is_inert | (code == 1)
+        progress_mask = ~is_inert & (code == 2)
+        gap_mask = ~is_inert & (code == 0)
+
+        covered = int(data.get("function") or 0) + int(counts[covered_mask].sum())
+        in_progress = int(counts[progress_mask].sum())
+        gap_tokens = int(counts[gap_mask].sum())
+
+        gap_ids, inverse = np.unique(canon[gap_mask], return_inverse=True)
+        gap_totals = np.bincount(inverse, weights=counts[gap_mask]).astype(np.int64)
+        # Highest token count first; ties keep first-seen order like Counter.
+        first_seen = np.full(len(gap_ids), len(inverse), dtype=np.int64)
+        np.minimum.at(first_seen, inverse, np.arange(len(inverse)))
+        top = np.lexsort((first_seen, -gap_totals))[:top_gap_count]
+        top_ids = [int(gap_ids[i]) for i in top]
+        display = {
+            row.lemma_id: row
+            for row in db.query(Lemma.lemma_id, Lemma.lemma_ar, Lemma.gloss_en)
+            .filter(Lemma.lemma_id.in_(top_ids))
+            .all()
+        } if top_ids else {}
         top_gaps = [
             BookGapWord(
                 lemma_id=lemma_id,
-                display=(by_id[lemma_id].lemma_ar if lemma_id in by_id else "?"),
-                gloss_en=(by_id[lemma_id].gloss_en if lemma_id in by_id else None),
-                tokens=count,
+                display=(display[lemma_id].lemma_ar if lemma_id in display else "?"),
+                gloss_en=(display[lemma_id].gloss_en if lemma_id in display else None),
+                tokens=int(gap_totals[i]),
                 status="new",
             )
-            for lemma_id, count in gap_by_lemma.most_common(top_gap_count)
+            for lemma_id, i in zip(top_ids, top)
         ]
         remaining = max(0, top_gap_count - len(top_gaps))
         if remaining:
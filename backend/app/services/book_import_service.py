@@ -12,14 +12,17 @@ Pipeline:
 import logging
 import re
 import time
+from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
-from app.models import Lemma, Sentence, SentenceWord, Story
+from app.models import Lemma, Sentence, SentenceWord, Story, StoryWord
 from app.services.interaction_logger import log_interaction
 from app.services.llm import AllProvidersFailed, generate_completion
+from app.services.llm_batching import estimate_tokens, run_keyed_batches
 from app.services.morphology import get_word_features
 from app.services.ocr_service import _call_gemini_vision, extract_text_from_image
 from app.services.sentence_validator import (
@@ -37,6 +40,7 @@ from app.services.story_service import (
     _recalculate_story_counts,
     _build_knowledge_map,
     _get_all_lemmas,
+    _known_bare_forms,
     _split_story_sentences,
     _story_word_bare,
 )
@@ -188,54 +192,74 @@ def cleanup_and_segment(raw_text: str, max_retries: int = 2) -> list[dict]:
     return []
 
 
+# Per translation call: ~input plus English output, and a cap on lines so a
+# malformed response never costs more than one small batch.
+TRANSLATION_BATCH_TOKENS = 4000
+TRANSLATION_BATCH_MAX_ITEMS = 40
+
+
+def _translate_batch(arabic_list: list[str]) -> dict[int, str]:
+    """One translation call; returns {0-based index in batch: english}."""
+    numbered = "\n".join(f"{i+1}. {a}" for i, a in enumerate(arabic_list))
+    result = generate_completion(
+        prompt=(
+            "Translate each Arabic sentence to natural English. "
+            "These are from a children's book, so use simple, clear language.\n\n"
+            "Return a JSON object with a 'translations' array of objects, "
+            "each with 'index' (1-based) and 'english' fields.\n\n"
+            f"Sentences:\n{numbered}"
+        ),
+        system_prompt=(
+            "You are a professional Arabic-English translator. "
+            "Translate children's book sentences clearly and naturally. "
+            "Respond with JSON only."
+        ),
+        model_override="claude_haiku",
+        temperature=0.2,
+        timeout=120,
+        task_type="book_import",
+    )
+    trans_map = {}
+    for t in result.get("translations", []):
+        idx = t.get("index")
+        english = t.get("english", "")
+        if idx is not None and english:
+            trans_map[int(idx) - 1] = english
+    return trans_map
+
+
 def translate_sentences(sentences: list[dict]) -> list[dict]:
     """LLM translate: add English translations to cleaned sentences.
 
     Takes list of dicts with 'arabic' key, returns same list with 'english' added.
+    Sentences are batched by token budget and the batches run concurrently;
+    sentences a response leaves out are retried once, then get "".
     """
     if not sentences:
         return sentences
 
-    arabic_list = [s["arabic"] for s in sentences]
-    numbered = "\n".join(f"{i+1}. {a}" for i, a in enumerate(arabic_list))
+    def call(batch: list[int]) -> dict[int, str]:
+        translated = _translate_batch([sentences[i]["arabic"] for i in batch])
+        return {batch[local]: english for local, english in translated.items() if local < len(batch)}
 
     try:
-        result = generate_completion(
-            prompt=(
-                "Translate each Arabic sentence to natural English. "
-                "These are from a children's book, so use simple, clear language.\n\n"
-                "Return a JSON object with a 'translations' array of objects, "
-                "each with 'index' (1-based) and 'english' fields.\n\n"
-                f"Sentences:\n{numbered}"
-            ),
-            system_prompt=(
-                "You are a professional Arabic-English translator. "
-                "Translate children's book sentences clearly and naturally. "
-                "Respond with JSON only."
-            ),
-            model_override="claude_haiku",
-            temperature=0.2,
-            timeout=120,
-            task_type="book_import",
+        trans_map = run_keyed_batches(
+            list(range(len(sentences))),
+            call,
+            key=lambda i: i,
+            cost=lambda i: 2 * estimate_tokens(sentences[i]["arabic"]),
+            max_tokens=TRANSLATION_BATCH_TOKENS,
+            max_items=TRANSLATION_BATCH_MAX_ITEMS,
+            label="book translation",
         )
-        translations = result.get("translations", [])
-
-        # Build index map
-        trans_map = {}
-        for t in translations:
-            idx = t.get("index")
-            if idx is not None:
-                trans_map[int(idx)] = t.get("english", "")
-
-        # Merge translations back
-        for i, s in enumerate(sentences):
-            s["english"] = trans_map.get(i + 1, "")
-
-        return sentences
-    except (AllProvidersFailed, Exception):
+    except Exception:
         logger.exception("Failed to translate sentences")
         return sentences
 
+    for i, s in enumerate(sentences):
+        s["english"] = trans_map.get(i, "")
+    return sentences
+
 
 def _add_transliterations(sentences: list[dict]) -> list[dict]:
     """Add ALA-LC transliteration to each sentence using deterministic transliterator."""
@@ -307,15 +331,18 @@ def create_book_sentences(
     story: Story,
     extracted_sentences: list[dict],
     story_word_lookup: dict[str, int] | None = None,
+    lemma_lookup: dict[str, int] | None = None,
 ) -> list[Sentence]:
     """Create Sentence + SentenceWord records from extracted book sentences.
 
     For unmapped tokens, uses CAMeL morphology to resolve to existing lemmas,
     then falls back to story_word_lookup (surface→lemma from StoryWords).
     Tokens that still can't be mapped get lemma_id=None in SentenceWord.
+    Streaming imports pass their shared ``lemma_lookup`` instead of having
+    every chunk rebuild it from all lemmas.
     """
-    all_lemmas = _get_all_lemmas(db)
-    lemma_lookup = build_lemma_lookup(all_lemmas)
+    if lemma_lookup is None:
+        lemma_lookup = build_lemma_lookup(_get_all_lemmas(db))
 
     created = []
     for sent_data in extracted_sentences:
@@ -424,108 +451,135 @@ def create_book_sentences(
     return created
 
 
-def import_book(
-    db: Session,
-    cover_image: bytes | None,
-    page_images: list[bytes],
-    title_override: str | None = None,
-) -> tuple[Story, list[int]]:
-    """Full book import pipeline.
+BOOK_IMPORT_CHUNK_PAGES = 8
 
-    Args:
-        db: Database session.
-        cover_image: Cover/title page image bytes (for metadata extraction).
-        page_images: Content page images in reading order.
-        title_override: Optional title override (skips cover extraction).
-
-    Returns:
-        (story, new_lemma_ids) — the created Story and IDs of newly created Lemmas.
-    """
-    # Step 1: Cover metadata
-    metadata = {}
-    if cover_image and not title_override:
-        metadata = extract_cover_metadata(cover_image)
-        logger.info(f"Cover metadata: {metadata}")
 
-    title_ar = title_override or metadata.get("title_ar")
-    title_en = metadata.get("title_en")
+@dataclass
+class _ImportLookups:
+    """Lookups shared by every chunk of one streamed import, built once and
+    extended with the lemmas each chunk creates."""
 
-    # Step 2: OCR all content pages in parallel
-    logger.info(f"OCR-ing {len(page_images)} pages...")
-    page_texts = ocr_pages_parallel(page_images)
+    lemma_lookup: dict[str, int]
+    known_bare_forms: set[str]
+    knowledge_map: dict[int, str]
+    story_word_lookup: dict[str, int] = field(default_factory=dict)
 
-    if not any(t.strip() for t in page_texts):
-        raise ValueError("No text extracted from any page")
+    @classmethod
+    def load(cls, db: Session) -> "_ImportLookups":
+        return cls(
+            lemma_lookup=build_lemma_lookup(_get_all_lemmas(db)),
+            known_bare_forms=_known_bare_forms(db),
+            knowledge_map=_build_knowledge_map(db),
+        )
 
-    logger.info(f"Extracted text from {len(page_images)} pages")
+    def add_lemmas(self, db: Session, lemma_ids: list[int]) -> None:
+        if lemma_ids:
+            self.known_bare_forms.update(
+                normalize_alef(bare)
+                for (bare,) in db.query(Lemma.lemma_ar_bare).filter(
+                    Lemma.lemma_id.in_(lemma_ids)
+                )
+                if bare
+            )
 
-    # Step 3: LLM cleanup + diacritics + segmentation — per page
-    logger.info("Cleaning up and segmenting text per page...")
-    all_sentences: list[dict] = []
-    for page_idx, page_text in enumerate(page_texts):
-        if not page_text.strip():
-            continue
-        page_num = page_idx + 1
-        page_sents = cleanup_and_segment(page_text)
-        for s in page_sents:
-            s["page_number"] = page_num
-        all_sentences.extend(page_sents)
-        logger.info(f"Page {page_num}: {len(page_sents)} sentences")
+    def add_story_words(self, words) -> None:
+        for sw in words:
+            if sw.lemma_id is not None:
+                bare = normalize_alef(strip_diacritics(sw.surface_form))
+                self.story_word_lookup[bare] = sw.lemma_id
 
-    sentences = all_sentences
-    logger.info(f"Extracted {len(sentences)} total sentences")
 
-    if not sentences:
-        raise ValueError("No sentences could be extracted from the text")
+def _import_cursor(story: Story) -> dict:
+    return dict((story.metadata_json or {}).get("import_cursor") or {})
 
-    # Step 4: LLM translate
-    logger.info("Translating sentences...")
-    sentences = translate_sentences(sentences)
 
-    # Step 5: Deterministic transliteration
-    sentences = _add_transliterations(sentences)
+def _save_import_cursor(story: Story, cursor: dict | None) -> None:
+    metadata = {**(story.metadata_json or {})}
+    if cursor is None:
+        metadata.pop("import_cursor", None)
+    else:
+        metadata["import_cursor"] = dict(cursor)
+    story.metadata_json = metadata or None
 
-    # Build cleaned body — join with "." so _create_story_words splits correctly
-    cleaned_body = ". ".join(s["arabic"] for s in sentences)
 
-    # Build sentence_index → page_number mapping
-    sent_page_map: dict[int, int] = {}
-    for i, s in enumerate(sentences):
-        sent_page_map[i] = s.get("page_number", 1)
+def _discard_partial_chunk(db: Session, story: Story, cursor: dict) -> None:
+    """Drop what an interrupted chunk committed past the cursor (StoryWords,
+    and the per-sentence commits of create_book_sentences) before redoing it.
+    Sentences are retired rather than deleted in case one was already shown.
 
-    # Step 6: Create story via existing story_service logic
-    all_lemmas = _get_all_lemmas(db)
-    lemma_lookup = build_lemma_lookup(all_lemmas)
-    knowledge_map = _build_knowledge_map(db)
+    Lemmas the chunk created stay (the redo finds them in the lookup and
+    won't create them again), so they are added to the cursor's
+    ``new_lemma_ids`` here and tagged as book lemmas."""
+    known = set(cursor.get("new_lemma_ids", []))
+    orphaned = [
+        lemma for lemma in db.query(Lemma).filter(Lemma.source_story_id == story.id)
+        if lemma.lemma_id not in known
+    ]
+    for lemma in orphaned:
+        lemma.source = "book"
+    cursor["new_lemma_ids"] = sorted(known) + sorted(l.lemma_id for l in orphaned)
+    _save_import_cursor(story, cursor)
+    db.query(StoryWord).filter(
+        StoryWord.story_id == story.id,
+        StoryWord.position >= cursor["next_position"],
+    ).delete(synchronize_session=False)
+    db.query(Sentence).filter(
+        Sentence.story_id == story.id,
+        Sentence.page_number > cursor["pages_done"],
+        Sentence.is_active == True,  # noqa: E712
+    ).update({Sentence.is_active: False}, synchronize_session=False)
+    db.commit()
 
-    body_en = " ".join(s.get("english", "") for s in sentences)
 
-    story = Story(
-        title_ar=title_ar,
-        title_en=title_en,
-        body_ar=cleaned_body,
-        body_en=body_en.strip() or None,
-        transliteration=" ".join(s.get("transliteration", "") for s in sentences) or None,
-        source="book_ocr",
-        status="active",
-        page_count=len(page_images),
+def _chunk_story_words(db: Session, story: Story, start_position: int) -> list[StoryWord]:
+    return (
+        db.query(StoryWord)
+        .filter(StoryWord.story_id == story.id, StoryWord.position >= start_position)
+        .order_by(StoryWord.position)
+        .all()
     )
-    db.add(story)
-    db.flush()
 
-    # Create StoryWords (reuse story_service helpers)
-    total, known, func = _create_story_words(
-        db, story, cleaned_body, lemma_lookup, knowledge_map
+
+def _append_text(existing: str | None, addition: str, sep: str) -> str | None:
+    if not addition:
+        return existing
+    return f"{existing}{sep}{addition}" if existing else addition
+
+
+def _import_book_chunk(
+    db: Session,
+    story: Story,
+    sentences: list[dict],
+    lookups: _ImportLookups,
+    cursor: dict,
+) -> int:
+    """Story words, new lemmas and Sentence rows for one chunk of pages.
+    Advances ``cursor`` in place; returns the number of sentences created.
+
+    The steps below commit as they go, so the story body is only extended at
+    the end, together with the cursor the caller commits: an interrupted
+    chunk leaves no text behind for the resume to append twice."""
+    # Join with "." so _create_story_words splits correctly
+    chunk_body = ". ".join(s["arabic"] for s in sentences)
+
+    start_position = cursor["next_position"]
+    start_sentence = cursor["next_sentence_index"]
+    _create_story_words(
+        db, story, chunk_body, lookups.lemma_lookup, lookups.knowledge_map,
+        known_bare_forms=lookups.known_bare_forms,
+        start_position=start_position,
+        start_sentence_index=start_sentence,
     )
+    words = _chunk_story_words(db, story, start_position)
 
     # Tag StoryWords with page_number based on sentence_index → page mapping
-    for sw in story.words:
-        page = sent_page_map.get(sw.sentence_index)
-        if page is not None:
-            sw.page_number = page
+    for sw in words:
+        offset = sw.sentence_index - start_sentence
+        if 0 <= offset < len(sentences):
+            sw.page_number = sentences[offset].get("page_number", 1)
 
     # Import unknown words (creates Lemma entries + runs quality gates internally)
-    new_ids = _import_unknown_words(db, story, lemma_lookup)
+    new_ids = _import_unknown_words(db, story, lookups.lemma_lookup, story_words=words)
 
     # Deliberately do not create UserLemmaKnowledge rows here. A book import
     # populates the library and lexicon only; learner state starts changing
@@ -536,31 +590,172 @@ def import_book(
     # provenance on existing vocabulary makes importing a book silently change
     # the global curriculum; existing lexical rows must remain exactly as they
     # were before the book was added.
-    source_updated = 0
     if new_ids:
         for lemma in db.query(Lemma).filter(Lemma.lemma_id.in_(new_ids)).all():
             lemma.source = "book"
             lemma.source_story_id = story.id
-            source_updated += 1
-    if source_updated:
         db.flush()
-        logger.info(f"Tagged {source_updated} new book lemmas for story {story.id}")
+        logger.info(f"Tagged {len(new_ids)} new book lemmas for story {story.id}")
+        lookups.add_lemmas(db, new_ids)
 
-    # Recalculate readiness
-    _recalculate_story_counts(db, story)
+    # Surface→lemma fallback from StoryWords (which _import_unknown_words resolved)
+    lookups.add_story_words(_chunk_story_words(db, story, start_position))
+
+    created = create_book_sentences(
+        db, story, sentences, lookups.story_word_lookup,
+        lemma_lookup=lookups.lemma_lookup,
+    )
+
+    story.body_ar = _append_text(story.body_ar, chunk_body, ". ")
+    story.body_en = _append_text(
+        story.body_en, " ".join(s.get("english", "") for s in sentences).strip(), " "
+    )
+    story.transliteration = _append_text(
+        story.transliteration,
+        " ".join(s.get("transliteration", "") for s in sentences).strip(),
+        " ",
+    )
+    cursor["next_position"] = start_position + len(words)
+    cursor["next_sentence_index"] = start_sentence + len(_split_story_sentences(chunk_body))
+    cursor["new_lemma_ids"] = cursor.get("new_lemma_ids", []) + new_ids
+    cursor["sentence_count"] = cursor.get("sentence_count", 0) + len(created)
+    return len(created)
+
+
+def import_book(
+    db: Session,
+    cover_image: bytes | None,
+    page_images: Sequence[bytes],
+    title_override: str | None = None,
+    *,
+    chunk_pages: int = BOOK_IMPORT_CHUNK_PAGES,
+    resume_story_id: int | None = None,
+) -> tuple[Story, list[int]]:
+    """Full book import pipeline, streamed in chunks of pages.
 
-    # Build surface→lemma fallback from StoryWords (which _import_unknown_words resolved)
-    story_word_lookup: dict[str, int] = {}
-    for sw in story.words:
-        if sw.lemma_id is not None:
-            bare = normalize_alef(strip_diacritics(sw.surface_form))
-            story_word_lookup[bare] = sw.lemma_id
+    Each chunk of ``chunk_pages`` pages goes through OCR, cleanup, translation,
+    transliteration, StoryWord/lemma creation and Sentence creation, and is
+    committed together with a cursor in ``story.metadata_json["import_cursor"]``.
+    Memory stays flat with book length; the story is hidden (status
+    "generating") until the last chunk lands. If an import dies part-way,
+    calling again with the same pages and ``resume_story_id`` continues after
+    the last committed chunk.
 
-    # Step 7: Create Sentence + SentenceWord records
-    logger.info("Creating sentence records...")
-    created_sentences = create_book_sentences(db, story, sentences, story_word_lookup)
-    logger.info(f"Created {len(created_sentences)} sentence records")
+    Args:
+        db: Database session.
+        cover_image: Cover/title page image bytes (for metadata extraction).
+        page_images: Content page images in reading order.
+        title_override: Optional title override (skips cover extraction).
+        chunk_pages: Pages per committed chunk.
+        resume_story_id: Story of an interrupted import to continue.
+
+    Returns:
+        (story, new_lemma_ids) — the created Story and IDs of newly created Lemmas.
+    """
+    if chunk_pages < 1:
+        raise ValueError("chunk_pages must be positive")
+
+    story: Story | None = None
+    metadata: dict = {}
+    if resume_story_id is not None:
+        story = db.get(Story, resume_story_id)
+        if story is None or story.status != "generating" or "import_cursor" not in (
+            story.metadata_json or {}
+        ):
+            raise ValueError(f"Story {resume_story_id} is not a resumable book import")
+        cursor = _import_cursor(story)
+        if cursor.get("page_total") != len(page_images):
+            raise ValueError(
+                f"Story {resume_story_id} was imported from {cursor.get('page_total')} pages, "
+                f"not {len(page_images)}"
+            )
+        logger.info(f"Resuming book import {story.id} after page {cursor['pages_done']}")
+        _discard_partial_chunk(db, story, cursor)
+    else:
+        # Step 1: Cover metadata
+        if cover_image and not title_override:
+            metadata = extract_cover_metadata(cover_image)
+            logger.info(f"Cover metadata: {metadata}")
+        cursor = {
+            "page_total": len(page_images),
+            "pages_done": 0,
+            "next_position": 0,
+            "next_sentence_index": 0,
+            "new_lemma_ids": [],
+            "sentence_count": 0,
+            "text_found": False,
+        }
 
+    lookups = _ImportLookups.load(db)
+    if story is not None:
+        lookups.add_story_words(
+            db.query(StoryWord).filter(
+                StoryWord.story_id == story.id, StoryWord.lemma_id.isnot(None)
+            )
+        )
+
+    for chunk_start in range(cursor["pages_done"], len(page_images), chunk_pages):
+        chunk = page_images[chunk_start:chunk_start + chunk_pages]
+
+        # Step 2: OCR this chunk's pages in parallel
+        logger.info(f"OCR-ing pages {chunk_start + 1}-{chunk_start + len(chunk)}...")
+        page_texts = ocr_pages_parallel(list(chunk))
+
+        # Step 3: LLM cleanup + diacritics + segmentation — per page
+        sentences: list[dict] = []
+        for offset, page_text in enumerate(page_texts):
+            if not page_text.strip():
+                continue
+            cursor["text_found"] = True
+            page_num = chunk_start + offset + 1
+            page_sents = cleanup_and_segment(page_text)
+            for s in page_sents:
+                s["page_number"] = page_num
+            sentences.extend(page_sents)
+            logger.info(f"Page {page_num}: {len(page_sents)} sentences")
+
+        if sentences:
+            # Step 4: LLM translate; Step 5: deterministic transliteration
+            sentences = _add_transliterations(translate_sentences(sentences))
+
+            # Step 6: the story row is created with the first real chunk
+            if story is None:
+                story = Story(
+                    title_ar=title_override or metadata.get("title_ar"),
+                    title_en=metadata.get("title_en"),
+                    body_ar="",
+                    source="book_ocr",
+                    status="generating",
+                    page_count=len(page_images),
+                )
+                db.add(story)
+                db.flush()
+                # Chunk steps commit internally; make the story resumable
+                # from its very first commit.
+                _save_import_cursor(story, cursor)
+
+            # Step 7: StoryWords, new lemmas, Sentence + SentenceWord records
+            created = _import_book_chunk(db, story, sentences, lookups, cursor)
+            logger.info(
+                f"Pages {chunk_start + 1}-{chunk_start + len(chunk)}: "
+                f"{len(sentences)} sentences, {created} sentence records"
+            )
+
+        cursor["pages_done"] = chunk_start + len(chunk)
+        if story is not None:
+            _save_import_cursor(story, cursor)
+            db.commit()
+
+    if story is None:
+        if not cursor["text_found"]:
+            raise ValueError("No text extracted from any page")
+        raise ValueError("No sentences could be extracted from the text")
+
+    # Recalculate readiness over the whole book, then publish it
+    _recalculate_story_counts(db, story)
+    new_ids = list(cursor["new_lemma_ids"])
+    _save_import_cursor(story, None)
+    story.status = "active"
     db.commit()
     db.refresh(story)
 
@@ -572,8 +767,9 @@ def import_book(
         readiness_pct=story.readiness_pct,
         new_words_imported=len(new_ids),
         page_count=len(page_images),
-        sentence_count=len(created_sentences),
+        sentence_count=cursor["sentence_count"],
         metadata=metadata,
+        resumed=resume_story_id is not None,
     )
 
     return story, new_ids
@@ -17,11 +17,14 @@ This module is the importable engine. The companion CLI runner is
 phase 7 once per cron pass; emits a ``chimera_audit_findings`` ActivityLog
 row only when the candidate set has changed since the previous run.
 
-Pure read — no DB writes from this module other than the idempotent
-ActivityLog emission in ``emit_chimera_alert``.
+Verdicts are persisted per lemma in ``chimera_audit_results`` keyed by a hash
+of the fields each check reads, so a run only re-audits new or edited lemmas.
+Besides that table, the only DB write is the idempotent ActivityLog emission
+in ``emit_chimera_alert``.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -32,10 +35,10 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import func
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from app.models import ActivityLog, Lemma, Root
+from app.models import ActivityLog, ChimeraAuditResult, Lemma, Root
 from app.services.activity_log import log_activity
 
 logger = logging.getLogger(__name__)
@@ -58,131 +61,167 @@ class ChimeraCandidate:
     note: str
 
 
-def find_chimera_candidates(db: Session) -> list[ChimeraCandidate]:
-    """Scan all non-variant lemmas; return candidates flagged by D1..D5."""
-    out: list[ChimeraCandidate] = []
-    lemmas = (
-        db.query(Lemma)
-        .filter(Lemma.canonical_lemma_id.is_(None))
-        .all()
-    )
-
-    for lem in lemmas:
-        bare = (lem.lemma_ar_bare or "").strip()
-        if not bare:
+# Bump when a D1..D5 heuristic or the D6 pre-filter changes, so every lemma
+# is re-audited on the next run instead of trusting its stored verdict.
+AUDIT_VERSION = 1
+
+_AUDIT_COLUMNS = (
+    Lemma.lemma_id,
+    Lemma.lemma_ar,
+    Lemma.lemma_ar_bare,
+    Lemma.pos,
+    Lemma.word_category,
+    Lemma.forms_json,
+    Lemma.root_id,
+    Lemma.gloss_en,
+    Lemma.etymology_json,
+)
+
+
+def _root_chars_in_order(rb: str, target: str) -> bool:
+    """All root chars of ``rb`` appear in ``target`` in order (cheap)."""
+    pos_idx = 0
+    for ch in rb:
+        pos_idx = target.find(ch, pos_idx)
+        if pos_idx < 0:
+            return False
+        pos_idx += 1
+    return True
+
+
+def _structural_finding(
+    lemma_ar: str | None,
+    lemma_ar_bare: str | None,
+    pos: str | None,
+    word_category: str | None,
+    forms_json,
+) -> tuple[str, str] | None:
+    """Run D1..D5 on one lemma's fields; return ``(category, note)`` or None."""
+    bare = (lemma_ar_bare or "").strip()
+    if not bare:
+        return None
+    ar = _strip(lemma_ar or "")
+    ar_nopfx = ar[2:] if ar.startswith("ال") else ar
+
+    # D1 — Form V (4 chars, ت prefix) / Form VI (5 chars, ت + root + ا + ...)
+    if (
+        len(bare) == 3
+        and pos in (None, "verb")
+        and ar_nopfx.startswith("ت")
+        and (
+            (len(ar_nopfx) == 4)
+            or (len(ar_nopfx) == 5 and ar_nopfx[2] == "ا")
+        )
+        and _root_chars_in_order(bare, ar_nopfx)
+    ):
+        return "D1", f"Form V/VI verb; bare='{bare}' should be stem (~'{ar_nopfx}')"
+
+    # D2 — Form VII / VIII (5 chars, اِنْفَعَلَ / اِفْتَعَلَ)
+    if (
+        len(bare) == 3
+        and pos in (None, "verb")
+        and len(ar_nopfx) == 5
+        and (
+            ar_nopfx.startswith("ان")
+            or (ar_nopfx.startswith("ا") and ar_nopfx[2] == "ت")
+        )
+        and _root_chars_in_order(bare, ar_nopfx)
+    ):
+        return "D2", f"Form VII/VIII verb; bare='{bare}' should be stem (~'{ar_nopfx}')"
+
+    # D3 — Form X (6 chars, اِسْتَفْعَلَ)
+    if (
+        len(bare) == 3
+        and pos in (None, "verb")
+        and ar_nopfx.startswith("است")
+        and len(ar_nopfx) == 6
+        and _root_chars_in_order(bare, ar_nopfx)
+    ):
+        return "D3", f"Form X verb; bare='{bare}' should be stem (~'{ar_nopfx}')"
+
+    # D4 — Defective ـٍ participle (only the active-participle shape; we
+    # filter out regular nouns in genitive case by requiring len(bare)==3
+    # to keep false-positive rate low; bigger words like سرور slip through
+    # the heuristic).
+    KASRATAN = "ٍ"
+    if (
+        (lemma_ar or "").endswith(KASRATAN)
+        and not bare.endswith("ي")
+        and len(bare) == 3
+        # Exclude proper names: those are inert anyway.
+        and (word_category or "") != "proper_name"
+        and (pos or "") != "noun_prop"
+    ):
+        return "D4", f"Defective participle; bare='{bare}' should end in ي"
+
+    # D5 — forms_json field from a different root than bare
+    forms = forms_json if isinstance(forms_json, dict) else {}
+    for k, v in forms.items():
+        if k in ("gender", "verb_form") or not isinstance(v, str):
             continue
-        ar = _strip(lem.lemma_ar or "")
-        ar_nopfx = ar[2:] if ar.startswith("ال") else ar
-        pos = lem.pos
-
-        # All-three-root-chars-in-order helper (cheap).
-        def root_chars_in_order(rb: str, target: str) -> bool:
-            pos_idx = 0
-            for ch in rb:
-                pos_idx = target.find(ch, pos_idx)
-                if pos_idx < 0:
-                    return False
-                pos_idx += 1
-            return True
-
-        # D1 — Form V (4 chars, ت prefix) / Form VI (5 chars, ت + root + ا + ...)
-        if (
-            len(bare) == 3
-            and pos in (None, "verb")
-            and ar_nopfx.startswith("ت")
-            and (
-                (len(ar_nopfx) == 4)
-                or (len(ar_nopfx) == 5 and ar_nopfx[2] == "ا")
-            )
-            and root_chars_in_order(bare, ar_nopfx)
-        ):
-            out.append(ChimeraCandidate(
-                lemma_id=lem.lemma_id, category="D1",
-                lemma_ar=lem.lemma_ar or "", lemma_ar_bare=bare,
-                gloss_en=lem.gloss_en or "",
-                note=f"Form V/VI verb; bare='{bare}' should be stem (~'{ar_nopfx}')",
-            ))
+        v_clean = _strip(v).strip()
+        if not v_clean or " " in v_clean:
             continue
-
-        # D2 — Form VII / VIII (5 chars, اِنْفَعَلَ / اِفْتَعَلَ)
+        v_nopfx = v_clean[2:] if v_clean.startswith("ال") and len(v_clean) > 4 else v_clean
         if (
-            len(bare) == 3
-            and pos in (None, "verb")
-            and len(ar_nopfx) == 5
-            and (
-                ar_nopfx.startswith("ان")
-                or (ar_nopfx.startswith("ا") and ar_nopfx[2] == "ت")
-            )
-            and root_chars_in_order(bare, ar_nopfx)
+            abs(len(v_nopfx) - len(bare)) >= 5
+            and bare[:3] not in v_nopfx
         ):
-            out.append(ChimeraCandidate(
-                lemma_id=lem.lemma_id, category="D2",
-                lemma_ar=lem.lemma_ar or "", lemma_ar_bare=bare,
-                gloss_en=lem.gloss_en or "",
-                note=f"Form VII/VIII verb; bare='{bare}' should be stem (~'{ar_nopfx}')",
-            ))
-            continue
+            return "D5", f"forms_json[{k!r}]={v!r} root differs from bare"
 
-        # D3 — Form X (6 chars, اِسْتَفْعَلَ)
-        if (
-            len(bare) == 3
-            and pos in (None, "verb")
-            and ar_nopfx.startswith("است")
-            and len(ar_nopfx) == 6
-            and root_chars_in_order(bare, ar_nopfx)
-        ):
-            out.append(ChimeraCandidate(
-                lemma_id=lem.lemma_id, category="D3",
-                lemma_ar=lem.lemma_ar or "", lemma_ar_bare=bare,
-                gloss_en=lem.gloss_en or "",
-                note=f"Form X verb; bare='{bare}' should be stem (~'{ar_nopfx}')",
-            ))
-            continue
+    return None
 
-        # D4 — Defective ـٍ participle (only the active-participle shape; we
-        # filter out regular nouns in genitive case by requiring len(bare)==3
-        # to keep false-positive rate low; bigger words like سرور slip through
-        # the heuristic).
-        KASRATAN = "ٍ"
-        if (
-            (lem.lemma_ar or "").endswith(KASRATAN)
-            and not bare.endswith("ي")
-            and len(bare) == 3
-            # Exclude proper names: those are inert anyway.
-            and (lem.word_category or "") != "proper_name"
-            and (lem.pos or "") != "noun_prop"
-        ):
-            out.append(ChimeraCandidate(
-                lemma_id=lem.lemma_id, category="D4",
-                lemma_ar=lem.lemma_ar or "", lemma_ar_bare=bare,
-                gloss_en=lem.gloss_en or "",
-                note=f"Defective participle; bare='{bare}' should end in ي",
-            ))
-            continue
 
-        # D5 — forms_json field from a different root than bare
-        forms = lem.forms_json if isinstance(lem.forms_json, dict) else {}
-        bare_norm = bare
-        for k, v in forms.items():
-            if k in ("gender", "verb_form") or not isinstance(v, str):
-                continue
-            v_clean = _strip(v).strip()
-            if not v_clean or " " in v_clean:
-                continue
-            v_nopfx = v_clean[2:] if v_clean.startswith("ال") and len(v_clean) > 4 else v_clean
-            if (
-                abs(len(v_nopfx) - len(bare_norm)) >= 5
-                and bare_norm[:3] not in v_nopfx
-            ):
+def _digest(*parts) -> str:
+    payload = json.dumps(
+        [AUDIT_VERSION, *parts], ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _structural_hash(row) -> str:
+    """Hash of every field D1..D5 read."""
+    return _digest(
+        row.lemma_ar, row.lemma_ar_bare, row.pos, row.word_category, row.forms_json,
+    )
+
+
+def _etymology_hash(row) -> str:
+    """Hash of every field the D6 pre-filter and LLM confirm read."""
+    return _digest(
+        row.lemma_ar_bare, row.root_id, row.gloss_en, row.etymology_json,
+    )
+
+
+def find_chimera_candidates(db: Session, *, persist: bool = True) -> list[ChimeraCandidate]:
+    """Return non-variant lemmas flagged by D1..D5.
+
+    Incremental: refreshes ``chimera_audit_results`` for new or changed
+    lemmas only (see ``refresh_audit_results``), then reads the stored
+    findings. ``persist=False`` classifies every lemma in memory instead and
+    writes nothing (the CLI's default).
+    """
+    if not persist:
+        out = []
+        rows = (
+            db.query(*_AUDIT_COLUMNS)
+            .filter(Lemma.canonical_lemma_id.is_(None))
+            .order_by(Lemma.lemma_id)
+        )
+        for row in rows:
+            finding = _structural_finding(
+                row.lemma_ar, row.lemma_ar_bare, row.pos, row.word_category, row.forms_json,
+            )
+            if finding:
                 out.append(ChimeraCandidate(
-                    lemma_id=lem.lemma_id, category="D5",
-                    lemma_ar=lem.lemma_ar or "", lemma_ar_bare=bare,
-                    gloss_en=lem.gloss_en or "",
-                    note=f"forms_json[{k!r}]={v!r} root differs from bare",
+                    lemma_id=row.lemma_id, category=finding[0],
+                    lemma_ar=row.lemma_ar or "",
+                    lemma_ar_bare=(row.lemma_ar_bare or "").strip(),
+                    gloss_en=row.gloss_en or "", note=finding[1],
                 ))
-                break
-
-    return out
+        return out
+    refresh_audit_results(db, etymology=False)
+    return _stored_candidates(db, etymology=False)
 
 
 # ── D6: etymology_json that describes a different word than the gloss ──────
@@ -194,10 +233,11 @@ def find_chimera_candidates(db: Session) -> list[ChimeraCandidate]:
 #
 # The pre-filter can't textually exclude every loanword (gloss "living room" ↔
 # "From French 'salon'" share no string), so the *cron* path only LLM-checks
-# lemmas created since the last run (id-floor checkpoint) — the inline coherence
-# gate in lemma_enrichment is the real generation-time guard, and the one-time
-# cleanup_etymology_mismatches.py sweep handled the historical backlog. A manual
-# `chimera_audit.py --etymology` (since_lemma_id=0) re-scans everything.
+# lemmas that are new or whose etymology inputs changed, and stores the verdict
+# (refresh_audit_results) — the inline coherence gate in lemma_enrichment is the
+# real generation-time guard, and the one-time cleanup_etymology_mismatches.py
+# sweep handled the historical backlog. A manual `chimera_audit.py --etymology`
+# (since_lemma_id=0) re-scans everything.
 
 _ETYM_CHECKPOINT_FILE = Path(__file__).resolve().parents[2] / "data" / "etym_coherence_checkpoint.json"
 
@@ -252,6 +292,19 @@ def _is_loanword_mode(etym: dict) -> bool:
     )
 
 
+def _is_etymology_suspect(lem) -> bool:
+    """D6 pre-filter: loanword-mode etymology on a rooted lemma whose gloss
+    does not match the derivation. ``lem`` is a Lemma or a row with the same
+    attribute names."""
+    etym = lem.etymology_json if isinstance(lem.etymology_json, dict) else None
+    if lem.root_id is None or not etym or not _is_loanword_mode(etym):
+        return False
+    # Source word matches the gloss → genuine loanword.
+    return not _etym_gloss_matches_derivation(
+        lem.gloss_en or "", etym.get("derivation") or "",
+    )
+
+
 def find_etymology_incoherence_candidates(
     db: Session,
     limit: int = 30,
@@ -284,11 +337,8 @@ def find_etymology_incoherence_candidates(
         .all()
     )
     for lem in rows:
-        etym = lem.etymology_json if isinstance(lem.etymology_json, dict) else None
-        if not etym or not _is_loanword_mode(etym):
+        if not _is_etymology_suspect(lem):
             continue
-        if _etym_gloss_matches_derivation(lem.gloss_en or "", etym.get("derivation") or ""):
-            continue  # source word matches the gloss → genuine loanword
         suspects.append(lem)
         if len(suspects) >= limit:
             break
@@ -334,6 +384,174 @@ def find_etymology_incoherence_candidates(
     return out
 
 
+def refresh_audit_results(
+    db: Session,
+    *,
+    etymology: bool = True,
+    etymology_limit: int = 50,
+) -> dict:
+    """Re-audit only lemmas whose inputs changed since their stored verdict.
+
+    One narrow column scan of the canonical lemmas is hashed against
+    ``chimera_audit_results``; D1..D5 re-run only where the structural hash
+    differs, and (with ``etymology``) the D6 pre-filter only where the
+    etymology hash differs. At most ``etymology_limit`` suspects are
+    LLM-confirmed per call; a suspect whose batch failed or did not fit keeps
+    its old etymology hash and is retried next run. Lemmas at or below the
+    legacy D6 checkpoint that were never D6-decided are baselined without an
+    LLM call — the one-time cleanup sweep already covered them.
+
+    LLM calls happen before any write; all writes land in one short commit.
+    Rows for lemmas that were deleted or became variants are pruned.
+    """
+    rows = (
+        db.query(*_AUDIT_COLUMNS)
+        .filter(Lemma.canonical_lemma_id.is_(None))
+        .all()
+    )
+    stored = {
+        r.lemma_id: (r.structural_hash, r.etymology_hash)
+        for r in db.query(
+            ChimeraAuditResult.lemma_id,
+            ChimeraAuditResult.structural_hash,
+            ChimeraAuditResult.etymology_hash,
+        )
+    }
+
+    structural: dict[int, tuple[str, tuple[str, str] | None]] = {}
+    decided_etym: dict[int, tuple[str, str | None]] = {}
+    suspects = []
+    floor = _read_etym_checkpoint() if etymology else 0
+    for row in rows:
+        prev_structural, prev_etym = stored.get(row.lemma_id, (None, None))
+        digest = _structural_hash(row)
+        if digest != prev_structural:
+            structural[row.lemma_id] = (digest, _structural_finding(
+                row.lemma_ar, row.lemma_ar_bare, row.pos,
+                row.word_category, row.forms_json,
+            ))
+        if not etymology:
+            continue
+        etym_digest = _etymology_hash(row)
+        if etym_digest == prev_etym:
+            continue
+        if (prev_etym is None and row.lemma_id <= floor) or not _is_etymology_suspect(row):
+            decided_etym[row.lemma_id] = (etym_digest, None)
+        elif len(suspects) < etymology_limit:
+            suspects.append(row)
+
+    if suspects:
+        try:
+            decided_etym.update(_confirm_etymology_suspects(db, suspects))
+        except Exception:
+            logger.exception("Etymology coherence audit failed; continuing")
+
+    current_ids = {row.lemma_id for row in rows}
+    stale_ids = [lid for lid in stored if lid not in current_ids]
+    touched = set(structural) | set(decided_etym)
+    if not touched and not stale_ids:
+        return {"audited": 0, "etymology_decided": 0, "pruned": 0}
+
+    existing = {
+        r.lemma_id: r
+        for r in db.query(ChimeraAuditResult)
+        .filter(ChimeraAuditResult.lemma_id.in_(touched))
+    } if touched else {}
+    for lemma_id in touched:
+        result = existing.get(lemma_id)
+        if result is None:
+            result = ChimeraAuditResult(lemma_id=lemma_id)
+            db.add(result)
+        if lemma_id in structural:
+            digest, finding = structural[lemma_id]
+            result.structural_hash = digest
+            result.category, result.note = finding or (None, None)
+        if lemma_id in decided_etym:
+            result.etymology_hash, result.etymology_note = decided_etym[lemma_id]
+        result.audited_at = datetime.now(timezone.utc)
+    if stale_ids:
+        db.query(ChimeraAuditResult).filter(
+            ChimeraAuditResult.lemma_id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+    db.commit()
+    return {
+        "audited": len(structural),
+        "etymology_decided": len(decided_etym),
+        "pruned": len(stale_ids),
+    }
+
+
+def _confirm_etymology_suspects(db: Session, suspects: list) -> dict[int, tuple[str, str | None]]:
+    """LLM-confirm D6 suspects in chunks of 10; map lemma_id → (hash, note).
+
+    Chunks whose LLM call failed are left out so they are retried next run.
+    """
+    from app.services.lemma_enrichment import verify_etymology_coherence_batch
+
+    root_ids = {row.root_id for row in suspects if row.root_id}
+    roots_by_id = {
+        r.root_id: r for r in db.query(Root).filter(Root.root_id.in_(root_ids))
+    } if root_ids else {}
+
+    decided: dict[int, tuple[str, str | None]] = {}
+    for i in range(0, len(suspects), 10):
+        chunk = suspects[i:i + 10]
+        incoherent = verify_etymology_coherence_batch(
+            [(row, row.etymology_json) for row in chunk], roots_by_id,
+        )
+        if incoherent is None:
+            continue
+        for row in chunk:
+            note = None
+            if row.lemma_id in incoherent:
+                note = (
+                    "etymology describes a different word: "
+                    f"{((row.etymology_json or {}).get('derivation') or '')[:80]}"
+                )
+            decided[row.lemma_id] = (_etymology_hash(row), note)
+    return decided
+
+
+def _stored_candidates(db: Session, *, etymology: bool) -> list[ChimeraCandidate]:
+    """Current findings from ``chimera_audit_results``: D1..D5, then D6."""
+    flagged = ChimeraAuditResult.category.isnot(None)
+    if etymology:
+        flagged = or_(flagged, ChimeraAuditResult.etymology_note.isnot(None))
+    rows = (
+        db.query(
+            ChimeraAuditResult.lemma_id,
+            ChimeraAuditResult.category,
+            ChimeraAuditResult.note,
+            ChimeraAuditResult.etymology_note,
+            Lemma.lemma_ar,
+            Lemma.lemma_ar_bare,
+            Lemma.gloss_en,
+        )
+        .join(Lemma, Lemma.lemma_id == ChimeraAuditResult.lemma_id)
+        .filter(flagged)
+        .order_by(ChimeraAuditResult.lemma_id)
+        .all()
+    )
+    out = [
+        ChimeraCandidate(
+            lemma_id=r.lemma_id, category=r.category,
+            lemma_ar=r.lemma_ar or "", lemma_ar_bare=(r.lemma_ar_bare or "").strip(),
+            gloss_en=r.gloss_en or "", note=r.note or "",
+        )
+        for r in rows if r.category
+    ]
+    if etymology:
+        out += [
+            ChimeraCandidate(
+                lemma_id=r.lemma_id, category="D6",
+                lemma_ar=r.lemma_ar or "", lemma_ar_bare=r.lemma_ar_bare or "",
+                gloss_en=r.gloss_en or "", note=r.etymology_note,
+            )
+            for r in rows if r.etymology_note
+        ]
+    return out
+
+
 def emit_chimera_alert(
     db: Session,
     candidates: list[ChimeraCandidate],
@@ -396,45 +614,27 @@ def emit_chimera_alert(
 
 
 def _read_etym_checkpoint() -> int:
-    """Highest lemma_id already D6-checked, persisted in a small JSON file."""
+    """Highest lemma_id D6-checked by the old id-floor cron, persisted in a
+    small JSON file; now only the baseline for lemmas never D6-decided."""
     try:
         return int(json.loads(_ETYM_CHECKPOINT_FILE.read_text()).get("max_lemma_id", 0))
     except Exception:
         return 0
 
 
-def _write_etym_checkpoint(max_lemma_id: int) -> None:
-    try:
-        _ETYM_CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
-        _ETYM_CHECKPOINT_FILE.write_text(json.dumps({
-            "max_lemma_id": max_lemma_id,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }))
-    except Exception:
-        logger.warning("Could not write etym coherence checkpoint", exc_info=True)
-
-
 def check_and_alert(db: Session) -> list[ChimeraCandidate]:
     """Convenience wrapper for cron / warm-cache callers.
 
-    Runs the structural D1..D5 scan plus the LLM-confirmed D6 etymology
-    coherence check (set ``ALIF_ETYM_COHERENCE_AUDIT=0`` to skip). D6 only
-    LLM-checks lemmas created since the last run (id-floor checkpoint), so the
-    cron stays cheap — the inline generation-time gate is the real guard. D6 LLM
-    calls run before any ActivityLog write, so no SQLite write lock is held.
+    Refreshes the stored audit for changed lemmas — the structural D1..D5
+    scan plus the LLM-confirmed D6 etymology coherence check (set
+    ``ALIF_ETYM_COHERENCE_AUDIT=0`` to skip) — and alerts on the stored
+    findings. With no lemma edits since the last run this is one narrow
+    column scan and no LLM call; the inline generation-time gate remains the
+    real D6 guard.
     """
-    candidates = find_chimera_candidates(db)
-    if os.environ.get("ALIF_ETYM_COHERENCE_AUDIT", "1") == "1":
-        try:
-            floor = _read_etym_checkpoint()
-            current_max = db.query(func.max(Lemma.lemma_id)).scalar() or 0
-            if current_max > floor:
-                candidates += find_etymology_incoherence_candidates(
-                    db, limit=50, since_lemma_id=floor,
-                )
-                _write_etym_checkpoint(current_max)
-        except Exception:
-            logger.exception("Etymology coherence audit failed; continuing")
+    etymology = os.environ.get("ALIF_ETYM_COHERENCE_AUDIT", "1") == "1"
+    refresh_audit_results(db, etymology=etymology)
+    candidates = _stored_candidates(db, etymology=etymology)
     if candidates:
         emit_chimera_alert(db, candidates)
     return candidates
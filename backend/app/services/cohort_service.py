@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import UserLemmaKnowledge
 from app.services.fsrs_service import parse_json_column
 
@@ -20,7 +21,7 @@ def get_focus_cohort(db: Session, at: datetime | None = None) -> set[int]:
     Always includes all acquiring words. Fills remaining slots with
     FSRS due words sorted by lowest stability (most fragile first).
     """
-    now = at or datetime.now(timezone.utc)
+    now = at or clock.now()
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
 
@@ -61,7 +62,7 @@ def get_focus_cohort(db: Session, at: datetime | None = None) -> set[int]:
 
 def get_cohort_stats(db: Session) -> dict:
     """Get breakdown of the focus cohort composition."""
-    now = datetime.now(timezone.utc)
+    now = clock.now()
 
     all_active = (
         db.query(UserLemmaKnowledge)
@@ -41,6 +41,7 @@ from app.models import (
 )
 from app.services.activity_log import log_activity
 from app.services.canonical_resolution import resolve_canonical_via_map
+from app.services.llm_batching import estimate_tokens, run_keyed_batches
 from app.services.pipeline_tiers import (
     WordTier,
     compute_knowledge_tier,
@@ -64,6 +65,8 @@ MAX_PREFLIGHT_ROWS = MAX_ENRICH_LIMIT * PREFLIGHT_OVERFETCH_FACTOR
 INTRODUCED_STATES = {"acquiring", "known", "learning", "lapsed"}
 FSRS_STATES = {"known", "learning", "lapsed"}
 INERT_CATEGORIES = {"proper_name", "onomatopoeia"}
+# Prompt-side token budget per enrichment call (text + content-token list).
+CORPUS_ENRICH_BATCH_TOKENS = 3000
 
 
 @dataclass(frozen=True)
@@ -101,6 +104,14 @@ class CorpusScope:
         }
 
 
+@dataclass(frozen=True)
+class _EnrichmentRow:
+    """Session-free copy of the fields an enrichment prompt reads."""
+
+    id: int
+    arabic_text: str
+
+
 @dataclass(frozen=True)
 class CorpusDemand:
     """Demand snapshot for one sentence after canonical/inert filtering."""
@@ -1319,9 +1330,13 @@ def has_arabic_diacritics(arabic_text: str | None) -> bool:
 
 
 def generate_corpus_enrichment_batch(
-    sentences: list[Sentence],
+    sentences: Sequence[Sentence | _EnrichmentRow],
 ) -> dict[int, dict[str, str]]:
-    """Diacritize and translate corpus sentences in one structured LLM call."""
+    """Diacritize and translate corpus sentences in one structured LLM call.
+
+    Only ``id`` and ``arabic_text`` are read, so this is safe to call from a
+    worker thread with `_EnrichmentRow` snapshots.
+    """
     from app.services.llm import AllProvidersFailed, generate_completion
 
     if not sentences:
@@ -2742,34 +2757,48 @@ def enrich_corpus_sentences(
             )
         ]
         ready_ids = set(claimed_ids) - {sent.id for sent in needs_enrichment}
-        for start in range(0, len(needs_enrichment), enrichment_batch_size):
-            batch = needs_enrichment[start : start + enrichment_batch_size]
-            enrichment_inputs = {
-                sentence.id: {
-                    "arabic": sentence.arabic_text,
-                    "english": sentence.english_translation,
-                    "needs_diacritics": not has_arabic_diacritics(
-                        sentence.arabic_text
-                    ),
-                    "needs_translation": not (
-                        sentence.english_translation or ""
-                    ).strip(),
-                }
-                for sentence in batch
+        enrichment_inputs = {
+            sentence.id: {
+                "arabic": sentence.arabic_text,
+                "english": sentence.english_translation,
+                "needs_diacritics": not has_arabic_diacritics(
+                    sentence.arabic_text
+                ),
+                "needs_translation": not (
+                    sentence.english_translation or ""
+                ).strip(),
             }
-            try:
-                enriched = generate_corpus_enrichment_batch(batch)
-            except Exception:
-                enriched = {}
+            for sentence in needs_enrichment
+        }
+        # All provider calls up front, token-budgeted and concurrent. Worker
+        # threads get plain snapshots, never session-bound rows. A row the
+        # provider dropped is not retried in-process: the claim ledger
+        # below already releases it for the next run.
+        enriched_all = run_keyed_batches(
+            [
+                _EnrichmentRow(sentence_id, snapshot["arabic"])
+                for sentence_id, snapshot in enrichment_inputs.items()
+            ],
+            generate_corpus_enrichment_batch,
+            key=lambda row: row.id,
+            cost=lambda row: 3 * estimate_tokens(row.arabic_text),
+            max_tokens=CORPUS_ENRICH_BATCH_TOKENS,
+            max_items=enrichment_batch_size,
+            retries=0,
+            label="corpus enrichment",
+        )
+        needs_enrichment_ids = list(enrichment_inputs)
+        for start in range(0, len(needs_enrichment_ids), enrichment_batch_size):
+            batch_ids = needs_enrichment_ids[start : start + enrichment_batch_size]
             retry_ids: list[int] = []
             content_changed_ids: list[int] = []
-            for sentence in batch:
-                enrichment_input = enrichment_inputs[sentence.id]
-                item = enriched.get(sentence.id)
+            for sentence_id in batch_ids:
+                enrichment_input = enrichment_inputs[sentence_id]
+                item = enriched_all.get(sentence_id)
                 needs_diacritics = enrichment_input["needs_diacritics"]
                 needs_translation = enrichment_input["needs_translation"]
                 if item is None:
-                    retry_ids.append(sentence.id)
+                    retry_ids.append(sentence_id)
                     continue
                 diacritized = item.get("diacritized", "")
                 translation = item.get("translation", "")
@@ -2792,7 +2821,7 @@ def enrich_corpus_sentences(
                 )
                 invalid_translation = needs_translation and not translation
                 if invalid_diacritics or invalid_translation:
-                    retry_ids.append(sentence.id)
+                    retry_ids.append(sentence_id)
                     continue
                 values = {}
                 if needs_diacritics:
@@ -2803,7 +2832,7 @@ def enrich_corpus_sentences(
                 if needs_translation:
                     values[Sentence.english_translation] = translation
                 update_query = db.query(Sentence).filter(
-                    Sentence.id == sentence.id,
+                    Sentence.id == sentence_id,
                     Sentence.is_active.is_(False),
                     Sentence.mappings_verified_at
                     == CORPUS_CLAIM_SENTINEL,
@@ -2830,10 +2859,10 @@ def enrich_corpus_sentences(
                     synchronize_session=False,
                 )
                 if not updated:
-                    content_changed_ids.append(sentence.id)
+                    content_changed_ids.append(sentence_id)
                     continue
-                ready_ids.add(sentence.id)
-                result.translated_ids.append(sentence.id)
+                ready_ids.add(sentence_id)
+                result.translated_ids.append(sentence_id)
             db.commit()
             for sentence_id in content_changed_ids:
                 _release_content_changed_for_retry(
@@ -0,0 +1,385 @@
+"""Pre-tokenized external corpus store and vectorized passage-window ranking.
+
+Scouting authentic passages (scripts/rank_hindawi_passages.py) used to
+re-read the Hindawi parquet, re-tokenize every sentence and re-map every
+token — optionally through CAMeL — on each run. Only the last step depends
+on the learner, so the expensive part is done once and saved:
+
+    <store>/tokens.npy            int32, one entry per content token.
+                                  >= 0: lemma_id mapped at build time
+                                  <  0: -(i + 1), i indexing meta["surfaces"]
+    <store>/sentence_offsets.npy  int64, n_sentences + 1 offsets into tokens
+    <store>/sentence_book.npy     int32, book index per sentence
+    <store>/meta.json             books, surfaces, build parameters
+    <store>/texts.json            sentence text (only read for output)
+
+Function words and one-letter tokens are dropped at build time. Lemma ids
+are stored raw: canonical merges, skip categories and knowledge state are
+applied at rank time through `LemmaMasks`, so the store stays valid as the
+learner studies. Arrays are memory-mapped on load.
+
+`rank_windows()` scores every consecutive N-sentence window against a
+`LemmaMasks` knowledge vector in one NumPy pass, with the same metrics and
+score as `PassageWindow` in the ranking script.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+
+STORE_VERSION = 1
+_CANONICAL_MAX_HOPS = 32
+
+
+def canonical_array(canonical_by_id: Mapping[int, int | None], size: int) -> np.ndarray:
+    """``lemma_id → canonical lemma_id`` as an array, following multi-hop
+    chains like `canonical_resolution.resolve_canonical_via_map`."""
+    size = max(size, max(canonical_by_id, default=-1) + 1)
+    canonical = np.arange(size, dtype=np.int32)
+    for lemma_id, target in canonical_by_id.items():
+        if target is not None and 0 <= target < size:
+            canonical[lemma_id] = target
+    # Pointer jumping: each pass doubles the resolved chain length. Cycles
+    # (never expected) stop at the hop cap instead of looping.
+    for _ in range(_CANONICAL_MAX_HOPS):
+        nxt = canonical[canonical]
+        if np.array_equal(nxt, canonical):
+            break
+        canonical = nxt
+    return canonical
+
+
+def id_mask(ids: Iterable[int], size: int) -> np.ndarray:
+    mask = np.zeros(size, dtype=bool)
+    ids = np.fromiter((i for i in ids if 0 <= i < size), dtype=np.int64)
+    mask[ids] = True
+    return mask
+
+
+@dataclass
+class LemmaMasks:
+    """Knowledge-state vector indexed by lemma id.
+
+    ``active``/``known``/``skipped`` are indexed by *canonical* id; tokens are
+    resolved through ``canonical`` first. Ids beyond ``size`` count as
+    unknown, unskipped, self-canonical lemmas.
+    """
+
+    canonical: np.ndarray
+    active: np.ndarray
+    known: np.ndarray
+    skipped: np.ndarray
+
+    @classmethod
+    def from_sets(
+        cls,
+        canonical_by_id: Mapping[int, int | None],
+        active_ids: Iterable[int],
+        known_ids: Iterable[int],
+        skipped_ids: Iterable[int],
+        size: int = 0,
+    ) -> "LemmaMasks":
+        canonical = canonical_array(canonical_by_id, size)
+        n = len(canonical)
+        return cls(
+            canonical=canonical,
+            active=id_mask(active_ids, n),
+            known=id_mask(known_ids, n),
+            skipped=id_mask(skipped_ids, n),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.canonical)
+
+    def resolve(self, lemma_ids: np.ndarray) -> np.ndarray:
+        inside = lemma_ids < self.size
+        return np.where(inside, self.canonical[np.where(inside, lemma_ids, 0)], lemma_ids)
+
+    def lookup(self, mask: np.ndarray, canonical_ids: np.ndarray) -> np.ndarray:
+        inside = canonical_ids < self.size
+        return inside & mask[np.where(inside, canonical_ids, 0)]
+
+
+# ── Store ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class CorpusStoreBuilder:
+    """Accumulates pre-mapped sentences; `save()` writes the store."""
+
+    params: dict = field(default_factory=dict)
+    books: list[dict] = field(default_factory=list)
+    _tokens: list[int] = field(default_factory=list)
+    _offsets: list[int] = field(default_factory=lambda: [0])
+    _sentence_book: list[int] = field(default_factory=list)
+    _texts: list[str] = field(default_factory=list)
+    _surface_index: dict[str, int] = field(default_factory=dict)
+
+    def add_book(
+        self,
+        title: str,
+        author: str,
+        sentences: Iterable[tuple[str, Sequence[int | str]]],
+        source: str = "",
+    ) -> None:
+        """``sentences`` yields ``(text, tokens)``; each token is a mapped
+        lemma_id or, when unmapped, its bare surface."""
+        book_index = len(self.books)
+        count = 0
+        for text, tokens in sentences:
+            for token in tokens:
+                if isinstance(token, str):
+                    idx = self._surface_index.setdefault(token, len(self._surface_index))
+                    self._tokens.append(-(idx + 1))
+                else:
+                    self._tokens.append(int(token))
+            self._offsets.append(len(self._tokens))
+            self._sentence_book.append(book_index)
+            self._texts.append(text)
+            count += 1
+        self.books.append({"title": title, "author": author, "source": source,
+                           "sentences": count})
+
+    def save(self, path: Path) -> "CorpusStore":
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "tokens.npy", np.asarray(self._tokens, dtype=np.int32))
+        np.save(path / "sentence_offsets.npy", np.asarray(self._offsets, dtype=np.int64))
+        np.save(path / "sentence_book.npy", np.asarray(self._sentence_book, dtype=np.int32))
+        (path / "texts.json").write_text(json.dumps(self._texts, ensure_ascii=False))
+        meta = {
+            "version": STORE_VERSION,
+            "params": self.params,
+            "books": self.books,
+            "surfaces": list(self._surface_index),
+        }
+        (path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=1))
+        return CorpusStore.load(path)
+
+
+class CorpusStore:
+    def __init__(
+        self,
+        tokens: np.ndarray,
+        sentence_offsets: np.ndarray,
+        sentence_book: np.ndarray,
+        meta: dict,
+        path: Path | None = None,
+    ):
+        self.tokens = tokens
+        self.sentence_offsets = sentence_offsets
+        self.sentence_book = sentence_book
+        self.meta = meta
+        self.books: list[dict] = meta["books"]
+        self.surfaces: list[str] = meta["surfaces"]
+        self.path = path
+        self._texts: list[str] | None = None
+        # Unmapped surfaces resolved after the build (see remap_surfaces).
+        self._surface_lemma = np.full(len(self.surfaces), -1, dtype=np.int32)
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusStore":
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"{path}: corpus store version {meta.get('version')} != {STORE_VERSION}")
+        return cls(
+            tokens=np.load(path / "tokens.npy", mmap_mode="r"),
+            sentence_offsets=np.load(path / "sentence_offsets.npy", mmap_mode="r"),
+            sentence_book=np.load(path / "sentence_book.npy", mmap_mode="r"),
+            meta=meta,
+            path=path,
+        )
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentence_book)
+
+    def text(self, sentence_index: int) -> str:
+        if self._texts is None:
+            if self.path is None:
+                return ""
+            self._texts = json.loads((self.path / "texts.json").read_text())
+        return self._texts[sentence_index]
+
+    def remap_surfaces(self, resolved: Mapping[str, int | None]) -> int:
+        """Treat build-time unmapped surfaces as mapped to lemmas created
+        since (e.g. later imports). Returns how many surfaces now resolve."""
+        for i, surface in enumerate(self.surfaces):
+            lemma_id = resolved.get(surface)
+            self._surface_lemma[i] = lemma_id if lemma_id is not None else -1
+        return int((self._surface_lemma >= 0).sum())
+
+    def lemma_tokens(self) -> np.ndarray:
+        """Token lemma ids with remapped surfaces applied; -1 = unmapped."""
+        tokens = np.asarray(self.tokens)
+        unmapped = tokens < 0
+        if not unmapped.any():
+            return tokens
+        out = tokens.copy()
+        out[unmapped] = self._surface_lemma[-tokens[unmapped] - 1] if len(self._surface_lemma) else -1
+        return out
+
+    def sentence_tokens(self, sentence_index: int) -> list[int | str]:
+        start, end = self.sentence_offsets[sentence_index], self.sentence_offsets[sentence_index + 1]
+        out: list[int | str] = []
+        for token in self.tokens[start:end]:
+            token = int(token)
+            if token >= 0:
+                out.append(token)
+            elif self._surface_lemma[-token - 1] >= 0:
+                out.append(int(self._surface_lemma[-token - 1]))
+            else:
+                out.append(self.surfaces[-token - 1])
+        return out
+
+
+# ── Ranking ────────────────────────────────────────────────────────────
+
+
+@dataclass
+class RankedWindows:
+    """Windows passing the filters, best first. ``sentences[i]`` holds the
+    store sentence indices of window i; ``start_index`` is the window's
+    offset among its book's non-empty sentences."""
+
+    book: np.ndarray
+    start_index: np.ndarray
+    sentences: np.ndarray
+    content_tokens: np.ndarray
+    known_tokens: np.ndarray
+    active_tokens: np.ndarray
+    unmapped_tokens: np.ndarray
+    top_gain_tokens: np.ndarray
+    score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+
+def _top_n_gain(
+    window_of: np.ndarray, lemma_of: np.ndarray, n_windows: int, top_n: int
+) -> np.ndarray:
+    """Per window, the summed counts of its ``top_n`` most frequent lemmas."""
+    if not len(window_of):
+        return np.zeros(n_windows, dtype=np.int64)
+    stride = int(lemma_of.max()) + 1
+    keys, counts = np.unique(window_of.astype(np.int64) * stride + lemma_of, return_counts=True)
+    windows = keys // stride
+    order = np.lexsort((-counts, windows))
+    windows, counts = windows[order], counts[order]
+    group_start = np.r_[0, np.flatnonzero(np.diff(windows)) + 1]
+    group_len = np.diff(np.r_[group_start, len(windows)])
+    rank = np.arange(len(windows)) - np.repeat(group_start, group_len)
+    keep = rank < top_n
+    return np.bincount(windows[keep], weights=counts[keep], minlength=n_windows).astype(np.int64)
+
+
+def rank_windows(
+    store: CorpusStore,
+    masks: LemmaMasks,
+    *,
+    sentence_count: int,
+    min_active_pct: float = 0.0,
+    max_unmapped_pct: float = 1.0,
+    book_filter: np.ndarray | None = None,
+    top_gain_n: int = 10,
+    limit: int | None = None,
+) -> RankedWindows:
+    """Score every window of ``sentence_count`` consecutive non-empty
+    sentences (within one book) and return those passing the filters,
+    ordered by `PassageWindow.score()` semantics."""
+    k = sentence_count
+    n_sent = store.sentence_count
+    offsets = np.asarray(store.sentence_offsets)
+    lemma = store.lemma_tokens().astype(np.int64)
+    sent_of_tok = np.repeat(np.arange(n_sent), np.diff(offsets))
+
+    mapped = lemma >= 0
+    canonical = masks.resolve(np.where(mapped, lemma, 0))
+    content = ~(mapped & masks.lookup(masks.skipped, canonical))
+    active = content & mapped & masks.lookup(masks.active, canonical)
+    known = content & mapped & masks.lookup(masks.known, canonical)
+    missing = content & mapped & ~active
+    unmapped = content & ~mapped
+
+    def per_sentence(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(sent_of_tok[mask], minlength=n_sent)
+
+    s_content = per_sentence(content)
+    kept = np.flatnonzero(s_content > 0)
+    kept_book = np.asarray(store.sentence_book)[kept]
+    n_starts = max(len(kept) - k + 1, 0)
+    empty = RankedWindows(*(np.zeros(0, dtype=np.int64) for _ in range(9)))
+    empty.sentences = np.zeros((0, k), dtype=np.int64)
+    if not n_starts:
+        return empty
+
+    starts = np.arange(n_starts)
+    valid = kept_book[starts] == kept_book[starts + k - 1]
+    if book_filter is not None:
+        valid &= book_filter[kept_book[starts]]
+
+    def window_sums(per_sent: np.ndarray) -> np.ndarray:
+        csum = np.r_[0, np.cumsum(per_sent[kept])]
+        return csum[starts + k] - csum[starts]
+
+    w_content = window_sums(s_content)
+    w_active = window_sums(per_sentence(active))
+    w_known = window_sums(per_sentence(known))
+    w_unmapped = window_sums(per_sentence(unmapped))
+    denom = np.maximum(w_content, 1)
+    valid &= w_active / denom >= min_active_pct
+    valid &= w_unmapped / denom <= max_unmapped_pct
+    ids = np.flatnonzero(valid)
+    if not len(ids):
+        return empty
+
+    # Each missing token falls in up to k windows: expand (window, lemma)
+    # pairs for the surviving windows and take each window's top-N lemmas.
+    window_slot = np.full(n_starts, -1, dtype=np.int64)
+    window_slot[ids] = np.arange(len(ids))
+    kept_pos = np.full(n_sent, -1, dtype=np.int64)
+    kept_pos[kept] = np.arange(len(kept))
+    miss_pos = kept_pos[sent_of_tok[missing]]
+    miss_lemma = canonical[missing]
+    pair_window, pair_lemma = [], []
+    for d in range(k):
+        start = miss_pos - d
+        ok = (start >= 0) & (start < n_starts)
+        slot = np.where(ok, window_slot[np.where(ok, start, 0)], -1)
+        ok &= slot >= 0
+        pair_window.append(slot[ok])
+        pair_lemma.append(miss_lemma[ok])
+    gain = _top_n_gain(np.concatenate(pair_window), np.concatenate(pair_lemma), len(ids), top_gain_n)
+
+    content_w = w_content[ids].astype(np.float64)
+    score = (
+        w_active[ids] / content_w * 100
+        + (w_active[ids] + gain) / content_w * 20
+        - w_unmapped[ids] / content_w * 55
+        - np.maximum(0, 24 - content_w) * 0.15
+    )
+    order = np.argsort(-score, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    chosen = ids[order]
+    book = kept_book[chosen]
+    first_kept_of_book = np.searchsorted(kept_book, book)
+    return RankedWindows(
+        book=book,
+        start_index=chosen - first_kept_of_book,
+        sentences=kept[chosen[:, None] + np.arange(k)],
+        content_tokens=w_content[chosen],
+        known_tokens=w_known[chosen],
+        active_tokens=w_active[chosen],
+        unmapped_tokens=w_unmapped[chosen],
+        top_gain_tokens=gain[order],
+        score=score[order],
+    )
@@ -16,6 +16,7 @@ from typing import Iterable
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import FrequencyCoreEntry, Lemma, UserLemmaKnowledge
 from app.services.sentence_validator import is_function_word_lemma
 
@@ -219,7 +220,7 @@ def select_slow_lane_sample(
 
 def due_lane_snapshot(db: Session, now: datetime | None = None) -> DueLaneSnapshot:
     """Classify currently due non-function words into main and slow lanes."""
-    now = now or datetime.now(timezone.utc)
+    now = now or clock.now()
     knowledges = (
         db.query(UserLemmaKnowledge)
         .filter(UserLemmaKnowledge.knowledge_state.notin_(["suspended", "encountered"]))
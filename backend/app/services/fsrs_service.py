@@ -1,13 +1,13 @@
 import json
 import hashlib
 import logging
-from datetime import datetime, timezone
 from importlib.metadata import version as package_version
 from typing import Optional
 
 from fsrs import Scheduler, Card, Rating, State
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import Lemma, UserLemmaKnowledge, ReviewLog
 
 logger = logging.getLogger(__name__)
@@ -78,7 +78,7 @@ def reactivate_if_suspended(db: Session, lemma_id: int, source: str) -> bool:
         ulk.knowledge_state = "learning"
         ulk.fsrs_card_json = create_new_card()
         ulk.source = source
-        ulk.introduced_at = datetime.now(timezone.utc)
+        ulk.introduced_at = clock.now()
         db.commit()
         log_interaction(event="word_auto_reactivated", lemma_id=lemma_id, context=f"source:{source}")
         return True
@@ -94,12 +94,13 @@ def submit_review(
     review_mode: str = "reading",
     comprehension_signal: Optional[str] = None,
     client_review_id: Optional[str] = None,
+    check_duplicate: bool = True,
     commit: bool = True,
     was_confused: bool = False,
     effective_rating_int: Optional[int] = None,
     review_metadata: Optional[dict] = None,
 ) -> dict:
-    if client_review_id:
+    if client_review_id and check_duplicate:
         existing = (
             db.query(ReviewLog)
             .filter(ReviewLog.client_review_id == client_review_id)
@@ -168,7 +169,7 @@ def submit_review(
     old_times_correct = knowledge.times_correct or 0
     old_knowledge_state = knowledge.knowledge_state
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     new_card, review_log_entry = selected_scheduler.review_card(
         card, fsrs_rating, now
     )
@@ -245,4 +246,5 @@ def submit_review(
         "lemma_id": lemma_id,
         "new_state": new_state,
         "next_due": new_card.due.isoformat(),
+        "review_log": log_entry,
     }
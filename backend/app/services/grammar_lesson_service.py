@@ -5,17 +5,17 @@ tracks introduction status, and resurfaces lessons when confusion is high.
 """
 
 import json
-from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import (
     GrammarFeature,
     SentenceGrammarFeature,
     UserGrammarExposure,
 )
-from app.services.grammar_service import compute_comfort
+from app.services.grammar_service import compute_comfort, invalidate_grammar_state
 
 # Static lesson content for each grammar concept.
 # These are short reading-focused explanations — no LLM needed.
@@ -245,7 +245,7 @@ def introduce_feature(
     if not feature:
         return None
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     exposure = (
         db.query(UserGrammarExposure)
         .filter(UserGrammarExposure.feature_id == feature.feature_id)
@@ -267,6 +267,7 @@ def introduce_feature(
         )
         db.add(exposure)
 
+    invalidate_grammar_state(db)
     db.commit()
     return {"feature_key": feature_key, "introduced_at": now.isoformat()}
 
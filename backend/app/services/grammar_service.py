@@ -6,12 +6,15 @@ based on a tiered progression system.
 """
 
 import math
-from datetime import datetime, timezone
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app import clock
 from app.models import (
     GrammarFeature,
     UserGrammarExposure,
@@ -149,7 +152,7 @@ def compute_comfort(
     else:
         if last_seen_at.tzinfo is None:
             last_seen_at = last_seen_at.replace(tzinfo=timezone.utc)
-        days_since = (datetime.now(timezone.utc) - last_seen_at).total_seconds() / 86400
+        days_since = (clock.now() - last_seen_at).total_seconds() / 86400
         decay = 0.5 ** (days_since / 30.0)
 
     return min((exposure + accuracy) * decay, 1.0)
@@ -163,27 +166,129 @@ def _get_total_known_words(db: Session) -> int:
     )
 
 
-def _tier_avg_comfort(db: Session, tier: int) -> float:
-    """Average comfort score across all features in a tier."""
+def _tier_avg_comfort(comfort: Mapping[str, float], tier: int) -> float:
+    """Average comfort across all features in a tier (unseen count as 0)."""
     keys = TIER_FEATURES.get(tier, [])
     if not keys:
         return 0.0
+    return sum(comfort.get(key, 0.0) for key in keys) / len(keys)
 
-    exposures = (
-        db.query(UserGrammarExposure)
-        .join(GrammarFeature)
-        .filter(GrammarFeature.feature_key.in_(keys))
+
+@dataclass(frozen=True)
+class GrammarState:
+    """Immutable snapshot of the learner's grammar progression.
+
+    ``comfort`` has an entry for every feature with an exposure row;
+    ``introduced`` holds the keys whose lesson was shown. Built once by
+    ``get_grammar_state`` — scoring against it is dictionary lookups only.
+    """
+
+    current_tier: int
+    total_words: int
+    unlocked_features: tuple[str, ...]  # tier order
+    unlocked: frozenset[str]
+    comfort: Mapping[str, float]
+    introduced: frozenset[str]
+    computed_at: datetime
+
+    def pattern_score(self, lemma_grammar_features: Optional[list[str]]) -> float:
+        """See ``grammar_pattern_score``."""
+        if not lemma_grammar_features:
+            return 0.1  # base score for words without grammar tagging
+
+        scores = []
+        for key in lemma_grammar_features:
+            if key not in self.unlocked:
+                continue
+            comfort = self.comfort.get(key)
+            if comfort is None:
+                scores.append(1.0)  # never-seen unlocked feature = high value
+            else:
+                scores.append(max(1.0 - comfort, 0.1))
+
+        if not scores:
+            return 0.1
+
+        return sum(scores) / len(scores)
+
+
+# Session-local, like acquisition_service's FSRS due-count cache. Keyed by the
+# knowledge version (known-word count) and expired after a short TTL (comfort
+# decays with time); exposure writers drop it via invalidate_grammar_state.
+_GRAMMAR_STATE_CACHE_KEY = "alif_grammar_state"
+_GRAMMAR_STATE_TTL = timedelta(minutes=5)
+
+
+def _build_grammar_state(db: Session, now: datetime) -> GrammarState:
+    total_words = _get_total_known_words(db)
+    comfort: dict[str, float] = {}
+    introduced: set[str] = set()
+    for key, times_seen, times_correct, last_seen_at, introduced_at in (
+        db.query(
+            GrammarFeature.feature_key,
+            UserGrammarExposure.times_seen,
+            UserGrammarExposure.times_correct,
+            UserGrammarExposure.last_seen_at,
+            UserGrammarExposure.introduced_at,
+        )
+        .join(GrammarFeature, GrammarFeature.feature_id == UserGrammarExposure.feature_id)
         .all()
-    )
+    ):
+        comfort[key] = compute_comfort(times_seen, times_correct, last_seen_at)
+        if introduced_at is not None:
+            introduced.add(key)
 
-    if not exposures:
-        return 0.0
+    unlocked: list[str] = []
+    max_tier = 0
+    for tier in sorted(TIER_FEATURES.keys()):
+        req = TIER_REQUIREMENTS[tier]
+
+        if "min_words" in req and total_words < req["min_words"]:
+            break
+        if "prev_tier" in req:
+            if _tier_avg_comfort(comfort, req["prev_tier"]) < req["comfort_threshold"]:
+                break
+
+        unlocked.extend(TIER_FEATURES[tier])
+        max_tier = tier
 
-    total = sum(
-        compute_comfort(e.times_seen, e.times_correct, e.last_seen_at)
-        for e in exposures
+    return GrammarState(
+        current_tier=max_tier,
+        total_words=total_words,
+        unlocked_features=tuple(unlocked),
+        unlocked=frozenset(unlocked),
+        comfort=MappingProxyType(comfort),
+        introduced=frozenset(introduced),
+        computed_at=now,
     )
-    return total / len(keys)
+
+
+def get_grammar_state(db: Session) -> GrammarState:
+    """Grammar snapshot for this session, rebuilt when stale.
+
+    A hit costs one knowledge-version read; a miss two more queries.
+    """
+    from app.services.knowledge_version import current_version
+
+    now = clock.now()
+    version = current_version(db)
+    cached = db.info.get(_GRAMMAR_STATE_CACHE_KEY)
+    if cached:
+        cached_version, state = cached
+        if (
+            cached_version == version
+            and timedelta(0) <= now - state.computed_at <= _GRAMMAR_STATE_TTL
+        ):
+            return state
+
+    state = _build_grammar_state(db, now)
+    db.info[_GRAMMAR_STATE_CACHE_KEY] = (version, state)
+    return state
+
+
+def invalidate_grammar_state(db: Session) -> None:
+    """Drop the session's grammar snapshot after an exposure write."""
+    db.info.pop(_GRAMMAR_STATE_CACHE_KEY, None)
 
 
 def get_all_features(db: Session) -> list[dict]:
@@ -250,27 +355,13 @@ def get_user_progress(db: Session) -> list[dict]:
 
 def get_unlocked_features(db: Session) -> dict:
     """Determine which tiers/features are unlocked for the user."""
-    total_words = _get_total_known_words(db)
-    unlocked: list[str] = []
-    max_tier = 0
-
-    for tier in sorted(TIER_FEATURES.keys()):
-        req = TIER_REQUIREMENTS[tier]
-
-        if "min_words" in req and total_words < req["min_words"]:
-            break
-        if "prev_tier" in req:
-            prev_comfort = _tier_avg_comfort(db, req["prev_tier"])
-            if prev_comfort < req["comfort_threshold"]:
-                break
-
-        unlocked.extend(TIER_FEATURES[tier])
-        max_tier = tier
+    state = get_grammar_state(db)
+    unlocked = state.unlocked
 
     return {
-        "current_tier": max_tier,
-        "total_words": total_words,
-        "unlocked_features": unlocked,
+        "current_tier": state.current_tier,
+        "total_words": state.total_words,
+        "unlocked_features": list(state.unlocked_features),
         "all_tiers": {
             tier: {
                 "features": features,
@@ -297,7 +388,7 @@ def record_grammar_exposure(
     if not feature:
         return
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     exposure = (
         db.query(UserGrammarExposure)
         .filter(UserGrammarExposure.feature_id == feature.feature_id)
@@ -323,6 +414,7 @@ def record_grammar_exposure(
         )
         db.add(exposure)
 
+    invalidate_grammar_state(db)
     if commit:
         db.commit()
     else:
@@ -333,35 +425,9 @@ def grammar_pattern_score(db: Session, lemma_grammar_features: Optional[list[str
     """Score how much a word's grammar features would benefit the learner.
 
     Returns higher scores for words with features the user needs practice on
-    (unlocked but low comfort). Used by word_selector as pattern_score.
+    (unlocked but low comfort). Scoring many words? Fetch
+    ``get_grammar_state`` once and call its ``pattern_score`` instead.
     """
     if not lemma_grammar_features:
         return 0.1  # base score for words without grammar tagging
-
-    unlocked_info = get_unlocked_features(db)
-    unlocked_set = set(unlocked_info["unlocked_features"])
-
-    exposure_map: dict[str, UserGrammarExposure] = {}
-    for e in (
-        db.query(UserGrammarExposure)
-        .join(GrammarFeature)
-        .filter(GrammarFeature.feature_key.in_(lemma_grammar_features))
-        .all()
-    ):
-        exposure_map[e.feature.feature_key] = e
-
-    scores = []
-    for key in lemma_grammar_features:
-        if key not in unlocked_set:
-            continue
-        exp = exposure_map.get(key)
-        if exp is None:
-            scores.append(1.0)  # never-seen unlocked feature = high value
-        else:
-            comfort = compute_comfort(exp.times_seen, exp.times_correct, exp.last_seen_at)
-            scores.append(max(1.0 - comfort, 0.1))
-
-    if not scores:
-        return 0.1
-
-    return sum(scores) / len(scores)
+    return get_grammar_state(db).pattern_score(lemma_grammar_features)
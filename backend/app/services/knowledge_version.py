@@ -0,0 +1,216 @@
+"""Knowledge version + ETag/response caching for aggregate endpoints.
+
+Roots, patterns and stats recompute heavy aggregates on
+every poll. ``knowledge_version`` is a one-row counter that SQLite triggers
+bump on every insert/update/delete of the tables those aggregates read:
+reviews (``review_log``, ``sentence_review_log``), introductions and
+scheduling (``user_lemma_knowledge``), lemma/root/pattern mutations and new
+or removed sentences. Triggers rather than ORM hooks, so scripts writing
+over raw ``sqlite3`` bump it too.
+
+`knowledge_cached()` turns the version into a weak ETag and an in-process
+LRU keyed by (path, query params, ETag):
+
+- ``If-None-Match`` matching the ETag → 304 with no body and no recompute;
+- otherwise a cached JSON body for that key, or compute-and-store.
+
+Endpoints whose numbers also move with the clock (due counts, "today",
+24h windows) pass ``window_seconds``; the ETag then carries the time bucket
+too, bounding staleness without activity to one window. The ETag also
+carries a per-process boot token, so a deploy never revalidates a body
+shaped by old code, and the counter is seeded from the wall clock, so a
+recreated database can't replay old versions.
+
+Sibling triggers bump a per-table row in ``table_versions`` as well, for
+consumers that only care about some of the tables — the deep-analytics
+snapshot (services/analytics_snapshot.py) recomputes a section only when
+one of the tables it reads has moved.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app import clock
+
+VERSION_TABLE = "knowledge_version"
+TABLE_VERSIONS_TABLE = "table_versions"
+
+# Tables whose writes bump the version; None = every column, else only
+# updates touching these columns (sentences churn times_shown/last_*_shown_at
+# on every session build, which no aggregate reads).
+TRACKED_TABLES: dict[str, tuple[str, ...] | None] = {
+    "user_lemma_knowledge": None,
+    "review_log": None,
+    "sentence_review_log": None,
+    "lemmas": None,
+    "roots": None,
+    "pattern_info": None,
+    "sentences": (
+        "arabic_text", "english_translation", "transliteration", "is_active",
+        "target_lemma_id", "root_focus_id", "kind", "mappings_verified_at",
+        "quality_reviewed_at", "quality_natural", "quality_translation_correct",
+    ),
+    "sentence_words": None,
+}
+
+RESPONSE_CACHE_SIZE = 128
+
+# Time buckets for clock-dependent endpoints.
+STATS_CACHE_WINDOW_SECONDS = 60
+
+_BOOT = uuid.uuid4().hex[:8]
+
+_BUMP = f"UPDATE {VERSION_TABLE} SET version = version + 1 WHERE id = 1;"
+
+
+def _table_bump(table: str) -> str:
+    return (
+        f"UPDATE {TABLE_VERSIONS_TABLE} SET version = version + 1 "
+        f"WHERE table_name = '{table}';"
+    )
+
+
+def knowledge_version_ddl() -> list[str]:
+    """Bump triggers for every tracked table (the tables themselves are ORM
+    models, `KnowledgeVersion` and `TableVersion`)."""
+    statements = []
+    for table, columns in TRACKED_TABLES.items():
+        update_of = f" OF {', '.join(columns)}" if columns else ""
+        bump = _table_bump(table)
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_ai AFTER INSERT ON {table} "
+            f"BEGIN {_BUMP} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_ad AFTER DELETE ON {table} "
+            f"BEGIN {_BUMP} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_kv_au AFTER UPDATE{update_of} ON {table} "
+            f"BEGIN {_BUMP} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_ai AFTER INSERT ON {table} "
+            f"BEGIN {bump} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_ad AFTER DELETE ON {table} "
+            f"BEGIN {bump} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_tv_au AFTER UPDATE{update_of} ON {table} "
+            f"BEGIN {bump} END",
+        ]
+    return statements
+
+
+def install_knowledge_version(conn) -> None:
+    """Seed the counter rows and create missing triggers. Idempotent; takes
+    a SQLAlchemy Connection."""
+    if conn.dialect.name != "sqlite":
+        return
+    conn.execute(
+        text(f"INSERT OR IGNORE INTO {VERSION_TABLE} (id, version) VALUES (1, :seed)"),
+        {"seed": time.time_ns() // 1000},
+    )
+    for table in TRACKED_TABLES:
+        conn.execute(
+            text(
+                f"INSERT OR IGNORE INTO {TABLE_VERSIONS_TABLE} (table_name, version) "
+                "VALUES (:table, 0)"
+            ),
+            {"table": table},
+        )
+    for statement in knowledge_version_ddl():
+        conn.execute(text(statement))
+
+
+def current_version(db: Session) -> int:
+    return db.execute(
+        text(f"SELECT version FROM {VERSION_TABLE} WHERE id = 1")
+    ).scalar() or 0
+
+
+def table_versions(db: Session) -> dict[str, int]:
+    """Per-table write counters for every tracked table."""
+    return dict(
+        db.execute(text(f"SELECT table_name, version FROM {TABLE_VERSIONS_TABLE}")).all()
+    )
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded JSON bodies."""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _etag(version: int, window_seconds: int | None) -> str:
+    tag = f"{_BOOT}-{version}"
+    if window_seconds:
+        tag += f"-{int(clock.now().timestamp() // window_seconds)}"
+    return f'W/"{tag}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {c.strip() for c in if_none_match.split(",")}
+    # Weak comparison: W/"x" and "x" match.
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+def knowledge_cached(
+    request: Request,
+    db: Session,
+    compute: Callable[[], Any],
+    *,
+    response_model: Any = None,
+    window_seconds: int | None = None,
+) -> Response:
+    """Serve ``compute()`` as JSON behind the knowledge-version ETag.
+
+    ``response_model`` (the endpoint's) is applied when encoding, since the
+    returned Response bypasses FastAPI's own serialization.
+    """
+    etag = _etag(current_version(db), window_seconds)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), etag)
+    body = response_cache.get(key)
+    if body is None:
+        result = compute()
+        if response_model is not None:
+            adapter = TypeAdapter(response_model)
+            body = adapter.dump_python(adapter.validate_python(result), mode="json")
+        else:
+            body = jsonable_encoder(result)
+        response_cache.put(key, body)
+    return JSONResponse(content=body, headers=headers)
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import FrequencyCoreEntry, Lemma, ReviewLog, UserLemmaKnowledge
 from app.services.activity_log import log_activity
 from app.services.frequency_lanes import is_low_priority_lemma
@@ -150,7 +151,7 @@ def check_and_manage_leeches(db: Session) -> list[int]:
             lemma = _get_lemma(db, ulk.lemma_id)
             core_rank = _get_core_rank(db, ulk.lemma_id)
             ulk.knowledge_state = "suspended"
-            ulk.leech_suspended_at = datetime.now(timezone.utc)
+            ulk.leech_suspended_at = clock.now()
             ulk.leech_count = (ulk.leech_count or 0) + 1
             ulk.acquisition_box = None
             ulk.acquisition_next_due = None
@@ -180,7 +181,8 @@ def check_and_manage_leeches(db: Session) -> list[int]:
     return suspended
 
 
-def check_leech_reintroductions(db: Session) -> list[int]:
+@clock.honors_at
+def check_leech_reintroductions(db: Session, at: datetime | None = None) -> list[int]:
     """Check for leeches ready for reintroduction based on graduated cooldown.
 
     Cooldown: 3d (1st), 7d (2nd), 14d (3rd+) based on leech_count.
@@ -196,7 +198,7 @@ def check_leech_reintroductions(db: Session) -> list[int]:
         start_acquisition,
     )
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
 
     # Fetch all suspended leeches (those with leech_suspended_at set)
     suspended_leeches = (
@@ -347,11 +349,26 @@ def check_leech_reintroductions(db: Session) -> list[int]:
     return reintroduced
 
 
+def _logs_since(
+    review_logs: list[ReviewLog], since: datetime | None
+) -> list[ReviewLog]:
+    """In-memory ``reviewed_at >= since`` over preloaded rows."""
+    if since is None:
+        return list(review_logs)
+    since = _as_utc(since)
+    return [
+        row
+        for row in review_logs
+        if row.reviewed_at is not None and _as_utc(row.reviewed_at) >= since
+    ]
+
+
 def _recent_accuracy(
     db: Session,
     lemma_id: int,
     window: int = LEECH_WINDOW_SIZE,
     since: datetime | None = None,
+    review_logs: list[ReviewLog] | None = None,
 ) -> float | None:
     """Compute accuracy over the last `window` reviews. Returns None if < LEECH_MIN_REVIEWS.
 
@@ -359,22 +376,41 @@ def _recent_accuracy(
     after a failure) are excluded: same-session recall is working memory and
     must not mask a leech. Quiz misses still count — a failed bare recall is
     genuine evidence.
+
+    ``review_logs`` is the lemma's full ReviewLog history when the caller
+    already holds it (batched sync); it replaces the query.
     """
     from sqlalchemy import or_
 
-    query = db.query(ReviewLog).filter(
-        ReviewLog.lemma_id == lemma_id,
-        or_(
-            ReviewLog.review_mode.is_(None),
-            ReviewLog.review_mode != "quiz",
-            ReviewLog.rating < 3,
-        ),
-    )
-    if since is not None:
-        query = query.filter(ReviewLog.reviewed_at >= since)
+    if review_logs is not None:
+        rows = sorted(
+            (
+                row
+                for row in _logs_since(review_logs, since)
+                if row.review_mode != "quiz"
+                or (row.rating is not None and row.rating < 3)
+            ),
+            key=lambda row: (
+                _as_utc(row.reviewed_at)
+                or datetime.min.replace(tzinfo=timezone.utc)
+            ),
+            reverse=True,
+        )
+    else:
+        query = db.query(ReviewLog).filter(
+            ReviewLog.lemma_id == lemma_id,
+            or_(
+                ReviewLog.review_mode.is_(None),
+                ReviewLog.review_mode != "quiz",
+                ReviewLog.rating < 3,
+            ),
+        )
+        if since is not None:
+            query = query.filter(ReviewLog.reviewed_at >= since)
+        rows = query.order_by(ReviewLog.reviewed_at.desc()).all()
     recent = [
         row
-        for row in query.order_by(ReviewLog.reviewed_at.desc()).all()
+        for row in rows
         if not is_form_recovery_protected_log(row)
     ][:window]
     if len(recent) < LEECH_MIN_REVIEWS:
@@ -383,29 +419,38 @@ def _recent_accuracy(
     return correct / len(recent)
 
 
-def is_leech(ulk: UserLemmaKnowledge, db: Session | None = None) -> bool:
+def is_leech(
+    ulk: UserLemmaKnowledge,
+    db: Session | None = None,
+    review_logs: list[ReviewLog] | None = None,
+) -> bool:
     """Check if a word meets leech criteria using sliding window accuracy.
 
     Uses last LEECH_WINDOW_SIZE reviews instead of cumulative stats so that
     words can escape leech status by improving recent performance.
+    ``review_logs`` (see `_recent_accuracy`) stands in for the ReviewLog queries.
     """
     if (ulk.times_seen or 0) < LEECH_MIN_REVIEWS:
         return False
     if db is not None:
         since = ulk.acquisition_started_at if _is_active_reintro_episode(ulk) else None
-        acc = _recent_accuracy(db, ulk.lemma_id, since=since)
+        acc = _recent_accuracy(db, ulk.lemma_id, since=since, review_logs=review_logs)
         if acc is not None:
             return acc < LEECH_MAX_ACCURACY
-        protected_query = db.query(ReviewLog).filter(
-            ReviewLog.lemma_id == ulk.lemma_id
-        )
-        if since is not None:
-            protected_query = protected_query.filter(
-                ReviewLog.reviewed_at >= since
+        if review_logs is not None:
+            protected_rows = _logs_since(review_logs, since)
+        else:
+            protected_query = db.query(ReviewLog).filter(
+                ReviewLog.lemma_id == ulk.lemma_id
             )
+            if since is not None:
+                protected_query = protected_query.filter(
+                    ReviewLog.reviewed_at >= since
+                )
+            protected_rows = protected_query.all()
         if any(
             is_form_recovery_protected_log(row)
-            for row in protected_query.all()
+            for row in protected_rows
         ):
             # The minimum evidence window is five canonical judgments. A
             # token-isolated form event is outside that denominator, so do not
@@ -420,26 +465,35 @@ def is_leech(ulk: UserLemmaKnowledge, db: Session | None = None) -> bool:
     return accuracy < LEECH_MAX_ACCURACY
 
 
-def check_single_word_leech(db: Session, lemma_id: int) -> bool:
+def check_single_word_leech(
+    db: Session,
+    lemma_id: int,
+    *,
+    ulk: UserLemmaKnowledge | None = None,
+    review_logs: list[ReviewLog] | None = None,
+) -> bool:
     """Check if a specific word just became a leech after a review.
 
     Call this after each review submission. Returns True if word was suspended.
+    Batch callers pass the already-loaded ``ulk`` and the lemma's full
+    ``review_logs`` history to skip the per-word queries.
     """
-    ulk = (
-        db.query(UserLemmaKnowledge)
-        .filter(UserLemmaKnowledge.lemma_id == lemma_id)
-        .first()
-    )
+    if ulk is None:
+        ulk = (
+            db.query(UserLemmaKnowledge)
+            .filter(UserLemmaKnowledge.lemma_id == lemma_id)
+            .first()
+        )
     if not ulk or ulk.knowledge_state == "suspended":
         return False
 
-    if is_leech(ulk, db=db):
+    if is_leech(ulk, db=db, review_logs=review_logs):
         since = ulk.acquisition_started_at if _is_active_reintro_episode(ulk) else None
-        acc = _recent_accuracy(db, lemma_id, since=since) or 0
+        acc = _recent_accuracy(db, lemma_id, since=since, review_logs=review_logs) or 0
         lemma = _get_lemma(db, lemma_id)
         core_rank = _get_core_rank(db, lemma_id)
         ulk.knowledge_state = "suspended"
-        ulk.leech_suspended_at = datetime.now(timezone.utc)
+        ulk.leech_suspended_at = clock.now()
         ulk.leech_count = (ulk.leech_count or 0) + 1
         ulk.acquisition_box = None
         ulk.acquisition_next_due = None
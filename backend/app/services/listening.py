@@ -9,11 +9,17 @@ Also handles comprehension signal processing — when a user marks
 "didn't catch any of that" or specific missed words in listening mode,
 we need to downgrade those words' listening confidence without necessarily
 treating them as failed reading reviews.
+
+Scoring is set-based: every word's confidence comes from one preloaded
+``lemma_id -> confidence`` table (`load_listening_confidence`), and
+candidate sentences are fetched per chunk of due lemmas together with
+their words, so `get_listening_candidates` issues a fixed handful of
+queries however many sentences and words the corpus holds.
 """
 
 import json
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -35,33 +41,37 @@ MAX_LISTENING_WORDS = 10
 # Minimum times a word must have been reviewed to be listening-ready
 MIN_REVIEWS_FOR_LISTENING = 3
 
+# Confidence assumed for function words / unlinked tokens
+FUNCTION_WORD_CONFIDENCE = 0.9
 
-def _get_word_listening_confidence(knowledge: Optional[UserLemmaKnowledge]) -> float:
-    """Score how confidently a user knows a word for listening (0.0-1.0).
+# Due lemmas whose sentences are fetched per query in get_listening_candidates
+LISTENING_CANDIDATE_CHUNK = 200
 
-    Higher scores mean the word is very well-known and unlikely to
-    cause confusion in a listening context.
-    """
-    if knowledge is None:
-        return 0.0
 
-    if knowledge.knowledge_state == "new":
+def _card_dict(card_data) -> dict:
+    if isinstance(card_data, str):
+        card_data = json.loads(card_data)
+    return card_data or {}
+
+
+def _listening_confidence_from(
+    knowledge_state: Optional[str],
+    times_seen: Optional[int],
+    times_correct: Optional[int],
+    card: dict,
+) -> float:
+    if knowledge_state == "new":
         return 0.0
 
-    if knowledge.knowledge_state == "lapsed":
+    if knowledge_state == "lapsed":
         return 0.1
 
-    times_seen = knowledge.times_seen or 0
+    times_seen = times_seen or 0
     if times_seen < MIN_REVIEWS_FOR_LISTENING:
         return 0.2
 
     # Check FSRS stability
-    stability_days = 0.0
-    if knowledge.fsrs_card_json:
-        card_data = knowledge.fsrs_card_json
-        if isinstance(card_data, str):
-            card_data = json.loads(card_data)
-        stability_days = card_data.get("stability", 0.0)
+    stability_days = card.get("stability", 0.0) or 0.0
 
     if stability_days < 1.0:
         return 0.3
@@ -71,80 +81,204 @@ def _get_word_listening_confidence(knowledge: Optional[UserLemmaKnowledge]) -> f
         return 0.7
 
     # Very well-known word
-    accuracy = (knowledge.times_correct or 0) / max(times_seen, 1)
+    accuracy = (times_correct or 0) / max(times_seen, 1)
     return min(0.7 + accuracy * 0.3, 1.0)
 
 
-def score_sentence_for_listening(
-    db: Session,
-    sentence_id: int,
-    target_lemma_id: Optional[int] = None,
-) -> dict:
-    """Score how suitable a sentence is for listening practice.
+def _get_word_listening_confidence(knowledge: Optional[UserLemmaKnowledge]) -> float:
+    """Score how confidently a user knows a word for listening (0.0-1.0).
 
-    Returns a dict with:
-    - confidence: 0.0-1.0 overall confidence
-    - word_count: number of words
-    - weakest_word: the word with lowest confidence (excluding target)
-    - all_words_known: whether all words are known state
+    Higher scores mean the word is very well-known and unlikely to
+    cause confusion in a listening context.
     """
-    words = (
-        db.query(SentenceWord)
-        .filter(SentenceWord.sentence_id == sentence_id)
-        .order_by(SentenceWord.position)
-        .all()
+    if knowledge is None:
+        return 0.0
+    return _listening_confidence_from(
+        knowledge.knowledge_state,
+        knowledge.times_seen,
+        knowledge.times_correct,
+        _card_dict(knowledge.fsrs_card_json),
     )
 
-    if not words:
-        return {"confidence": 0.0, "word_count": 0, "all_words_known": False}
 
+def _knowledge_rows(db: Session, lemma_ids: Optional[Iterable[int]] = None):
+    query = db.query(
+        UserLemmaKnowledge.lemma_id,
+        UserLemmaKnowledge.knowledge_state,
+        UserLemmaKnowledge.times_seen,
+        UserLemmaKnowledge.times_correct,
+        UserLemmaKnowledge.fsrs_card_json,
+    )
+    if lemma_ids is not None:
+        query = query.filter(UserLemmaKnowledge.lemma_id.in_(list(lemma_ids)))
+    return query.all()
+
+
+def load_listening_confidence(
+    db: Session, lemma_ids: Optional[Iterable[int]] = None,
+) -> dict[int, float]:
+    """Listening confidence per lemma in one column query (no ORM objects).
+
+    Lemmas without a knowledge row are absent; callers treat them as 0.0.
+    """
+    return {
+        lemma_id: _listening_confidence_from(state, seen, correct, _card_dict(card))
+        for lemma_id, state, seen, correct, card in _knowledge_rows(db, lemma_ids)
+    }
+
+
+def _score_words(
+    lemma_ids: list[Optional[int]],
+    target_lemma_id: Optional[int],
+    confidence: dict[int, float],
+) -> Optional[tuple[float, bool, Optional[int], float]]:
+    """Score a sentence's words (in position order) against a confidence
+    table. Returns ``(confidence, all_words_known, weakest_lemma_id,
+    weakest_confidence)``, or None when no word counts."""
     confidences = []
-    weakest = None
+    weakest_id = None
     weakest_conf = 1.0
 
-    for sw in words:
-        if sw.lemma_id is None:
+    for lemma_id in lemma_ids:
+        if lemma_id is None:
             # Function word or unlinked — assume known
-            confidences.append(0.9)
+            confidences.append(FUNCTION_WORD_CONFIDENCE)
             continue
 
-        if sw.lemma_id == target_lemma_id:
+        if lemma_id == target_lemma_id:
             # Skip target word — we're testing this one
             continue
 
-        knowledge = (
-            db.query(UserLemmaKnowledge)
-            .filter(UserLemmaKnowledge.lemma_id == sw.lemma_id)
-            .first()
-        )
-        conf = _get_word_listening_confidence(knowledge)
+        conf = confidence.get(lemma_id, 0.0)
         confidences.append(conf)
-
         if conf < weakest_conf:
             weakest_conf = conf
-            lemma = db.query(Lemma).filter(Lemma.lemma_id == sw.lemma_id).first()
-            weakest = {
-                "lemma_id": sw.lemma_id,
-                "lemma_ar": lemma.lemma_ar if lemma else "?",
-                "confidence": conf,
-            }
+            weakest_id = lemma_id
 
     if not confidences:
-        return {"confidence": 0.0, "word_count": len(words), "all_words_known": False}
+        return None
 
     # Overall confidence is the minimum word confidence
     # (chain is only as strong as weakest link for listening)
     min_conf = min(confidences)
     avg_conf = sum(confidences) / len(confidences)
+    return (
+        round(min_conf * 0.6 + avg_conf * 0.4, 3),
+        min_conf >= 0.5,
+        weakest_id,
+        weakest_conf,
+    )
+
+
+def score_sentence_for_listening(
+    db: Session,
+    sentence_id: int,
+    target_lemma_id: Optional[int] = None,
+    confidence: Optional[dict[int, float]] = None,
+) -> dict:
+    """Score how suitable a sentence is for listening practice.
+
+    Pass a preloaded ``confidence`` table (`load_listening_confidence`) when
+    scoring many sentences; otherwise only this sentence's lemmas are loaded.
+
+    Returns a dict with:
+    - confidence: 0.0-1.0 overall confidence
+    - word_count: number of words
+    - weakest_word: the word with lowest confidence (excluding target)
+    - all_words_known: whether all words are known state
+    """
+    lemma_ids = [
+        row[0]
+        for row in db.query(SentenceWord.lemma_id)
+        .filter(SentenceWord.sentence_id == sentence_id)
+        .order_by(SentenceWord.position)
+        .all()
+    ]
+
+    if not lemma_ids:
+        return {"confidence": 0.0, "word_count": 0, "all_words_known": False}
+
+    if confidence is None:
+        confidence = load_listening_confidence(
+            db, {lid for lid in lemma_ids if lid is not None}
+        )
+
+    scored = _score_words(lemma_ids, target_lemma_id, confidence)
+    if scored is None:
+        return {"confidence": 0.0, "word_count": len(lemma_ids), "all_words_known": False}
+
+    overall, all_known, weakest_id, weakest_conf = scored
+    weakest = None
+    if weakest_id is not None:
+        lemma_ar = (
+            db.query(Lemma.lemma_ar).filter(Lemma.lemma_id == weakest_id).scalar()
+        )
+        weakest = {
+            "lemma_id": weakest_id,
+            "lemma_ar": lemma_ar or "?",
+            "confidence": weakest_conf,
+        }
 
     return {
-        "confidence": round(min_conf * 0.6 + avg_conf * 0.4, 3),
-        "word_count": len(words),
-        "all_words_known": min_conf >= 0.5,
+        "confidence": overall,
+        "word_count": len(lemma_ids),
+        "all_words_known": all_known,
         "weakest_word": weakest,
     }
 
 
+def _parse_due(card: dict) -> Optional[datetime]:
+    due_str = card.get("due")
+    if not due_str:
+        return None
+    due_dt = datetime.fromisoformat(due_str)
+    if due_dt.tzinfo is None:
+        due_dt = due_dt.replace(tzinfo=timezone.utc)
+    return due_dt
+
+
+def _best_sentences_for_chunk(
+    db: Session,
+    lemma_ids: list[int],
+    max_word_count: int,
+    min_confidence: float,
+    confidence: dict[int, float],
+) -> dict[int, tuple[int, float]]:
+    """Best listening sentence per target lemma for one chunk of due lemmas:
+    ``{lemma_id: (sentence_id, confidence)}``. One query fetches every
+    candidate sentence's words; ties keep the lowest sentence id."""
+    rows = (
+        db.query(Sentence.id, Sentence.target_lemma_id, SentenceWord.lemma_id)
+        .join(SentenceWord, SentenceWord.sentence_id == Sentence.id)
+        .filter(Sentence.target_lemma_id.in_(lemma_ids))
+        .filter(
+            (Sentence.max_word_count <= max_word_count)
+            | (Sentence.max_word_count.is_(None))
+        )
+        .order_by(Sentence.id, SentenceWord.position)
+        .all()
+    )
+
+    words_by_sentence: dict[int, list[Optional[int]]] = {}
+    target_by_sentence: dict[int, int] = {}
+    for sentence_id, target_lemma_id, lemma_id in rows:
+        words_by_sentence.setdefault(sentence_id, []).append(lemma_id)
+        target_by_sentence[sentence_id] = target_lemma_id
+
+    best: dict[int, tuple[int, float]] = {}
+    for sentence_id, lemma_seq in words_by_sentence.items():
+        target = target_by_sentence[sentence_id]
+        scored = _score_words(lemma_seq, target, confidence)
+        if scored is None:
+            continue
+        conf = scored[0]
+        if conf < min_confidence:
+            continue
+        if target not in best or conf > best[target][1]:
+            best[target] = (sentence_id, conf)
+    return best
+
+
 def get_listening_candidates(
     db: Session,
     limit: int = 10,
@@ -158,74 +292,77 @@ def get_listening_candidates(
     """
     now = datetime.now(timezone.utc)
 
-    # Get all due knowledge records
-    knowledges = (
-        db.query(UserLemmaKnowledge)
-        .join(Lemma)
-        .filter(UserLemmaKnowledge.fsrs_card_json.isnot(None))
-        .all()
-    )
-
+    # One pass over knowledge builds both the confidence table and the
+    # due list, parsing each FSRS card once.
+    confidence: dict[int, float] = {}
+    states: dict[int, str] = {}
     due_items = []
-    for k in knowledges:
-        card_data = k.fsrs_card_json
-        if isinstance(card_data, str):
-            card_data = json.loads(card_data)
-        due_str = card_data.get("due")
-        if due_str:
-            due_dt = datetime.fromisoformat(due_str)
-            if due_dt.tzinfo is None:
-                due_dt = due_dt.replace(tzinfo=timezone.utc)
-            if due_dt <= now:
-                due_items.append((k, due_dt))
+    for lemma_id, state, seen, correct, card_data in _knowledge_rows(db):
+        card = _card_dict(card_data)
+        confidence[lemma_id] = _listening_confidence_from(state, seen, correct, card)
+        if card_data is None:
+            continue
+        due_dt = _parse_due(card)
+        if due_dt is not None and due_dt <= now:
+            due_items.append((lemma_id, due_dt))
+            states[lemma_id] = state
 
     due_items.sort(key=lambda x: x[1])
 
-    # For each due item, find a suitable sentence
-    results = []
-    for k, due_dt in due_items:
-        if len(results) >= limit:
+    # For each due lemma (in due order), pick its best sentence
+    picks = []
+    for start in range(0, len(due_items), LISTENING_CANDIDATE_CHUNK):
+        if len(picks) >= limit:
             break
-
-        lemma = k.lemma
-
-        # Find sentences for this lemma that are short enough
-        sentences = (
-            db.query(Sentence)
-            .filter(Sentence.target_lemma_id == lemma.lemma_id)
-            .filter(
-                (Sentence.max_word_count <= max_word_count)
-                | (Sentence.max_word_count.is_(None))
-            )
-            .all()
+        chunk = due_items[start:start + LISTENING_CANDIDATE_CHUNK]
+        best = _best_sentences_for_chunk(
+            db, [lemma_id for lemma_id, _ in chunk],
+            max_word_count, min_confidence, confidence,
         )
+        for lemma_id, due_dt in chunk:
+            if lemma_id in best:
+                picks.append((lemma_id, due_dt, *best[lemma_id]))
+                if len(picks) >= limit:
+                    break
+
+    if not picks:
+        return []
+
+    lemmas = {
+        lemma.lemma_id: lemma
+        for lemma in db.query(Lemma)
+        .filter(Lemma.lemma_id.in_([p[0] for p in picks]))
+        .all()
+    }
+    sentences = {
+        sent.id: sent
+        for sent in db.query(Sentence)
+        .filter(Sentence.id.in_([p[2] for p in picks]))
+        .all()
+    }
 
-        best_sentence = None
-        best_confidence = 0.0
-
-        for sent in sentences:
-            score = score_sentence_for_listening(db, sent.id, lemma.lemma_id)
-            if score["confidence"] >= min_confidence and score["confidence"] > best_confidence:
-                best_confidence = score["confidence"]
-                best_sentence = sent
-
-        if best_sentence:
-            results.append({
-                "lemma_id": lemma.lemma_id,
-                "lemma_ar": lemma.lemma_ar,
-                "lemma_ar_bare": lemma.lemma_ar_bare,
-                "gloss_en": lemma.gloss_en,
-                "audio_url": lemma.audio_url,
-                "knowledge_state": k.knowledge_state,
-                "due": due_dt.isoformat(),
-                "sentence": {
-                    "id": best_sentence.id,
-                    "arabic": best_sentence.arabic_text,
-                    "english": best_sentence.english_translation,
-                    "transliteration": best_sentence.transliteration,
-                    "audio_url": best_sentence.audio_url,
-                },
-                "listening_confidence": best_confidence,
-            })
+    results = []
+    for lemma_id, due_dt, sentence_id, best_confidence in picks:
+        lemma = lemmas.get(lemma_id)
+        if lemma is None:
+            continue
+        best_sentence = sentences[sentence_id]
+        results.append({
+            "lemma_id": lemma.lemma_id,
+            "lemma_ar": lemma.lemma_ar,
+            "lemma_ar_bare": lemma.lemma_ar_bare,
+            "gloss_en": lemma.gloss_en,
+            "audio_url": lemma.audio_url,
+            "knowledge_state": states[lemma_id],
+            "due": due_dt.isoformat(),
+            "sentence": {
+                "id": best_sentence.id,
+                "arabic": best_sentence.arabic_text,
+                "english": best_sentence.english_translation,
+                "transliteration": best_sentence.transliteration,
+                "audio_url": best_sentence.audio_url,
+            },
+            "listening_confidence": best_confidence,
+        })
 
     return results
@@ -25,22 +25,73 @@ Claude CLI requires `claude` installed and authenticated (`claude setup-token`).
 Codex CLI requires `codex` installed and authenticated (`codex auth`).
 """
 
+import asyncio
 import json
+import logging
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
-import litellm
 from pydantic import BaseModel
 
 from app.config import settings
 
-litellm.set_verbose = False
+_litellm_module = None
+_litellm_lock = threading.Lock()
+_cost_tracking_project: str | None = None
+
+
+def enable_cost_tracking(project: str) -> None:
+    """Attach limbic's cost_log callback to litellm (limbic mounted via
+    PYTHONPATH). Deferred until litellm is first imported so registering at
+    API startup doesn't pay litellm's import cost."""
+    global _cost_tracking_project
+    _cost_tracking_project = project
+    if _litellm_module is not None:
+        _register_cost_tracking(_litellm_module)
+
+
+def _register_cost_tracking(litellm) -> None:
+    if _cost_tracking_project is None:
+        return
+    try:
+        from limbic.cerebellum.cost_log import cost_log
+    except ImportError:
+        return
+    litellm.callbacks = [cost_log.callback(_cost_tracking_project)]
+    logging.getLogger(__name__).info("LLM cost tracking active → %s", cost_log.db_path)
+
+
+def _litellm():
+    """litellm, imported on first API-fallback call. Importing it costs
+    seconds (it pulls in openai, tokenizers and every provider's types), and
+    most processes only ever use the CLI providers."""
+    global _litellm_module
+    if _litellm_module is None:
+        # litellm's own lazy submodule loading isn't safe to race from the
+        # background-task threads that may all hit this first.
+        with _litellm_lock:
+            if _litellm_module is None:
+                import litellm
+
+                litellm.set_verbose = False
+                _register_cost_tracking(litellm)
+                _litellm_module = litellm
+    return _litellm_module
+
+
+def __getattr__(name: str):
+    # `app.services.llm.litellm` (e.g. patch targets in tests) still resolves,
+    # importing litellm only when someone actually asks for it.
+    if name == "litellm":
+        return _litellm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Strip CLAUDECODE env var to allow nested invocation from Claude Code sessions
 _CLEAN_ENV = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
@@ -466,7 +517,7 @@ def generate_completion(
             if json_mode:
                 kwargs["response_format"] = {"type": "json_object"}
 
-            response = litellm.completion(**kwargs)
+            response = _litellm().completion(**kwargs)
             elapsed = time.time() - start
 
             content = response.choices[0].message.content
@@ -505,6 +556,87 @@ def generate_completion(
     raise AllProvidersFailed(f"All LLM providers failed: {'; '.join(errors)}")
 
 
+async def stream_completion(
+    prompt: str,
+    system_prompt: str = "",
+    temperature: float = 0.7,
+    timeout: int = 60,
+    model_override: str | None = None,
+    task_type: str | None = None,
+) -> AsyncIterator[str]:
+    """Streaming, plain-text counterpart of `generate_completion`.
+
+    Yields content deltas as the provider produces them, via litellm's async
+    client, so interactive callers never hold a threadpool worker for the
+    length of the call. API chain only — the CLI providers can't stream.
+    Falls back to the next model only if nothing has been yielded yet; a
+    failure mid-stream raises LLMError.
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+
+    if model_override:
+        models_to_try = [m for m in MODELS if m["name"] == model_override]
+        if not models_to_try:
+            raise LLMError(f"Unknown model override: {model_override}")
+    else:
+        models_to_try = MODELS
+
+    # First use pays litellm's import cost; keep it off the event loop.
+    litellm = await asyncio.to_thread(_litellm)
+    errors: list[str] = []
+
+    for model_config in models_to_try:
+        api_key = _get_api_key(model_config)
+        if not api_key:
+            continue
+
+        start = time.time()
+        started = False
+        try:
+            response = await litellm.acompletion(
+                model=model_config["model"],
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout,
+                api_key=api_key,
+                stream=True,
+            )
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    started = True
+                    yield delta
+        except Exception as e:
+            _log_call(
+                settings.log_dir,
+                model_config["model"],
+                False,
+                time.time() - start,
+                error=str(e),
+                prompt_length=len(prompt),
+                task_type=task_type,
+            )
+            if started:
+                raise LLMError(f"{model_config['name']}: stream interrupted: {e}") from e
+            errors.append(f"{model_config['name']}: {e}")
+            continue
+
+        _log_call(
+            settings.log_dir,
+            model_config["model"],
+            True,
+            time.time() - start,
+            prompt_length=len(prompt),
+            task_type=task_type,
+        )
+        return
+
+    raise AllProvidersFailed(f"All LLM providers failed: {'; '.join(errors)}")
+
+
 def format_known_words_by_pos(known_words: list[dict]) -> str:
     """Format known words grouped by part of speech for clearer LLM prompts."""
     groups: dict[str, list[str]] = {"NOUNS": [], "VERBS": [], "ADJECTIVES": [], "OTHER": []}
@@ -0,0 +1,155 @@
+"""Token-budgeted, concurrent LLM batches for import pipelines.
+
+Book translation, corpus enrichment and story word glossing used to send
+their batches one after another, so a long import was bounded by request
+latency rather than provider throughput. These helpers:
+
+- size batches by an estimated token budget instead of a fixed item count
+  (`plan_batches`), so short sentences share a call and long ones don't
+  overflow it;
+- run several batches at once (`map_batches`, ``ALIF_IMPORT_LLM_CONCURRENCY``,
+  default 4 — the CLI providers each spawn a subprocess, so keep it modest);
+- retry only what failed: a batch that raised (`map_batches`) or the items a
+  response left out (`run_keyed_batches`).
+
+Callers keep their own prompt building and parsing, and must not touch ORM
+objects inside ``call`` — it runs on worker threads without a session.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+
+DEFAULT_CONCURRENCY = int(os.environ.get("ALIF_IMPORT_LLM_CONCURRENCY", "4"))
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Rough token count: vocalized Arabic runs ~3 characters per token."""
+    return len(text or "") // 3 + 1
+
+
+def plan_batches(
+    items: Sequence[T],
+    *,
+    cost: Callable[[T], int],
+    max_tokens: int,
+    max_items: int | None = None,
+) -> list[list[T]]:
+    """Greedy in-order batches whose summed ``cost`` stays within
+    ``max_tokens`` (an item over budget gets a batch of its own)."""
+    batches: list[list[T]] = []
+    current: list[T] = []
+    used = 0
+    for item in items:
+        item_cost = max(1, cost(item))
+        full = max_items is not None and len(current) >= max_items
+        if current and (full or used + item_cost > max_tokens):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += item_cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def map_batches(
+    call: Callable[[list[T]], R],
+    batches: Sequence[list[T]],
+    *,
+    concurrency: int | None = None,
+    retries: int = 1,
+    label: str = "llm batch",
+) -> list[R | BaseException]:
+    """Run ``call`` on every batch concurrently; results come back in batch
+    order. A batch that raises is retried up to ``retries`` times and then
+    returned as its exception, so one bad batch never sinks the others."""
+    results: list[R | BaseException] = [None] * len(batches)  # type: ignore[list-item]
+    pending = list(range(len(batches)))
+    workers = max(1, min(concurrency or DEFAULT_CONCURRENCY, len(batches) or 1))
+    pool = (
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-batch")
+        if workers > 1
+        else None
+    )
+    try:
+        for attempt in range(retries + 1):
+            if not pending:
+                break
+            failed = []
+            if pool is None:
+                # One batch (or concurrency 1): run inline, no thread hop.
+                for i in pending:
+                    try:
+                        results[i] = call(batches[i])
+                    except Exception as exc:
+                        results[i] = exc
+                        failed.append(i)
+            else:
+                futures = {i: pool.submit(call, batches[i]) for i in pending}
+                for i, future in futures.items():
+                    try:
+                        results[i] = future.result()
+                    except Exception as exc:
+                        results[i] = exc
+                        failed.append(i)
+            if failed and attempt < retries:
+                logger.warning(
+                    "%s: %d/%d batches failed, retrying", label, len(failed), len(pending)
+                )
+            pending = failed
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    for i in pending:
+        logger.warning("%s: batch of %d failed: %s", label, len(batches[i]), results[i])
+    return results
+
+
+def run_keyed_batches(
+    items: Sequence[T],
+    call: Callable[[list[T]], dict[K, R]],
+    *,
+    key: Callable[[T], K],
+    cost: Callable[[T], int],
+    max_tokens: int,
+    max_items: int | None = None,
+    concurrency: int | None = None,
+    retries: int = 1,
+    label: str = "llm batch",
+) -> dict[K, R]:
+    """Batch ``items`` by token budget, run the batches concurrently and
+    merge the keyed results. Items missing from a response (or from a batch
+    that raised) are re-batched and retried up to ``retries`` times; whatever
+    is still missing is simply absent from the returned dict."""
+    results: dict[K, R] = {}
+    pending = list(items)
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        batches = plan_batches(pending, cost=cost, max_tokens=max_tokens, max_items=max_items)
+        outcomes = map_batches(
+            call, batches, concurrency=concurrency, retries=0, label=label,
+        )
+        missing: list[T] = []
+        for batch, outcome in zip(batches, outcomes):
+            found = outcome if isinstance(outcome, dict) else {}
+            for item in batch:
+                k = key(item)
+                if k in found:
+                    results[k] = found[k]
+                else:
+                    missing.append(item)
+        if missing and attempt < retries:
+            logger.info("%s: retrying %d/%d items", label, len(missing), len(pending))
+        pending = missing
+    return results
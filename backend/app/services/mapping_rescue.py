@@ -31,6 +31,8 @@ reopen → write, in line with CLAUDE.md Rule #10.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -42,10 +44,12 @@ from sqlalchemy.orm import Session, joinedload
 from app.database import SessionLocal
 from app.models import FrequencyCoreEntry, Lemma, Sentence, SentenceWord
 from app.services.canonical_resolution import resolve_canonical_lemma_id
+from app.services.llm_batching import DEFAULT_CONCURRENCY, map_batches
 from app.services.sentence_eligibility import (
     CORPUS_BLOCKED_SENTINEL,
     CORPUS_QUALITY_REJECTED_SENTINEL,
     MAPPING_VERIFICATION_MIN_AT,
+    has_current_mapping_verification,
     has_no_completed_authentic_quality_failure,
     mapping_verification_retryable_before,
     not_has_unmapped_words,
@@ -77,6 +81,10 @@ RESCUE_BATCH_SIZE = 15  # sentences per batch_verify_sentences call
 # leave the corpus in a "every active sentence is currently verified" state.
 REVERIFY_BATCH_SIZE = 15
 
+# Folded into every verification fingerprint: moving the verifier cutoff (or
+# bumping the prefix after a prompt change) invalidates them all.
+REVERIFY_FINGERPRINT_VERSION = f"1:{MAPPING_VERIFICATION_MIN_AT.isoformat()}"
+
 
 @dataclass
 class RescueStats:
@@ -105,6 +113,7 @@ class _VerificationSnapshot:
     payload: dict
     verification_stamp: datetime | None
     state_signature: tuple
+    fingerprint: str | None = None
 
 
 def _sentence_state_signature(
@@ -864,6 +873,8 @@ class ReverifyStats:
     sentences_skipped_changed: int = 0
     sentences_target_invalid: int = 0
     targets_repaired: int = 0
+    # Currently stamped and fingerprint unchanged — no LLM call made.
+    sentences_unchanged: int = 0
 
     def to_dict(self) -> dict:
         return self.__dict__.copy()
@@ -942,23 +953,136 @@ def _all_active_reviewable_sentence_ids(db: Session) -> list[int]:
     ]
 
 
+def _verification_fingerprint(
+    sentence: Sentence,
+    words: Iterable[SentenceWord],
+    lemma_map: dict[int, Lemma],
+) -> str:
+    """Hash of everything the verifier sees for this sentence.
+
+    Text, mapping rows, target, and the referenced lemmas' prompt fields
+    (form, POS, gloss, canonical link), plus the verifier version. A stored
+    fingerprint equal to the current one means a re-check would ask the
+    model the same question again.
+    """
+    word_rows = sorted(
+        (w.position, w.surface_form, w.lemma_id, bool(w.is_target_word))
+        for w in words
+    )
+    lemma_rows = []
+    for lemma_id in sorted({row[2] for row in word_rows if row[2] is not None}):
+        lemma = lemma_map.get(lemma_id)
+        lemma_rows.append(
+            None if lemma is None else (
+                lemma_id, lemma.lemma_ar, lemma.lemma_ar_bare, lemma.pos,
+                lemma.gloss_en, lemma.canonical_lemma_id,
+            )
+        )
+    payload = [
+        REVERIFY_FINGERPRINT_VERSION,
+        sentence.arabic_text,
+        sentence.english_translation or "",
+        sentence.target_lemma_id,
+        word_rows,
+        lemma_rows,
+    ]
+    return hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, default=str).encode()
+    ).hexdigest()[:32]
+
+
+def _read_reverify_batch(
+    chunk_ids: list[int],
+    *,
+    only_changed: bool,
+    stats: ReverifyStats,
+) -> tuple[list[_VerificationSnapshot], dict[int, Lemma]]:
+    """Snapshot one batch for verification, skipping unchanged sentences."""
+    db = SessionLocal()
+    try:
+        sentences = (
+            db.query(Sentence)
+            .options(joinedload(Sentence.words))
+            .filter(
+                Sentence.id.in_(chunk_ids),
+                _mapping_maintenance_candidate_clauses(),
+            )
+            .order_by(Sentence.id.asc())
+            .all()
+        )
+        current_ids = {
+            row[0] for row in db.query(Sentence.id).filter(
+                Sentence.id.in_(chunk_ids),
+                has_current_mapping_verification(),
+            )
+        } if only_changed else set()
+        referenced_lemma_ids = {
+            word.lemma_id
+            for sentence in sentences
+            for word in sentence.words
+            if word.lemma_id
+        }
+        lemma_map = {
+            lemma.lemma_id: lemma
+            for lemma in db.query(Lemma)
+            .filter(Lemma.lemma_id.in_(list(referenced_lemma_ids)))
+            .all()
+        }
+
+        snapshots: list[_VerificationSnapshot] = []
+        for sentence in sentences:
+            mappings = _to_token_mappings(sentence.words)
+            if not mappings:
+                continue
+            fingerprint = _verification_fingerprint(sentence, sentence.words, lemma_map)
+            if (
+                sentence.id in current_ids
+                and sentence.mappings_verified_fingerprint == fingerprint
+            ):
+                stats.sentences_unchanged += 1
+                continue
+            snapshots.append(
+                _VerificationSnapshot(
+                    sentence_id=sentence.id,
+                    payload={
+                        "arabic": sentence.arabic_text,
+                        "english": sentence.english_translation or "",
+                        "mappings": mappings,
+                        "has_ambiguous": False,
+                    },
+                    verification_stamp=sentence.mappings_verified_at,
+                    state_signature=_sentence_state_signature(sentence),
+                    fingerprint=fingerprint,
+                )
+            )
+        return snapshots, lemma_map
+    finally:
+        db.close()
+
+
 def reverify_all_active_sentences(
     *,
     batch_size: int = REVERIFY_BATCH_SIZE,
     sentence_ids: list[int] | None = None,
     dry_run: bool = False,
     progress_every: int = 10,
+    only_changed: bool = True,
+    concurrency: int | None = None,
 ) -> ReverifyStats:
     """Walk the full active-reviewable corpus and fail unfixable rows closed.
 
-    Designed to run as a one-shot maintenance pass when the user wants
-    confidence that *every* sentence currently visible in sessions has been
-    checked by the current verifier against the current vocabulary. Subsequent
-    runs are idempotent: passing sentences get re-stamped (cheap), while bad
-    positions are NULLed and hidden by the reviewability gate.
+    Designed to run as a maintenance pass when the user wants confidence
+    that *every* sentence currently visible in sessions has been checked by
+    the current verifier against the current vocabulary. Each verified
+    sentence stores a fingerprint of its verifier inputs
+    (`_verification_fingerprint`); with ``only_changed`` a currently-stamped
+    sentence whose fingerprint still matches is skipped without an LLM call,
+    so repeat sweeps only pay for what changed.
 
-    Write-lock discipline (CLAUDE.md Rule #10): each batch reads its data and
-    closes the DB before the LLM call, then reopens for a quick write.
+    Write-lock discipline (CLAUDE.md Rule #10): the sweep runs in waves of
+    ``concurrency`` batches. Each wave reads its snapshots in short sessions,
+    verifies all its batches concurrently with no session open, then applies
+    the verdicts one sentence per short transaction on this thread.
 
     Args:
         batch_size: sentences per LLM call. Higher → fewer round trips but
@@ -969,6 +1093,10 @@ def reverify_all_active_sentences(
         dry_run: if True, run the verifier with no database, proposal,
             quality-pipeline, triage-log, or activity-log writes.
         progress_every: print a one-line progress update every N batches.
+        only_changed: skip sentences whose stored fingerprint still matches.
+            Pass False to force a re-check (rolling/cutoff re-verification).
+        concurrency: LLM batches in flight (default
+            ``ALIF_IMPORT_LLM_CONCURRENCY``, 4).
     """
     stats = ReverifyStats()
     if batch_size <= 0:
@@ -999,245 +1127,249 @@ def reverify_all_active_sentences(
     total = len(ids)
     logger.info("reverify_all_active_sentences: %d sentences to check", total)
     batch_count = (total + batch_size - 1) // batch_size
+    workers = max(1, concurrency or DEFAULT_CONCURRENCY)
 
-    for batch_idx in range(batch_count):
-        chunk_ids = ids[batch_idx * batch_size:(batch_idx + 1) * batch_size]
-
+    for wave_start in range(0, batch_count, workers):
         # ── Read phase ───────────────────────────────────────────────────
-        db = SessionLocal()
-        snapshots: list[_VerificationSnapshot] = []
-        try:
-            sentences = (
-                db.query(Sentence)
-                .options(joinedload(Sentence.words))
-                .filter(
-                    Sentence.id.in_(chunk_ids),
-                    _mapping_maintenance_candidate_clauses(),
-                )
-                .order_by(Sentence.id.asc())
-                .all()
-            )
-            referenced_lemma_ids = {
-                word.lemma_id
-                for sentence in sentences
-                for word in sentence.words
-                if word.lemma_id
-            }
-            referenced_lemmas = (
-                db.query(Lemma)
-                .filter(Lemma.lemma_id.in_(list(referenced_lemma_ids)))
-                .all()
-            )
-            lemma_map = {
-                lemma.lemma_id: lemma for lemma in referenced_lemmas
-            }
-
-            for sentence in sentences:
-                mappings = _to_token_mappings(sentence.words)
-                if not mappings:
-                    continue
-                snapshots.append(
-                    _VerificationSnapshot(
-                        sentence_id=sentence.id,
-                        payload={
-                            "arabic": sentence.arabic_text,
-                            "english": sentence.english_translation or "",
-                            "mappings": mappings,
-                            "has_ambiguous": False,
-                        },
-                        verification_stamp=sentence.mappings_verified_at,
-                        state_signature=_sentence_state_signature(sentence),
-                    )
+        wave: list[tuple[int, list[_VerificationSnapshot]]] = []
+        wave_lemmas: dict[int, Lemma] = {}
+        for batch_idx in range(wave_start, min(wave_start + workers, batch_count)):
+            chunk_ids = ids[batch_idx * batch_size:(batch_idx + 1) * batch_size]
+            try:
+                snapshots, lemma_map = _read_reverify_batch(
+                    chunk_ids, only_changed=only_changed, stats=stats,
                 )
-        except Exception:
-            logger.exception("reverify: read phase failed for batch %d", batch_idx)
-            continue
-        finally:
-            db.close()
-
-        if not snapshots:
+            except Exception:
+                logger.exception("reverify: read phase failed for batch %d", batch_idx)
+                continue
+            if snapshots:
+                wave.append((batch_idx, snapshots))
+                wave_lemmas.update(lemma_map)
+        if not wave:
             continue
 
         # ── LLM verify (no DB session held) ──────────────────────────────
-        inputs = [snapshot.payload for snapshot in snapshots]
-        try:
-            results = batch_verify_sentences(
-                inputs,
-                lemma_map,
+        outcomes = map_batches(
+            lambda snapshots: batch_verify_sentences(
+                [snapshot.payload for snapshot in snapshots],
+                wave_lemmas,
                 return_invalid_rows=True,
+            ),
+            [snapshots for _, snapshots in wave],
+            concurrency=workers,
+            retries=0,
+            label="reverify",
+        )
+
+        for (batch_idx, snapshots), results in zip(wave, outcomes):
+            if isinstance(results, BaseException):
+                results = None
+            _apply_reverify_batch(
+                batch_idx, batch_count, snapshots, results, stats,
+                dry_run=dry_run, progress_every=progress_every,
             )
-        except Exception:
-            logger.exception("reverify: batch_verify raised, batch %d", batch_idx)
-            results = None
-        if results is None or len(results) != len(snapshots):
-            stats.llm_failures += len(snapshots)
-            if (
-                (batch_idx + 1) % progress_every == 0
-                or batch_idx + 1 == batch_count
-            ):
-                logger.info(
-                    "reverify: batch %d/%d — LLM failed, skipping %d sentences",
-                    batch_idx + 1, batch_count, len(snapshots),
-                )
-            continue
 
-        stats.batches_run += 1
-        stats.sentences_attempted += len(snapshots)
-        verified_pairs = [
-            (snapshot, result)
-            for snapshot, result in zip(snapshots, results)
-            if isinstance(result, dict) and not result.get("invalid_reason")
-        ]
-        invalid_count = len(snapshots) - len(verified_pairs)
-        stats.llm_failures += invalid_count
-        verified_snapshots = [snapshot for snapshot, _ in verified_pairs]
-        issues_by_sentence_id = {
-            snapshot.sentence_id: list(result.get("issues") or [])
-            for snapshot, result in verified_pairs
-        }
-        stats.sentences_flagged += sum(
-            1 for issues in issues_by_sentence_id.values() if issues
-        )
+    return stats
 
-        # A dry-run is strictly observational. In particular it must not call
-        # proposal/logging helpers or the lemma quality pipeline, all of which
-        # can write or commit.
-        if dry_run:
-            for issues in issues_by_sentence_id.values():
-                if not issues:
-                    stats.sentences_passed += 1
-            continue
 
-        if not verified_snapshots:
-            continue
+def _apply_reverify_batch(
+    batch_idx: int,
+    batch_count: int,
+    snapshots: list[_VerificationSnapshot],
+    results: list[dict] | None,
+    stats: ReverifyStats,
+    *,
+    dry_run: bool,
+    progress_every: int,
+) -> None:
+    """Fold one batch's verdicts into ``stats`` and write them."""
+    if results is None or len(results) != len(snapshots):
+        stats.llm_failures += len(snapshots)
+        if (
+            (batch_idx + 1) % progress_every == 0
+            or batch_idx + 1 == batch_count
+        ):
+            logger.info(
+                "reverify: batch %d/%d — LLM failed, skipping %d sentences",
+                batch_idx + 1, batch_count, len(snapshots),
+            )
+        return
+
+    stats.batches_run += 1
+    stats.sentences_attempted += len(snapshots)
+    verified_pairs = [
+        (snapshot, result)
+        for snapshot, result in zip(snapshots, results)
+        if isinstance(result, dict) and not result.get("invalid_reason")
+    ]
+    invalid_count = len(snapshots) - len(verified_pairs)
+    stats.llm_failures += invalid_count
+    verified_snapshots = [snapshot for snapshot, _ in verified_pairs]
+    issues_by_sentence_id = {
+        snapshot.sentence_id: list(result.get("issues") or [])
+        for snapshot, result in verified_pairs
+    }
+    stats.sentences_flagged += sum(
+        1 for issues in issues_by_sentence_id.values() if issues
+    )
+
+    # A dry-run is strictly observational. In particular it must not call
+    # proposal/logging helpers or the lemma quality pipeline, all of which
+    # can write or commit.
+    if dry_run:
+        for issues in issues_by_sentence_id.values():
+            if not issues:
+                stats.sentences_passed += 1
+        return
 
-        proposal_stats = RescueStats()
-        _prepare_unlinked_frequency_proposals(
-            verified_snapshots, issues_by_sentence_id, proposal_stats
+    if not verified_snapshots:
+        return
+
+    proposal_stats = RescueStats()
+    _prepare_unlinked_frequency_proposals(
+        verified_snapshots, issues_by_sentence_id, proposal_stats
+    )
+    _fold_proposal_stats(stats, proposal_stats)
+
+    # ── Write phase ──────────────────────────────────────────────────────
+    for snapshot in verified_snapshots:
+        _write_reverify_snapshot(
+            snapshot, issues_by_sentence_id[snapshot.sentence_id], stats,
         )
-        _fold_proposal_stats(stats, proposal_stats)
-
-        # ── Write phase ──────────────────────────────────────────────────
-        for snapshot in verified_snapshots:
-            issues = issues_by_sentence_id[snapshot.sentence_id]
-            db = SessionLocal()
-            sentence_stats = RescueStats()
-            triage: tuple[list[int], list[TokenMapping]] | None = None
-            try:
-                acquired = _acquire_snapshot_for_write(db, snapshot)
-                if acquired is None:
-                    db.rollback()
-                    stats.sentences_skipped_changed += 1
-                    continue
-                sentence, word_rows = acquired
-
-                if not issues:
-                    if not _target_is_represented(db, sentence, word_rows):
-                        sentence.mappings_verified_at = None
-                        db.commit()
-                        stats.sentences_unfixable += 1
-                        stats.sentences_target_invalid += 1
-                        continue
-                    sentence.mappings_verified_at = datetime.now(timezone.utc)
-                    db.commit()
-                    stats.sentences_passed += 1
-                    continue
 
-                before_mapping_state = _mapping_state(sentence, word_rows)
-                lemma_lookup = build_comprehensive_lemma_lookup(
-                    db, require_gated=True
-                )
-                still_failed = _apply_with_proposal_fallback(
-                    db,
-                    issues,
-                    word_rows,
-                    snapshot.sentence_id,
-                    sentence.arabic_text or "",
-                    lemma_lookup,
-                    sentence_stats,
-                    sentence=sentence,
-                    allow_lemma_creation=False,
-                )
-                mapping_changed = (
-                    _mapping_state(sentence, word_rows)
-                    != before_mapping_state
-                )
-                if not still_failed:
-                    if not _target_is_represented(db, sentence, word_rows):
-                        sentence.mappings_verified_at = None
-                        db.commit()
-                        stats.sentences_unfixable += 1
-                        stats.sentences_target_invalid += 1
-                        stats.targets_repaired += sentence_stats.targets_repaired
-                        _fold_proposal_stats(stats, sentence_stats)
-                        continue
-                    sentence.mappings_verified_at = datetime.now(timezone.utc)
-                    db.commit()
-                    if mapping_changed:
-                        stats.sentences_corrected += 1
-                    else:
-                        stats.sentences_passed += 1
-                    stats.targets_repaired += sentence_stats.targets_repaired
-                    _fold_proposal_stats(stats, sentence_stats)
-                    continue
+    if (
+        (batch_idx + 1) % progress_every == 0
+        or batch_idx + 1 == batch_count
+    ):
+        logger.info(
+            "reverify: batch %d/%d — passed=%d corrected=%d unchanged=%d "
+            "unfixable=%d skipped_changed=%d (nulled %d positions)",
+            batch_idx + 1,
+            batch_count,
+            stats.sentences_passed,
+            stats.sentences_corrected,
+            stats.sentences_unchanged,
+            stats.sentences_unfixable,
+            stats.sentences_skipped_changed,
+            stats.positions_nulled,
+        )
+
+
+def _write_reverify_snapshot(
+    snapshot: _VerificationSnapshot,
+    issues: list[dict],
+    stats: ReverifyStats,
+) -> None:
+    """Apply one verdict in its own short transaction (CAS on the snapshot)."""
+    db = SessionLocal()
+    sentence_stats = RescueStats()
+    triage: tuple[list[int], list[TokenMapping]] | None = None
+    try:
+        acquired = _acquire_snapshot_for_write(db, snapshot)
+        if acquired is None:
+            db.rollback()
+            stats.sentences_skipped_changed += 1
+            return
+        sentence, word_rows = acquired
 
-                # Can't repair — NULL the offending positions and clear the
-                # verification stamp. Both conditions fail the central
-                # reviewability gate even if a reported position is missing.
-                word_by_pos = {word.position: word for word in word_rows}
-                nulled = 0
-                for position in still_failed:
-                    word = word_by_pos.get(position)
-                    if word is not None and word.lemma_id is not None:
-                        word.lemma_id = None
-                        nulled += 1
+        if not issues:
+            if not _target_is_represented(db, sentence, word_rows):
                 sentence.mappings_verified_at = None
-                triage = (
-                    still_failed,
-                    list(snapshot.payload["mappings"]),
-                )
+                sentence.mappings_verified_fingerprint = None
+                db.commit()
+                stats.sentences_unfixable += 1
+                stats.sentences_target_invalid += 1
+                return
+            sentence.mappings_verified_at = datetime.now(timezone.utc)
+            sentence.mappings_verified_fingerprint = snapshot.fingerprint
+            db.commit()
+            stats.sentences_passed += 1
+            return
+
+        before_mapping_state = _mapping_state(sentence, word_rows)
+        lemma_lookup = build_comprehensive_lemma_lookup(
+            db, require_gated=True
+        )
+        still_failed = _apply_with_proposal_fallback(
+            db,
+            issues,
+            word_rows,
+            snapshot.sentence_id,
+            sentence.arabic_text or "",
+            lemma_lookup,
+            sentence_stats,
+            sentence=sentence,
+            allow_lemma_creation=False,
+        )
+        mapping_changed = (
+            _mapping_state(sentence, word_rows)
+            != before_mapping_state
+        )
+        if not still_failed:
+            if not _target_is_represented(db, sentence, word_rows):
+                sentence.mappings_verified_at = None
+                sentence.mappings_verified_fingerprint = None
                 db.commit()
                 stats.sentences_unfixable += 1
-                stats.positions_nulled += nulled
+                stats.sentences_target_invalid += 1
                 stats.targets_repaired += sentence_stats.targets_repaired
                 _fold_proposal_stats(stats, sentence_stats)
-            except Exception:
-                logger.exception(
-                    "reverify: write failed for sentence %d",
-                    snapshot.sentence_id,
-                )
-                db.rollback()
-            finally:
-                db.close()
-
-            if triage is not None:
-                failed_positions, original_words = triage
-                _log_reverify_triage(
-                    snapshot.sentence_id,
-                    snapshot.payload["arabic"] or "",
-                    snapshot.payload["english"] or "",
-                    failed_positions,
-                    original_words,
-                    issues,
-                )
-
-        if (
-            (batch_idx + 1) % progress_every == 0
-            or batch_idx + 1 == batch_count
-        ):
-            logger.info(
-                "reverify: batch %d/%d — passed=%d corrected=%d "
-                "unfixable=%d skipped_changed=%d (nulled %d positions)",
-                batch_idx + 1,
-                batch_count,
-                stats.sentences_passed,
-                stats.sentences_corrected,
-                stats.sentences_unfixable,
-                stats.sentences_skipped_changed,
-                stats.positions_nulled,
+                return
+            sentence.mappings_verified_at = datetime.now(timezone.utc)
+            # A corrected mapping was never itself shown to the verifier;
+            # leave it unfingerprinted so the next sweep re-checks it.
+            sentence.mappings_verified_fingerprint = (
+                None if mapping_changed else snapshot.fingerprint
             )
+            db.commit()
+            if mapping_changed:
+                stats.sentences_corrected += 1
+            else:
+                stats.sentences_passed += 1
+            stats.targets_repaired += sentence_stats.targets_repaired
+            _fold_proposal_stats(stats, sentence_stats)
+            return
+
+        # Can't repair — NULL the offending positions and clear the
+        # verification stamp. Both conditions fail the central
+        # reviewability gate even if a reported position is missing.
+        word_by_pos = {word.position: word for word in word_rows}
+        nulled = 0
+        for position in still_failed:
+            word = word_by_pos.get(position)
+            if word is not None and word.lemma_id is not None:
+                word.lemma_id = None
+                nulled += 1
+        sentence.mappings_verified_at = None
+        sentence.mappings_verified_fingerprint = None
+        triage = (
+            still_failed,
+            list(snapshot.payload["mappings"]),
+        )
+        db.commit()
+        stats.sentences_unfixable += 1
+        stats.positions_nulled += nulled
+        stats.targets_repaired += sentence_stats.targets_repaired
+        _fold_proposal_stats(stats, sentence_stats)
+    except Exception:
+        logger.exception(
+            "reverify: write failed for sentence %d",
+            snapshot.sentence_id,
+        )
+        db.rollback()
+    finally:
+        db.close()
 
-    return stats
+    if triage is not None:
+        failed_positions, original_words = triage
+        _log_reverify_triage(
+            snapshot.sentence_id,
+            snapshot.payload["arabic"] or "",
+            snapshot.payload["english"] or "",
+            failed_positions,
+            original_words,
+            issues,
+        )
 
 
 def reverify_oldest_active_sentences(
@@ -1283,6 +1415,7 @@ def reverify_oldest_active_sentences(
     return reverify_all_active_sentences(
         batch_size=REVERIFY_BATCH_SIZE,
         sentence_ids=ids,
+        only_changed=False,
     )
 
 
@@ -1331,6 +1464,7 @@ def reverify_sentences_before(
     return reverify_all_active_sentences(
         batch_size=batch_size,
         sentence_ids=ids,
+        only_changed=False,
     )
 
 
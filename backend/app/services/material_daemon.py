@@ -0,0 +1,475 @@
+"""Resident material-maintenance service.
+
+Optional replacement for the cold-start phases of
+``deploy/alif-update-material.sh``. Each cron pass used to start four fresh
+interpreters, and every one re-imported litellm and the morphology stack and
+re-read the lemma tables before doing any work. The daemon instead keeps a
+``forkserver`` whose process has those modules imported once and the
+comprehensive lemma lookups built (`material_daemon_preload`); each phase runs
+as a fork of it, so a phase starts in milliseconds with warm imports and
+lookups while still getting a fresh DB session, its own crash isolation and a
+hard, kill-enforced timeout. Before each cycle the daemon compares the
+``lemmas`` signature (write counter plus aggregates) with the one the
+forkserver warmed at and restarts the forkserver when it moved. Learner state
+is not kept warm; it changes with every review.
+
+Phases, budgets and timeouts mirror the shell wrapper and honour the same
+environment variables. A cycle runs every ``interval`` seconds, or as soon as
+the API nudges it after a session (rate-limited by ``nudge_cooldown``).
+``/status`` (JSON), ``/metrics`` (Prometheus text) and ``POST /nudge`` are
+served on a loopback HTTP port. The scripts' own material-update lock still
+serialises them against any other writer, so running cron and daemon side by
+side is safe, just wasteful — the wrapper skips its pass while the daemon
+answers ``/status``.
+
+Run with ``scripts/material_daemon.py``; ``nudge_material_daemon`` is the
+client side used by the API.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import runpy
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+DAEMON_URL_ENV = "ALIF_MATERIAL_DAEMON_URL"
+DEFAULT_PORT = 3011
+DEFAULT_INTERVAL_SECONDS = 3 * 3600
+DEFAULT_NUDGE_COOLDOWN_SECONDS = 15 * 60
+
+PRELOAD_MODULE = "app.services.material_daemon_preload"
+
+# Imported once by the forkserver and inherited by every phase.
+WARM_MODULES = (
+    "app.database",
+    "app.models",
+    "app.services.llm",
+    "app.services.morphology",
+    "app.services.sentence_validator",
+    "app.services.sentence_generator",
+    "app.services.material_generator",
+    "app.services.transliteration",
+    PRELOAD_MODULE,
+)
+
+# Same defaults the cron wrapper exports for its phases.
+CRON_ENV_DEFAULTS = {
+    "ALIF_RUN_CRON_PREGENERATION": "1",
+    "ALIF_RUN_CRON_LEMMA_ENRICHMENT": "1",
+    "ALIF_FREQ_CORE_INTAKE_MAX_RANK": "3000",
+    "ALIF_FREQ_CORE_INTAKE_LIMIT": "10",
+    "PYTHONUNBUFFERED": "1",
+    # Importing litellm otherwise starts a background fetch of its cost map;
+    # a live thread in the forkserver would be copied mid-lock into every fork.
+    "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class Phase:
+    name: str
+    script: str  # relative to the backend directory
+    argv: tuple[str, ...] = ()
+    timeout_seconds: int = 900
+    env: tuple[tuple[str, str], ...] = ()
+
+
+def default_phases() -> list[Phase]:
+    """The four passes of alif-update-material.sh, in the same order."""
+    return [
+        Phase(
+            "rotate_stale_sentences",
+            "scripts/rotate_stale_sentences.py",
+            timeout_seconds=_env_int("ALIF_ROTATE_TIMEOUT_SECONDS", 600),
+        ),
+        Phase(
+            "update_material_maintenance",
+            "scripts/update_material.py",
+            argv=("--limit", "50", "--skip-audio", "--max-step-a-sentences", "0"),
+            timeout_seconds=_env_int("ALIF_MATERIAL_MAINTENANCE_TIMEOUT_SECONDS", 900),
+        ),
+        Phase(
+            "refill_due_deficit",
+            "scripts/refill_due_deficit.py",
+            timeout_seconds=_env_int("ALIF_DEFICIT_REFILL_TIMEOUT_SECONDS", 1200),
+            env=(("ALIF_DEFICIT_REFILL_BUDGET", str(_env_int("ALIF_DEFICIT_REFILL_BUDGET", 30))),),
+        ),
+        Phase(
+            "maintain_short_story_supply",
+            "scripts/maintain_short_story_supply.py",
+            timeout_seconds=_env_int("ALIF_SHORT_STORY_TIMEOUT_SECONDS", 1800),
+            env=(
+                ("ALIF_SHORT_STORY_CRON_BUDGET", str(_env_int("ALIF_SHORT_STORY_CRON_BUDGET", 1))),
+                ("ALIF_SHORT_STORY_MIN_SELECTABLE", str(_env_int("ALIF_SHORT_STORY_MIN_SELECTABLE", 6))),
+            ),
+        ),
+    ]
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    status: str  # ok / failed / timeout / crashed
+    exit_code: int | None
+    started_at: float
+    wall_seconds: float
+    cpu_seconds: float | None = None
+    max_rss_kb: int | None = None
+
+
+@dataclass
+class DaemonStats:
+    cycles: int = 0
+    nudges_received: int = 0
+    nudges_deferred: int = 0
+    forkserver_restarts: int = 0
+    current_phase: str | None = None
+    cycle_started_at: float | None = None
+    last_cycle_finished_at: float | None = None
+    last_cycle_reason: str | None = None
+    last_results: dict[str, PhaseResult] = field(default_factory=dict)
+    phase_runs: dict[str, dict[str, int]] = field(default_factory=dict)
+    phase_wall_seconds: dict[str, float] = field(default_factory=dict)
+    phase_cpu_seconds: dict[str, float] = field(default_factory=dict)
+
+
+def _run_script(script: str, argv: tuple[str, ...], env: dict[str, str], conn) -> None:
+    """Phase entry point, executed in a fork of the warm forkserver."""
+    import resource
+
+    os.environ.update(env)
+    os.chdir(BACKEND_DIR)
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    sys.argv = [script, *argv]
+    exit_code = 0
+    try:
+        runpy.run_path(str(BACKEND_DIR / script), run_name="__main__")
+    except SystemExit as exc:
+        if isinstance(exc.code, int):
+            exit_code = exc.code
+        elif exc.code is not None:
+            print(exc.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        logging.getLogger(__name__).exception("Phase %s crashed", script)
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        conn.send({
+            "exit_code": exit_code,
+            "cpu_seconds": usage.ru_utime + usage.ru_stime,
+            "max_rss_kb": usage.ru_maxrss,
+        })
+        conn.close()
+
+
+class MaterialDaemon:
+    def __init__(
+        self,
+        phases: list[Phase] | None = None,
+        *,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        nudge_cooldown: float = DEFAULT_NUDGE_COOLDOWN_SECONDS,
+        warm_modules: tuple[str, ...] = WARM_MODULES,
+    ):
+        self.phases = phases if phases is not None else default_phases()
+        self.interval = interval
+        self.nudge_cooldown = nudge_cooldown
+        self.stats = DaemonStats()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._pending_reason: str | None = None
+        self._started_at = time.time()
+        for key, value in CRON_ENV_DEFAULTS.items():
+            os.environ.setdefault(key, value)
+        self._ctx = multiprocessing.get_context("forkserver")
+        self._ctx.set_forkserver_preload(list(warm_modules))
+        self._warms_lookup = PRELOAD_MODULE in warm_modules
+        self._warm_signature: tuple | None = None
+
+    # ── Forkserver warm state ─────────────────────────────────────────
+
+    def _lemma_signature(self) -> tuple | None:
+        from app.database import SessionLocal
+        from app.services.sentence_validator import lemma_table_signature
+
+        db = SessionLocal()
+        try:
+            return lemma_table_signature(db)
+        except Exception:
+            logger.warning("Could not read the lemmas signature", exc_info=True)
+            return None
+        finally:
+            db.close()
+
+    def refresh_forkserver(self) -> bool:
+        """Restart the forkserver if ``lemmas`` was written since it warmed
+        its lookups, so the next phase forks from a current copy. Returns
+        True when it restarted. Forks check the signature themselves too, so
+        a stale forkserver only costs a rebuild, never a wrong lookup."""
+        if not self._warms_lookup:
+            return False
+        signature = self._lemma_signature()
+        if signature is None or signature == self._warm_signature:
+            return False
+        restarted = self._warm_signature is not None
+        if restarted:
+            from multiprocessing import forkserver
+
+            forkserver._forkserver._stop()
+            with self._lock:
+                self.stats.forkserver_restarts += 1
+            logger.info("lemmas changed; restarted the material forkserver")
+        self._warm_signature = signature
+        return restarted
+
+    # ── Phases ────────────────────────────────────────────────────────
+
+    def run_phase(self, phase: Phase) -> PhaseResult:
+        started = time.time()
+        recv, send = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(
+            target=_run_script,
+            args=(phase.script, phase.argv, dict(phase.env), send),
+            name=f"alif-material-{phase.name}",
+        )
+        proc.start()
+        send.close()
+        proc.join(phase.timeout_seconds)
+        if proc.is_alive():
+            logger.warning("Phase %s exceeded %ss; terminating", phase.name, phase.timeout_seconds)
+            proc.terminate()
+            proc.join(10)
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+            status, report = "timeout", {}
+        else:
+            report = recv.recv() if recv.poll() else {}
+            if not report:
+                status = "crashed"
+            else:
+                status = "ok" if report["exit_code"] == 0 else "failed"
+        recv.close()
+        return PhaseResult(
+            name=phase.name,
+            status=status,
+            exit_code=report.get("exit_code", proc.exitcode),
+            started_at=started,
+            wall_seconds=round(time.time() - started, 3),
+            cpu_seconds=report.get("cpu_seconds"),
+            max_rss_kb=report.get("max_rss_kb"),
+        )
+
+    def run_cycle(self, reason: str = "schedule") -> list[PhaseResult]:
+        """Run every phase in order. A failed phase doesn't stop the rest,
+        matching the shell wrapper."""
+        with self._lock:
+            self.stats.cycle_started_at = time.time()
+            self.stats.last_cycle_reason = reason
+        logger.info("Material cycle start (%s)", reason)
+        self.refresh_forkserver()
+        results = []
+        for phase in self.phases:
+            if self._stop.is_set():
+                break
+            with self._lock:
+                self.stats.current_phase = phase.name
+            result = self.run_phase(phase)
+            results.append(result)
+            logger.info(
+                "Phase %s: %s in %.1fs (cpu %s)",
+                phase.name, result.status, result.wall_seconds, result.cpu_seconds,
+            )
+            with self._lock:
+                stats = self.stats
+                stats.last_results[phase.name] = result
+                runs = stats.phase_runs.setdefault(phase.name, {})
+                runs[result.status] = runs.get(result.status, 0) + 1
+                stats.phase_wall_seconds[phase.name] = (
+                    stats.phase_wall_seconds.get(phase.name, 0.0) + result.wall_seconds
+                )
+                if result.cpu_seconds is not None:
+                    stats.phase_cpu_seconds[phase.name] = (
+                        stats.phase_cpu_seconds.get(phase.name, 0.0) + result.cpu_seconds
+                    )
+        with self._lock:
+            self.stats.cycles += 1
+            self.stats.current_phase = None
+            self.stats.cycle_started_at = None
+            self.stats.last_cycle_finished_at = time.time()
+        logger.info("Material cycle done (%s)", reason)
+        return results
+
+    # ── Scheduling ────────────────────────────────────────────────────
+
+    def nudge(self, reason: str = "nudge") -> bool:
+        """Request an early cycle. Returns False when it falls inside the
+        cooldown after the previous cycle (the request is dropped) or a cycle
+        is already running (it will pick up the new material anyway)."""
+        with self._lock:
+            self.stats.nudges_received += 1
+            last = self.stats.last_cycle_finished_at
+            busy = self.stats.cycle_started_at is not None
+            if busy or (last is not None and time.time() - last < self.nudge_cooldown):
+                self.stats.nudges_deferred += 1
+                return False
+            self._pending_reason = reason
+        self._wake.set()
+        return True
+
+    def next_run_at(self) -> float:
+        last = self.stats.last_cycle_finished_at or self._started_at
+        return last + self.interval
+
+    def serve_forever(self, *, run_immediately: bool = True) -> None:
+        if run_immediately:
+            self.run_cycle("startup")
+        while not self._stop.is_set():
+            timeout = max(0.0, self.next_run_at() - time.time())
+            self._wake.wait(timeout)
+            if self._stop.is_set():
+                break
+            with self._lock:
+                reason = self._pending_reason or "schedule"
+                self._pending_reason = None
+            self._wake.clear()
+            self.run_cycle(reason)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    # ── Reporting ─────────────────────────────────────────────────────
+
+    def status(self) -> dict:
+        with self._lock:
+            stats = self.stats
+            return {
+                "status": "running" if stats.current_phase else "idle",
+                "current_phase": stats.current_phase,
+                "cycles": stats.cycles,
+                "last_cycle_reason": stats.last_cycle_reason,
+                "last_cycle_finished_at": stats.last_cycle_finished_at,
+                "next_run_at": self.next_run_at(),
+                "nudges_received": stats.nudges_received,
+                "nudges_deferred": stats.nudges_deferred,
+                "forkserver_restarts": stats.forkserver_restarts,
+                "phases": [
+                    {
+                        **asdict(phase),
+                        "last": asdict(stats.last_results[phase.name])
+                        if phase.name in stats.last_results else None,
+                    }
+                    for phase in self.phases
+                ],
+            }
+
+    def metrics(self) -> str:
+        with self._lock:
+            stats = self.stats
+            lines = [
+                "# TYPE alif_material_cycles_total counter",
+                f"alif_material_cycles_total {stats.cycles}",
+                "# TYPE alif_material_nudges_total counter",
+                f"alif_material_nudges_total {stats.nudges_received}",
+                "# TYPE alif_material_nudges_deferred_total counter",
+                f"alif_material_nudges_deferred_total {stats.nudges_deferred}",
+                "# TYPE alif_material_forkserver_restarts_total counter",
+                f"alif_material_forkserver_restarts_total {stats.forkserver_restarts}",
+                "# TYPE alif_material_phase_runs_total counter",
+            ]
+            for name, by_status in sorted(stats.phase_runs.items()):
+                for status, count in sorted(by_status.items()):
+                    lines.append(
+                        f'alif_material_phase_runs_total{{phase="{name}",status="{status}"}} {count}'
+                    )
+            lines.append("# TYPE alif_material_phase_wall_seconds_total counter")
+            for name, value in sorted(stats.phase_wall_seconds.items()):
+                lines.append(f'alif_material_phase_wall_seconds_total{{phase="{name}"}} {value:.3f}')
+            lines.append("# TYPE alif_material_phase_cpu_seconds_total counter")
+            for name, value in sorted(stats.phase_cpu_seconds.items()):
+                lines.append(f'alif_material_phase_cpu_seconds_total{{phase="{name}"}} {value:.3f}')
+            lines.append("# TYPE alif_material_phase_last_wall_seconds gauge")
+            for name, result in sorted(stats.last_results.items()):
+                lines.append(
+                    f'alif_material_phase_last_wall_seconds{{phase="{name}"}} {result.wall_seconds:.3f}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def make_http_server(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, code: int, body: str, content_type: str) -> None:
+                data = body.encode()
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == "/status":
+                    self._send(200, json.dumps(daemon.status()), "application/json")
+                elif self.path == "/metrics":
+                    self._send(200, daemon.metrics(), "text/plain; version=0.0.4")
+                else:
+                    self._send(404, "{}", "application/json")
+
+            def do_POST(self):
+                if not self.path.startswith("/nudge"):
+                    self._send(404, "{}", "application/json")
+                    return
+                reason = self.headers.get("X-Alif-Nudge-Reason", "api")
+                accepted = daemon.nudge(reason)
+                self._send(202, json.dumps({"accepted": accepted}), "application/json")
+
+            def log_message(self, format, *args):
+                logger.debug("material daemon http: " + format, *args)
+
+        return ThreadingHTTPServer((host, port), Handler)
+
+
+def nudge_material_daemon(reason: str = "session") -> bool:
+    """Ask a running daemon for an early cycle. No-op unless
+    ``ALIF_MATERIAL_DAEMON_URL`` is set; never raises."""
+    url = os.environ.get(DAEMON_URL_ENV)
+    if not url:
+        return False
+    import httpx
+
+    try:
+        resp = httpx.post(
+            f"{url.rstrip('/')}/nudge",
+            headers={"X-Alif-Nudge-Reason": reason},
+            timeout=2.0,
+            trust_env=False,
+        )
+        return bool(resp.json().get("accepted"))
+    except Exception:
+        logger.debug("Material daemon nudge failed", exc_info=True)
+        return False
@@ -0,0 +1,47 @@
+"""Warm state for the material daemon's forkserver.
+
+Listed last in ``material_daemon.WARM_MODULES``, so the forkserver imports it
+once, after the heavy modules. Importing it enables the comprehensive lemma
+lookup cache and builds both variants (all lemmas, gated only). Every forked
+phase inherits them, and `build_comprehensive_lemma_lookup` hands out copies
+until ``lemmas`` is written (`lemma_table_signature`). The daemon restarts the
+forkserver when that signature moves between cycles, so the inherited copy
+follows the table instead of being rebuilt in every phase.
+
+Learner state (ULK rows, due counts, known-word samples) is deliberately not
+warmed: it changes with every review, and reviews are what nudge a cycle, so
+a forkserver copy would be stale on nearly every run.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from app.database import SessionLocal
+from app.services.sentence_validator import (
+    build_comprehensive_lemma_lookup,
+    enable_comprehensive_lookup_cache,
+    lemma_table_signature,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def warm() -> tuple | None:
+    """Build the cached lookups; returns the lemmas signature they match,
+    or None if the database couldn't be read (phases then build their own)."""
+    enable_comprehensive_lookup_cache()
+    db = SessionLocal()
+    try:
+        signature = lemma_table_signature(db)
+        for require_gated in (False, True):
+            build_comprehensive_lemma_lookup(db, require_gated=require_gated)
+        return signature
+    except Exception:
+        logger.warning("Material daemon preload: lemma lookup warm-up failed", exc_info=True)
+        return None
+    finally:
+        db.close()
+
+
+WARM_SIGNATURE = warm()
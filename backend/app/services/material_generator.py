@@ -17,9 +17,11 @@ from pathlib import Path
 from sqlalchemy import exists, func
 from sqlalchemy.orm import aliased
 
+from app import clock
 from app.database import SessionLocal, db_operation_context
 from app.models import Lemma, Sentence, SentenceWord, Story, UserLemmaKnowledge
 from app.services.fsrs_service import parse_json_column
+from app.services.sentence_fingerprint import shared_index, stored_duplicate_exists
 from app.services.sentence_eligibility import (
     has_current_mapping_verification,
     reviewable_sentence_clauses,
@@ -83,6 +85,12 @@ def _release_material_update_lock(handle) -> None:
 # Prevent concurrent warm_sentence_cache runs from overlapping prefetches
 _warm_cache_lock = threading.Lock()
 
+# Serializes the dedup claim + sentence write phase of generators running as
+# threads of one process (the material-job executor runs several shards at
+# once). Only the millisecond write is serialized; the LLM phases overlap, and
+# no thread's shared_index() rebuild can drop another's uncommitted claims.
+_sentence_write_lock = threading.Lock()
+
 
 # After this many consecutive 0-result generation attempts, skip the lemma
 # for BACKOFF_DURATION to avoid wasting LLM calls on chronically-failing words.
@@ -207,7 +215,7 @@ def acquiring_material_gaps(db, limit: int = 40) -> list[dict]:
 
     lemma_ids = [lemma.lemma_id for lemma, _ulk in rows]
     active_counts = active_sentence_counts_by_lemma(db, lemma_ids)
-    now_ts = datetime.now(timezone.utc).timestamp()
+    now_ts = clock.now().timestamp()
 
     def _ts(dt, fallback: float) -> float:
         if dt is None:
@@ -356,7 +364,7 @@ def record_generation_result(db, lemma_id: int, sentences_generated: int) -> Non
         return
     ulk.generation_failed_count = (ulk.generation_failed_count or 0) + 1
     if ulk.generation_failed_count >= GENERATION_BACKOFF_THRESHOLD:
-        ulk.generation_backoff_until = datetime.utcnow() + GENERATION_BACKOFF_DURATION
+        ulk.generation_backoff_until = clock.utcnow() + GENERATION_BACKOFF_DURATION
     db.commit()
 
 
@@ -364,7 +372,7 @@ def lemmas_on_backoff(db, lemma_ids: list[int]) -> set[int]:
     """Return the subset of ``lemma_ids`` whose generation backoff is still active."""
     if not lemma_ids:
         return set()
-    now = datetime.utcnow()
+    now = clock.utcnow()
     rows = (
         db.query(UserLemmaKnowledge.lemma_id)
         .filter(
@@ -963,46 +971,55 @@ def generate_material_for_word(lemma_id: int, needed: int = 2, model_override: s
         return 0
 
     # ── Phase 3: DB write (milliseconds) ──
-    db = SessionLocal()
-    stored = 0
-    try:
-        for vs in valid_sentences:
-            review = vs.get("quality_review")
-            reviewed_at = datetime.now(timezone.utc) if review is not None else None
-            sent = Sentence(
-                arabic_text=vs["arabic"],
-                english_translation=vs["english"],
-                transliteration=vs["transliteration"],
-                source="llm",
-                target_lemma_id=target_lemma_id,
-                created_at=datetime.now(timezone.utc),
-                mappings_verified_at=datetime.now(timezone.utc),
-                quality_reviewed_at=reviewed_at,
-                quality_natural=bool(review.natural) if review is not None else None,
-                quality_translation_correct=bool(review.translation_correct) if review is not None else None,
-                quality_reason=review.reason[:500] if review is not None else None,
-            )
-            db.add(sent)
-            db.flush()
-
-            for m in vs["mappings"]:
-                sw = SentenceWord(
-                    sentence_id=sent.id,
-                    position=m.position,
-                    surface_form=m.surface_form,
-                    lemma_id=m.lemma_id,
-                    is_target_word=m.is_target,
+    with _sentence_write_lock:
+        pool = shared_index()
+        db = SessionLocal()
+        stored = 0
+        try:
+            for vs in valid_sentences:
+                if stored_duplicate_exists(db, vs["arabic"]) or not pool.claim(vs["arabic"]):
+                    _log_pipeline(_log_dir, {
+                        "event": "pool_duplicate_skipped",
+                        "lemma_id": lemma_id,
+                        "arabic": vs["arabic"],
+                    })
+                    continue
+                review = vs.get("quality_review")
+                reviewed_at = datetime.now(timezone.utc) if review is not None else None
+                sent = Sentence(
+                    arabic_text=vs["arabic"],
+                    english_translation=vs["english"],
+                    transliteration=vs["transliteration"],
+                    source="llm",
+                    target_lemma_id=target_lemma_id,
+                    created_at=datetime.now(timezone.utc),
+                    mappings_verified_at=datetime.now(timezone.utc),
+                    quality_reviewed_at=reviewed_at,
+                    quality_natural=bool(review.natural) if review is not None else None,
+                    quality_translation_correct=bool(review.translation_correct) if review is not None else None,
+                    quality_reason=review.reason[:500] if review is not None else None,
                 )
-                db.add(sw)
-            stored += 1
+                db.add(sent)
+                db.flush()
+
+                for m in vs["mappings"]:
+                    sw = SentenceWord(
+                        sentence_id=sent.id,
+                        position=m.position,
+                        surface_form=m.surface_form,
+                        lemma_id=m.lemma_id,
+                        is_target_word=m.is_target,
+                    )
+                    db.add(sw)
+                stored += 1
 
-        db.commit()
-        logger.info(f"Generated {stored} sentences for lemma {lemma_id}")
-    except Exception:
-        logger.exception(f"Error writing sentences for lemma {lemma_id}")
-        db.rollback()
-    finally:
-        db.close()
+            db.commit()
+            logger.info(f"Generated {stored} sentences for lemma {lemma_id}")
+        except Exception:
+            logger.exception(f"Error writing sentences for lemma {lemma_id}")
+            db.rollback()
+        finally:
+            db.close()
     return stored
 
 
@@ -1382,49 +1399,58 @@ def batch_generate_material(
             })
 
     # ── Phase 3: DB write ─��
-    db = SessionLocal()
-    stored = 0
-    covered_ids: set[int] = set()
-    try:
-        for vs in valid_sentences:
-            review = vs.get("quality_review")
-            reviewed_at = datetime.now(timezone.utc) if review is not None else None
-            sent = Sentence(
-                arabic_text=vs["arabic"],
-                english_translation=vs["english"],
-                transliteration=vs["transliteration"],
-                source="llm",
-                target_lemma_id=vs["target_lemma_id"],
-                created_at=datetime.now(timezone.utc),
-                mappings_verified_at=datetime.now(timezone.utc),
-                quality_reviewed_at=reviewed_at,
-                quality_natural=bool(review.natural) if review is not None else None,
-                quality_translation_correct=bool(review.translation_correct) if review is not None else None,
-                quality_reason=review.reason[:500] if review is not None else None,
-            )
-            db.add(sent)
-            db.flush()
-
-            for m in vs["mappings"]:
-                sw = SentenceWord(
-                    sentence_id=sent.id,
-                    position=m.position,
-                    surface_form=m.surface_form,
-                    lemma_id=m.lemma_id,
-                    is_target_word=m.is_target,
+    with _sentence_write_lock:
+        pool = shared_index()
+        db = SessionLocal()
+        stored = 0
+        covered_ids: set[int] = set()
+        try:
+            for vs in valid_sentences:
+                if stored_duplicate_exists(db, vs["arabic"]) or not pool.claim(vs["arabic"]):
+                    _log_pipeline(_log_dir, {
+                        "event": "pool_duplicate_skipped",
+                        "lemma_id": vs["target_lemma_id"],
+                        "arabic": vs["arabic"],
+                    })
+                    continue
+                review = vs.get("quality_review")
+                reviewed_at = datetime.now(timezone.utc) if review is not None else None
+                sent = Sentence(
+                    arabic_text=vs["arabic"],
+                    english_translation=vs["english"],
+                    transliteration=vs["transliteration"],
+                    source="llm",
+                    target_lemma_id=vs["target_lemma_id"],
+                    created_at=datetime.now(timezone.utc),
+                    mappings_verified_at=datetime.now(timezone.utc),
+                    quality_reviewed_at=reviewed_at,
+                    quality_natural=bool(review.natural) if review is not None else None,
+                    quality_translation_correct=bool(review.translation_correct) if review is not None else None,
+                    quality_reason=review.reason[:500] if review is not None else None,
                 )
-                db.add(sw)
+                db.add(sent)
+                db.flush()
+
+                for m in vs["mappings"]:
+                    sw = SentenceWord(
+                        sentence_id=sent.id,
+                        position=m.position,
+                        surface_form=m.surface_form,
+                        lemma_id=m.lemma_id,
+                        is_target_word=m.is_target,
+                    )
+                    db.add(sw)
 
-            stored += 1
-            covered_ids.add(vs["target_lemma_id"])
+                stored += 1
+                covered_ids.add(vs["target_lemma_id"])
 
-        db.commit()
-        logger.info(f"Batch: stored {stored} sentences for {len(covered_ids)} words")
-    except Exception:
-        logger.exception("Error writing batch sentences")
-        db.rollback()
-    finally:
-        db.close()
+            db.commit()
+            logger.info(f"Batch: stored {stored} sentences for {len(covered_ids)} words")
+        except Exception:
+            logger.exception("Error writing batch sentences")
+            db.rollback()
+        finally:
+            db.close()
 
     all_target_ids = [t["lemma_id"] for t in targets]
     words_failed = [lid for lid in all_target_ids if lid not in covered_ids]
@@ -1832,7 +1858,7 @@ def rotate_stale_sentences(db, min_shown: int = 1, tier_lookup: dict | None = No
     for s in sentences:
         active_per_target[s.target_lemma_id] = active_per_target.get(s.target_lemma_id, 0) + 1
 
-    now = datetime.utcnow()
+    now = clock.utcnow()
     age_cutoff = now - timedelta(hours=24)
 
     retirable: list[tuple] = []
@@ -2336,21 +2362,25 @@ def _warm_sentence_cache_impl(
             run_label,
             len(validated),
         )
-        db = SessionLocal()
-        try:
-            for mres, mappings in validated:
-                write_multi_target_sentence(db, mres, mappings)
-                stats["generated"] += 1
-                stats["multi_target"] += 1
-                for lid in mres.target_lemma_ids:
-                    multi_covered.add(lid)
-            db.commit()
-        except Exception:
-            logger.warning("Warm cache: failed to write multi-target sentences")
-            db.rollback()
-            multi_covered.clear()
-        finally:
-            db.close()
+        with _sentence_write_lock:
+            pool = shared_index()
+            db = SessionLocal()
+            try:
+                for mres, mappings in validated:
+                    if stored_duplicate_exists(db, mres.arabic) or not pool.claim(mres.arabic):
+                        continue
+                    write_multi_target_sentence(db, mres, mappings)
+                    stats["generated"] += 1
+                    stats["multi_target"] += 1
+                    for lid in mres.target_lemma_ids:
+                        multi_covered.add(lid)
+                db.commit()
+            except Exception:
+                logger.warning("Warm cache: failed to write multi-target sentences")
+                db.rollback()
+                multi_covered.clear()
+            finally:
+                db.close()
         logger.info(
             "Warm cache %s: phase 3b multi-target write done generated=%d",
             run_label,
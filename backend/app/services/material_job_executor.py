@@ -0,0 +1,312 @@
+"""Concurrent executor for the `material_jobs` queue.
+
+`scripts/work_material_jobs.py` used to lease and run one job at a time per
+process, which is why the queue never drained (~3 jobs/week done against
+~70/day enqueued). The executor keeps several leased jobs in flight:
+
+- Each kind gets its own pool (`KindPool.concurrency`): LLM-bound generation
+  runs several CLI calls at once (the generator serializes only its short
+  dedup-and-write phase), a CPU-bound kind would stay narrow, and one kind's
+  backlog can't occupy another kind's slots.
+- Leasing is round-robin across kinds (`lease_material_jobs_fair`, rotating
+  the starting kind each pass), so with a global ``max_workers`` below the
+  summed pool sizes, a rescue flood still leaves room for the others.
+- Leases are short and extended by a heartbeat thread while the job runs, so
+  a crashed worker's jobs return to the queue in minutes, not half an hour.
+- Every job runs in its own session (SQLite busy_timeout serializes the
+  short writes); per-kind throughput, queue-wait and run-time percentiles
+  are reported by `metrics()`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, set_session_context
+from app.models import MaterialJob
+from app.services.material_jobs import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    _now,
+    extend_material_job_leases,
+    lease_material_jobs_fair,
+    release_material_job_lease_lock,
+    try_acquire_material_job_lease_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Session, MaterialJob], MaterialJob]
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_POLL_SECONDS = 5.0
+
+_OUTCOMES = {STATUS_DONE: "done", STATUS_QUEUED: "requeued", STATUS_FAILED: "failed"}
+
+
+@dataclass(frozen=True)
+class KindPool:
+    kind: str
+    handler: JobHandler
+    concurrency: int = 1
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[idx], 3)
+
+
+def _naive(dt: datetime | None) -> datetime | None:
+    return dt.replace(tzinfo=None) if dt is not None and dt.tzinfo else dt
+
+
+@dataclass
+class KindMetrics:
+    leased: int = 0
+    done: int = 0
+    requeued: int = 0
+    failed: int = 0
+    errors: int = 0
+    lost_leases: int = 0
+    wait_seconds: list[float] = field(default_factory=list)
+    run_seconds: list[float] = field(default_factory=list)
+
+    def summary(self, elapsed_seconds: float) -> dict:
+        finished = self.done + self.requeued + self.failed + self.errors
+        return {
+            "leased": self.leased,
+            "done": self.done,
+            "requeued": self.requeued,
+            "failed": self.failed,
+            "errors": self.errors,
+            "lost_leases": self.lost_leases,
+            "jobs_per_hour": round(finished / elapsed_seconds * 3600, 1) if elapsed_seconds > 0 else None,
+            "wait_p50_s": _percentile(self.wait_seconds, 50),
+            "wait_p95_s": _percentile(self.wait_seconds, 95),
+            "run_p50_s": _percentile(self.run_seconds, 50),
+            "run_p95_s": _percentile(self.run_seconds, 95),
+        }
+
+
+class MaterialJobExecutor:
+    def __init__(
+        self,
+        pools: Iterable[KindPool],
+        *,
+        worker_id: str,
+        max_workers: int | None = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        heartbeat_seconds: float | None = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.pools = {pool.kind: pool for pool in pools if pool.concurrency > 0}
+        self.worker_id = worker_id
+        total = sum(pool.concurrency for pool in self.pools.values())
+        self.max_workers = min(max_workers or total, total)
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds or max(1.0, lease_seconds / 3)
+        self.poll_seconds = poll_seconds
+        self.session_factory = session_factory
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._in_flight: dict[Future, tuple[int, str]] = {}
+        self._running: dict[int, str] = {}  # job_id -> kind, while the handler runs
+        self._heartbeat_stop = threading.Event()
+        self._rotation = 0
+        self._started: float | None = None
+        self._finished: float | None = None
+        self._metrics = {kind: KindMetrics() for kind in self.pools}
+
+    # ── public ─────────────────────────────────────────────────────────
+
+    def run(
+        self,
+        *,
+        max_jobs: int | None = None,
+        max_seconds: float | None = None,
+        until_empty: bool = True,
+    ) -> dict:
+        """Lease and run jobs until the queue is empty (``until_empty``),
+        ``max_jobs`` have been leased, ``max_seconds`` pass or `stop()`.
+        In-flight jobs always finish. Returns `metrics()`."""
+        self._started = time.monotonic()
+        deadline = self._started + max_seconds if max_seconds else None
+        leased_total = 0
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="material-job-heartbeat", daemon=True
+        )
+        self._heartbeat_stop.clear()
+        heartbeat.start()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, self.max_workers), thread_name_prefix="material-job"
+            ) as pool:
+                while True:
+                    accepting = (
+                        not self._stop.is_set()
+                        and (max_jobs is None or leased_total < max_jobs)
+                        and (deadline is None or time.monotonic() < deadline)
+                    )
+                    leased: list[tuple[int, str, float | None]] | None = []
+                    if accepting:
+                        budget = None if max_jobs is None else max_jobs - leased_total
+                        leased = self._lease(budget)
+                    contended = leased is None
+                    leased = leased or []
+                    if leased:
+                        leased_total += len(leased)
+                        for job_id, kind, wait_s in leased:
+                            with self._lock:
+                                metrics = self._metrics[kind]
+                                metrics.leased += 1
+                                if wait_s is not None:
+                                    metrics.wait_seconds.append(wait_s)
+                                # Registered before the handler can run so the
+                                # heartbeat covers it from the start.
+                                self._running[job_id] = kind
+                                future = pool.submit(self._run_job, job_id, kind)
+                                self._in_flight[future] = (job_id, kind)
+
+                    with self._lock:
+                        pending = list(self._in_flight)
+                    if not pending:
+                        if not accepting or (until_empty and not contended):
+                            break
+                        self._stop.wait(self.poll_seconds)
+                        continue
+                    done, _ = wait(pending, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                    with self._lock:
+                        for future in done:
+                            self._in_flight.pop(future, None)
+        finally:
+            self._heartbeat_stop.set()
+            heartbeat.join(timeout=5)
+            self._finished = time.monotonic()
+        return self.metrics()
+
+    def stop(self) -> None:
+        """Stop leasing new jobs; `run()` returns once in-flight jobs finish."""
+        self._stop.set()
+
+    def metrics(self) -> dict:
+        end = self._finished or time.monotonic()
+        elapsed = end - self._started if self._started else 0.0
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {
+            "worker_id": self.worker_id,
+            "elapsed_s": round(elapsed, 3),
+            "in_flight": in_flight,
+            "kinds": {kind: m.summary(elapsed) for kind, m in self._metrics.items()},
+        }
+
+    # ── internals ──────────────────────────────────────────────────────
+
+    def _free_capacity(self) -> tuple[dict[str, int], int]:
+        with self._lock:
+            busy: dict[str, int] = {}
+            for _job_id, kind in self._in_flight.values():
+                busy[kind] = busy.get(kind, 0) + 1
+            free_total = self.max_workers - len(self._in_flight)
+        return (
+            {kind: pool.concurrency - busy.get(kind, 0) for kind, pool in self.pools.items()},
+            free_total,
+        )
+
+    def _lease(self, budget: int | None) -> list[tuple[int, str, float | None]] | None:
+        """Lease what free capacity allows; None if another worker holds the
+        claim lock (try again next poll)."""
+        capacity, free_total = self._free_capacity()
+        limit = free_total if budget is None else min(free_total, budget)
+        if limit <= 0 or not any(n > 0 for n in capacity.values()):
+            return []
+        lock = try_acquire_material_job_lease_lock()
+        if lock is None:
+            return None
+        db = self.session_factory()
+        set_session_context(db, f"material_job_executor.lease:{self.worker_id}")
+        try:
+            now = _now()
+            jobs = lease_material_jobs_fair(
+                db,
+                worker_id=self.worker_id,
+                capacity=capacity,
+                limit=limit,
+                lease_seconds=self.lease_seconds,
+                start=self._rotation,
+                now=now,
+            )
+            self._rotation += 1
+            out = []
+            for job in jobs:
+                queued_at = _naive(job.not_before) or _naive(job.created_at)
+                wait_s = (_naive(now) - queued_at).total_seconds() if queued_at else None
+                out.append((job.id, job.kind, max(0.0, wait_s) if wait_s is not None else None))
+            return out
+        finally:
+            db.close()
+            release_material_job_lease_lock(lock)
+
+    def _run_job(self, job_id: int, kind: str) -> None:
+        started = time.monotonic()
+        outcome = "errors"
+        db = self.session_factory()
+        set_session_context(db, f"material_job:{kind}:{job_id}")
+        try:
+            job = db.get(MaterialJob, job_id)
+            if job is not None:
+                updated = self.pools[kind].handler(db, job)
+                outcome = _OUTCOMES.get(getattr(updated, "status", None), "errors")
+        except Exception:
+            logger.exception("Material job %s (%s) raised", job_id, kind)
+            db.rollback()
+        finally:
+            db.close()
+            with self._lock:
+                self._running.pop(job_id, None)
+                metrics = self._metrics[kind]
+                setattr(metrics, outcome, getattr(metrics, outcome) + 1)
+                metrics.run_seconds.append(time.monotonic() - started)
+
+    def _heartbeat_loop(self) -> None:
+        while not self._heartbeat_stop.wait(self.heartbeat_seconds):
+            with self._lock:
+                running = dict(self._running)
+            if not running:
+                continue
+            db = self.session_factory()
+            set_session_context(db, f"material_job_executor.heartbeat:{self.worker_id}")
+            try:
+                extended = extend_material_job_leases(
+                    db,
+                    running,
+                    worker_id=self.worker_id,
+                    lease_seconds=self.lease_seconds,
+                )
+            except Exception:
+                logger.exception("Material job lease heartbeat failed")
+                db.rollback()
+                continue
+            finally:
+                db.close()
+            with self._lock:
+                # A job that finished meanwhile isn't lost, just no longer running.
+                lost = [job_id for job_id in set(running) - extended if job_id in self._running]
+                for job_id in lost:
+                    self._metrics[running[job_id]].lost_leases += 1
+            for job_id in lost:
+                logger.warning("Lost lease on material job %s", job_id)
@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from functools import partial
+from typing import Any, Callable, Mapping
 
 from sqlalchemy.orm import Session
 
 from app.models import MaterialJob
 from app.services.material_generator import batch_generate_material, record_generation_result
+from app.services.material_job_executor import KindPool
 from app.services.material_job_planner import KIND_SENTENCE_SHARD
 from app.services.material_jobs import complete_material_job, fail_material_job
 
 
 BatchGenerator = Callable[[list[int], int, str], dict[str, Any]]
 
+# Per-kind concurrency for MaterialJobExecutor. sentence_shard is the only
+# kind the planner emits today, so the executor's cross-kind round-robin has
+# nothing to balance yet; a kind added here gets its own pool. Shards are
+# bound by the Claude/Codex CLI round trips, so several run at once; their
+# dedup claim and DB write run one at a time under the generator's
+# `_sentence_write_lock`.
+DEFAULT_KIND_CONCURRENCY = {KIND_SENTENCE_SHARD: 3}
+
 
 def _default_batch_generator(
     lemma_ids: list[int],
@@ -82,3 +92,19 @@ def process_material_job(
         )
 
     return complete_material_job(db, job, result=result)
+
+
+def default_pools(
+    *,
+    model: str = "claude_sonnet",
+    retry_delay_seconds: int = 900,
+    concurrency: Mapping[str, int] | None = None,
+):
+    """Executor pools for every kind this module can run."""
+    limits = {**DEFAULT_KIND_CONCURRENCY, **(concurrency or {})}
+    handler = partial(
+        process_material_job,
+        model=model,
+        retry_delay_seconds=retry_delay_seconds,
+    )
+    return [KindPool(kind, handler, limits[kind]) for kind in DEFAULT_KIND_CONCURRENCY]
@@ -235,6 +235,95 @@ def lease_material_jobs_locked(
         release_material_job_lease_lock(lock_handle)
 
 
+def lease_material_jobs_fair(
+    db: Session,
+    *,
+    worker_id: str,
+    capacity: dict[str, int],
+    limit: int | None = None,
+    lease_seconds: int = 1800,
+    start: int = 0,
+    now: datetime | None = None,
+    commit: bool = True,
+) -> list[MaterialJob]:
+    """Lease up to ``capacity[kind]`` jobs per kind, one per kind per round.
+
+    Kinds are visited round-robin starting at ``start`` (callers rotate it),
+    so when ``limit`` is below the summed capacity a flood of one kind still
+    leaves slots for the others. Within a kind, priority order is kept.
+    """
+
+    remaining = {kind: n for kind, n in capacity.items() if n > 0}
+    if limit is None:
+        limit = sum(remaining.values())
+    kinds = list(remaining)
+    if kinds:
+        start %= len(kinds)
+        kinds = kinds[start:] + kinds[:start]
+
+    now = now or _now()
+    leased: list[MaterialJob] = []
+    while kinds and len(leased) < limit:
+        for kind in list(kinds):
+            if len(leased) >= limit:
+                break
+            jobs = lease_material_jobs(
+                db,
+                worker_id=worker_id,
+                limit=1,
+                lease_seconds=lease_seconds,
+                kinds=[kind],
+                now=now,
+                commit=False,
+            )
+            remaining[kind] -= len(jobs)
+            leased.extend(jobs)
+            if not jobs or remaining[kind] <= 0:
+                kinds.remove(kind)
+
+    # Commit even when nothing was leased: lease_material_jobs may have
+    # returned expired leases to the queue.
+    if commit:
+        db.commit()
+        for job in leased:
+            db.refresh(job)
+    return leased
+
+
+def extend_material_job_leases(
+    db: Session,
+    job_ids: Iterable[int],
+    *,
+    worker_id: str,
+    lease_seconds: int,
+    now: datetime | None = None,
+    commit: bool = True,
+) -> set[int]:
+    """Heartbeat: push ``lease_until`` out for running jobs this worker still
+    owns. Returns the ids extended; a missing id means the lease was lost."""
+
+    job_ids = list(job_ids)
+    if not job_ids:
+        return set()
+    now = now or _now()
+    jobs = (
+        db.query(MaterialJob)
+        .filter(
+            MaterialJob.id.in_(job_ids),
+            MaterialJob.status == STATUS_RUNNING,
+            MaterialJob.lease_owner == worker_id,
+        )
+        .all()
+    )
+    lease_until = now + timedelta(seconds=lease_seconds)
+    for job in jobs:
+        job.lease_until = lease_until
+        job.updated_at = now
+    if jobs and commit:
+        db.commit()
+    return {job.id for job in jobs}
+
+
 def complete_material_job(
     db: Session,
     job: MaterialJob,
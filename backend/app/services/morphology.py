@@ -5,6 +5,7 @@ and morphological feature extraction (gender, number, enclitics, etc.).
 Falls back to stub behavior if CAMeL Tools is not installed.
 """
 
+import importlib.util
 import logging
 import re
 
@@ -69,26 +70,25 @@ def backfill_root_meanings(db) -> int:
     return filled
 
 
-try:
-    from camel_tools.morphology.database import MorphologyDB
-    from camel_tools.morphology.analyzer import Analyzer
-    from camel_tools.disambig.mle import MLEDisambiguator
-
-    _db = None
-    _analyzer = None
-    _disambiguator = None
-    CAMEL_AVAILABLE = True
-    MLE_AVAILABLE = True
-except ImportError:
-    CAMEL_AVAILABLE = False
-    MLE_AVAILABLE = False
+# Only check that camel_tools is installed; importing it (and its numpy /
+# scipy stack) is deferred to the first analysis.
+CAMEL_AVAILABLE = importlib.util.find_spec("camel_tools") is not None
+MLE_AVAILABLE = CAMEL_AVAILABLE
+if not CAMEL_AVAILABLE:
     logger.info("camel_tools not installed, morphology analysis will use stubs")
 
+_db = None
+_analyzer = None
+_disambiguator = None
+
 
 def _get_analyzer():
     """Lazy-load the CAMeL Tools analyzer singleton."""
     global _db, _analyzer
     if _analyzer is None:
+        from camel_tools.morphology.analyzer import Analyzer
+        from camel_tools.morphology.database import MorphologyDB
+
         _db = MorphologyDB.builtin_db()
         _analyzer = Analyzer(_db, backoff="ADD_PROP")
     return _analyzer
@@ -101,6 +101,8 @@ def _get_disambiguator():
         return None
     if _disambiguator is None:
         try:
+            from camel_tools.disambig.mle import MLEDisambiguator
+
             _disambiguator = MLEDisambiguator.pretrained()
         except Exception:
             logger.warning("MLE disambiguator model not available, falling back to analyzer")
@@ -18,7 +18,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal, Optional
 
-import httpx
 from sqlalchemy import func as sa_func
 from sqlalchemy.orm import Session
 
@@ -145,6 +144,8 @@ async def generate_tts(seg: Seg) -> bytes:
     if seg.slow_mode and seg.lang == "ar":
         text = _add_learner_pauses(text)
 
+    import httpx
+
     async with httpx.AsyncClient() as client:
         resp = await client.post(
             f"{ELEVENLABS_BASE_URL}/text-to-speech/{voice_id}",
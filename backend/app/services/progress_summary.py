@@ -0,0 +1,339 @@
+"""Materialized per-root and per-wazn progress (``root_progress``,
+``pattern_progress``) behind the Explore listings.
+
+One row per root / wazn with the canonical lemma count, counts by ULK
+knowledge state, ``covered_words`` (acquiring + learning + known — the
+listings' historical "known_words"), ``known_ratio`` and the latest
+``last_reviewed`` among its words.
+
+Rows are maintained incrementally by SQLite triggers that apply the delta
+of the one lemma that changed:
+
+- ``user_lemma_knowledge`` insert/delete and updates of ``knowledge_state``
+  / ``last_reviewed`` move one word between state columns of its lemma's
+  root and wazn;
+- ``lemmas`` insert/delete and updates of ``root_id`` / ``wazn`` /
+  ``canonical_lemma_id`` subtract the word (with its current state) from
+  the old keys and add it to the new ones. Variants
+  (``canonical_lemma_id`` set) never count.
+
+``last_activity_at`` only moves forward incrementally; `rebuild_progress()`
+recomputes everything from scratch (startup runs it when a trigger was
+missing, e.g. after a batch migration copied ``lemmas``).
+
+Listings read these rows (a few thousand at most) with keyset pagination:
+``after`` is the last key of the previous page, whose sort values are
+looked up by primary key, so pages stay stable while counts move and no
+lemma or ULK row is touched.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import and_, case, func, or_, select, String, text, type_coerce
+from sqlalchemy.orm import Session
+
+from app.models import PatternInfo, PatternProgress, Root, RootProgress
+
+logger = logging.getLogger(__name__)
+
+COUNTED_STATES = ("encountered", "acquiring", "learning", "known", "lapsed", "suspended")
+COVERED_STATES = ("acquiring", "learning", "known")
+
+SORTS = ("known", "total", "coverage", "recent")
+MAX_PAGE_SIZE = 500
+
+# (progress table, key column, lemma column, has wazn_meaning)
+_TARGETS = (
+    ("root_progress", "root_id", "root_id", False),
+    ("pattern_progress", "wazn", "wazn", True),
+)
+
+_COVERED_SQL = ", ".join(f"'{s}'" for s in COVERED_STATES)
+
+
+def _ulk_col(lemma_ref: str, col: str) -> str:
+    return f"(SELECT {col} FROM user_lemma_knowledge WHERE lemma_id = {lemma_ref})"
+
+
+def _apply(
+    table: str,
+    key_col: str,
+    key_expr: str,
+    sign: str,
+    state_expr: str,
+    *,
+    total: bool,
+    last_expr: str | None = None,
+    meaning_expr: str | None = None,
+) -> str:
+    """SQL adding (``sign='+'``) or removing one word from ``table``'s row."""
+    state = f"coalesce({state_expr}, '')"
+    sets = [f"total_words = total_words {sign} 1"] if total else []
+    sets += [f"{s}_count = {s}_count {sign} ({state} = '{s}')" for s in COUNTED_STATES]
+    sets.append(f"covered_words = covered_words {sign} ({state} IN ({_COVERED_SQL}))")
+    if last_expr:
+        sets.append(
+            f"last_activity_at = CASE WHEN {last_expr} > coalesce(last_activity_at, '') "
+            f"THEN {last_expr} ELSE last_activity_at END"
+        )
+    if meaning_expr:
+        sets.append(
+            f"wazn_meaning = CASE WHEN {meaning_expr} > coalesce(wazn_meaning, '') "
+            f"THEN {meaning_expr} ELSE wazn_meaning END"
+        )
+    statements = []
+    if sign == "+" and total:
+        statements.append(
+            f"INSERT OR IGNORE INTO {table} ({key_col}) "
+            f"SELECT {key_expr} WHERE {key_expr} IS NOT NULL;"
+        )
+    statements.append(f"UPDATE {table} SET {', '.join(sets)} WHERE {key_col} = {key_expr};")
+    statements.append(
+        f"UPDATE {table} SET known_ratio = CASE WHEN total_words > 0 "
+        f"THEN CAST(covered_words AS REAL) / total_words ELSE 0 END "
+        f"WHERE {key_col} = {key_expr};"
+    )
+    return " ".join(statements)
+
+
+def _lemma_delta(row: str, sign: str) -> str:
+    """Add/remove lemma ``row`` (``new``/``old``) with its current ULK state."""
+    parts = []
+    for table, key_col, lemma_col, has_meaning in _TARGETS:
+        key = f"(CASE WHEN {row}.canonical_lemma_id IS NULL THEN {row}.{lemma_col} END)"
+        parts.append(_apply(
+            table, key_col, key, sign, _ulk_col(f"{row}.lemma_id", "knowledge_state"),
+            total=True,
+            last_expr=_ulk_col(f"{row}.lemma_id", "last_reviewed") if sign == "+" else None,
+            meaning_expr=f"{row}.wazn_meaning" if has_meaning and sign == "+" else None,
+        ))
+    return " ".join(parts)
+
+
+def _knowledge_delta(row: str, sign: str) -> str:
+    """Move ULK ``row`` (``new``/``old``) into/out of its state column."""
+    parts = []
+    for table, key_col, lemma_col, _ in _TARGETS:
+        key = (
+            f"(SELECT {lemma_col} FROM lemmas WHERE lemma_id = {row}.lemma_id "
+            f"AND canonical_lemma_id IS NULL)"
+        )
+        parts.append(_apply(
+            table, key_col, key, sign, f"{row}.knowledge_state",
+            total=False,
+            last_expr=f"{row}.last_reviewed" if sign == "+" else None,
+        ))
+    return " ".join(parts)
+
+
+def progress_trigger_ddl() -> dict[str, str]:
+    """Trigger name → CREATE TRIGGER statement."""
+    return {
+        "lemmas_progress_ai":
+            "CREATE TRIGGER IF NOT EXISTS lemmas_progress_ai AFTER INSERT ON lemmas "
+            f"BEGIN {_lemma_delta('new', '+')} END",
+        "lemmas_progress_ad":
+            "CREATE TRIGGER IF NOT EXISTS lemmas_progress_ad AFTER DELETE ON lemmas "
+            f"BEGIN {_lemma_delta('old', '-')} END",
+        "lemmas_progress_au":
+            "CREATE TRIGGER IF NOT EXISTS lemmas_progress_au "
+            "AFTER UPDATE OF root_id, wazn, wazn_meaning, canonical_lemma_id ON lemmas "
+            f"BEGIN {_lemma_delta('old', '-')} {_lemma_delta('new', '+')} END",
+        "user_lemma_knowledge_progress_ai":
+            "CREATE TRIGGER IF NOT EXISTS user_lemma_knowledge_progress_ai "
+            "AFTER INSERT ON user_lemma_knowledge "
+            f"BEGIN {_knowledge_delta('new', '+')} END",
+        "user_lemma_knowledge_progress_ad":
+            "CREATE TRIGGER IF NOT EXISTS user_lemma_knowledge_progress_ad "
+            "AFTER DELETE ON user_lemma_knowledge "
+            f"BEGIN {_knowledge_delta('old', '-')} END",
+        "user_lemma_knowledge_progress_au":
+            "CREATE TRIGGER IF NOT EXISTS user_lemma_knowledge_progress_au "
+            "AFTER UPDATE OF knowledge_state, last_reviewed, lemma_id ON user_lemma_knowledge "
+            f"BEGIN {_knowledge_delta('old', '-')} {_knowledge_delta('new', '+')} END",
+    }
+
+
+def _rebuild_sql() -> list[str]:
+    state = "coalesce(k.knowledge_state, '')"
+    counts = ", ".join(f"sum({state} = '{s}')" for s in COUNTED_STATES)
+    covered = f"sum({state} IN ({_COVERED_SQL}))"
+    columns = ", ".join(f"{s}_count" for s in COUNTED_STATES)
+    statements = []
+    for table, key_col, lemma_col, has_meaning in _TARGETS:
+        meaning_col = ", wazn_meaning" if has_meaning else ""
+        meaning_val = ", max(l.wazn_meaning)" if has_meaning else ""
+        statements += [
+            f"DELETE FROM {table}",
+            f"INSERT INTO {table} ({key_col}{meaning_col}, total_words, {columns}, "
+            f"covered_words, known_ratio, last_activity_at) "
+            f"SELECT l.{lemma_col}{meaning_val}, count(*), {counts}, {covered}, "
+            f"CAST({covered} AS REAL) / count(*), max(k.last_reviewed) "
+            f"FROM lemmas l LEFT JOIN user_lemma_knowledge k ON k.lemma_id = l.lemma_id "
+            f"WHERE l.canonical_lemma_id IS NULL AND l.{lemma_col} IS NOT NULL "
+            f"GROUP BY l.{lemma_col}",
+        ]
+    return statements
+
+
+def install_progress_triggers(conn) -> None:
+    """Create any missing trigger; if one was missing, rebuild both tables.
+
+    Takes a SQLAlchemy Connection (create_all hook, startup).
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    try:
+        existing = {
+            row[0] for row in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            )
+        }
+        ddl = progress_trigger_ddl()
+        if set(ddl) <= existing:
+            return
+        for name, statement in ddl.items():
+            if name not in existing:
+                conn.execute(text(statement))
+        for statement in _rebuild_sql():
+            conn.execute(text(statement))
+    except Exception:
+        logger.warning("Progress summary install failed", exc_info=True)
+
+
+def rebuild_progress(db: Session, commit: bool = True) -> int:
+    """Recompute root_progress and pattern_progress from lemmas + ULK.
+
+    Returns the number of rows written.
+    """
+    for statement in _rebuild_sql():
+        db.execute(text(statement))
+    if commit:
+        db.commit()
+    return (
+        db.query(RootProgress).count() + db.query(PatternProgress).count()
+    )
+
+
+def _sort_columns(model, sort: str) -> list[tuple]:
+    """(expression, descending) pairs, ending with the primary key."""
+    if sort not in SORTS:
+        raise ValueError(f"Unknown sort {sort!r}; expected one of {', '.join(SORTS)}")
+    key = model.root_id if model is RootProgress else model.wazn
+    by_sort = {
+        "known": [(model.covered_words, True), (model.total_words, True)],
+        "total": [(model.total_words, True)],
+        "coverage": [(model.known_ratio, True), (model.total_words, True)],
+        # Never-reviewed keys sort last.
+        "recent": [
+            (case((model.last_activity_at.is_(None), 0), else_=1), True),
+            (type_coerce(model.last_activity_at, String), True),
+        ],
+    }
+    return by_sort[sort] + [(key, False)]
+
+
+def _after_clause(columns: list[tuple], values: tuple):
+    """Strictly-after-``values`` predicate for the (mixed-direction) order."""
+    branches = []
+    for i, (expr, desc) in enumerate(columns):
+        value = values[i]
+        ties = [
+            columns[j][0].is_(None) if values[j] is None else columns[j][0] == values[j]
+            for j in range(i)
+        ]
+        if value is None:
+            # Only the "recent" timestamp can be NULL, and its IS NOT NULL
+            # flag already ordered it; nothing sorts past NULL within it.
+            continue
+        step = expr < value if desc else expr > value
+        branches.append(and_(*ties, step))
+    return or_(*branches)
+
+
+def _has_enrichment(column):
+    # JSON columns may hold SQL NULL or a JSON 'null'.
+    return (
+        func.coalesce(type_coerce(column, String), "null") != "null"
+    ).label("has_enrichment")
+
+
+def _progress_page(db: Session, model, select_cols, join, sort: str,
+                   limit: int | None, after) -> list:
+    columns = _sort_columns(model, sort)
+    query = select(*select_cols).select_from(model)
+    for target, onclause in join:
+        query = query.outerjoin(target, onclause)
+    query = query.where(model.total_words > 0)
+    if after is not None:
+        key = columns[-1][0]
+        cursor = db.execute(
+            select(*[expr for expr, _ in columns]).where(key == after)
+        ).first()
+        if cursor is None:
+            raise ValueError(f"Unknown cursor {after!r}")
+        query = query.where(_after_clause(columns, tuple(cursor)))
+    query = query.order_by(*[expr.desc() if desc else expr.asc() for expr, desc in columns])
+    if limit is not None:
+        query = query.limit(limit)
+    return db.execute(query).all()
+
+
+def _state_counts(row) -> dict[str, int]:
+    counts = {s: getattr(row, f"{s}_count") for s in COUNTED_STATES}
+    counts["new"] = row.total_words - sum(counts.values())
+    return counts
+
+
+def _common(row) -> dict:
+    return {
+        "total_words": row.total_words,
+        "known_words": row.covered_words,
+        "coverage_pct": round(row.known_ratio * 100, 1),
+        "state_counts": _state_counts(row),
+        "last_activity_at": row.last_activity_at.isoformat() if row.last_activity_at else None,
+    }
+
+
+def list_root_progress(
+    db: Session, sort: str = "known", limit: int | None = None, after: int | None = None,
+) -> list[dict]:
+    rows = _progress_page(
+        db, RootProgress,
+        [RootProgress, Root.root, Root.core_meaning_en,
+         _has_enrichment(Root.enrichment_json)],
+        [(Root, Root.root_id == RootProgress.root_id)],
+        sort, limit, after,
+    )
+    return [
+        {
+            "root_id": row.RootProgress.root_id,
+            "root": row.root,
+            "core_meaning_en": row.core_meaning_en,
+            **_common(row.RootProgress),
+            "has_enrichment": bool(row.has_enrichment),
+        }
+        for row in rows
+    ]
+
+
+def list_pattern_progress(
+    db: Session, sort: str = "total", limit: int | None = None, after: str | None = None,
+) -> list[dict]:
+    rows = _progress_page(
+        db, PatternProgress,
+        [PatternProgress, _has_enrichment(PatternInfo.enrichment_json)],
+        [(PatternInfo, PatternInfo.wazn == PatternProgress.wazn)],
+        sort, limit, after,
+    )
+    return [
+        {
+            "wazn": row.PatternProgress.wazn,
+            "wazn_meaning": row.PatternProgress.wazn_meaning,
+            **_common(row.PatternProgress),
+            "has_enrichment": bool(row.has_enrichment),
+        }
+        for row in rows
+    ]
@@ -13,7 +13,14 @@ from sqlalchemy.orm import Session
 
 from sqlalchemy import func
 
-from app.models import Lemma, QuranicVerse, QuranicVerseWord, Root, UserLemmaKnowledge
+from app.models import (
+    Lemma,
+    QuranicVerse,
+    QuranicVerseWord,
+    QuranScheduleState,
+    Root,
+    UserLemmaKnowledge,
+)
 from app.services.interaction_logger import log_interaction
 from app.services.transliteration import transliterate_arabic
 import re
@@ -258,6 +265,41 @@ LEMMATIZE_THRESHOLD = 10  # trigger when fewer than this many lemmatized unseen
 MAX_NEW_VERSES_PER_DAY = 3
 
 
+def _in_backlog(srs_level: int | None, last_rating: str | None) -> bool:
+    """A learning verse whose last rating was not got_it (SQL ``!=`` skips NULL)."""
+    return (
+        1 <= (srs_level or 0) <= MAX_LEARNING_LEVEL
+        and last_rating is not None
+        and last_rating != "got_it"
+    )
+
+
+def _count_backlog(db: Session) -> int:
+    return (
+        db.query(func.count(QuranicVerse.id))
+        .filter(
+            QuranicVerse.srs_level >= 1,
+            QuranicVerse.srs_level <= MAX_LEARNING_LEVEL,
+            QuranicVerse.last_rating != "got_it",
+        )
+        .scalar() or 0
+    )
+
+
+def get_verse_backlog(db: Session) -> int:
+    """Non-understood learning verses, from the maintained counter.
+
+    The single ``quran_schedule_state`` row is created from a full count the
+    first time it is needed; delete it to force a recount after bulk edits.
+    """
+    state = db.get(QuranScheduleState, 1)
+    if state is None:
+        state = QuranScheduleState(id=1, backlog_count=_count_backlog(db))
+        db.add(state)
+        db.flush()
+    return state.backlog_count
+
+
 def select_verse_cards(
     db: Session,
     max_new: int = 1,
@@ -284,16 +326,8 @@ def select_verse_cards(
         .all()
     )
 
-    # 2. Count non-understood backlog
-    backlog = (
-        db.query(QuranicVerse)
-        .filter(
-            QuranicVerse.srs_level >= 1,
-            QuranicVerse.srs_level <= MAX_LEARNING_LEVEL,
-            QuranicVerse.last_rating != "got_it",
-        )
-        .count()
-    )
+    # 2. Non-understood backlog (maintained counter, no scan)
+    backlog = get_verse_backlog(db)
 
     # 3. Introduce new verses if backlog allows + daily cap
     new_verses: list[QuranicVerse] = []
@@ -328,14 +362,17 @@ def select_verse_cards(
         if new_verses:
             db.commit()
 
-    # 4. Check if we need to lemmatize more verses ahead
-    lemmatized_unseen = (
-        db.query(QuranicVerse)
+    # 4. Check if we need to lemmatize more verses ahead. Only "fewer than
+    # the threshold?" matters, so stop counting there instead of scanning
+    # every unseen verse.
+    lemmatized_unseen = len(
+        db.query(QuranicVerse.id)
         .filter(
             QuranicVerse.srs_level == 0,
             QuranicVerse.lemmatized_at.isnot(None),
         )
-        .count()
+        .limit(LEMMATIZE_THRESHOLD)
+        .all()
     )
     if lemmatized_unseen < LEMMATIZE_THRESHOLD:
         try:
@@ -348,6 +385,8 @@ def select_verse_cards(
     # 5. Build response with word data
     all_verses = due_verses + new_verses
     verse_ids = [v.id for v in all_verses]
+    if not verse_ids:
+        return []
 
     # Build lemma lookup dict once for morphological fallback
     all_lemmas = db.query(Lemma).all()
@@ -551,6 +590,8 @@ def submit_verse_review(
         return {"error": "verse not found"}
 
     old_level = verse.srs_level
+    was_backlog = _in_backlog(verse.srs_level, verse.last_rating)
+    get_verse_backlog(db)  # seed the counter from pre-review state if missing
 
     if rating == "not_yet":
         verse.srs_level = 1
@@ -571,6 +612,12 @@ def submit_verse_review(
     verse.last_rating = rating
     verse.last_reviewed = now
     verse.times_reviewed = (verse.times_reviewed or 0) + 1
+    delta = int(_in_backlog(verse.srs_level, rating)) - int(was_backlog)
+    if delta:
+        db.query(QuranScheduleState).filter(QuranScheduleState.id == 1).update(
+            {QuranScheduleState.backlog_count: QuranScheduleState.backlog_count + delta},
+            synchronize_session=False,
+        )
     db.commit()
 
     log_interaction(
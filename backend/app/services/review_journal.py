@@ -0,0 +1,356 @@
+"""Write-behind ingestion for sentence reviews.
+
+With ``ALIF_REVIEW_WRITE_BEHIND=1``, `POST /api/review/submit-sentence` and
+`/api/review/sync` no longer run `submit_sentence_review()` (FSRS updates,
+acquisition transitions, word evidence, grammar exposure, leech checks) in
+the request's write transaction. The request validates, appends the payload
+to ``review_journal`` and returns; entries are applied later:
+
+- in ``id`` (arrival) order, by whichever caller holds ``_apply_lock`` — the
+  background `ReviewJournalWriter` or a request draining before it reads;
+- up to ``REVIEW_JOURNAL_BATCH`` entries per transaction. Each entry is
+  claimed with a ``pending -> applied`` compare-and-set in the same
+  transaction as its effects, so an entry is applied exactly once even
+  across processes. If the batch raises, it is rolled back and replayed one
+  entry per transaction so a bad entry is marked ``failed`` on its own;
+- at the time they were received: ``received_at`` is passed as ``at=`` so
+  FSRS intervals don't shift with writer lag.
+
+Read-your-writes: `apply_pending_reviews()` drains the journal and is called
+before `build_session` and the other review reads (cheap when empty), so
+the next session always sees every accepted review. Verse reviews stay
+synchronous — they are tiny and have no idempotency key to journal on.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import clock
+from app.database import SessionLocal, set_session_context
+from app.models import ReviewJournalEntry
+from app.services.interaction_logger import log_interaction
+from app.services.sentence_review_service import submit_sentence_review
+
+logger = logging.getLogger(__name__)
+
+REVIEW_JOURNAL_BATCH = 20
+WRITER_POLL_SECONDS = 2.0
+
+STATUS_PENDING = "pending"
+STATUS_APPLIED = "applied"
+STATUS_DUPLICATE = "duplicate"
+STATUS_FAILED = "failed"
+
+# One applier per process keeps application in journal order; the claim CAS
+# covers other processes.
+_apply_lock = threading.Lock()
+
+
+def write_behind_enabled() -> bool:
+    return os.environ.get("ALIF_REVIEW_WRITE_BEHIND") == "1"
+
+
+def append_review(
+    db: Session,
+    payload: dict,
+    *,
+    client_review_id: str | None,
+    source: str = "submit",
+    received_at: datetime | None = None,
+) -> tuple[ReviewJournalEntry | None, bool]:
+    """Durably journal one sentence review. Returns ``(entry, duplicate)``;
+    a client_review_id already in the journal is a duplicate, not an error."""
+    if client_review_id:
+        existing = (
+            db.query(ReviewJournalEntry)
+            .filter(ReviewJournalEntry.client_review_id == client_review_id)
+            .first()
+        )
+        if existing is not None:
+            return existing, True
+    entry = ReviewJournalEntry(
+        client_review_id=client_review_id,
+        status=STATUS_PENDING,
+        source=source,
+        payload_json=payload,
+        received_at=received_at or clock.utcnow(),
+    )
+    db.add(entry)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent append of the same client_review_id.
+        db.rollback()
+        return None, True
+    notify_review_writer()
+    return entry, False
+
+
+def pending_review_count(db: Session) -> int:
+    return (
+        db.query(ReviewJournalEntry)
+        .filter(ReviewJournalEntry.status == STATUS_PENDING)
+        .count()
+    )
+
+
+def has_pending_reviews(db: Session) -> bool:
+    """Lock-free existence check on the pending-status index."""
+    return db.query(ReviewJournalEntry.id).filter(
+        ReviewJournalEntry.status == STATUS_PENDING
+    ).first() is not None
+
+
+def apply_pending_reviews(db: Session, *, max_entries: int | None = None) -> int:
+    """Apply pending journal entries in order; returns how many were
+    processed (applied, duplicate or failed). Drains the whole journal
+    unless ``max_entries`` is given."""
+    processed = 0
+    with _apply_lock:
+        while max_entries is None or processed < max_entries:
+            limit = REVIEW_JOURNAL_BATCH
+            if max_entries is not None:
+                limit = min(limit, max_entries - processed)
+            entry_ids = [
+                row[0]
+                for row in db.query(ReviewJournalEntry.id)
+                .filter(ReviewJournalEntry.status == STATUS_PENDING)
+                .order_by(ReviewJournalEntry.id)
+                .limit(limit)
+                .all()
+            ]
+            if not entry_ids:
+                break
+            try:
+                logs = [_apply_entry(db, entry_id) for entry_id in entry_ids]
+                db.commit()
+            except Exception:
+                db.rollback()
+                logger.warning(
+                    "Review journal batch of %d failed; replaying one by one",
+                    len(entry_ids),
+                    exc_info=True,
+                )
+                logs = []
+                for entry_id in entry_ids:
+                    try:
+                        log = _apply_entry(db, entry_id)
+                        db.commit()
+                    except Exception as exc:
+                        db.rollback()
+                        _mark_failed(db, entry_id, exc)
+                        continue
+                    logs.append(log)
+            # Interaction logs only for committed work, so a replayed batch
+            # doesn't log twice.
+            for log in logs:
+                if log is not None:
+                    log_interaction(**log)
+            processed += len(entry_ids)
+    return processed
+
+
+def _apply_entry(db: Session, entry_id: int) -> dict | None:
+    """Claim and apply one entry (uncommitted); returns its interaction log
+    kwargs, or None when there is nothing to log."""
+    claimed = (
+        db.query(ReviewJournalEntry)
+        .filter(
+            ReviewJournalEntry.id == entry_id,
+            ReviewJournalEntry.status == STATUS_PENDING,
+        )
+        .update(
+            {
+                ReviewJournalEntry.status: STATUS_APPLIED,
+                ReviewJournalEntry.applied_at: clock.utcnow(),
+                ReviewJournalEntry.attempts: ReviewJournalEntry.attempts + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    if not claimed:
+        return None  # another process got there first
+    entry = db.get(ReviewJournalEntry, entry_id)
+    db.refresh(entry)
+    payload = entry.payload_json or {}
+    result = submit_sentence_review(
+        db,
+        sentence_id=payload.get("sentence_id"),
+        sentence_ids=payload.get("sentence_ids") or [],
+        primary_lemma_id=payload["primary_lemma_id"],
+        comprehension_signal=payload["comprehension_signal"],
+        missed_lemma_ids=payload.get("missed_lemma_ids") or [],
+        confused_lemma_ids=payload.get("confused_lemma_ids") or [],
+        confusion_candidate_lemma_ids=_int_keys(
+            payload.get("confusion_candidate_lemma_ids")
+        ),
+        confusion_captures=payload.get("confusion_captures") or [],
+        response_ms=payload.get("response_ms"),
+        session_id=payload.get("session_id"),
+        review_mode=payload.get("review_mode") or "reading",
+        client_review_id=entry.client_review_id,
+        word_evidence_protocol_version=payload.get("word_evidence_protocol_version"),
+        word_review_evidence=_list(payload.get("word_review_evidence")),
+        at=entry.received_at,
+        commit=False,
+    )
+    if result.get("duplicate"):
+        entry.status = STATUS_DUPLICATE
+        return None
+    return _review_log_fields(entry, payload, result)
+
+
+def _mark_failed(db: Session, entry_id: int, exc: Exception) -> None:
+    logger.error("Review journal entry %s failed: %s", entry_id, exc)
+    db.query(ReviewJournalEntry).filter(ReviewJournalEntry.id == entry_id).update(
+        {
+            ReviewJournalEntry.status: STATUS_FAILED,
+            ReviewJournalEntry.attempts: ReviewJournalEntry.attempts + 1,
+            ReviewJournalEntry.last_error: str(exc)[:1000],
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def _list(value) -> list:
+    return value if isinstance(value, list) else []
+
+
+def _int_keys(value) -> dict[int, list[int]]:
+    # JSON round-trips the request's int keys as strings.
+    if not isinstance(value, dict):
+        return {}
+    out: dict[int, list[int]] = {}
+    for key, ids in value.items():
+        try:
+            out[int(key)] = list(ids or [])
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+def _review_log_fields(entry: ReviewJournalEntry, payload: dict, result: dict) -> dict:
+    word_results = result.get("word_results", [])
+    evidence = _list(payload.get("word_review_evidence"))
+    return dict(
+        event="sentence_review",
+        sentence_id=payload.get("sentence_id"),
+        sentence_ids=payload.get("sentence_ids") or [],
+        lemma_id=payload["primary_lemma_id"],
+        comprehension_signal=payload["comprehension_signal"],
+        missed_lemma_ids=payload.get("missed_lemma_ids") or [],
+        confused_lemma_ids=payload.get("confused_lemma_ids") or [],
+        confusion_candidate_lemma_ids=_int_keys(
+            payload.get("confusion_candidate_lemma_ids")
+        ),
+        confusion_captures_count=len(_list(payload.get("confusion_captures"))),
+        response_ms=payload.get("response_ms"),
+        session_id=payload.get("session_id"),
+        review_mode=payload.get("review_mode") or "reading",
+        words_reviewed=len(word_results),
+        collateral_count=len(
+            [w for w in word_results if w.get("credit_type") == "collateral"]
+        ),
+        word_ratings={
+            w["lemma_id"]: w["rating"]
+            for w in word_results
+            if "lemma_id" in w and "rating" in w
+        },
+        form_recovery_protected_lemma_ids=[
+            w["lemma_id"] for w in word_results if w.get("form_recovery_protected")
+        ],
+        audio_play_count=payload.get("audio_play_count"),
+        lookup_count=payload.get("lookup_count"),
+        parent_card_type=payload.get("parent_card_type"),
+        rating2_prompt_shown_sentence_word_ids=payload.get(
+            "rating2_prompt_shown_sentence_word_ids"
+        )
+        or [],
+        failure_cause_prompt_shown_sentence_word_ids=payload.get(
+            "failure_cause_prompt_shown_sentence_word_ids"
+        )
+        or [],
+        word_evidence_protocol_version=payload.get("word_evidence_protocol_version"),
+        word_evidence_count=len(evidence),
+        word_evidence_saved=result.get("word_evidence_saved", 0),
+        source=entry.source,
+        journal_lag_ms=(
+            int((entry.applied_at - entry.received_at).total_seconds() * 1000)
+            if entry.applied_at and entry.received_at
+            else None
+        ),
+    )
+
+
+class ReviewJournalWriter:
+    """Background thread that drains the journal as entries arrive."""
+
+    def __init__(self, *, poll_seconds: float = WRITER_POLL_SECONDS):
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="review-journal-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+            db = SessionLocal()
+            set_session_context(db, "review_journal.writer")
+            try:
+                apply_pending_reviews(db)
+            except Exception:
+                logger.exception("Review journal writer pass failed")
+                db.rollback()
+            finally:
+                db.close()
+
+
+_writer: ReviewJournalWriter | None = None
+
+
+def start_review_writer() -> ReviewJournalWriter:
+    global _writer
+    if _writer is None:
+        _writer = ReviewJournalWriter()
+    _writer.start()
+    return _writer
+
+
+def stop_review_writer() -> None:
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+def notify_review_writer() -> None:
+    if _writer is not None:
+        _writer.notify()
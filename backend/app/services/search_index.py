@@ -0,0 +1,330 @@
+"""Full-text search over lemmas, sentences and stories (SQLite FTS5).
+
+One FTS5 table, ``search_fts(arabic, english)``, indexes:
+
+- lemmas: ``lemma_ar_bare`` / ``gloss_en``
+- sentences: ``arabic_text`` / ``english_translation``
+- stories: ``title_ar + body_ar`` / ``title_en + body_en``
+
+Each row's FTS rowid encodes its source, ``source_id * 4 + kind code``
+(lemma=1, sentence=2, story=3), so the triggers that keep the index in step
+with the source tables update and delete by rowid instead of scanning.
+
+Arabic is folded at index time in SQL by the triggers: Quranic letters are
+mapped to MSA, then tashkeel and tatweel are stripped and alef variants
+normalized. This is the same result as `sentence_validator.normalize_arabic`,
+and because it is plain ``replace()`` chains with no Python UDF, rows written
+by scripts over a raw ``sqlite3`` connection are indexed too. Queries are
+folded with the same `ARABIC_FOLD` steps, so كِتَاب, كتاب and كتابٌ all
+match. English relies on FTS5's ``unicode61 remove_diacritics 2`` tokenizer.
+
+The table and triggers come from migration ``e5a7c9d1f3b5`` in production,
+and from `install_search_index()` (hooked to ``Base.metadata`` create_all)
+for fresh and test databases.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Lemma, Sentence, Story
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = "search_fts"
+
+KIND_CODES = {"lemma": 1, "sentence": 2, "story": 3}
+_KIND_BY_CODE = {code: kind for kind, code in KIND_CODES.items()}
+_ROWID_STRIDE = 4
+
+MAX_SEARCH_LIMIT = 100
+
+# Shorter trailing tokens match exactly: a 1-2 character prefix expands to
+# so many terms that bm25-ranking them costs 100ms+ at 100k sentences.
+MIN_PREFIX_CHARS = 3
+
+# Ordered (old, new) replacements — applied by nested SQL replace() at index
+# time and by str.replace() at query time. Order mirrors normalize_arabic():
+# Quranic→MSA first (U+0670 would otherwise be stripped as a diacritic).
+_DIACRITIC_RANGES = [
+    (0x0610, 0x061A), (0x064B, 0x065F), (0x0670, 0x0670), (0x06D6, 0x06DC),
+    (0x06DF, 0x06E4), (0x06E7, 0x06E8), (0x06EA, 0x06ED),
+]
+ARABIC_FOLD: list[tuple[str, str]] = [
+    ("ۥ", ""), ("ۦ", ""),
+    ("ٰ", "ا"),
+    ("اا", "ا"), ("ىا", "ى"), ("اى", "ى"),
+    *[(chr(cp), "") for lo, hi in _DIACRITIC_RANGES for cp in range(lo, hi + 1)],
+    ("ـ", ""),
+    ("أ", "ا"), ("إ", "ا"), ("آ", "ا"), ("ٱ", "ا"),
+]
+
+_FOLD_CHUNK = 16
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def fold_arabic(value: str) -> str:
+    for old, new in ARABIC_FOLD:
+        value = value.replace(old, new)
+    return value
+
+
+def _folded_row_select(rowid: str, arabic: str, english: str, source: str = "") -> str:
+    """``SELECT r, s, e`` with ``s`` = ``arabic`` run through ARABIC_FOLD.
+
+    SQLite's parser overflows at ~30 nested calls, so the replace() chain
+    is split across stacked subqueries of `_FOLD_CHUNK` steps each (CTEs
+    aren't allowed inside triggers).
+    """
+    inner = f"SELECT {rowid} AS r, {arabic} AS s, {english} AS e{source}"
+    for start in range(0, len(ARABIC_FOLD), _FOLD_CHUNK):
+        expr = "s"
+        for old, new in ARABIC_FOLD[start:start + _FOLD_CHUNK]:
+            expr = f"replace({expr}, '{old}', '{new}')"
+        inner = f"SELECT r, {expr} AS s, e FROM ({inner})"
+    return inner
+
+
+# (kind, table, id column, arabic expr, english expr, columns watched by the
+# update trigger)
+_SOURCES = [
+    (
+        "lemma", "lemmas", "lemma_id",
+        "coalesce({t}.lemma_ar_bare, '')",
+        "coalesce({t}.gloss_en, '')",
+        ("lemma_ar_bare", "gloss_en"),
+    ),
+    (
+        "sentence", "sentences", "id",
+        "coalesce({t}.arabic_text, '')",
+        "coalesce({t}.english_translation, '')",
+        ("arabic_text", "english_translation"),
+    ),
+    (
+        "story", "stories", "id",
+        "coalesce({t}.title_ar, '') || ' ' || coalesce({t}.body_ar, '')",
+        "coalesce({t}.title_en, '') || ' ' || coalesce({t}.body_en, '')",
+        ("title_ar", "body_ar", "title_en", "body_en"),
+    ),
+]
+
+
+def _rowid_sql(ref: str, kind: str) -> str:
+    return f"{ref} * {_ROWID_STRIDE} + {KIND_CODES[kind]}"
+
+
+def search_index_ddl() -> list[str]:
+    """CREATE statements for the FTS table and its sync triggers."""
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "arabic, english, tokenize='unicode61 remove_diacritics 2', prefix='3 4')"
+    ]
+    for kind, table, id_col, arabic, english, watched in _SOURCES:
+        new_row = (
+            f"INSERT INTO {SEARCH_TABLE}(rowid, arabic, english) "
+            + _folded_row_select(
+                _rowid_sql("new." + id_col, kind),
+                arabic.format(t="new"),
+                english.format(t="new"),
+            )
+            + ";"
+        )
+        delete_old = (
+            f"DELETE FROM {SEARCH_TABLE} WHERE rowid = {_rowid_sql('old.' + id_col, kind)};"
+        )
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} "
+            f"BEGIN {new_row} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} "
+            f"BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_au "
+            f"AFTER UPDATE OF {', '.join(watched)}, {id_col} ON {table} "
+            f"BEGIN {delete_old} {new_row} END",
+        ]
+    return statements
+
+
+def _backfill_sql(kind: str) -> str:
+    _, table, id_col, arabic, english, _ = next(s for s in _SOURCES if s[0] == kind)
+    return f"INSERT INTO {SEARCH_TABLE}(rowid, arabic, english) " + _folded_row_select(
+        _rowid_sql(f"{table}.{id_col}", kind),
+        arabic.format(t=table),
+        english.format(t=table),
+        f" FROM {table}",
+    )
+
+
+def _rebuild(conn) -> None:
+    conn.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    for kind in KIND_CODES:
+        conn.execute(text(_backfill_sql(kind)))
+
+
+def install_search_index(conn) -> None:
+    """Create the FTS table and any missing triggers; rebuild the index when
+    either was missing (a batch migration that copies a source table drops
+    its triggers, leaving the index stale). Idempotent — cheap at startup.
+
+    Takes a SQLAlchemy Connection. Logs and skips when the SQLite build
+    lacks FTS5.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    present = {
+        row[0]
+        for row in conn.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE (type = 'table' AND name = :table) "
+                "OR (type = 'trigger' AND name LIKE '%\\_search\\_%' ESCAPE '\\')"
+            ),
+            {"table": SEARCH_TABLE},
+        )
+    }
+    try:
+        for statement in search_index_ddl():
+            conn.execute(text(statement))
+    except Exception as e:
+        logger.warning("Search index not installed (FTS5 unavailable?): %s", e)
+        return
+    if not _expected_objects() <= present:
+        _rebuild(conn)
+
+
+def _expected_objects() -> set[str]:
+    names = {SEARCH_TABLE}
+    for _, table, *_ in _SOURCES:
+        names |= {f"{table}_search_ai", f"{table}_search_ad", f"{table}_search_au"}
+    return names
+
+
+def drop_search_index(conn) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+    for name in sorted(_expected_objects() - {SEARCH_TABLE}):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+def rebuild_search_index(db: Session, *, commit: bool = True) -> int:
+    """Re-derive every index row from the source tables; returns the row count."""
+    _rebuild(db.connection())
+    count = db.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE}")).scalar() or 0
+    if commit:
+        db.commit()
+    return count
+
+
+def build_match_query(q: str) -> str | None:
+    """FTS5 MATCH expression: every folded token must match (AND); the last
+    one (if at least MIN_PREFIX_CHARS long) as a prefix so partial input finds
+    whole words. None if no tokens."""
+    tokens = _TOKEN_RE.findall(fold_arabic(q))
+    if not tokens:
+        return None
+    quoted = [f'"{token}"' for token in tokens]
+    if len(tokens[-1]) >= MIN_PREFIX_CHARS:
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search(
+    db: Session,
+    q: str,
+    *,
+    kinds: list[str] | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> dict:
+    """Ranked (bm25) search across lemmas, sentences and stories.
+
+    Returns ``{"query", "results", "has_more"}``; each result carries its
+    kind, id, display fields and an FTS snippet of the matching column.
+    """
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    offset = max(0, offset)
+    match = build_match_query(q)
+    if match is None:
+        return {"query": q, "results": [], "has_more": False}
+
+    codes = sorted(KIND_CODES[k] for k in (kinds or KIND_CODES) if k in KIND_CODES)
+    if not codes:
+        return {"query": q, "results": [], "has_more": False}
+    kind_filter = ""
+    if len(codes) < len(KIND_CODES):
+        kind_filter = f"AND rowid % {_ROWID_STRIDE} IN ({', '.join(map(str, codes))})"
+
+    rows = db.execute(
+        text(
+            f"SELECT rowid, rank, snippet({SEARCH_TABLE}, -1, '[', ']', '…', 12) "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match {kind_filter} "
+            "ORDER BY rank, rowid LIMIT :limit OFFSET :offset"
+        ),
+        {"match": match, "limit": limit + 1, "offset": offset},
+    ).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    hits = [
+        (_KIND_BY_CODE[rowid % _ROWID_STRIDE], rowid // _ROWID_STRIDE, rank, snippet)
+        for rowid, rank, snippet in rows
+    ]
+    details = _hydrate(db, hits)
+
+    results = []
+    for kind, ref_id, rank, snippet in hits:
+        detail = details.get((kind, ref_id))
+        if detail is None:
+            continue
+        results.append({
+            "kind": kind,
+            "id": ref_id,
+            **detail,
+            "snippet": snippet,
+            "score": round(-rank, 4),
+        })
+    return {"query": q, "results": results, "has_more": has_more}
+
+
+def _hydrate(db: Session, hits: list[tuple]) -> dict[tuple[str, int], dict]:
+    ids: dict[str, list[int]] = {}
+    for kind, ref_id, _, _ in hits:
+        ids.setdefault(kind, []).append(ref_id)
+
+    details: dict[tuple[str, int], dict] = {}
+    if ids.get("lemma"):
+        for row in db.query(
+            Lemma.lemma_id, Lemma.lemma_ar, Lemma.gloss_en, Lemma.pos,
+            Lemma.canonical_lemma_id,
+        ).filter(Lemma.lemma_id.in_(ids["lemma"])):
+            details[("lemma", row.lemma_id)] = {
+                "arabic": row.lemma_ar,
+                "english": row.gloss_en,
+                "pos": row.pos,
+                "canonical_lemma_id": row.canonical_lemma_id,
+            }
+    if ids.get("sentence"):
+        for row in db.query(
+            Sentence.id, Sentence.arabic_text, Sentence.english_translation,
+            Sentence.story_id,
+        ).filter(Sentence.id.in_(ids["sentence"])):
+            details[("sentence", row.id)] = {
+                "arabic": row.arabic_text,
+                "english": row.english_translation,
+                "story_id": row.story_id,
+            }
+    if ids.get("story"):
+        for row in db.query(
+            Story.id, Story.title_ar, Story.title_en, Story.status,
+        ).filter(Story.id.in_(ids["story"])):
+            details[("story", row.id)] = {
+                "arabic": row.title_ar,
+                "english": row.title_en,
+                "status": row.status,
+            }
+    return details
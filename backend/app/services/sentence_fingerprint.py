@@ -0,0 +1,353 @@
+"""Normalized sentence fingerprints, MinHash signatures and an LSH index.
+
+Every `Sentence` stores `text_fingerprint` (diacritics, tatweel, punctuation
+stripped, alef normalized, whitespace collapsed) and `text_minhash`, a MinHash
+signature over character 3-grams of that fingerprint. Both are set by the
+model whenever `arabic_text` is assigned. A raw-SQL edit of ``arabic_text``
+can't recompute them, so the ``sentences_fp_au`` trigger NULLs both instead;
+readers compute a NULL fingerprint in memory and
+``scripts/backfill_sentence_fingerprints.py`` stores it (also the one-shot
+fill for rows written before the columns existed).
+
+`NearDuplicateIndex` buckets signatures by LSH band so "near-duplicates of
+this text" only compares against the handful of sentences sharing a band,
+instead of every sentence in the pool. Candidates are then confirmed with the
+same rule the session selector uses (`fingerprints_near_duplicate`), so the
+index never reports a pair the selector would accept.
+
+Generation writes check candidates against `shared_index()`, one index per
+process over the active pool: built once, extended with newer sentence ids on
+each call and rebuilt after ``SHARED_INDEX_MAX_AGE_SECONDS`` to drop retired
+or edited rows. It is read in its own short session before the caller opens
+its write transaction. `NearDuplicateIndex.claim()` checks and adds under one
+lock, so concurrent generation threads can't both insert the same text;
+`stored_duplicate_exists()` is the indexed exact-match check against rows
+other processes wrote since the index was read.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.sentence_validator import (
+    normalize_alef,
+    strip_diacritics,
+    strip_punctuation,
+    strip_tatweel,
+)
+
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS  # 4 rows/band: ~50% char-3gram Jaccard recall knee
+SHINGLE_SIZE = 3
+
+# Same-session veto thresholds, shared with sentence_selector.
+TEXT_VETO_RATIO = 0.86  # max normalized Arabic char similarity
+TEXT_TOKEN_VETO_THRESHOLD = 0.8  # max normalized Arabic token Jaccard
+
+SHARED_INDEX_MAX_AGE_SECONDS = 3600
+
+FINGERPRINT_TRIGGER = "sentences_fp_au"
+
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations() -> tuple[tuple[int, int], ...]:
+    # Fixed coefficients derived from crc32 so signatures are stable across
+    # processes and releases; changing them invalidates stored signatures.
+    out = []
+    for i in range(NUM_PERM):
+        a = zlib.crc32(f"alif-minhash-a{i}".encode()) | 1
+        b = zlib.crc32(f"alif-minhash-b{i}".encode())
+        out.append((a, b))
+    return tuple(out)
+
+
+_PERMS = _permutations()
+
+
+@lru_cache(maxsize=8192)
+def text_fingerprint(text: str | None) -> str:
+    """Normalize Arabic sentence text for exact/similarity duplicate checks."""
+    if not text:
+        return ""
+    bare = normalize_alef(strip_tatweel(strip_diacritics(text)))
+    bare = strip_punctuation(bare)
+    return " ".join(bare.split())
+
+
+def _shingle_hashes(fingerprint: str) -> set[int]:
+    if len(fingerprint) <= SHINGLE_SIZE:
+        return {zlib.crc32(fingerprint.encode())}
+    return {
+        zlib.crc32(fingerprint[i:i + SHINGLE_SIZE].encode())
+        for i in range(len(fingerprint) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(fingerprint: str) -> list[int]:
+    """MinHash of a fingerprint's character 3-grams. Empty for empty text."""
+    if not fingerprint:
+        return []
+    hashes = _shingle_hashes(fingerprint)
+    return [
+        min((a * x + b) % _MERSENNE for x in hashes) & _MAX_HASH
+        for a, b in _PERMS
+    ]
+
+
+def estimated_jaccard(sig_a: list[int], sig_b: list[int]) -> float:
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def fingerprints_near_duplicate(a: str, b: str) -> bool:
+    """True if two fingerprints are identical, share most tokens, or are
+    near-identical character strings."""
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    union = tokens_a | tokens_b
+    if union and len(tokens_a & tokens_b) / len(union) >= TEXT_TOKEN_VETO_THRESHOLD:
+        return True
+    # real_quick_ratio/quick_ratio are upper bounds on ratio(); most pairs
+    # are rejected without the full matching-blocks computation.
+    matcher = SequenceMatcher(None, a, b)
+    return (
+        matcher.real_quick_ratio() >= TEXT_VETO_RATIO
+        and matcher.quick_ratio() >= TEXT_VETO_RATIO
+        and matcher.ratio() >= TEXT_VETO_RATIO
+    )
+
+
+class NearDuplicateIndex:
+    """In-memory LSH index over sentence fingerprints, keyed by sentence id
+    (or any hashable key for not-yet-stored candidates)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._fingerprints: dict[object, str] = {}
+        self._by_fingerprint: dict[str, set[object]] = {}
+        self._buckets: list[dict[tuple[int, ...], set[object]]] = [
+            {} for _ in range(LSH_BANDS)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fingerprints
+
+    def add(
+        self,
+        key: object,
+        fingerprint: str,
+        signature: list[int] | None = None,
+    ) -> None:
+        if not fingerprint or key in self._fingerprints:
+            return
+        if not signature:
+            signature = minhash_signature(fingerprint)
+        with self._lock:
+            self._fingerprints[key] = fingerprint
+            self._by_fingerprint.setdefault(fingerprint, set()).add(key)
+            for band, bucket in zip(self._bands(signature), self._buckets):
+                bucket.setdefault(band, set()).add(key)
+
+    def add_text(self, key: object, text: str | None) -> None:
+        self.add(key, text_fingerprint(text))
+
+    def near_duplicates(
+        self,
+        text: str | None = None,
+        *,
+        fingerprint: str | None = None,
+        signature: list[int] | None = None,
+    ) -> set[object]:
+        """Keys whose fingerprint is a near-duplicate of ``text``."""
+        if fingerprint is None:
+            fingerprint = text_fingerprint(text)
+        if not fingerprint:
+            return set()
+        if not signature:
+            signature = minhash_signature(fingerprint)
+        with self._lock:
+            found = set(self._by_fingerprint.get(fingerprint, ()))
+            candidates: set[object] = set()
+            for band, bucket in zip(self._bands(signature), self._buckets):
+                candidates |= bucket.get(band, set())
+            for key in candidates - found:
+                if fingerprints_near_duplicate(fingerprint, self._fingerprints[key]):
+                    found.add(key)
+            return found
+
+    def has_near_duplicate(self, text: str | None) -> bool:
+        fingerprint = text_fingerprint(text)
+        if fingerprint in self._by_fingerprint:
+            return True
+        return bool(self.near_duplicates(fingerprint=fingerprint))
+
+    def claim(self, text: str | None, key: object | None = None) -> bool:
+        """Add ``text`` unless it near-duplicates the index; False if it does.
+
+        Atomic, so of two threads claiming the same text only one wins. A
+        claim isn't released if the caller's write later fails; the next
+        rebuild of the index forgets it.
+        """
+        fingerprint = text_fingerprint(text)
+        if not fingerprint:
+            return True
+        signature = minhash_signature(fingerprint)
+        with self._lock:
+            if fingerprint in self._by_fingerprint or self.near_duplicates(
+                fingerprint=fingerprint, signature=signature,
+            ):
+                return False
+            self.add(object() if key is None else key, fingerprint, signature)
+            return True
+
+    @staticmethod
+    def _bands(signature: list[int]) -> Iterable[tuple[int, ...]]:
+        for i in range(LSH_BANDS):
+            yield tuple(signature[i * LSH_ROWS:(i + 1) * LSH_ROWS])
+
+
+def fingerprint_trigger_ddl() -> str:
+    """NULL the stored fingerprint when ``arabic_text`` changes without it
+    (raw SQL); ORM writes set all three columns in the same UPDATE."""
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {FINGERPRINT_TRIGGER} "
+        "AFTER UPDATE OF arabic_text ON sentences "
+        "WHEN NEW.arabic_text IS NOT OLD.arabic_text "
+        "AND NEW.text_fingerprint IS OLD.text_fingerprint "
+        "AND NEW.text_fingerprint IS NOT NULL "
+        "BEGIN UPDATE sentences SET text_fingerprint = NULL, text_minhash = NULL "
+        "WHERE id = NEW.id; END"
+    )
+
+
+def install_fingerprint_trigger(conn) -> None:
+    """Create the trigger if missing. Idempotent; takes a SQLAlchemy Connection."""
+    if conn.dialect.name != "sqlite":
+        return
+    conn.execute(text(fingerprint_trigger_ddl()))
+
+
+def backfill_fingerprints(db: Session, batch_size: int = 500) -> int:
+    """Store `text_fingerprint`/`text_minhash` on rows that lack them,
+    committing per batch so the write lock is only held briefly. Returns
+    rows updated. Run by scripts/backfill_sentence_fingerprints.py."""
+    from app.models import Sentence
+
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Sentence)
+            .filter(Sentence.text_fingerprint.is_(None), Sentence.id > last_id)
+            .order_by(Sentence.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return updated
+        for sent in rows:
+            fingerprint = text_fingerprint(sent.arabic_text)
+            sent.text_fingerprint = fingerprint
+            sent.text_minhash = minhash_signature(fingerprint)
+        last_id = rows[-1].id
+        db.commit()
+        updated += len(rows)
+
+
+def stored_duplicate_exists(db: Session, text: str | None) -> bool:
+    """Indexed exact match on ``text_fingerprint`` (any sentence, active or not)."""
+    from app.models import Sentence
+
+    fingerprint = text_fingerprint(text)
+    if not fingerprint:
+        return False
+    return db.query(Sentence.id).filter(
+        Sentence.text_fingerprint == fingerprint
+    ).first() is not None
+
+
+def _add_rows(index: NearDuplicateIndex, rows) -> int:
+    """Add (id, fingerprint, signature, arabic_text) rows; NULL fingerprints
+    (raw-SQL edits, not yet backfilled) are computed in memory. Returns the
+    highest id seen."""
+    high_water = 0
+    for sentence_id, fingerprint, signature, arabic_text in rows:
+        if fingerprint is None:
+            fingerprint, signature = text_fingerprint(arabic_text), None
+        index.add(sentence_id, fingerprint, signature)
+        high_water = max(high_water, sentence_id)
+    return high_water
+
+
+def _index_query(db: Session, *, active_only: bool, after_id: int = 0):
+    from app.models import Sentence
+
+    query = db.query(
+        Sentence.id, Sentence.text_fingerprint, Sentence.text_minhash, Sentence.arabic_text,
+    ).filter(Sentence.id > after_id)
+    if active_only:
+        query = query.filter(Sentence.is_active == True)  # noqa: E712
+    return query.yield_per(5000)
+
+
+def load_index(db: Session, *, active_only: bool = True) -> NearDuplicateIndex:
+    """Build an index over stored signatures. Read-only."""
+    index = NearDuplicateIndex()
+    _add_rows(index, _index_query(db, active_only=active_only))
+    return index
+
+
+_shared: dict[str, object] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_index() -> NearDuplicateIndex:
+    """The process-wide index over active sentences, brought up to date in a
+    session of its own (see module docstring)."""
+    from app.database import SessionLocal
+
+    with _shared_lock:
+        index = _shared.get("index")
+        stale = time.monotonic() - _shared.get("built_at", 0.0) > SHARED_INDEX_MAX_AGE_SECONDS
+        db = SessionLocal()
+        try:
+            if index is None or stale:
+                index = NearDuplicateIndex()
+                _shared.update(
+                    index=index,
+                    built_at=time.monotonic(),
+                    high_water=_add_rows(index, _index_query(db, active_only=True)),
+                )
+            else:
+                high_water = _add_rows(
+                    index,
+                    _index_query(db, active_only=True, after_id=_shared["high_water"]),
+                )
+                _shared["high_water"] = max(_shared["high_water"], high_water)
+        finally:
+            db.close()
+        return index
+
+
+def reset_shared_index() -> None:
+    """Forget the process-wide index (e.g. after the schema is recreated)."""
+    with _shared_lock:
+        _shared.clear()
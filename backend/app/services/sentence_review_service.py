@@ -3,13 +3,15 @@
 Translates sentence comprehension signals into per-word FSRS reviews.
 """
 
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import (
     ConfusionCapture,
     GrammarFeature,
@@ -47,6 +49,244 @@ from app.services.surface_form_experiment import (
 
 logger = logging.getLogger(__name__)
 
+# Reviews per transaction in `submit_sentence_reviews_batch`.
+SYNC_COMMIT_CHUNK = 25
+
+
+@dataclass
+class ReviewPrefetch:
+    """Rows a batch of sentence reviews will read, loaded up front.
+
+    Passed to `submit_sentence_review(prefetch=...)` in place of its
+    per-review SentenceWord / Lemma / ULK queries. Entries are the session's
+    identity-mapped objects, so edits made by an earlier review in the same
+    transaction are visible to later ones; ids not loaded up front (e.g. a
+    ULK created by an earlier review) fall back to a query and are cached.
+    """
+
+    sentence_words: dict[int, list[SentenceWord]] = field(default_factory=dict)
+    lemmas: dict[int, Lemma] = field(default_factory=dict)
+    knowledge: dict[int, UserLemmaKnowledge] = field(default_factory=dict)
+    sentences: dict[int, Sentence] = field(default_factory=dict)
+    # Full ReviewLog history per lemma for the leech window. Logs written by
+    # reviews in the batch are appended via `record_review_log`.
+    review_logs: dict[int, list[ReviewLog]] = field(default_factory=dict)
+    # client_review_ids already stored (or applied earlier in this batch).
+    seen_client_review_ids: set[str] = field(default_factory=set)
+    # Per-word ReviewLog client_review_ids looked up up front, and the subset
+    # already stored; `needs_duplicate_check` answers from these.
+    checked_word_review_ids: set[str] = field(default_factory=set)
+    stored_word_review_ids: set[str] = field(default_factory=set)
+
+    def sentence_words_for(self, sentence_ids: Iterable[int]) -> list[SentenceWord]:
+        return [
+            sw
+            for sid in sorted(set(sentence_ids))
+            for sw in self.sentence_words.get(sid, [])
+        ]
+
+    def lemmas_for(self, db: Session, lemma_ids: Iterable[int]) -> list[Lemma]:
+        lemma_ids = set(lemma_ids)
+        missing = lemma_ids - self.lemmas.keys()
+        if missing:
+            for lemma in db.query(Lemma).filter(Lemma.lemma_id.in_(missing)).all():
+                self.lemmas[lemma.lemma_id] = lemma
+        return [self.lemmas[lid] for lid in lemma_ids if lid in self.lemmas]
+
+    def knowledge_for(
+        self, db: Session, lemma_ids: Iterable[int]
+    ) -> list[UserLemmaKnowledge]:
+        lemma_ids = set(lemma_ids)
+        missing = lemma_ids - self.knowledge.keys()
+        if missing:
+            for ulk in (
+                db.query(UserLemmaKnowledge)
+                .filter(UserLemmaKnowledge.lemma_id.in_(missing))
+                .all()
+            ):
+                self.knowledge[ulk.lemma_id] = ulk
+        return [self.knowledge[lid] for lid in lemma_ids if lid in self.knowledge]
+
+    def sentences_for(self, db: Session, sentence_ids: Iterable[int]) -> list[Sentence]:
+        sentence_ids = set(sentence_ids)
+        missing = sentence_ids - self.sentences.keys()
+        if missing:
+            for sentence in db.query(Sentence).filter(Sentence.id.in_(missing)).all():
+                self.sentences[sentence.id] = sentence
+        return [self.sentences[sid] for sid in sentence_ids if sid in self.sentences]
+
+    def needs_duplicate_check(self, review_client_id: str | None) -> bool:
+        return (
+            review_client_id not in self.checked_word_review_ids
+            or review_client_id in self.stored_word_review_ids
+        )
+
+    def record_review_log(self, log: ReviewLog) -> None:
+        # Only histories loaded in full; a partial one would skew the window.
+        if log.lemma_id in self.review_logs:
+            self.review_logs[log.lemma_id].append(log)
+
+
+def _review_sentence_ids(
+    sentence_id: Optional[int], sentence_ids: Sequence[int] | None
+) -> list[int]:
+    """Primary sentence first, then the rest in order, deduplicated."""
+    review_sentence_ids: list[int] = []
+    for sid in sentence_ids or []:
+        if sid is not None and sid not in review_sentence_ids:
+            review_sentence_ids.append(sid)
+    if sentence_id is not None:
+        review_sentence_ids = [sentence_id] + [
+            sid for sid in review_sentence_ids if sid != sentence_id
+        ]
+    return review_sentence_ids
+
+
+def prefetch_sentence_reviews(db: Session, reviews: Sequence[dict]) -> ReviewPrefetch:
+    """Load everything ``reviews`` (`submit_sentence_review` kwargs) will
+    read in a handful of queries: the idempotency keys, sentences and their
+    words, lemmas along their canonical chains, ULKs, and the ReviewLog
+    history the leech check reads."""
+    prefetch = ReviewPrefetch()
+    sentence_ids_by_review = [
+        _review_sentence_ids(r.get("sentence_id"), r.get("sentence_ids"))
+        for r in reviews
+    ]
+    all_sentence_ids = {sid for sids in sentence_ids_by_review for sid in sids}
+
+    sentence_log_ids: dict[str, str] = {}  # stored id -> client_review_id
+    word_only_ids: set[str] = set()
+    for review, sids in zip(reviews, sentence_ids_by_review):
+        cid = review.get("client_review_id")
+        if not cid:
+            continue
+        if sids:
+            sentence_log_ids[cid] = cid
+            for sid in sids:
+                sentence_log_ids[f"{cid}:s{sid}"] = cid
+        else:
+            word_only_ids.add(cid)
+    if sentence_log_ids:
+        for (stored,) in db.query(SentenceReviewLog.client_review_id).filter(
+            SentenceReviewLog.client_review_id.in_(list(sentence_log_ids))
+        ):
+            prefetch.seen_client_review_ids.add(sentence_log_ids[stored])
+
+    lemma_ids = {
+        r["primary_lemma_id"]
+        for r, sids in zip(reviews, sentence_ids_by_review)
+        if not sids and r.get("primary_lemma_id") is not None
+    }
+    if all_sentence_ids:
+        for sw in (
+            db.query(SentenceWord)
+            .filter(SentenceWord.sentence_id.in_(all_sentence_ids))
+            .order_by(SentenceWord.sentence_id, SentenceWord.position)
+            .all()
+        ):
+            prefetch.sentence_words.setdefault(sw.sentence_id, []).append(sw)
+            if sw.lemma_id:
+                lemma_ids.add(sw.lemma_id)
+
+    # Lemmas plus every hop of their canonical chains.
+    to_load = set(lemma_ids)
+    while to_load:
+        loaded = prefetch.lemmas_for(db, to_load)
+        to_load = {
+            lemma.canonical_lemma_id
+            for lemma in loaded
+            if lemma.canonical_lemma_id
+            and lemma.canonical_lemma_id not in prefetch.lemmas
+        }
+    prefetch.knowledge_for(db, prefetch.lemmas.keys())
+
+    # Word-level ReviewLog ids the reviews may write: the review's own id for
+    # word-only items, "<id>:<lemma>" along each sentence word's chain.
+    word_review_ids = set(word_only_ids)
+    for review, sids in zip(reviews, sentence_ids_by_review):
+        cid = review.get("client_review_id")
+        if not cid or not sids:
+            continue
+        for sw in prefetch.sentence_words_for(sids):
+            lid = sw.lemma_id
+            while lid and f"{cid}:{lid}" not in word_review_ids:
+                word_review_ids.add(f"{cid}:{lid}")
+                lemma = prefetch.lemmas.get(lid)
+                lid = lemma.canonical_lemma_id if lemma else None
+    if word_review_ids:
+        for (stored,) in db.query(ReviewLog.client_review_id).filter(
+            ReviewLog.client_review_id.in_(word_review_ids)
+        ):
+            prefetch.stored_word_review_ids.add(stored)
+            if stored in word_only_ids:
+                prefetch.seen_client_review_ids.add(stored)
+    prefetch.checked_word_review_ids = word_review_ids
+
+    if all_sentence_ids:
+        prefetch.sentences_for(db, all_sentence_ids)
+    if prefetch.lemmas:
+        prefetch.review_logs = {lid: [] for lid in prefetch.lemmas}
+        for log in (
+            db.query(ReviewLog)
+            .filter(ReviewLog.lemma_id.in_(list(prefetch.lemmas)))
+            .all()
+        ):
+            prefetch.review_logs[log.lemma_id].append(log)
+    return prefetch
+
+
+def submit_sentence_reviews_batch(
+    db: Session,
+    reviews: Sequence[dict],
+    *,
+    chunk_size: int = SYNC_COMMIT_CHUNK,
+) -> list[dict]:
+    """Apply many sentence reviews (`submit_sentence_review` kwargs, in the
+    order given) with one commit per ``chunk_size`` reviews. Each chunk
+    shares one `prefetch_sentence_reviews` load.
+
+    Returns one outcome per review, in input order: ``{"status": "ok" |
+    "duplicate", "result": ...}`` or ``{"status": "error", "error": ...}``.
+    If a chunk raises it is rolled back and replayed one review per
+    transaction, so a bad review fails alone.
+    """
+    outcomes: list[dict] = [{} for _ in reviews]
+    for start in range(0, len(reviews), max(1, chunk_size)):
+        chunk = range(start, min(start + chunk_size, len(reviews)))
+        # Per chunk: the previous commit expired every loaded row.
+        prefetch = prefetch_sentence_reviews(db, [reviews[i] for i in chunk])
+        try:
+            results = [
+                submit_sentence_review(
+                    db, **reviews[i], commit=False, prefetch=prefetch
+                )
+                for i in chunk
+            ]
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.warning(
+                "Sentence review chunk of %d failed; replaying one by one",
+                len(chunk),
+                exc_info=True,
+            )
+            results = []
+            for i in chunk:
+                try:
+                    results.append(submit_sentence_review(db, **reviews[i]))
+                except Exception as exc:
+                    db.rollback()
+                    results.append(exc)
+        for i, result in zip(chunk, results):
+            if isinstance(result, Exception):
+                outcomes[i] = {"status": "error", "error": str(result)}
+            else:
+                outcomes[i] = {
+                    "status": "duplicate" if result.get("duplicate") else "ok",
+                    "result": result,
+                }
+    return outcomes
+
 WORD_REVIEW_EVIDENCE_PROTOCOL_VERSION = 3
 _SUPPORTED_WORD_REVIEW_EVIDENCE_PROTOCOLS = {1, 2, 3}
 _WORD_FAILURE_CAUSES = {
@@ -57,6 +297,7 @@ _WORD_FAILURE_CAUSES = {
 }
 
 
+@clock.honors_at
 def submit_sentence_review(
     db: Session,
     sentence_id: Optional[int],
@@ -73,6 +314,9 @@ def submit_sentence_review(
     sentence_ids: list[int] | None = None,
     word_evidence_protocol_version: int | None = None,
     word_review_evidence: list[dict] | None = None,
+    at: datetime | None = None,
+    commit: bool = True,
+    prefetch: ReviewPrefetch | None = None,
 ) -> dict:
     """Submit a review for a whole sentence, distributing ratings to words.
 
@@ -81,19 +325,21 @@ def submit_sentence_review(
     - "no_idea" -> all words get rating=1
 
     Previously unseen words are routed through acquisition (Leitner box 1)
-    rather than getting FSRS cards directly.
+    rather than getting FSRS cards directly. ``at`` pins the review clock
+    (see app.clock) for replays and simulations. ``commit=False`` leaves the
+    work flushed but uncommitted so a caller can batch several reviews into
+    one transaction (the review journal writer does). ``prefetch`` (see
+    `prefetch_sentence_reviews`) replaces the per-review lookups when
+    applying a batch.
     """
-    review_sentence_ids: list[int] = []
-    for sid in sentence_ids or []:
-        if sid is not None and sid not in review_sentence_ids:
-            review_sentence_ids.append(sid)
-    if sentence_id is not None:
-        review_sentence_ids = [sentence_id] + [
-            sid for sid in review_sentence_ids if sid != sentence_id
-        ]
+    review_sentence_ids = _review_sentence_ids(sentence_id, sentence_ids)
     primary_sentence_id = review_sentence_ids[0] if review_sentence_ids else None
 
-    if client_review_id:
+    if client_review_id and prefetch is not None:
+        if client_review_id in prefetch.seen_client_review_ids:
+            return {"word_results": [], "duplicate": True}
+        prefetch.seen_client_review_ids.add(client_review_id)
+    elif client_review_id:
         if review_sentence_ids:
             sentence_log_ids = [client_review_id] + [
                 f"{client_review_id}:s{sid}" for sid in review_sentence_ids
@@ -116,7 +362,7 @@ def submit_sentence_review(
             if existing_primary:
                 return {"word_results": [], "duplicate": True}
 
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     missed_set = set(missed_lemma_ids or [])
     confused_set = set(confused_lemma_ids or [])
 
@@ -127,7 +373,9 @@ def submit_sentence_review(
     sentence_words: list[SentenceWord] = []
     if review_sentence_ids:
         sentence_words = (
-            db.query(SentenceWord)
+            prefetch.sentence_words_for(review_sentence_ids)
+            if prefetch is not None
+            else db.query(SentenceWord)
             .filter(SentenceWord.sentence_id.in_(review_sentence_ids))
             .order_by(SentenceWord.sentence_id, SentenceWord.position)
             .all()
@@ -153,12 +401,13 @@ def submit_sentence_review(
     # Must follow multi-hop chains (A→B→C) to the root canonical.
     variant_to_canonical: dict[int, int] = {}
 
+    def _load_lemmas(ids: set[int]) -> list[Lemma]:
+        if prefetch is not None:
+            return prefetch.lemmas_for(db, ids)
+        return db.query(Lemma).filter(Lemma.lemma_id.in_(ids)).all()
+
     if lemma_ids_in_sentence:
-        lemma_objs = (
-            db.query(Lemma)
-            .filter(Lemma.lemma_id.in_(lemma_ids_in_sentence))
-            .all()
-        )
+        lemma_objs = _load_lemmas(lemma_ids_in_sentence)
         lemma_map = {lo.lemma_id: lo for lo in lemma_objs}
         for lo in lemma_objs:
             if is_function_word_lemma(
@@ -173,11 +422,7 @@ def submit_sentence_review(
         # Also fetch canonical lemmas that may not be in the sentence directly
         canonical_ids_needed = set(variant_to_canonical.values()) - lemma_ids_in_sentence
         if canonical_ids_needed:
-            canonical_lemma_objs = (
-                db.query(Lemma)
-                .filter(Lemma.lemma_id.in_(canonical_ids_needed))
-                .all()
-            )
+            canonical_lemma_objs = _load_lemmas(canonical_ids_needed)
             for lo in canonical_lemma_objs:
                 lemma_map[lo.lemma_id] = lo
 
@@ -197,13 +442,15 @@ def submit_sentence_review(
             # Fetch any new canonical lemmas we haven't loaded yet
             missing = next_hop_ids - set(lemma_map.keys())
             if missing:
-                for lo in db.query(Lemma).filter(Lemma.lemma_id.in_(missing)).all():
+                for lo in _load_lemmas(missing):
                     lemma_map[lo.lemma_id] = lo
 
         # Fetch ULK for both sentence lemma_ids and their canonical targets
         all_ulk_ids = lemma_ids_in_sentence | set(variant_to_canonical.values())
         ulk_objs = (
-            db.query(UserLemmaKnowledge)
+            prefetch.knowledge_for(db, all_ulk_ids)
+            if prefetch is not None
+            else db.query(UserLemmaKnowledge)
             .filter(UserLemmaKnowledge.lemma_id.in_(all_ulk_ids))
             .all()
         )
@@ -428,6 +675,10 @@ def submit_sentence_review(
                 review_mode=review_mode,
                 comprehension_signal=comprehension_signal,
                 client_review_id=review_client_id,
+                check_duplicate=(
+                    prefetch is None
+                    or prefetch.needs_duplicate_check(review_client_id)
+                ),
                 commit=False,
                 was_confused=is_confused,
                 effective_rating_int=2 if form_recovery_protected else None,
@@ -443,6 +694,10 @@ def submit_sentence_review(
                 review_mode=review_mode,
                 comprehension_signal=comprehension_signal,
                 client_review_id=review_client_id,
+                check_duplicate=(
+                    prefetch is None
+                    or prefetch.needs_duplicate_check(review_client_id)
+                ),
                 commit=False,
                 was_confused=is_confused,
                 effective_rating_int=2 if form_recovery_protected else None,
@@ -450,16 +705,13 @@ def submit_sentence_review(
             )
         is_duplicate = bool(result.get("duplicate"))
         # Tag the review log entry with sentence context
-        latest_log = (
-            db.query(ReviewLog)
-            .filter(ReviewLog.lemma_id == effective_lemma_id)
-            .order_by(ReviewLog.id.desc())
-            .first()
-        )
-        if latest_log and not is_duplicate:
+        latest_log = None if is_duplicate else result.get("review_log")
+        if latest_log:
             latest_log.sentence_id = primary_sentence_id
             latest_log.credit_type = credit_type
             latest_review_log_by_effective[effective_lemma_id] = latest_log
+            if prefetch is not None:
+                prefetch.record_review_log(latest_log)
 
         # Track encounters on the canonical ULK
         knowledge = knowledge_map.get(effective_lemma_id)
@@ -557,15 +809,28 @@ def submit_sentence_review(
     # correct one and flip the window into leech territory.
     from app.services.leech_service import check_single_word_leech
     for wr in word_results:
-        check_single_word_leech(db, wr["lemma_id"])
+        check_single_word_leech(
+            db,
+            wr["lemma_id"],
+            ulk=knowledge_map.get(wr["lemma_id"]),
+            review_logs=(
+                prefetch.review_logs.get(wr["lemma_id"])
+                if prefetch is not None
+                else None
+            ),
+        )
 
     # Log the sentence-level review
     if review_sentence_ids:
         sentence_map = {
             s.id: s
-            for s in db.query(Sentence)
-            .filter(Sentence.id.in_(review_sentence_ids))
-            .all()
+            for s in (
+                prefetch.sentences_for(db, review_sentence_ids)
+                if prefetch is not None
+                else db.query(Sentence)
+                .filter(Sentence.id.in_(review_sentence_ids))
+                .all()
+            )
         }
         for idx, sid in enumerate(review_sentence_ids):
             sent_log = SentenceReviewLog(
@@ -643,7 +908,10 @@ def submit_sentence_review(
         now=now,
     )
 
-    db.commit()
+    if commit:
+        db.commit()
+    else:
+        db.flush()
 
     return {
         "word_results": word_results,
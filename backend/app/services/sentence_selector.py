@@ -9,13 +9,13 @@ import logging
 import uuid
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 from typing import Optional
 
 from sqlalchemy import or_
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, joinedload
 
+from app import clock
 from app.services.canonical_resolution import resolve_canonical_via_map
 from app.services.fsrs_service import parse_json_column
 from app.services.transliteration import transliterate_arabic, transliterate_forms
@@ -31,7 +31,6 @@ from app.models import (
     SentenceGrammarFeature,
     SentenceReviewLog,
     SentenceWord,
-    UserGrammarExposure,
     UserLemmaKnowledge,
 )
 from app.services.interaction_logger import log_interaction
@@ -43,7 +42,6 @@ from app.services.sentence_validator import (
     build_lemma_lookup,
     normalize_alef,
     strip_diacritics,
-    strip_punctuation,
     strip_tatweel,
 )
 from app.services.frequency_lanes import (
@@ -55,6 +53,7 @@ from app.services.frequency_lanes import (
     select_slow_lane_sample,
 )
 from app.services.sentence_eligibility import reviewable_sentence_clauses
+from app.services.sentence_fingerprint import fingerprints_near_duplicate, text_fingerprint
 from app.services.surface_form_experiment import (
     EXACT_SURFACE_MAX_SLOTS_PER_SESSION,
     active_treatment_episodes,
@@ -87,8 +86,6 @@ LOW_TIER_INTRO_SOURCES = {"wiktionary", "story_import", "manual", "flag_autocrea
 LOW_TIER_BLOCK_BACKLOG = 60  # block low-tier auto-intros once box-1 acquiring exceeds this
 SESSION_SCAFFOLD_DECAY = 0.5  # per-appearance decay for scaffold words already in session
 JACCARD_VETO_THRESHOLD = 0.7  # max lemma-set Jaccard between two sentences in same session
-TEXT_VETO_RATIO = 0.86  # max normalized Arabic char similarity in same session
-TEXT_TOKEN_VETO_THRESHOLD = 0.8  # max normalized Arabic token Jaccard in same session
 NEVER_REVIEWED_BOOST = 5.0  # score multiplier for sentences targeting acquiring words with 0 reviews
 LAPSED_BOOST = 3.0  # score multiplier for sentences targeting lapsed words (re-expose soon)
 OVERDUE_ESCALATION_DAYS = 0.5  # start escalating as soon as a card is past due
@@ -1128,13 +1125,12 @@ def _is_near_duplicate_of_selected(candidate, selected_lemma_sets: list[set[int]
     return False
 
 
-def _sentence_text_fingerprint(text: str | None) -> str:
-    """Normalize Arabic sentence text for exact/similarity duplicate checks."""
-    if not text:
-        return ""
-    bare = normalize_alef(strip_tatweel(strip_diacritics(text)))
-    bare = strip_punctuation(bare)
-    return " ".join(bare.split())
+def _stored_fingerprint(sentence) -> str:
+    """A sentence's stored fingerprint, computing it for unbackfilled rows."""
+    fingerprint = getattr(sentence, "text_fingerprint", None)
+    if fingerprint is None:
+        fingerprint = text_fingerprint(getattr(sentence, "arabic_text", ""))
+    return fingerprint
 
 
 def _canonical_id_for_word(
@@ -1160,24 +1156,16 @@ def _canonical_id_for_word(
 
 def _is_text_near_duplicate(candidate_text: str | None, selected_texts: list[str]) -> bool:
     """Catch surface-near-identical sentences that lemma-set Jaccard can miss."""
-    cand_fp = _sentence_text_fingerprint(candidate_text)
+    return _is_fingerprint_near_duplicate(
+        text_fingerprint(candidate_text),
+        [text_fingerprint(t) for t in selected_texts],
+    )
+
+
+def _is_fingerprint_near_duplicate(cand_fp: str, selected_fps: list[str]) -> bool:
     if not cand_fp:
         return False
-    cand_tokens = set(cand_fp.split())
-    for selected_text in selected_texts:
-        prior_fp = _sentence_text_fingerprint(selected_text)
-        if not prior_fp:
-            continue
-        if cand_fp == prior_fp:
-            return True
-        prior_tokens = set(prior_fp.split())
-        union = cand_tokens | prior_tokens
-        token_jacc = len(cand_tokens & prior_tokens) / len(union) if union else 0.0
-        if token_jacc >= TEXT_TOKEN_VETO_THRESHOLD:
-            return True
-        if SequenceMatcher(None, cand_fp, prior_fp).ratio() >= TEXT_VETO_RATIO:
-            return True
-    return False
+    return any(fingerprints_near_duplicate(cand_fp, prior_fp) for prior_fp in selected_fps)
 
 
 def _is_near_duplicate_candidate(
@@ -1189,8 +1177,10 @@ def _is_near_duplicate_candidate(
     ]
     if _is_near_duplicate_of_selected(candidate, selected_lemma_sets):
         return True
-    selected_texts = [getattr(s.sentence, "arabic_text", "") for s in selected]
-    return _is_text_near_duplicate(getattr(candidate.sentence, "arabic_text", ""), selected_texts)
+    return _is_fingerprint_near_duplicate(
+        _stored_fingerprint(candidate.sentence),
+        [_stored_fingerprint(s.sentence) for s in selected],
+    )
 
 
 def _auto_introduce_words(
@@ -1337,6 +1327,7 @@ def _auto_introduce_words(
     return introduced_ids
 
 
+@clock.honors_at
 def build_session(
     db: Session,
     limit: int = 10,
@@ -1357,7 +1348,7 @@ def build_session(
     if selector_policy not in SELECTOR_POLICIES:
         raise ValueError(f"Unknown selector policy: {selector_policy}")
     session_id = str(uuid.uuid4())
-    now = at or datetime.now(timezone.utc)
+    now = at or clock.now()
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
 
@@ -1799,19 +1790,13 @@ def build_session(
         else {}
     )
 
-    # Load grammar exposure for grammar_fit scoring
-    from app.services.grammar_service import compute_comfort
-    grammar_exposure_map: dict[str, dict] = {}
-    gram_exposures = (
-        db.query(UserGrammarExposure)
-        .join(GrammarFeature)
-        .all()
-    )
-    for exp in gram_exposures:
-        grammar_exposure_map[exp.feature.feature_key] = {
-            "comfort": compute_comfort(exp.times_seen, exp.times_correct, exp.last_seen_at),
-            "introduced": exp.introduced_at is not None,
-        }
+    # Grammar exposure for grammar_fit scoring, from the shared snapshot
+    from app.services.grammar_service import get_grammar_state
+    grammar_state = get_grammar_state(db)
+    grammar_exposure_map: dict[str, dict] = {
+        key: {"comfort": comfort, "introduced": key in grammar_state.introduced}
+        for key, comfort in grammar_state.comfort.items()
+    }
 
     # Pre-compute grammar features per sentence from SentenceGrammarFeature + lemma tags
     sentence_grammar_cache: dict[int, list[str]] = {}
@@ -3165,7 +3150,7 @@ def _build_intro_cards(
     promoted by start_acquisition(), where they count against the same daily
     and recovery budgets as all other new vocabulary.
     """
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     cooldown_cutoff = now - timedelta(days=RESCUE_COOLDOWN_DAYS)
 
     new_card_ids = set()
@@ -3292,7 +3277,7 @@ def _find_pregenerated_sentences_for_words(
         return []
 
     # Recency filter (same cutoffs as build_session)
-    now = datetime.now(timezone.utc)
+    now = clock.now()
     cutoff_unrated = now - timedelta(days=30)
     cutoff_partial = now - timedelta(hours=4)
     cutoff_no_idea = now - timedelta(minutes=30)
@@ -3912,7 +3897,7 @@ def _with_fallbacks(
             f"Fill phase: session has {len(items)} cards / {session_unit_count} sentence-units out of {limit}"
         )
         try:
-            now = datetime.now(timezone.utc)
+            now = clock.now()
             fill_ids = _auto_introduce_words(
                 db, limit - session_unit_count, knowledge_by_id, now,
                 skip_material_gen=True,
@@ -3955,7 +3940,7 @@ def _with_fallbacks(
         try:
             from app.services.cohort_service import get_focus_cohort
             cohort = get_focus_cohort(db)
-            now = datetime.now(timezone.utc)
+            now = clock.now()
             already_covered = {item.get("primary_lemma_id") for item in items if item.get("primary_lemma_id")}
             almost_due: list[tuple[int, datetime]] = []
             for k in (all_knowledge or []):
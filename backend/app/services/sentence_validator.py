@@ -1711,6 +1711,19 @@ class LemmaLookupDict(dict):
             EXACT_RUNNING_TEXT_ALIAS_IDENTITIES
         )
 
+    def copy(self) -> "LemmaLookupDict":
+        """Independent copy: the mapping and every tracking container, so a
+        caller that extends its lookup can't touch a cached one."""
+        clone = LemmaLookupDict.__new__(LemmaLookupDict)
+        dict.update(clone, self)
+        for name, value in vars(self).items():
+            if name == "collisions":
+                value = {key: list(entries) for key, entries in value.items()}
+            else:
+                value = value.copy()
+            setattr(clone, name, value)
+        return clone
+
     def set_if_new(self, key: str, lemma_id: int, original_bare: str = "") -> None:
         """Set key→lemma_id without overwriting. Track collisions."""
         bare = original_bare or key
@@ -2130,6 +2143,33 @@ def build_lemma_lookup(lemmas: list) -> dict[str, int]:
     return lookup
 
 
+# Opt-in cache for build_comprehensive_lemma_lookup: require_gated ->
+# (lemmas signature, lookup). Off (None) unless a long-lived process enables
+# it; the material daemon warms it in its forkserver so every forked phase
+# inherits a built lookup (see material_daemon_preload.py).
+_comprehensive_lookup_cache: dict[bool, tuple[tuple, LemmaLookupDict]] | None = None
+
+
+def enable_comprehensive_lookup_cache(enabled: bool = True) -> None:
+    global _comprehensive_lookup_cache
+    _comprehensive_lookup_cache = {} if enabled else None
+
+
+def lemma_table_signature(db) -> tuple:
+    """Changes whenever ``lemmas`` is written: its ``table_versions`` counter
+    (edits the aggregates can't see) plus a row count and max id, so a reset
+    counter on a recreated database can't match an old lookup."""
+    from sqlalchemy import func
+
+    from app.models import Lemma
+    from app.services.knowledge_version import table_versions
+
+    # Aggregates first: the ORM query autoflushes pending lemma writes, so
+    # their trigger bumps land before the counter is read.
+    count, max_id = db.query(func.count(Lemma.lemma_id), func.max(Lemma.lemma_id)).one()
+    return (table_versions(db).get("lemmas"), count, max_id)
+
+
 def build_comprehensive_lemma_lookup(
     db,
     *,
@@ -2143,14 +2183,30 @@ def build_comprehensive_lemma_lookup(
     mapped to a lemma_id. Mapping-maintenance callers may set
     ``require_gated=True`` so an independently committed, still-in-progress
     lemma-quality claim cannot be used before ``run_quality_gates`` finishes.
+
+    With the cache enabled (`enable_comprehensive_lookup_cache`), a lookup
+    built at the current `lemma_table_signature` is reused; callers always
+    get their own copy.
     """
     from app.models import Lemma
 
+    cache = _comprehensive_lookup_cache
+    signature = None
+    if cache is not None:
+        signature = lemma_table_signature(db)
+        cached = cache.get(require_gated)
+        if cached is not None and cached[0] == signature:
+            return cached[1].copy()
+
     query = db.query(Lemma).filter(Lemma.canonical_lemma_id.is_(None))
     if require_gated:
         query = query.filter(Lemma.gates_completed_at.isnot(None))
     all_lemmas = query.all()
-    return build_lemma_lookup(all_lemmas)
+    lookup = build_lemma_lookup(all_lemmas)
+    if cache is not None:
+        cache[require_gated] = (signature, lookup)
+        return lookup.copy()
+    return lookup
 
 
 def verify_word_mappings_llm(
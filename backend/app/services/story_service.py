@@ -25,6 +25,7 @@ from app.models import (
 )
 from app.services.fsrs_service import submit_review
 from app.services.interaction_logger import log_interaction
+from app.services.llm_batching import map_batches
 from app.services.llm import (
     ARABIC_STYLE_RULES,
     DIFFICULTY_STYLE_GUIDE,
@@ -154,6 +155,11 @@ def _get_all_lemmas(db: Session) -> list:
     return db.query(Lemma).all()
 
 
+def _known_bare_forms(db: Session) -> set[str]:
+    """Normalized bare forms of every lemma, for the morphological fallback."""
+    return {normalize_alef(bare) for (bare,) in db.query(Lemma.lemma_ar_bare) if bare}
+
+
 def _tokenize_story(text: str) -> list[str]:
     """Tokenize story text, stripping punctuation (for lookup/compliance)."""
     return tokenize(text)
@@ -203,16 +209,24 @@ def _create_story_words(
     knowledge_map: dict[int, str],
     proper_names: set[str] | None = None,
     proper_name_source: str = "story",
+    *,
+    known_bare_forms: set[str] | None = None,
+    start_position: int = 0,
+    start_sentence_index: int = 0,
 ) -> tuple[int, int, int]:
     """Create StoryWord records for each token in the story.
 
     Surface forms preserve original punctuation (commas, periods, guillemets)
     so the reader can display them naturally.
 
+    Chunked imports pass a shared ``known_bare_forms`` and continue numbering
+    from ``start_position``/``start_sentence_index`` so ``body_ar`` can be one
+    slice of a longer text.
+
     Returns (total_words, known_count, function_word_count).
     """
     sentences = _split_story_sentences(body_ar)
-    position = 0
+    position = start_position
     total = 0
     known = 0
     func = 0
@@ -222,10 +236,9 @@ def _create_story_words(
     }
     proper_name_norms = {name for name in proper_name_norms if name}
 
-    # Build set of known bare forms for morphological fallback
-    known_bare_forms: set[str] = set()
-    for lem in db.query(Lemma).all():
-        known_bare_forms.add(normalize_alef(lem.lemma_ar_bare))
+    # Known bare forms for the morphological fallback
+    if known_bare_forms is None:
+        known_bare_forms = _known_bare_forms(db)
 
     # Batch-load all lemmas for gloss lookup (avoid N+1 queries)
     all_lemma_ids_needed: set[int] = set()
@@ -317,7 +330,7 @@ def _create_story_words(
                 position=position,
                 surface_form=display_form,
                 lemma_id=lemma_id,
-                sentence_index=sent_idx,
+                sentence_index=start_sentence_index + sent_idx,
                 gloss_en=gloss,
                 is_known_at_creation=is_known or is_func or is_proper_name,
                 is_function_word=is_func,
@@ -334,6 +347,68 @@ def _create_story_words(
     return total, known, func
 
 
+def _gloss_story_word_batch(batch: list[dict]) -> list:
+    """One LLM call glossing a batch of word analyses; returns the raw items.
+
+    Reads only the plain-string fields of each analysis, so it can run on a
+    worker thread (see `llm_batching.map_batches`).
+    """
+    # Build word list from CAMeL lex forms for better dictionary glosses.
+    words_for_llm = []
+    for index, analysis in enumerate(batch, start=1):
+        words_for_llm.append(
+            f"{index}. surface={analysis['surface']} | "
+            f"candidate_lemma={analysis['lex']} | "
+            f"context={analysis['context']}"
+        )
+    words_list = "\n".join(words_for_llm)
+
+    result = generate_completion(
+        prompt=f"""Given these Arabic words (base/dictionary forms), provide dictionary-form English glosses, part of speech, and whether the word is a proper name.
+
+Items: {words_list}
+
+IMPORTANT: Give dictionary-form glosses, NOT conjugated translations:
+- Verbs: use infinitive ("to write", "to wake up"), NOT ("she wrote", "he woke up")
+- Nouns: use bare singular ("book", "school"), NOT ("his books", "the schools")
+- Adjectives: use base form ("big", "beautiful"), NOT ("bigger", "the big one")
+
+Return exactly one result for every numbered item, in the same order. Use the
+context to repair an inflected, cliticized, fused, or imperfect candidate.
+Never refuse the whole batch because one item is uncertain: give the safest
+contextual dictionary lemma and gloss for that item.
+
+Respond with JSON: {{"words": [{{"index": 1, "arabic": "the corrected base-form lemma", "english": "dictionary gloss", "pos": "noun/verb/adj/adv/prep/conj", "name_type": null or "personal" or "place"}}]}}
+
+Set name_type to "personal" for personal names (people, characters), "place" for place names (cities, countries, landmarks), or null for regular vocabulary words.""",
+        system_prompt="You translate Arabic words to English. Give concise, dictionary-form glosses (1-3 words). For verbs use infinitive ('to X'). For proper names, provide the transliterated name. Respond with JSON only.",
+        json_mode=True,
+        model_override="openai",
+        task_type="story_word_import",
+    )
+
+    # Result may be a list or a dict with a list inside. Treat an
+    # explicit model error as a failed batch, never as an empty success.
+    if isinstance(result, list):
+        items = result
+    elif isinstance(result, dict):
+        if result.get("error"):
+            raise ValueError(str(result["error"]))
+        items = next(
+            (
+                result[key]
+                for key in ("words", "translations", "items", "results", "entries")
+                if isinstance(result.get(key), list)
+            ),
+            [],
+        )
+    else:
+        items = []
+    if not items:
+        raise ValueError("word translation returned no entries")
+    return items
+
+
 def _import_unknown_words(
     db: Session,
     story: Story,
@@ -342,12 +417,15 @@ def _import_unknown_words(
     target_positions: set[int] | None = None,
     background_enrich: bool = True,
     include_proper_names_as_lemmas: bool = False,
+    story_words: list[StoryWord] | None = None,
 ) -> list[int]:
     """Create Lemma entries for unknown words in a story.
 
     For words with lemma_id=None (excluding function words), uses CAMeL morphology
     + LLM batch translation to create proper Lemma (+ Root) entries.
     Does NOT create ULK — words become Learn mode candidates via story_bonus.
+    ``story_words`` limits the pass (and duplicate-surface propagation) to one
+    chunk of a streamed import instead of loading ``story.words``.
 
     Structured to avoid holding the DB write lock during LLM calls:
     Phase 1-2: Read DB + CAMeL analysis + all LLM calls (no DB writes)
@@ -371,7 +449,8 @@ def _import_unknown_words(
     ] = []
     resolved_lemma_ids: set[int] = set()
     unresolved_alias_updates: list[StoryWord] = []
-    for sw in story.words:
+    words = story.words if story_words is None else story_words
+    for sw in words:
         if target_positions is not None and sw.position not in target_positions:
             continue
         alias = resolve_exact_running_text_alias(
@@ -456,7 +535,7 @@ def _import_unknown_words(
 
     # CAMeL morphological analysis — resolve to existing lemmas where possible
     word_analyses: list[dict] = []
-    ordered_story_words = sorted(story.words, key=lambda item: item.position)
+    ordered_story_words = sorted(words, key=lambda item: item.position)
     story_word_index = {
         item.position: index for index, item in enumerate(ordered_story_words)
     }
@@ -541,91 +620,50 @@ def _import_unknown_words(
     # Step 2a: LLM batch translation — use lex (base form) not surface form
     gloss_map: dict[str, dict] = {}
     translation_batch_size = 12
-    for batch_start in range(0, len(word_analyses), translation_batch_size):
-        batch = word_analyses[batch_start:batch_start + translation_batch_size]
-        try:
-            # Build word list from CAMeL lex forms for better dictionary glosses.
-            words_for_llm = []
-            for index, analysis in enumerate(batch, start=1):
-                words_for_llm.append(
-                    f"{index}. surface={analysis['surface']} | "
-                    f"candidate_lemma={analysis['lex']} | "
-                    f"context={analysis['context']}"
-                )
-            words_list = "\n".join(words_for_llm)
-
-            result = generate_completion(
-                prompt=f"""Given these Arabic words (base/dictionary forms), provide dictionary-form English glosses, part of speech, and whether the word is a proper name.
-
-Items: {words_list}
-
-IMPORTANT: Give dictionary-form glosses, NOT conjugated translations:
-- Verbs: use infinitive ("to write", "to wake up"), NOT ("she wrote", "he woke up")
-- Nouns: use bare singular ("book", "school"), NOT ("his books", "the schools")
-- Adjectives: use base form ("big", "beautiful"), NOT ("bigger", "the big one")
-
-Return exactly one result for every numbered item, in the same order. Use the
-context to repair an inflected, cliticized, fused, or imperfect candidate.
-Never refuse the whole batch because one item is uncertain: give the safest
-contextual dictionary lemma and gloss for that item.
-
-Respond with JSON: {{"words": [{{"index": 1, "arabic": "the corrected base-form lemma", "english": "dictionary gloss", "pos": "noun/verb/adj/adv/prep/conj", "name_type": null or "personal" or "place"}}]}}
-
-Set name_type to "personal" for personal names (people, characters), "place" for place names (cities, countries, landmarks), or null for regular vocabulary words.""",
-                system_prompt="You translate Arabic words to English. Give concise, dictionary-form glosses (1-3 words). For verbs use infinitive ('to X'). For proper names, provide the transliterated name. Respond with JSON only.",
-                json_mode=True,
-                model_override="openai",
-                task_type="story_word_import",
-            )
-
-            # Result may be a list or a dict with a list inside. Treat an
-            # explicit model error as a failed batch, never as an empty success.
-            if isinstance(result, list):
-                items = result
-            elif isinstance(result, dict):
-                if result.get("error"):
-                    raise ValueError(str(result["error"]))
-                items = next(
-                    (
-                        result[key]
-                        for key in ("words", "translations", "items", "results", "entries")
-                        if isinstance(result.get(key), list)
-                    ),
-                    [],
-                )
-            else:
-                items = []
-            if not items:
-                raise ValueError("word translation returned no entries")
-
-            for idx, item in enumerate(items):
-                if not isinstance(item, dict):
-                    continue
-                arabic = item.get("arabic") or item.get("word") or item.get("lemma") or ""
-                bare = _story_word_bare(arabic)
-                gloss_data = {
-                    "english": item.get("english") or item.get("gloss_en") or item.get("gloss") or "",
-                    "pos": item.get("pos") or item.get("part_of_speech"),
-                    "name_type": item.get("name_type"),
-                }
-                if bare:
-                    gloss_map[bare] = gloss_data
-                # Positional fallback is batch-relative and makes harmless
-                # spelling/diacritic variations in model output non-fatal.
-                if idx < len(batch):
-                    analysis = batch[idx]
-                    surface_bare = _story_word_bare(
-                        analysis["story_word"].surface_form
-                    )
-                    gloss_map.setdefault(surface_bare, gloss_data)
-                    gloss_map.setdefault(analysis["lex_norm"], gloss_data)
-        except (AllProvidersFailed, Exception) as e:
+    translation_batches = [
+        word_analyses[batch_start:batch_start + translation_batch_size]
+        for batch_start in range(0, len(word_analyses), translation_batch_size)
+    ]
+    # Batches run concurrently; results are applied in batch order so
+    # gloss_map's first-wins fallbacks stay deterministic.
+    batch_results = map_batches(
+        _gloss_story_word_batch,
+        translation_batches,
+        retries=1,
+        label=f"story {story.id} word glosses",
+    )
+    for batch_number, (batch, items) in enumerate(
+        zip(translation_batches, batch_results), start=1
+    ):
+        if isinstance(items, BaseException):
             logger.warning(
                 "LLM translation batch %d failed for story %d: %s",
-                batch_start // translation_batch_size + 1,
+                batch_number,
                 story.id,
-                e,
+                items,
             )
+            continue
+        for idx, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            arabic = item.get("arabic") or item.get("word") or item.get("lemma") or ""
+            bare = _story_word_bare(arabic)
+            gloss_data = {
+                "english": item.get("english") or item.get("gloss_en") or item.get("gloss") or "",
+                "pos": item.get("pos") or item.get("part_of_speech"),
+                "name_type": item.get("name_type"),
+            }
+            if bare:
+                gloss_map[bare] = gloss_data
+            # Positional fallback is batch-relative and makes harmless
+            # spelling/diacritic variations in model output non-fatal.
+            if idx < len(batch):
+                analysis = batch[idx]
+                surface_bare = _story_word_bare(
+                    analysis["story_word"].surface_form
+                )
+                gloss_map.setdefault(surface_bare, gloss_data)
+                gloss_map.setdefault(analysis["lex_norm"], gloss_data)
 
     # Step 2b: Quality gate — filter out junk + classify (names, sounds)
     _category_by_bare: dict[str, str] = {}
@@ -711,7 +749,7 @@ Set name_type to "personal" for personal names (people, characters), "place" for
             sw.name_type = name_type
             sw.gloss_en = english
             # Also tag any duplicate surface forms in the story
-            for other_sw in story.words:
+            for other_sw in words:
                 if other_sw.id == sw.id:
                     continue
                 other_bare = _story_word_bare(other_sw.surface_form)
@@ -775,7 +813,7 @@ Set name_type to "personal" for personal names (people, characters), "place" for
             lemma_lookup[surface_bare] = new_lemma.lemma_id
 
         # Update all StoryWords with matching bare form
-        for other_sw in story.words:
+        for other_sw in words:
             if other_sw.lemma_id is not None:
                 continue
             other_bare = _story_word_bare(other_sw.surface_form)
@@ -799,19 +837,25 @@ Set name_type to "personal" for personal names (people, characters), "place" for
 
     # Verify new lemma-StoryWord mappings via LLM
     if new_lemma_ids:
-        _verify_new_story_mappings(db, story, set(new_lemma_ids))
+        _verify_new_story_mappings(
+            db, story, set(new_lemma_ids), story_words=story_words,
+        )
 
     return new_lemma_ids
 
 
 def _verify_new_story_mappings(
-    db: Session, story: Story, new_lemma_ids: set[int]
+    db: Session,
+    story: Story,
+    new_lemma_ids: set[int],
+    story_words: list[StoryWord] | None = None,
 ) -> None:
     """Verify StoryWord mappings for newly created lemmas using LLM.
 
     Groups story words into chunks by position, builds a sentence-like context,
     and calls verify_and_correct_mappings_llm. Wrong mappings are nulled out
-    (never auto-create lemmas from corrections).
+    (never auto-create lemmas from corrections). ``story_words`` restricts the
+    pass to that position range of the story.
     """
     from app.services.sentence_validator import (
         apply_corrections,
@@ -819,22 +863,43 @@ def _verify_new_story_mappings(
         TokenMapping,
     )
 
+    position_range = None
+    if story_words is not None:
+        if not story_words:
+            return
+        positions = [sw.position for sw in story_words]
+        position_range = (min(positions), max(positions))
+
     # Callers (_import_unknown_words) flush new lemma/root writes before
     # calling us, which leaves the SQLite write lock held. Release it now so
     # the verify LLM calls below don't stall other writers.
     db.commit()
 
+    if position_range is None:
+        all_words = sorted(story.words, key=lambda w: w.position)
+    else:
+        # One query refreshes the (now expired) chunk rows together.
+        all_words = (
+            db.query(StoryWord)
+            .filter(
+                StoryWord.story_id == story.id,
+                StoryWord.position.between(*position_range),
+            )
+            .order_by(StoryWord.position)
+            .all()
+        )
+
     # Collect story words that reference new lemmas
     words_to_verify = [
-        sw for sw in story.words
+        sw for sw in all_words
         if sw.lemma_id and sw.lemma_id in new_lemma_ids
     ]
     if not words_to_verify:
         return
 
     # Build context: get surrounding text for each new-lemma word
-    all_words = sorted(story.words, key=lambda w: w.position)
     text_tokens = [sw.surface_form for sw in all_words]
+    base_position = all_words[0].position
     full_text = " ".join(text_tokens)
 
     # Build mappings for verification (only new-lemma words)
@@ -865,8 +930,8 @@ def _verify_new_story_mappings(
         # Use story text as context (truncated around the chunk)
         min_pos = min(sw.position for sw in chunk)
         max_pos = max(sw.position for sw in chunk)
-        context_start = max(0, min_pos - 5)
-        context_end = min(len(text_tokens), max_pos + 6)
+        context_start = max(0, min_pos - base_position - 5)
+        context_end = min(len(text_tokens), max_pos - base_position + 6)
         context_text = " ".join(text_tokens[context_start:context_end])
 
         corrections = verify_and_correct_mappings_llm(
@@ -5,12 +5,12 @@ tracks progress, and advances when a topic is exhausted.
 """
 
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app import clock
 from app.models import Lemma, LearnerSettings, UserLemmaKnowledge
 
 logger = logging.getLogger(__name__)
@@ -131,7 +131,7 @@ def ensure_active_topic(db: Session) -> Optional[str]:
 
 def _advance_topic(db: Session, settings: LearnerSettings) -> None:
     """Switch to the next best topic, archiving the old one."""
-    now = datetime.now(timezone.utc)
+    now = clock.now()
 
     if settings.active_topic:
         history = settings.topic_history_json or []
@@ -168,7 +168,7 @@ def set_topic(db: Session, domain: str) -> LearnerSettings:
         _advance_topic(db, settings)
 
     settings.active_topic = domain
-    settings.topic_started_at = datetime.now(timezone.utc)
+    settings.topic_started_at = clock.now()
     settings.words_introduced_in_topic = 0
     db.flush()
     return settings
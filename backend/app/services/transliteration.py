@@ -8,6 +8,8 @@ Reference: ALA-LC Romanization Tables for Arabic
 Cross-checked against MTG/ArabicTransliterator and CAMeL-Lab/Arabic_ALA-LC_Romanization.
 """
 
+from functools import lru_cache
+
 # Unicode constants
 FATHA = "\u064E"       # َ
 DAMMA = "\u064F"       # ُ
@@ -97,26 +99,23 @@ def transliterate_arabic(text: str, strip_tanwin: bool = True) -> str:
         return ""
 
     text = text.replace(TATWEEL, "")
-    result: list[str] = []
-    words = text.split()
-
-    for wi, word in enumerate(words):
-        if wi > 0:
-            result.append(" ")
-
-        # Handle al- prefix: ال or اَل or اْل etc.
-        al_prefix = ""
-        core = word
-        if _detect_al_prefix(word):
-            al_prefix = "al-"
-            core = _strip_al_prefix(word)
-            # Strip sun-letter assimilation shadda from first consonant
-            core = _strip_leading_shadda(core)
-
-        result.append(al_prefix)
-        result.append(_transliterate_word(core, strip_tanwin))
-
-    return "".join(result)
+    return " ".join(_transliterate_token(word, strip_tanwin) for word in text.split())
+
+
+@lru_cache(maxsize=65536)
+def _transliterate_token(word: str, strip_tanwin: bool) -> str:
+    """One whitespace-separated word. Words transliterate independently, so
+    imports that repeat the same vocabulary thousands of times hit the cache."""
+    # Handle al- prefix: ال or اَل or اْل etc.
+    al_prefix = ""
+    core = word
+    if _detect_al_prefix(word):
+        al_prefix = "al-"
+        core = _strip_al_prefix(word)
+        # Strip sun-letter assimilation shadda from first consonant
+        core = _strip_leading_shadda(core)
+
+    return al_prefix + _transliterate_word(core, strip_tanwin)
 
 
 def _detect_al_prefix(word: str) -> bool:
@@ -4,8 +4,6 @@ import os
 from pathlib import Path
 from typing import Optional
 
-import httpx
-
 ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
 DEFAULT_MODEL = "eleven_multilingual_v2"
 DEFAULT_VOICE_ID = "G1HOkzin3NMwRHSq60UI"  # Chaouki — MSA male, clear neutral accent
@@ -101,6 +99,8 @@ def _save_index(index: dict) -> None:
 
 async def list_voices(api_key: Optional[str] = None) -> list[dict]:
     key = api_key or _get_api_key()
+    import httpx
+
     async with httpx.AsyncClient() as client:
         resp = await client.get(
             f"{ELEVENLABS_BASE_URL}/voices",
@@ -157,6 +157,8 @@ async def generate_audio(
     if slow_mode:
         text = _add_learner_pauses(text)
 
+    import httpx
+
     async with httpx.AsyncClient() as client:
         resp = await client.post(
             f"{ELEVENLABS_BASE_URL}/text-to-speech/{voice_id}",
@@ -211,3 +213,14 @@ def update_index(sentence_id: int | str, filename: str) -> None:
 def get_audio_total_size() -> int:
     _ensure_audio_dir()
     return sum(f.stat().st_size for f in AUDIO_DIR.iterdir() if f.suffix == ".mp3")
+
+
+def __getattr__(name: str):
+    # httpx is imported inside the request functions so importing this module
+    # (every API start) doesn't pay for it; keep `app.services.tts.httpx`
+    # resolvable for callers and patch targets.
+    if name == "httpx":
+        import httpx
+
+        return httpx
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
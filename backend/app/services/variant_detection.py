@@ -7,6 +7,10 @@ Two detection modes:
 1. Rule-based (CAMeL + gloss overlap) — fast but 34% true positive rate
 2. LLM-based — uses Gemini Flash to confirm/reject ambiguous candidates
 
+Either can run as a change-driven sweep (detect_changed_variants) that only
+evaluates pairs involving new or edited lemmas, using the cached analyses and
+the lex -> lemma index instead of re-analysing the whole vocabulary.
+
 Used by:
 - Import scripts (post-import variant detection)
 - cleanup_lemma_variants.py (batch cleanup with optional merge)
@@ -16,15 +20,21 @@ Used by:
 import logging
 from typing import Any
 
+from sqlalchemy import Text, cast, or_
 from sqlalchemy.orm import Session
 
+from app import clock
 from app.models import Lemma
-from app.services.morphology import find_best_db_match, CAMEL_AVAILABLE
+from app.services.morphology import CAMEL_AVAILABLE
 from app.services.sentence_validator import normalize_alef
 
 logger = logging.getLogger(__name__)
 
 
+def _now():
+    return clock.now()
+
+
 _NEVER_MERGE = {
     ("هذه", "هذا"),     # distinct demonstratives, both A1 words
     ("جدا", "جد"),      # "very" vs "grandfather"
@@ -74,116 +84,273 @@ def _has_enclitic(enc0: str) -> bool:
     return bool(enc0) and enc0 not in ("0", "na")
 
 
-def detect_variants(
-    db: Session,
-    lemma_ids: list[int] | None = None,
-    verbose: bool = False,
-) -> list[tuple[int, int, str, dict]]:
-    """Detect morphological variants using CAMeL Tools + DB-aware disambiguation.
+# ---------------------------------------------------------------------------
+# Variant-candidate index
+# ---------------------------------------------------------------------------
+#
+# A full sweep used to load every lemma and re-run CAMeL on each one, so every
+# import paid for the whole vocabulary. Analyses are now cached on the lemma
+# (variant_analyses_json) and mirrored into variant_lex_index; bare-form
+# lookups hit the lemma_ar_bare index. The Lemma validators clear the cache
+# when the Arabic changes and clear variants_checked_at whenever an input to
+# the decision changes, so detect_changed_variants() only looks at pairs
+# touching new or edited lemmas.
 
-    Iterates all CAMeL analyses for each word and picks the one whose lex
-    matches a lemma already in the database. Requires gloss overlap or
-    pronominal enclitic to confirm.
+_CHUNK = 500
 
-    Args:
-        db: Database session
-        lemma_ids: If provided, only check these lemmas (for import-time use).
-                   Otherwise checks all unlinked lemmas.
-        verbose: Print per-word analysis details.
 
-    Returns:
-        List of (variant_id, canonical_id, vtype, details) tuples.
-    """
-    if not CAMEL_AVAILABLE:
+def _chunks(items: list, size: int = _CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _analyse_lemma(lemma: Lemma) -> list[list[str]]:
+    """CAMeL analyses reduced to distinct lexes, in analyzer order:
+    [[lex_norm, lex_bare, enc0, lex], ...]. Only the first analysis per
+    normalized lex can ever win a match, so later duplicates are dropped."""
+    from app.services.morphology import analyze_word_camel
+    from app.services.sentence_validator import strip_diacritics
+
+    ar = lemma.lemma_ar or lemma.lemma_ar_bare
+    if not ar:
         return []
+    analyses = analyze_word_camel(ar) or analyze_word_camel(strip_diacritics(ar))
+    out: list[list[str]] = []
+    seen: set[str] = set()
+    for a in analyses:
+        lex = a.get("lex", "") or ""
+        lex_bare = strip_diacritics(lex)
+        lex_norm = normalize_alef(lex_bare)
+        if lex_norm in seen:
+            continue
+        seen.add(lex_norm)
+        out.append([lex_norm, lex_bare, a.get("enc0", "") or "", lex])
+    return out
 
-    all_lemmas = db.query(Lemma).filter(Lemma.canonical_lemma_id.is_(None)).all()
-    bare_to_lemma: dict[str, list] = {}
-    for l in all_lemmas:
-        bare_norm = normalize_alef(l.lemma_ar_bare or "")
-        bare_to_lemma.setdefault(bare_norm, []).append(l)
 
-    known_bare_forms = set(bare_to_lemma.keys())
+def refresh_variant_index(db: Session, lemmas: list[Lemma] | None = None) -> int:
+    """Analyse lemmas whose cached analyses are missing and rewrite their
+    variant_lex_index rows. Defaults to every unanalysed lemma. Flushes; the
+    caller commits. Returns the number of lemmas analysed.
 
+    Only the change-driven sweep writes the index; detect_variants() and
+    detect_variants_llm() analyse uncached lemmas in memory and stay
+    read-only."""
+    from app.models import VariantLexIndex
+
+    if not CAMEL_AVAILABLE:
+        return 0
+    if lemmas is None:
+        lemmas = db.query(Lemma).filter(or_(
+            Lemma.variant_analyses_json.is_(None),
+            # rows reset before the column stored None as SQL NULL
+            cast(Lemma.variant_analyses_json, Text) == "null",
+        )).all()
+    stale = [l for l in lemmas if l.variant_analyses_json is None]
+    for chunk in _chunks(stale):
+        ids = [l.lemma_id for l in chunk]
+        db.query(VariantLexIndex).filter(
+            VariantLexIndex.lemma_id.in_(ids)
+        ).delete(synchronize_session=False)
+        for lemma in chunk:
+            analyses = _analyse_lemma(lemma)
+            lemma.variant_analyses_json = analyses
+            db.add_all(
+                VariantLexIndex(lemma_id=lemma.lemma_id, lex_norm=a[0]) for a in analyses
+            )
+        db.flush()
+    return len(stale)
+
+
+def _load_lemmas_any(db: Session, lemma_ids) -> list[Lemma]:
+    out: list[Lemma] = []
+    for chunk in _chunks(sorted(set(lemma_ids))):
+        out.extend(db.query(Lemma).filter(Lemma.lemma_id.in_(chunk)).all())
+    return sorted(out, key=lambda l: l.lemma_id)
+
+
+def _load_lemmas(db: Session, lemma_ids) -> list[Lemma]:
+    """Non-variant lemmas with the given ids, in id order."""
+    return [l for l in _load_lemmas_any(db, lemma_ids) if l.canonical_lemma_id is None]
+
+
+def _bare_index(db: Session, bare_forms) -> dict[str, list[Lemma]]:
+    """Normalized bare form -> non-variant lemmas, for just these forms."""
+    index: dict[str, list[Lemma]] = {}
+    for chunk in _chunks(sorted({b for b in bare_forms if b})):
+        rows = (
+            db.query(Lemma)
+            .filter(Lemma.lemma_ar_bare.in_(chunk), Lemma.canonical_lemma_id.is_(None))
+            .order_by(Lemma.lemma_id)
+            .all()
+        )
+        for l in rows:
+            index.setdefault(normalize_alef(l.lemma_ar_bare or ""), []).append(l)
+    return index
+
+
+def _check_lemmas(db: Session, lemma_ids: list[int] | None) -> list[Lemma]:
     if lemma_ids is not None:
-        id_set = set(lemma_ids)
-        check_lemmas = [l for l in all_lemmas if l.lemma_id in id_set]
-    else:
-        check_lemmas = all_lemmas
+        return _load_lemmas(db, lemma_ids)
+    return (
+        db.query(Lemma)
+        .filter(Lemma.canonical_lemma_id.is_(None))
+        .order_by(Lemma.lemma_id)
+        .all()
+    )
 
-    variants = []
-    seen_variant_ids: set[int] = set()
 
-    for lemma in check_lemmas:
-        ar = lemma.lemma_ar or lemma.lemma_ar_bare
-        if not ar:
-            continue
+def _analyses(lemma: Lemma) -> list[list[str]]:
+    """Cached analyses, or computed in memory without storing them."""
+    if lemma.variant_analyses_json is not None:
+        return lemma.variant_analyses_json
+    return _analyse_lemma(lemma)
 
-        lemma_bare = lemma.lemma_ar_bare or ""
 
-        match = find_best_db_match(ar, known_bare_forms, self_bare=lemma_bare)
-        if not match:
-            if verbose:
-                print(f"  SKIP {lemma_bare} ({lemma.gloss_en}): no DB-matching analysis")
+def _match_variant(
+    lemma: Lemma,
+    analyses: list[list[str]],
+    bare_to_lemma: dict[str, list[Lemma]],
+    verbose: bool = False,
+) -> tuple[int, int, str, dict] | None:
+    """Pick the base for one lemma from its cached analyses (first analysis
+    whose lex is a known bare form other than itself), then apply the gloss,
+    enclitic, root and never-merge rules."""
+    lemma_bare = lemma.lemma_ar_bare or ""
+    self_norm = normalize_alef(lemma_bare) if lemma_bare else None
+    match = None
+    for lex_norm, lex_bare, enc0, lex in analyses:
+        if self_norm and lex_norm == self_norm:
             continue
+        if lex_norm in bare_to_lemma:
+            match = (lex_norm, lex_bare, enc0, lex)
+            break
+    if not match:
+        if verbose:
+            print(f"  SKIP {lemma_bare} ({lemma.gloss_en}): no DB-matching analysis")
+        return None
 
-        lex_bare = match["lex_bare"]
-        enc0 = match["enc0"]
-        analysis = match["analysis"]
-
-        candidates = bare_to_lemma.get(normalize_alef(lex_bare), [])
-        base = None
+    lex_norm, lex_bare, enc0, lex = match
+    candidates = bare_to_lemma.get(lex_norm, [])
+    base = None
+    for c in candidates:
+        if c.lemma_id == lemma.lemma_id:
+            continue
+        if _gloss_overlap(lemma.gloss_en, c.gloss_en):
+            base = c
+            break
+
+    if not base and _has_enclitic(enc0):
+        # Enclitic-bearing forms (possessives like كتابه) can be variants
+        # even without gloss overlap, but only if the candidate's bare form
+        # is a proper substring (the word minus the enclitic). This prevents
+        # false positives like صيادية (dish) → صياد (hunter) where CAMeL
+        # reports an enclitic-like suffix but the meanings are unrelated.
         for c in candidates:
             if c.lemma_id == lemma.lemma_id:
                 continue
-            if _gloss_overlap(lemma.gloss_en, c.gloss_en):
+            c_bare = normalize_alef(c.lemma_ar_bare or "")
+            l_bare = normalize_alef(lemma_bare)
+            if c_bare and l_bare.startswith(c_bare) and len(l_bare) > len(c_bare):
                 base = c
                 break
 
-        if not base and _has_enclitic(enc0):
-            # Enclitic-bearing forms (possessives like كتابه) can be variants
-            # even without gloss overlap, but only if the candidate's bare form
-            # is a proper substring (the word minus the enclitic). This prevents
-            # false positives like صيادية (dish) → صياد (hunter) where CAMeL
-            # reports an enclitic-like suffix but the meanings are unrelated.
-            for c in candidates:
-                if c.lemma_id == lemma.lemma_id:
-                    continue
-                c_bare = normalize_alef(c.lemma_ar_bare or "")
-                l_bare = normalize_alef(lemma_bare)
-                if c_bare and l_bare.startswith(c_bare) and len(l_bare) > len(c_bare):
-                    base = c
-                    break
-
-        if not base:
-            if verbose:
-                print(f"  SKIP {lemma_bare} ({lemma.gloss_en}): lex={lex_bare} but no suitable base")
-            continue
+    if not base:
+        if verbose:
+            print(f"  SKIP {lemma_bare} ({lemma.gloss_en}): lex={lex_bare} but no suitable base")
+        return None
 
-        # Reject if both lemmas have roots and they differ — prevents cross-root false variants
-        if lemma.root_id and base.root_id and lemma.root_id != base.root_id:
-            if verbose:
-                print(f"  SKIP {lemma_bare} ({lemma.gloss_en}) → {base.lemma_ar_bare} ({base.gloss_en}): different roots")
-            continue
+    # Reject if both lemmas have roots and they differ — prevents cross-root false variants
+    if lemma.root_id and base.root_id and lemma.root_id != base.root_id:
+        if verbose:
+            print(f"  SKIP {lemma_bare} ({lemma.gloss_en}) → {base.lemma_ar_bare} ({base.gloss_en}): different roots")
+        return None
 
-        pair = (lemma_bare, base.lemma_ar_bare)
-        if pair in _NEVER_MERGE or (pair[1], pair[0]) in _NEVER_MERGE:
-            if verbose:
-                print(f"  SKIP {lemma_bare} → {base.lemma_ar_bare}: never-merge")
-            continue
+    pair = (lemma_bare, base.lemma_ar_bare)
+    if pair in _NEVER_MERGE or (pair[1], pair[0]) in _NEVER_MERGE:
+        if verbose:
+            print(f"  SKIP {lemma_bare} → {base.lemma_ar_bare}: never-merge")
+        return None
 
-        if lemma.lemma_id in seen_variant_ids:
-            continue
-        seen_variant_ids.add(lemma.lemma_id)
+    vtype = "possessive" if _has_enclitic(enc0) else "inflected"
+    if verbose:
+        print(f"  MATCH {lemma_bare} ({lemma.gloss_en}) → {base.lemma_ar_bare} ({base.gloss_en}) [{vtype}]")
+    return (lemma.lemma_id, base.lemma_id, vtype, {"enc0": enc0, "lex": lex})
+
+
+def _detect_variants_in(
+    db: Session, check_lemmas: list[Lemma], verbose: bool = False
+) -> list[tuple[int, int, str, dict]]:
+    analyses = {l.lemma_id: _analyses(l) for l in check_lemmas}
+    bare_to_lemma = _bare_index(db, {a[0] for al in analyses.values() for a in al})
+    variants = []
+    for lemma in check_lemmas:
+        found = _match_variant(
+            lemma, analyses[lemma.lemma_id], bare_to_lemma, verbose=verbose
+        )
+        if found:
+            variants.append(found)
+    return variants
 
-        vtype = "possessive" if _has_enclitic(enc0) else "inflected"
-        if verbose:
-            print(f"  MATCH {lemma_bare} ({lemma.gloss_en}) → {base.lemma_ar_bare} ({base.gloss_en}) [{vtype}]")
-        variants.append((lemma.lemma_id, base.lemma_id, vtype, {"enc0": enc0, "lex": analysis.get("lex", "")}))
 
+def _detect_definite_in(
+    db: Session, check_lemmas: list[Lemma], already: set[int]
+) -> list[tuple[int, int, str, dict]]:
+    bare_to_lemma = _bare_index(
+        db,
+        {
+            normalize_alef(l.lemma_ar_bare[2:])
+            for l in check_lemmas
+            if (l.lemma_ar_bare or "").startswith("ال")
+        },
+    )
+    variants = []
+    for lemma in check_lemmas:
+        if lemma.lemma_id in already:
+            continue
+        bare = lemma.lemma_ar_bare or ""
+        if not bare.startswith("ال"):
+            continue
+        without_al = bare[2:]
+        for base in bare_to_lemma.get(normalize_alef(without_al), []):
+            if base.lemma_id == lemma.lemma_id:
+                continue
+            if base.lemma_id in already:
+                continue
+            pair = (bare, base.lemma_ar_bare or "")
+            if pair in _NEVER_MERGE or (pair[1], pair[0]) in _NEVER_MERGE:
+                continue
+            variants.append((lemma.lemma_id, base.lemma_id, "definite", {"stripped": without_al}))
+            break
     return variants
 
 
+def detect_variants(
+    db: Session,
+    lemma_ids: list[int] | None = None,
+    verbose: bool = False,
+) -> list[tuple[int, int, str, dict]]:
+    """Detect morphological variants using CAMeL Tools + DB-aware disambiguation.
+
+    Walks the CAMeL analyses of each word (cached on the lemma, else computed
+    in memory) and picks the first whose lex matches a lemma already in the
+    database. Requires gloss overlap or pronominal enclitic to confirm.
+    Read-only.
+
+    Args:
+        db: Database session
+        lemma_ids: If provided, only check these lemmas (for import-time use).
+                   Otherwise checks all unlinked lemmas.
+        verbose: Print per-word analysis details.
+
+    Returns:
+        List of (variant_id, canonical_id, vtype, details) tuples.
+    """
+    if not CAMEL_AVAILABLE:
+        return []
+    return _detect_variants_in(db, _check_lemmas(db, lemma_ids), verbose=verbose)
+
+
 def detect_definite_variants(
     db: Session,
     lemma_ids: list[int] | None = None,
@@ -199,41 +366,81 @@ def detect_definite_variants(
     Returns:
         List of (variant_id, canonical_id, "definite", details) tuples.
     """
-    all_lemmas = db.query(Lemma).filter(Lemma.canonical_lemma_id.is_(None)).all()
-    bare_to_lemma: dict[str, list] = {}
-    for l in all_lemmas:
-        bare_norm = normalize_alef(l.lemma_ar_bare or "")
-        bare_to_lemma.setdefault(bare_norm, []).append(l)
+    return _detect_definite_in(
+        db, _check_lemmas(db, lemma_ids), already_variant_ids or set()
+    )
 
-    if lemma_ids is not None:
-        id_set = set(lemma_ids)
-        check_lemmas = [l for l in all_lemmas if l.lemma_id in id_set]
-    else:
-        check_lemmas = all_lemmas
 
-    already = already_variant_ids or set()
-    variants = []
+def detect_changed_variants(
+    db: Session,
+    use_llm: bool = False,
+    model_override: str | None = None,
+    verbose: bool = False,
+) -> list[tuple[int, int, str, dict]]:
+    """Change-driven sweep: only pairs that involve a new or edited lemma.
 
-    for lemma in check_lemmas:
-        if lemma.lemma_id in already:
-            continue
-        bare = lemma.lemma_ar_bare or ""
-        if not bare.startswith("ال"):
-            continue
-        without_al = bare[2:]
-        without_al_norm = normalize_alef(without_al)
-        if without_al_norm in bare_to_lemma:
-            for base in bare_to_lemma[without_al_norm]:
-                if base.lemma_id == lemma.lemma_id:
-                    continue
-                if base.lemma_id in already:
-                    continue
-                pair = (bare, base.lemma_ar_bare or "")
-                if pair in _NEVER_MERGE or (pair[1], pair[0]) in _NEVER_MERGE:
-                    continue
-                variants.append((lemma.lemma_id, base.lemma_id, "definite", {"stripped": without_al}))
-                break
+    Dirty lemmas (variants_checked_at NULL) are checked as variants, and so
+    are existing lemmas that could now be variants *of* them — those whose
+    indexed lex equals a dirty bare form, or whose bare form is ال + a dirty
+    bare form. CAMeL candidates go through the LLM when ``use_llm``. The
+    index refresh is committed before any candidate is evaluated, so no LLM
+    call runs inside its write transaction. Dirty lemmas are stamped as
+    checked; the caller marks and commits.
 
+    Returns CAMeL (or LLM-confirmed) variants followed by definite variants.
+    """
+    from app.models import VariantLexIndex
+
+    dirty = (
+        db.query(Lemma)
+        .filter(Lemma.canonical_lemma_id.is_(None), Lemma.variants_checked_at.is_(None))
+        .order_by(Lemma.lemma_id)
+        .all()
+    )
+    if not dirty:
+        return []
+
+    dirty_ids = {l.lemma_id for l in dirty}
+    dirty_bares = sorted({normalize_alef(l.lemma_ar_bare or "") for l in dirty} - {""})
+
+    variants: list[tuple[int, int, str, dict]] = []
+    if CAMEL_AVAILABLE:
+        refresh_variant_index(db)
+        db.commit()
+        affected: set[int] = set()
+        for chunk in _chunks(dirty_bares):
+            affected.update(
+                row[0]
+                for row in db.query(VariantLexIndex.lemma_id)
+                .filter(VariantLexIndex.lex_norm.in_(chunk))
+                .distinct()
+            )
+        check = _load_lemmas(db, dirty_ids | affected)
+        if verbose:
+            print(f"Variant sweep: {len(dirty)} changed lemmas, {len(check)} to check")
+        if use_llm:
+            variants = _confirm_variants_llm(
+                db, _detect_variants_in(db, check),
+                model_override=model_override, verbose=verbose,
+            )
+        else:
+            variants = _detect_variants_in(db, check, verbose=verbose)
+
+    definite_ids = set(dirty_ids)
+    for chunk in _chunks(["ال" + b for b in dirty_bares]):
+        definite_ids.update(
+            row[0]
+            for row in db.query(Lemma.lemma_id).filter(
+                Lemma.lemma_ar_bare.in_(chunk), Lemma.canonical_lemma_id.is_(None)
+            )
+        )
+    already = {v[0] for v in variants}
+    variants += _detect_definite_in(db, _load_lemmas(db, definite_ids), already)
+
+    now = _now()
+    for lemma in dirty:
+        lemma.variants_checked_at = now
+    db.flush()
     return variants
 
 
@@ -378,6 +585,7 @@ def evaluate_variants_llm(
     candidates: list[dict[str, Any]],
     model_override: str | None = None,
     db: Session | None = None,
+    cache: dict[tuple[str, str], dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """Use LLM to confirm or reject variant candidates, with DB cache.
 
@@ -386,6 +594,8 @@ def evaluate_variants_llm(
             id, word_ar, word_gloss, word_pos, base_ar, base_gloss, base_pos
         model_override: LLM provider to use (default: primary/Gemini)
         db: If provided, check/save cache in variant_decisions table
+        cache: Decisions already loaded with `_load_cache` (batch callers load
+            once); new decisions are added to it. Loaded from ``db`` if None.
 
     Returns:
         List of result dicts with keys: id, is_variant (bool), reason (str)
@@ -396,9 +606,8 @@ def evaluate_variants_llm(
         return []
 
     # Check cache for already-decided pairs
-    cache: dict[tuple[str, str], dict[str, Any]] = {}
-    if db is not None:
-        cache = _load_cache(db)
+    if cache is None:
+        cache = _load_cache(db) if db is not None else {}
 
     cached_results: list[dict[str, Any]] = []
     uncached: list[dict[str, Any]] = []
@@ -463,6 +672,11 @@ def evaluate_variants_llm(
 
     if db is not None and to_cache:
         _save_decisions(db, to_cache)
+    for d in to_cache:
+        cache[(normalize_alef(d["word_bare"]), normalize_alef(d["base_bare"]))] = {
+            "is_variant": d["is_variant"],
+            "reason": d["reason"],
+        }
 
     return cached_results + llm_parsed
 
@@ -493,7 +707,19 @@ def detect_variants_llm(
     """
     # Phase 1: get CAMeL candidates (reuse existing logic)
     camel_candidates = detect_variants(db, lemma_ids=lemma_ids, verbose=False)
+    return _confirm_variants_llm(
+        db, camel_candidates,
+        batch_size=batch_size, model_override=model_override, verbose=verbose,
+    )
 
+
+def _confirm_variants_llm(
+    db: Session,
+    camel_candidates: list[tuple[int, int, str, dict]],
+    batch_size: int = 15,
+    model_override: str | None = None,
+    verbose: bool = False,
+) -> list[tuple[int, int, str, dict]]:
     if not camel_candidates:
         if verbose:
             print("No CAMeL candidates found")
@@ -503,12 +729,18 @@ def detect_variants_llm(
         print(f"Phase 1: {len(camel_candidates)} CAMeL candidates")
 
     # Build LLM evaluation batches
+    lemmas = {
+        l.lemma_id: l
+        for l in _load_lemmas_any(
+            db, {c[0] for c in camel_candidates} | {c[1] for c in camel_candidates}
+        )
+    }
     id_to_candidate: dict[int, tuple] = {}
     llm_candidates: list[dict[str, Any]] = []
 
     for i, (var_id, canon_id, vtype, details) in enumerate(camel_candidates):
-        var = db.query(Lemma).filter(Lemma.lemma_id == var_id).first()
-        canon = db.query(Lemma).filter(Lemma.lemma_id == canon_id).first()
+        var = lemmas.get(var_id)
+        canon = lemmas.get(canon_id)
         if not var or not canon:
             continue
 
@@ -524,7 +756,8 @@ def detect_variants_llm(
         llm_candidates.append(cand)
         id_to_candidate[i] = (var_id, canon_id, vtype, details)
 
-    # Phase 2: LLM evaluation in batches
+    # Phase 2: LLM evaluation in batches, against a decision cache loaded once
+    cache = _load_cache(db)
     confirmed: list[tuple[int, int, str, dict]] = []
 
     for batch_start in range(0, len(llm_candidates), batch_size):
@@ -534,7 +767,7 @@ def detect_variants_llm(
                   f"({len(batch)} candidates)")
 
         results = evaluate_variants_llm(
-            batch, model_override=model_override, db=db,
+            batch, model_override=model_override, db=db, cache=cache,
         )
 
         result_by_id = {r["id"]: r for r in results}
@@ -20,6 +20,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case, or_
 
+from app import clock
 from app.models import (
     FrequencyCoreEntry,
     Root,
@@ -30,7 +31,7 @@ from app.models import (
     StoryWord,
     Story,
 )
-from app.services.grammar_service import grammar_pattern_score
+from app.services.grammar_service import get_grammar_state
 from app.services.transliteration import transliterate_arabic
 
 
@@ -103,7 +104,7 @@ def _get_recently_failed_roots(db: Session) -> set[int]:
     """Get root_ids that have a sibling which failed (rating=1) in the last 7 days."""
     from app.services.form_recovery_service import is_form_recovery_protected_log
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+    cutoff = clock.now() - timedelta(days=7)
     failed_logs = (
         db.query(ReviewLog)
         .filter(
@@ -338,7 +339,7 @@ def _days_since_introduced(db: Session, root_id: Optional[int]) -> float:
 
     if latest.tzinfo is None:
         latest = latest.replace(tzinfo=timezone.utc)
-    delta = datetime.now(timezone.utc) - latest
+    delta = clock.now() - latest
     return delta.total_seconds() / 86400
 
 
@@ -413,30 +414,6 @@ def _days_since_introduced_batch(
     return (now - latest).total_seconds() / 86400
 
 
-def _grammar_pattern_score_batch(
-    grammar_features: Optional[list[str]],
-    unlocked_set: set[str],
-    exposure_map: dict,
-) -> float:
-    """Batch version of grammar_pattern_score using pre-fetched data."""
-    if not grammar_features:
-        return 0.1
-    from app.services.grammar_service import compute_comfort
-    scores = []
-    for key in grammar_features:
-        if key not in unlocked_set:
-            continue
-        exp = exposure_map.get(key)
-        if exp is None:
-            scores.append(1.0)
-        else:
-            comfort = compute_comfort(exp.times_seen, exp.times_correct, exp.last_seen_at)
-            scores.append(max(1.0 - comfort, 0.1))
-    if not scores:
-        return 0.1
-    return sum(scores) / len(scores)
-
-
 def select_next_words(
     db: Session,
     count: int = DEFAULT_BATCH_SIZE,
@@ -610,34 +587,10 @@ def select_next_words(
         .all()
     ) if root_ids else {}
 
-    now = datetime.now(timezone.utc)
-
-    # Grammar: get unlocked features once and batch-fetch exposure records
-    from app.services.grammar_service import get_unlocked_features, compute_comfort
-    from app.models import GrammarFeature, UserGrammarExposure
-
-    unlocked_info = get_unlocked_features(db)
-    unlocked_set = set(unlocked_info["unlocked_features"])
-
-    all_grammar_keys: set[str] = set()
-    for c in candidates:
-        if c.grammar_features_json:
-            feats = c.grammar_features_json
-            if isinstance(feats, str):
-                feats = _json.loads(feats)
-            if isinstance(feats, list):
-                all_grammar_keys.update(feats)
-
-    exposure_map: dict[str, UserGrammarExposure] = {}
-    if all_grammar_keys:
-        rows = (
-            db.query(GrammarFeature.feature_key, UserGrammarExposure)
-            .join(UserGrammarExposure, UserGrammarExposure.feature_id == GrammarFeature.feature_id)
-            .filter(GrammarFeature.feature_key.in_(all_grammar_keys))
-            .all()
-        )
-        for key, exp in rows:
-            exposure_map[key] = exp
+    now = clock.now()
+
+    # Grammar: one immutable snapshot; per-word scoring is dict lookups.
+    grammar_state = get_grammar_state(db)
 
     scored = []
     for lemma in candidates:
@@ -656,9 +609,7 @@ def select_next_words(
         feats = lemma.grammar_features_json
         if isinstance(feats, str):
             feats = _json.loads(feats)
-        pattern_score = _grammar_pattern_score_batch(
-            feats, unlocked_set, exposure_map
-        )
+        pattern_score = grammar_state.pattern_score(feats)
 
         # --- Priority bonus: strict tier system ---
         # The curated frequency core is the default general-reading curriculum.
@@ -1004,7 +955,7 @@ def get_sentence_difficulty_params(db: Session, lemma_id: int) -> dict:
         introduced = knowledge.introduced_at.replace(tzinfo=timezone.utc)
     else:
         introduced = knowledge.introduced_at
-    hours_since = (datetime.now(timezone.utc) - introduced).total_seconds() / 3600
+    hours_since = (clock.now() - introduced).total_seconds() / 3600
 
     # Stage 1: First session (< 2 hours, seen < 3 times)
     if hours_since < 2 and times_seen < 3:
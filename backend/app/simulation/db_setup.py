@@ -1,13 +1,15 @@
-"""Database setup for simulation — copy production DB to temp file."""
+"""Database setup for simulation — copy production DB to temp file or memory."""
 
 import atexit
 import os
 import shutil
+import sqlite3
 import tempfile
 from pathlib import Path
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 def find_latest_backup(backup_dir: str | None = None) -> Path:
@@ -52,6 +54,51 @@ def create_simulation_db(source_path: str | Path) -> tuple:
     return engine, SessionFactory, tmp_path
 
 
+def load_into_memory(source: "str | Path | sqlite3.Connection") -> sqlite3.Connection:
+    """Copy a SQLite DB (file path or open connection) into a private
+    in-memory connection via the online backup API.
+
+    Reads the source page-by-page without holding a long read lock on a live
+    file, and a memory→memory backup of an already-loaded template is a
+    fast page copy, so sweep workers load the backup file once and clone it
+    per run.
+    """
+    if isinstance(source, sqlite3.Connection):
+        src, owned = source, False
+    else:
+        source = Path(source)
+        if not source.exists():
+            raise FileNotFoundError(f"Source DB not found: {source}")
+        src, owned = sqlite3.connect(f"file:{source.resolve()}?mode=ro", uri=True), True
+    mem = sqlite3.connect(":memory:", check_same_thread=False)
+    try:
+        src.backup(mem)
+    finally:
+        if owned:
+            src.close()
+    return mem
+
+
+def create_memory_simulation_db(source: "str | Path | sqlite3.Connection") -> tuple:
+    """In-memory variant of `create_simulation_db`; returns (engine, SessionFactory).
+
+    Nothing touches disk, so concurrent workers never contend on a file.
+    The engine wraps the single in-memory connection (StaticPool) — closing
+    it via ``engine.dispose()`` frees the copy.
+    """
+    mem = load_into_memory(source)
+    engine = create_engine(
+        "sqlite://",
+        creator=lambda: mem,
+        poolclass=StaticPool,
+        echo=False,
+    )
+    _apply_missing_columns(engine)
+    # Same rationale as create_simulation_db for expire_on_commit=False.
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    return engine, SessionFactory
+
+
 def _apply_missing_columns(engine):
     """Add any columns from the current model that are missing in the DB.
 
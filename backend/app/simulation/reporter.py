@@ -143,3 +143,42 @@ def write_csv_report(snapshots: list[DaySnapshot], path: str) -> None:
         for snap in snapshots:
             writer.writerow(asdict(snap))
     print(f"CSV written to {path}")
+
+
+def print_sweep_summary(summary: dict[str, dict[str, dict]], runs_per_profile: int = 0) -> None:
+    """Print mean and 95% CI per profile for each sweep metric."""
+    print()
+    print("=" * 90)
+    title = "SWEEP SUMMARY (mean [95% CI] across seeds)"
+    if runs_per_profile:
+        title += f" — {runs_per_profile} seeds/profile"
+    print(title)
+    print("=" * 90)
+    profiles = list(summary)
+    if not profiles:
+        print("  No runs.")
+        return
+    metrics = list(summary[profiles[0]])
+    print(f"{'metric':<26}" + "".join(f"{p:>22}" for p in profiles))
+    print("-" * (26 + 22 * len(profiles)))
+    for metric in metrics:
+        cells = []
+        for p in profiles:
+            s = summary[p][metric]
+            if s["n"] > 1:
+                cells.append(f"{s['mean']:8.1f} [{s['ci_low']:5.0f},{s['ci_high']:5.0f}]")
+            else:
+                cells.append(f"{s['mean']:8.1f}")
+        print(f"{metric:<26}" + "".join(f"{c:>22}" for c in cells))
+    print()
+
+
+def write_sweep_summary_csv(summary: dict[str, dict[str, dict]], path: str) -> None:
+    """Write the per-profile CI table as long-form CSV."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["profile", "metric", "n", "mean", "sd", "ci_low", "ci_high"])
+        for profile, metrics in summary.items():
+            for metric, s in metrics.items():
+                writer.writerow([profile, metric, s["n"], s["mean"], s["sd"], s["ci_low"], s["ci_high"]])
+    print(f"Summary CSV written to {path}")
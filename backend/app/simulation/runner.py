@@ -9,11 +9,11 @@ Models realistic multi-session-per-day usage patterns:
 import logging
 import os
 import random
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
-from freezegun import freeze_time
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -53,6 +53,9 @@ class DaySnapshot:
     # Review load
     total_due: int = 0
     covered_due: int = 0
+    # End-of-day schedule, from the card store (see _fill_schedule_metrics)
+    due_next_day: int = 0
+    mean_retrievability: float = 0.0
     # Events
     leeches_detected: int = 0
     leeches_reintroduced: int = 0
@@ -60,7 +63,10 @@ class DaySnapshot:
     cohort_size: int = 0
 
 
-def _fill_state_counts(db: Session, snap: DaySnapshot) -> None:
+_SCHEDULED_STATES = ("acquiring", "learning", "known", "lapsed")
+
+
+def _fill_state_counts(db: Session, snap: DaySnapshot, at: datetime) -> None:
     """Fill word state counts on a snapshot from current DB state."""
     all_ulk = db.query(UserLemmaKnowledge).all()
     for ulk in all_ulk:
@@ -88,6 +94,33 @@ def _fill_state_counts(db: Session, snap: DaySnapshot) -> None:
         elif box >= 3:
             snap.box_3 += 1
 
+    scheduled = [u.lemma_id for u in all_ulk if u.knowledge_state in _SCHEDULED_STATES]
+    _fill_schedule_metrics(db, snap, scheduled, at)
+
+
+def _fill_schedule_metrics(
+    db: Session, snap: DaySnapshot, lemma_ids: list[int], at: datetime
+) -> None:
+    """Next-day due load and mean FSRS retrievability at ``at``.
+
+    One columnar pass through the card store instead of parsing every
+    ``fsrs_card_json`` into a py-fsrs Card. Suspended and encountered words are
+    left out, as in the session's own due count.
+    """
+    import numpy as np
+    from alif_core.card_store import to_epoch
+
+    from app.services import card_store
+
+    if not lemma_ids:
+        return
+    store = card_store.load(db, lemma_ids)
+    snap.due_next_day = int(store.due_mask(to_epoch(at + timedelta(days=1))).sum())
+    r = store.retrievability(card_store.FSRS_PARAMS, to_epoch(at))
+    reviewed = store.has_card & (store.box == 0) & np.isfinite(r)
+    if reviewed.any():
+        snap.mean_retrievability = round(float(r[reviewed].mean()), 4)
+
 
 def _count_state(db: Session, state: str) -> int:
     return (
@@ -120,6 +153,23 @@ def _session_times(num_sessions: int, base_morning: datetime) -> list[datetime]:
     return sorted(times)
 
 
+@contextmanager
+def _llm_disabled():
+    from app.services.sentence_generator import GenerationError
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch("app.services.material_generator.generate_material_for_word", return_value=None)
+        )
+        stack.enter_context(
+            patch(
+                "app.services.sentence_generator.generate_validated_sentence",
+                side_effect=GenerationError("Simulation mode — no LLM"),
+            )
+        )
+        yield
+
+
 def _default_start_date(db: Session) -> datetime:
     """Start the sim the day after the DB's most recent review.
 
@@ -145,11 +195,14 @@ def run_simulation(
     profile: StudentProfile,
     start_date: datetime | None = None,
     seed: int = 42,
+    freezegun: bool = False,
 ) -> list[DaySnapshot]:
     """Run a multi-day simulation using real services against the given DB session.
 
     Models multiple short sessions per day with realistic time gaps.
-    All LLM-dependent code paths are mocked out. Time is controlled via freezegun.
+    All LLM-dependent code paths are mocked out. Simulated time is passed to
+    the services as ``at=`` (see app.clock); ``freezegun=True`` additionally
+    freezes the process clock and exists only to check the two agree.
     The DB session is modified in-place (use a copy of the production DB).
     """
     os.environ["TESTING"] = "1"
@@ -163,110 +216,101 @@ def run_simulation(
     if start_date is None:
         start_date = _default_start_date(db)
 
-    snapshots: list[DaySnapshot] = []
-
-    for day in range(1, days + 1):
-        day_start = start_date + timedelta(days=day - 1)
-        snap = DaySnapshot(day=day, date=day_start.strftime("%Y-%m-%d"))
-
-        if not profile.should_study_today(day_start.weekday(), day):
-            snap.skipped = True
-            _fill_state_counts(db, snap)
-            snapshots.append(snap)
-            continue
-
-        pre_learning = _count_state(db, "learning")
-        pre_suspended = _count_state(db, "suspended")
-        pre_acquiring = _count_state(db, "acquiring")
-
-        num_sessions = profile.sessions_today()
-        snap.num_sessions = num_sessions
-        session_times = _session_times(num_sessions, day_start)
-
-        from app.services.sentence_generator import GenerationError
-
-        for session_idx, session_time in enumerate(session_times):
-            session_limit = profile.session_size()
-            snap.session_limit += session_limit
-
-            with (
-                freeze_time(session_time),
-                patch(
-                    "app.services.material_generator.generate_material_for_word",
-                    return_value=None,
-                ),
-                patch(
-                    "app.services.sentence_generator.generate_validated_sentence",
-                    side_effect=GenerationError("Simulation mode — no LLM"),
-                ),
-            ):
-                from app.services.leech_service import check_leech_reintroductions
-                from app.services.sentence_selector import build_session
-
-                # Only check leech reintroductions on first session of the day
-                if session_idx == 0:
-                    reintro = check_leech_reintroductions(db)
-                    snap.leeches_reintroduced = len(reintro)
-
-                session = build_session(
-                    db, limit=session_limit, mode="reading", log_events=False
-                )
+    from app.services.cohort_service import get_focus_cohort
+    from app.services.leech_service import check_leech_reintroductions
+    from app.services.sentence_review_service import submit_sentence_review
+    from app.services.sentence_selector import build_session
 
-            # Track due/covered from the last session of the day (most representative)
-            snap.total_due = session["total_due_words"]
-            snap.covered_due = session["covered_due_words"]
-            snap.items_received += len(session["items"])
-
-            # Review each item with advancing time within this session
-            for i, item in enumerate(session["items"]):
-                review_time = session_time + timedelta(minutes=1 + i * 1.5)
-
-                words = item.get("words", [])
-                comprehension = profile.decide_comprehension(words)
-                missed, confused = profile.decide_missed_words(words, comprehension)
-
-                if comprehension == "understood":
-                    snap.understood += 1
-                elif comprehension == "partial":
-                    snap.partial += 1
-                else:
-                    snap.no_idea += 1
-
-                with freeze_time(review_time):
-                    from app.services.sentence_review_service import (
-                        submit_sentence_review,
-                    )
+    if freezegun:
+        from freezegun import freeze_time
+    else:
+        freeze_time = nullcontext
 
-                    submit_sentence_review(
-                        db,
-                        sentence_id=item.get("sentence_id"),
-                        primary_lemma_id=item["primary_lemma_id"],
-                        comprehension_signal=comprehension,
-                        missed_lemma_ids=missed,
-                        confused_lemma_ids=confused,
-                        session_id=session["session_id"],
-                        review_mode="reading",
+    snapshots: list[DaySnapshot] = []
+    with _llm_disabled():
+        for day in range(1, days + 1):
+            day_start = start_date + timedelta(days=day - 1)
+            snap = DaySnapshot(day=day, date=day_start.strftime("%Y-%m-%d"))
+
+            if not profile.should_study_today(day_start.weekday(), day):
+                snap.skipped = True
+                _fill_state_counts(db, snap, day_start + timedelta(days=1))
+                snapshots.append(snap)
+                continue
+
+            pre_learning = _count_state(db, "learning")
+            pre_suspended = _count_state(db, "suspended")
+            pre_acquiring = _count_state(db, "acquiring")
+
+            num_sessions = profile.sessions_today()
+            snap.num_sessions = num_sessions
+            session_times = _session_times(num_sessions, day_start)
+
+            for session_idx, session_time in enumerate(session_times):
+                session_limit = profile.session_size()
+                snap.session_limit += session_limit
+
+                with freeze_time(session_time):
+                    # Only check leech reintroductions on first session of the day
+                    if session_idx == 0:
+                        reintro = check_leech_reintroductions(db, at=session_time)
+                        snap.leeches_reintroduced = len(reintro)
+
+                    session = build_session(
+                        db, limit=session_limit, mode="reading", log_events=False,
+                        at=session_time,
                     )
-                    snap.reviews_submitted += 1
-
-        # End-of-day snapshot
-        _fill_state_counts(db, snap)
-        post_learning = _count_state(db, "learning")
-        snap.graduated_today = max(0, post_learning - pre_learning)
-        snap.leeches_detected = max(0, _count_state(db, "suspended") - pre_suspended)
-        post_acquiring = _count_state(db, "acquiring")
-        snap.auto_introduced = max(0, post_acquiring - pre_acquiring + snap.graduated_today)
-
-        from app.services.cohort_service import get_focus_cohort
 
-        snap.cohort_size = len(get_focus_cohort(db))
+                # Track due/covered from the last session of the day (most representative)
+                snap.total_due = session["total_due_words"]
+                snap.covered_due = session["covered_due_words"]
+                snap.items_received += len(session["items"])
+
+                # Review each item with advancing time within this session
+                for i, item in enumerate(session["items"]):
+                    review_time = session_time + timedelta(minutes=1 + i * 1.5)
+
+                    words = item.get("words", [])
+                    comprehension = profile.decide_comprehension(words)
+                    missed, confused = profile.decide_missed_words(words, comprehension)
+
+                    if comprehension == "understood":
+                        snap.understood += 1
+                    elif comprehension == "partial":
+                        snap.partial += 1
+                    else:
+                        snap.no_idea += 1
+
+                    with freeze_time(review_time):
+                        submit_sentence_review(
+                            db,
+                            sentence_id=item.get("sentence_id"),
+                            primary_lemma_id=item["primary_lemma_id"],
+                            comprehension_signal=comprehension,
+                            missed_lemma_ids=missed,
+                            confused_lemma_ids=confused,
+                            session_id=session["session_id"],
+                            review_mode="reading",
+                            at=review_time,
+                        )
+                        snap.reviews_submitted += 1
+
+            # End-of-day snapshot
+            _fill_state_counts(db, snap, day_start + timedelta(days=1))
+            post_learning = _count_state(db, "learning")
+            snap.graduated_today = max(0, post_learning - pre_learning)
+            snap.leeches_detected = max(0, _count_state(db, "suspended") - pre_suspended)
+            post_acquiring = _count_state(db, "acquiring")
+            snap.auto_introduced = max(0, post_acquiring - pre_acquiring + snap.graduated_today)
+
+            snap.cohort_size = len(get_focus_cohort(db, at=session_times[-1]))
 
-        snapshots.append(snap)
+            snapshots.append(snap)
 
-        if day % 10 == 0 or day == days:
-            logger.info(
-                f"Day {day}: {snap.reviews_submitted} reviews across {snap.num_sessions} sessions, "
-                f"{snap.acquiring} acquiring, {snap.known} known"
-            )
+            if day % 10 == 0 or day == days:
+                logger.info(
+                    f"Day {day}: {snap.reviews_submitted} reviews across {snap.num_sessions} sessions, "
+                    f"{snap.acquiring} acquiring, {snap.known} known"
+                )
 
     return snapshots
@@ -0,0 +1,252 @@
+"""Parallel Monte Carlo sweeps: many profiles × seeds over one source DB.
+
+Each worker process loads the source backup into memory once (SQLite backup
+API) and clones that template into a fresh in-memory DB per run, so runs
+never share state or contend on a file. Runs are fanned out across a
+process pool; their `DaySnapshot` rows stream into a single CSV or Parquet
+file as each run finishes, and `summarize_sweep` reports a mean and 95%
+confidence interval per profile and metric across seeds.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import math
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from statistics import mean, stdev
+from typing import Callable, Iterable
+
+from app.simulation.runner import DaySnapshot
+
+logger = logging.getLogger(__name__)
+
+# Per-run outcomes summarized across seeds. Final-day stock, then run totals.
+FINAL_METRICS = ("known", "learning", "acquiring", "lapsed", "suspended", "encountered")
+TOTAL_METRICS = (
+    "reviews_submitted",
+    "auto_introduced",
+    "graduated_today",
+    "leeches_detected",
+    "understood",
+    "partial",
+    "no_idea",
+)
+SWEEP_COLUMNS = ["profile", "seed"] + [f.name for f in fields(DaySnapshot)]
+
+# Two-sided 95% Student-t critical values by degrees of freedom.
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+@dataclass(frozen=True)
+class SweepRun:
+    profile: str
+    seed: int
+    days: int
+    start_date: datetime | None = None
+
+
+_TEMPLATE: sqlite3.Connection | None = None
+
+
+def _init_worker(source_path: str) -> None:
+    global _TEMPLATE
+    from app.simulation.db_setup import load_into_memory
+
+    os.environ.setdefault("ALIF_SKIP_MIGRATIONS", "1")
+    os.environ["TESTING"] = "1"
+    # Simulations never call an LLM; don't let each fresh worker fetch the
+    # litellm cost map over the network when the generator module imports it.
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    logging.getLogger("app").setLevel(logging.WARNING)
+    _TEMPLATE = load_into_memory(source_path)
+    # run_simulation imports these lazily, after seeding `random`. Import
+    # them up front so a worker's first run consumes the same random stream
+    # as its later ones — otherwise results depend on task placement.
+    import app.services.cohort_service  # noqa: F401
+    import app.services.leech_service  # noqa: F401
+    import app.services.sentence_generator  # noqa: F401
+    import app.services.sentence_review_service  # noqa: F401
+    import app.services.sentence_selector  # noqa: F401
+
+
+def _run_one(run: SweepRun) -> tuple[SweepRun, list[dict]]:
+    from app.simulation.db_setup import create_memory_simulation_db
+    from app.simulation.runner import run_simulation
+    from app.simulation.student import PROFILES
+
+    engine, SessionFactory = create_memory_simulation_db(_TEMPLATE)
+    db = SessionFactory()
+    try:
+        snapshots = run_simulation(
+            db, run.days, PROFILES[run.profile], start_date=run.start_date, seed=run.seed
+        )
+    finally:
+        db.close()
+        engine.dispose()
+    return run, [
+        {"profile": run.profile, "seed": run.seed, **asdict(snap)} for snap in snapshots
+    ]
+
+
+class _CsvSink:
+    def __init__(self, path: Path):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=SWEEP_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("pyarrow is required for Parquet output; use a .csv path") from exc
+        self._pa = pa
+        self._path = path
+        self._pq = pq
+        self._writer = None
+
+    def write(self, rows: list[dict]) -> None:
+        table = self._pa.Table.from_pylist(rows)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table.cast(self._writer.schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _open_sink(path: Path):
+    return _ParquetSink(path) if path.suffix == ".parquet" else _CsvSink(path)
+
+
+def _source_start_date(source_path: str) -> datetime:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.simulation.runner import _default_start_date
+
+    engine = create_engine(f"sqlite:///file:{source_path}?mode=ro&uri=true")
+    try:
+        with Session(engine) as db:
+            return _default_start_date(db)
+    finally:
+        engine.dispose()
+
+
+def run_sweep(
+    source_path: str | Path,
+    profiles: Iterable[str],
+    seeds: Iterable[int],
+    days: int,
+    *,
+    start_date: datetime | None = None,
+    out_path: str | Path | None = None,
+    workers: int | None = None,
+    on_run_done: Callable[[SweepRun, int, int], None] | None = None,
+) -> list[dict]:
+    """Run every profile × seed and return all snapshot rows.
+
+    Rows are also appended to ``out_path`` (``.csv`` or ``.parquet``) as runs
+    complete, so a long sweep leaves usable partial output if interrupted.
+    Row order in the return value is (profile, seed, day) regardless of
+    completion order.
+    """
+    source_path = str(Path(source_path).resolve())
+    if start_date is None:
+        # Resolve once so every run simulates the same calendar window.
+        start_date = _source_start_date(source_path)
+    runs = [SweepRun(p, s, days, start_date) for p in profiles for s in seeds]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(runs)))
+    sink = _open_sink(Path(out_path)) if out_path else None
+
+    results: dict[tuple[str, int], list[dict]] = {}
+    try:
+        # spawn, not fork: the parent may have live threads (litellm's
+        # background cost-map fetch, SQLAlchemy pools) whose locks a fork
+        # would copy in a held state.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(source_path,),
+        ) as pool:
+            futures = [pool.submit(_run_one, run) for run in runs]
+            for done, future in enumerate(as_completed(futures), 1):
+                run, rows = future.result()
+                results[(run.profile, run.seed)] = rows
+                if sink is not None:
+                    sink.write(rows)
+                if on_run_done is not None:
+                    on_run_done(run, done, len(runs))
+    finally:
+        if sink is not None:
+            sink.close()
+    return [row for run in runs for row in results[(run.profile, run.seed)]]
+
+
+def _t95(df: int) -> float:
+    if df <= 0:
+        return math.nan
+    eligible = [k for k in _T95 if k <= df]
+    return _T95[max(eligible)] if df <= 120 else 1.960
+
+
+def summarize_sweep(rows: list[dict]) -> dict[str, dict[str, dict]]:
+    """``{profile: {metric: {n, mean, sd, ci_low, ci_high}}}`` across seeds.
+
+    Final-day metrics (``known_final`` …) use the last snapshot of each run;
+    totals (``reviews_submitted_total`` …) sum over the run's days.
+    """
+    per_run: dict[tuple[str, int], list[dict]] = {}
+    for row in rows:
+        per_run.setdefault((row["profile"], row["seed"]), []).append(row)
+
+    outcomes: dict[str, dict[str, list[float]]] = {}
+    for (profile, _seed), run_rows in per_run.items():
+        run_rows.sort(key=lambda r: r["day"])
+        metrics = outcomes.setdefault(profile, {})
+        for name in FINAL_METRICS:
+            metrics.setdefault(f"{name}_final", []).append(float(run_rows[-1][name]))
+        for name in TOTAL_METRICS:
+            metrics.setdefault(f"{name}_total", []).append(
+                float(sum(r[name] for r in run_rows))
+            )
+
+    summary: dict[str, dict[str, dict]] = {}
+    for profile, metrics in outcomes.items():
+        summary[profile] = {}
+        for name, values in metrics.items():
+            n = len(values)
+            m = mean(values)
+            sd = stdev(values) if n > 1 else 0.0
+            half = _t95(n - 1) * sd / math.sqrt(n) if n > 1 else math.nan
+            summary[profile][name] = {
+                "n": n,
+                "mean": m,
+                "sd": sd,
+                "ci_low": m - half,
+                "ci_high": m + half,
+            }
+    return summary
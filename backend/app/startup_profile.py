@@ -0,0 +1,72 @@
+"""What the API paid to start, for GET /api/debug/startup.
+
+app.main records how long its own import took (routers, services, models)
+and how long the lifespan hook ran (migrations, stuck-flag/OCR recovery).
+The report also lists which heavy optional dependencies are already in
+sys.modules — litellm, CAMeL Tools, httpx etc. are meant to load on first
+use, so seeing one here right after boot means something imports it eagerly.
+Find the culprit with:
+
+    python -X importtime -c "import app.main" 2>&1 | sort -t'|' -k2 -n | tail
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+# Modules that cost ≥100ms to import and are only needed by specific paths.
+HEAVY_MODULES = (
+    "litellm",
+    "openai",
+    "tokenizers",
+    "camel_tools",
+    "httpx",
+    "pydub",
+    "numpy",
+    "anthropic",
+    "google.genai",
+)
+
+_import_seconds: float | None = None
+_lifespan_started: float | None = None
+_lifespan_seconds: float | None = None
+_ready_at: float | None = None
+_modules_at_ready: int | None = None
+
+
+def mark_imported(started: float) -> None:
+    global _import_seconds
+    _import_seconds = time.perf_counter() - started
+
+
+def mark_lifespan_started() -> None:
+    global _lifespan_started
+    _lifespan_started = time.perf_counter()
+
+
+def mark_lifespan_done() -> None:
+    global _lifespan_seconds, _ready_at, _modules_at_ready
+    now = time.perf_counter()
+    if _lifespan_started is not None:
+        _lifespan_seconds = now - _lifespan_started
+    _ready_at = now
+    _modules_at_ready = len(sys.modules)
+
+
+def loaded_heavy_modules() -> list[str]:
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+def report() -> dict:
+    def _round(value: float | None) -> float | None:
+        return round(value, 3) if value is not None else None
+
+    return {
+        "app_import_seconds": _round(_import_seconds),
+        "lifespan_seconds": _round(_lifespan_seconds),
+        "uptime_seconds": _round(time.perf_counter() - _ready_at) if _ready_at else None,
+        "modules_at_ready": _modules_at_ready,
+        "modules_now": len(sys.modules),
+        "heavy_modules_loaded": {name: name in sys.modules for name in HEAVY_MODULES},
+    }
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Store text_fingerprint / text_minhash on sentences that lack them.
+
+Run once after deploying the fingerprint columns (rows written before them
+are NULL), and any time after raw-SQL edits of arabic_text, which the
+sentences_fp_au trigger resets to NULL. Commits per batch, so the app keeps
+writing while it runs. Readers handle NULL rows in memory, so skipping this
+only costs speed.
+
+Usage:
+    python scripts/backfill_sentence_fingerprints.py [--batch-size 500]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ALIF_SKIP_MIGRATIONS", "1")
+
+from app.database import SessionLocal
+from app.services.sentence_fingerprint import backfill_fingerprints
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        updated = backfill_fingerprints(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Fingerprinted {updated} sentence(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,16 @@
 Same logic that runs every cron pass via warm_sentence_cache phase 7. This
 script is the human-readable front-end:
 
-    python3 scripts/chimera_audit.py                  # print only (D1..D5)
+    python3 scripts/chimera_audit.py                  # print only (D1..D5), read-only
+    python3 scripts/chimera_audit.py --store          # also refresh chimera_audit_results
     python3 scripts/chimera_audit.py --etymology      # also run D6 etymology check
     python3 scripts/chimera_audit.py --etymology --no-llm   # D6 pre-filter only (cheap)
     python3 scripts/chimera_audit.py --emit-alert     # also write ActivityLog
 
+Without ``--store`` the D1..D5 scan classifies every lemma in memory and
+writes nothing; ``--store`` uses the cron's incremental path, which stores
+verdicts in ``chimera_audit_results``.
+
 The six categories are documented in ``app/services/chimera_audit.py``.
 """
 from __future__ import annotations
@@ -33,6 +38,10 @@ def main():
         "--emit-alert", action="store_true",
         help="Write a chimera_audit_findings ActivityLog row (idempotent)",
     )
+    ap.add_argument(
+        "--store", action="store_true",
+        help="Refresh chimera_audit_results incrementally (the cron path) instead of a read-only scan",
+    )
     ap.add_argument(
         "--etymology", action="store_true",
         help="Also run the D6 etymology↔gloss coherence check (LLM)",
@@ -49,7 +58,7 @@ def main():
 
     db = SessionLocal()
     try:
-        candidates = find_chimera_candidates(db)
+        candidates = find_chimera_candidates(db, persist=args.store)
         if args.etymology:
             candidates += find_etymology_incoherence_candidates(
                 db, limit=args.limit, llm_verify=not args.no_llm,
@@ -13,10 +13,12 @@ For detected variants:
 - Sets canonical_lemma_id on the variant lemma
 - Optionally merges review data into the canonical lemma (--merge)
 
-Run: python scripts/cleanup_lemma_variants.py [--dry-run] [--merge] [--verbose]
-  --dry-run:  Show what would be detected, don't change anything
-  --merge:    Also merge review data and delete variant lemma rows
-  --verbose:  Show which analysis was picked and why for each lemma
+Run: python scripts/cleanup_lemma_variants.py [--dry-run] [--merge] [--verbose] [--changed-only]
+  --dry-run:       Show what would be detected, don't change anything
+  --merge:         Also merge review data and delete variant lemma rows
+  --verbose:       Show which analysis was picked and why for each lemma
+  --changed-only:  Only check pairs involving lemmas added or edited since the
+                   last changed-only sweep (variants_checked_at NULL)
 """
 
 import json
@@ -37,6 +39,7 @@ from app.models import (
 from app.services.activity_log import log_activity
 from app.services.morphology import CAMEL_AVAILABLE
 from app.services.variant_detection import (
+    detect_changed_variants,
     detect_variants_llm,
     detect_definite_variants,
     mark_variants,
@@ -122,6 +125,7 @@ def main():
     dry_run = "--dry-run" in sys.argv
     do_merge = "--merge" in sys.argv
     verbose = "--verbose" in sys.argv
+    changed_only = "--changed-only" in sys.argv
 
     if not CAMEL_AVAILABLE:
         print("CAMeL Tools not available. Install with: pip install camel-tools")
@@ -130,29 +134,38 @@ def main():
 
     db = SessionLocal()
 
-    # Step 1: CAMeL + LLM variant detection
-    print("=== VARIANT DETECTION (CAMeL + LLM confirmation) ===")
-    camel_variants = detect_variants_llm(db, verbose=verbose)
-    print(f"\nFound {len(camel_variants)} LLM-confirmed variants:")
-    for var_id, canon_id, vtype, details in camel_variants:
-        var = db.get(Lemma, var_id)
-        canon = db.get(Lemma, canon_id)
-        print(f"  {var.lemma_ar_bare} ({var.gloss_en}) → {canon.lemma_ar_bare} ({canon.gloss_en}) [{vtype}]")
-
-    # Step 2: Definite form detection (skip already-detected variants)
-    already_ids = {v[0] for v in camel_variants}
-    print("\n=== DEFINITE FORM DETECTION ===")
-    def_variants = detect_definite_variants(db, already_variant_ids=already_ids)
-    print(f"Found {len(def_variants)} definite-form variants:")
-    for var_id, canon_id, vtype, details in def_variants:
-        var = db.get(Lemma, var_id)
-        canon = db.get(Lemma, canon_id)
-        print(f"  {var.lemma_ar_bare} ({var.gloss_en}) → {canon.lemma_ar_bare} ({canon.gloss_en})")
+    if changed_only:
+        print("=== CHANGED-LEMMA VARIANT SWEEP (CAMeL + LLM confirmation) ===")
+        found = detect_changed_variants(db, use_llm=True, verbose=verbose)
+        camel_variants = [v for v in found if v[2] != "definite"]
+        def_variants = [v for v in found if v[2] == "definite"]
+        print(f"Found {len(camel_variants)} LLM-confirmed and {len(def_variants)} definite-form variants")
+    else:
+        # Step 1: CAMeL + LLM variant detection
+        print("=== VARIANT DETECTION (CAMeL + LLM confirmation) ===")
+        camel_variants = detect_variants_llm(db, verbose=verbose)
+        print(f"\nFound {len(camel_variants)} LLM-confirmed variants:")
+        for var_id, canon_id, vtype, details in camel_variants:
+            var = db.get(Lemma, var_id)
+            canon = db.get(Lemma, canon_id)
+            print(f"  {var.lemma_ar_bare} ({var.gloss_en}) → {canon.lemma_ar_bare} ({canon.gloss_en}) [{vtype}]")
+
+        # Step 2: Definite form detection (skip already-detected variants)
+        already_ids = {v[0] for v in camel_variants}
+        print("\n=== DEFINITE FORM DETECTION ===")
+        def_variants = detect_definite_variants(db, already_variant_ids=already_ids)
+        print(f"Found {len(def_variants)} definite-form variants:")
+        for var_id, canon_id, vtype, details in def_variants:
+            var = db.get(Lemma, var_id)
+            canon = db.get(Lemma, canon_id)
+            print(f"  {var.lemma_ar_bare} ({var.gloss_en}) → {canon.lemma_ar_bare} ({canon.gloss_en})")
 
     all_variants = camel_variants + def_variants
 
     if not all_variants:
         print("\nNo variants detected.")
+        if changed_only and not dry_run:
+            db.commit()  # keep the checked stamps
         db.close()
         return
 
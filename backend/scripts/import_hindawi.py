@@ -40,6 +40,11 @@ sys.path.insert(0, ".")
 from app.database import SessionLocal
 from app.models import Sentence, SentenceWord
 from app.services.proper_name_lemmas import get_or_create_proper_name_lemma
+from app.services.sentence_fingerprint import (
+    backfill_fingerprints,
+    stored_duplicate_exists,
+    text_fingerprint,
+)
 from app.services.sentence_quality import fails_corpus_regex_filter
 from app.services.sentence_validator import (
     build_lemma_lookup,
@@ -207,11 +212,31 @@ def build_name_set(
 
 # ── Deduplication ────────────────────────────────────────────────────
 
-def get_existing_arabic_texts(db) -> set[str]:
-    """Load normalized Arabic text of all existing sentences for dedup."""
-    from sqlalchemy import text
-    rows = db.execute(text("SELECT arabic_text FROM sentences")).fetchall()
-    return {normalize_alef(strip_diacritics(r[0])) for r in rows if r[0]}
+class ExistingSentences:
+    """Exact dedup against every stored sentence (active or retired) and the
+    texts accepted earlier in this run, compared by normalized fingerprint.
+
+    Each check is one lookup on the indexed ``sentences.text_fingerprint``
+    instead of loading every text; rows missing a fingerprint are backfilled
+    first so the lookup sees them.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.accepted: set[str] = set()
+        backfill_fingerprints(db)
+
+    def __len__(self) -> int:
+        return self.db.query(Sentence.id).count()
+
+    def __contains__(self, text: str) -> bool:
+        return (
+            text_fingerprint(text) in self.accepted
+            or stored_duplicate_exists(self.db, text)
+        )
+
+    def add(self, text: str) -> None:
+        self.accepted.add(text_fingerprint(text))
 
 
 # ── Main pipeline ────────────────────────────────────────────────────
@@ -293,7 +318,7 @@ def run_pipeline(
         names = build_name_set(all_sentences, lookup)
 
         # Load existing sentences for dedup
-        existing = get_existing_arabic_texts(db)
+        existing = ExistingSentences(db)
         logger.info(f"Existing sentences in DB: {len(existing)}")
 
         # Second pass: map with names, filter
@@ -304,8 +329,7 @@ def run_pipeline(
 
         for s in all_sentences:
             # Dedup check
-            text_norm = normalize_alef(strip_diacritics(s["text"]))
-            if text_norm in existing:
+            if s["text"] in existing:
                 dedup_count += 1
                 continue
 
@@ -343,7 +367,7 @@ def run_pipeline(
                 rejected_count += 1
                 continue
 
-            existing.add(text_norm)  # prevent intra-batch dupes
+            existing.add(s["text"])  # prevent intra-batch dupes
             accepted.append({
                 "text": s["text"],
                 "title": s["title"],
@@ -43,10 +43,10 @@ from app.services.sentence_validator import (  # noqa: E402
 )
 from app.services.transliteration import transliterate_arabic  # noqa: E402
 from scripts.import_hindawi import (  # noqa: E402
+    ExistingSentences,
     build_lemma_lookup,
     build_name_set,
     extract_sentences,
-    get_existing_arabic_texts,
     map_tokens_to_lemmas,
     tokenize_display,
 )
@@ -94,12 +94,11 @@ def run(text_path: str, require_source: str | None, min_words: int,
             logger.info(f"Momo-purpose filter: sentence must contain one of "
                         f"{len(required_ids)} '{require_source}' lemmas")
         names = build_name_set(all_sentences, lookup)
-        existing = get_existing_arabic_texts(db)
+        existing = ExistingSentences(db)
 
         accepted, rejected_unmapped, rejected_no_target, dedup = [], 0, 0, 0
         for s in all_sentences:
-            text_norm = normalize_alef(strip_diacritics(s["text"]))
-            if text_norm in existing:
+            if s["text"] in existing:
                 dedup += 1
                 continue
             tokens = tokenize_display(s["text"])
@@ -129,7 +128,7 @@ def run(text_path: str, require_source: str | None, min_words: int,
             if required_ids and not (mapped_ids & required_ids):
                 rejected_no_target += 1
                 continue
-            existing.add(text_norm)
+            existing.add(s["text"])
             accepted.append({"text": s["text"], "mappings": mappings,
                              "lemma_ids": mapped_ids})
 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Resident material-maintenance service (optional replacement for the
+3-hourly cold-start cron passes in deploy/alif-update-material.sh).
+
+Keeps litellm, the morphology stack and the generation/validation modules
+imported in a forkserver and runs the same four phases as forks of it, with
+per-phase timeouts and the same budget env vars. Serves ``/status``,
+``/metrics`` and ``POST /nudge`` on a loopback port; the API nudges it after
+sessions when ``ALIF_MATERIAL_DAEMON_URL`` is set.
+
+Usage:
+    python3 scripts/material_daemon.py                  # serve (port 3011)
+    python3 scripts/material_daemon.py --once           # one cycle, then exit
+    python3 scripts/material_daemon.py --interval 10800 --nudge-cooldown 900
+
+See app/services/material_daemon.py and deploy/alif-material-daemon.service.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from app.services.material_daemon import (  # noqa: E402
+    DEFAULT_INTERVAL_SECONDS,
+    DEFAULT_NUDGE_COOLDOWN_SECONDS,
+    DEFAULT_PORT,
+    MaterialDaemon,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_SECONDS,
+                        help="Seconds between scheduled cycles (default: 3h)")
+    parser.add_argument("--nudge-cooldown", type=float, default=DEFAULT_NUDGE_COOLDOWN_SECONDS,
+                        help="Ignore API nudges this soon after a cycle (default: 15min)")
+    parser.add_argument("--no-initial-cycle", action="store_true",
+                        help="Wait for the first interval or nudge instead of running at startup")
+    parser.add_argument("--once", action="store_true", help="Run one cycle, print results, exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    daemon = MaterialDaemon(interval=args.interval, nudge_cooldown=args.nudge_cooldown)
+
+    if args.once:
+        results = daemon.run_cycle("once")
+        print(json.dumps([r.__dict__ for r in results], indent=2))
+        return 0 if all(r.status == "ok" for r in results) else 1
+
+    server = daemon.make_http_server(args.host, args.port)
+    threading.Thread(target=server.serve_forever, name="material-daemon-http", daemon=True).start()
+
+    def _shutdown(signum, _frame):
+        logging.getLogger(__name__).info("Signal %s: stopping after the current phase", signum)
+        daemon.stop()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    try:
+        daemon.serve_forever(run_immediately=not args.no_initial_cycle)
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
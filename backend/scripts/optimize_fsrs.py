@@ -18,8 +18,15 @@ import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
+from alif_core import FsrsParams
+from alif_core.replay import sweep
 from fsrs import Optimizer, ReviewLog as FsrsReviewLog, Rating, Scheduler, Card
 
+try:
+    from sweep_fsrs import load_review_columns
+except ModuleNotFoundError:
+    from scripts.sweep_fsrs import load_review_columns
+
 
 RATING_MAP = {1: Rating.Again, 2: Rating.Hard, 3: Rating.Good, 4: Rating.Easy}
 
@@ -154,6 +161,21 @@ def main():
     print(f"  optimized params: {n_lapse:7.2f} days  ({pct(n_lapse, d_lapse).strip()})")
     print()
     print("Higher post-lapse stability = gentler recovery path after a lapse.")
+
+    # In-sample fit of both vectors, one columnar replay each. For wider
+    # retention/parameter grids use scripts/sweep_fsrs.py.
+    print("\n== In-sample fit (pre-review R vs recall, elapsed >= 1 day) ==")
+    cols = load_review_columns(db_path)
+    fits = sweep(cols, [
+        FsrsParams(parameters=tuple(DEFAULT_W), enable_fuzzing=False),
+        FsrsParams(parameters=tuple(new_w), enable_fuzzing=False),
+    ])
+    print(f"{'':<18}{'log-loss':>10}{'RMSE(bins)':>12}")
+    for label, fit in zip(("default params", "optimized params"), fits):
+        if fit["log_loss"] is None:
+            print(f"  {label:<16}(no reviews with elapsed >= 1 day)")
+            continue
+        print(f"  {label:<16}{fit['log_loss']:>10.4f}{fit['rmse_bins']:>12.4f}")
     print()
     print(
         "DO NOT DEPLOY THIS OUTPUT DIRECTLY. Validate on clean, versioned, "
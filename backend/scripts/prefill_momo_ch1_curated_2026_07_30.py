@@ -690,10 +690,16 @@ def _stable_value(value: Any) -> Any:
     return value
 
 
+# Derived from arabic_text; the sentences_fp_au trigger resets them when the
+# compare-and-set rewrites the text, so they are not independent fields.
+_DERIVED_SENTENCE_COLUMNS = frozenset({"text_fingerprint", "text_minhash"})
+
+
 def _sentence_snapshot(sentence: Sentence) -> dict[str, Any]:
     return {
         column.name: _stable_value(getattr(sentence, column.name))
         for column in Sentence.__table__.columns
+        if column.name not in _DERIVED_SENTENCE_COLUMNS
     }
 
 
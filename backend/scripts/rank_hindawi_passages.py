@@ -6,10 +6,18 @@ This is a read-only scouting tool for longer passage work. It finds consecutive
 current production lemma state, so promising authentic passages can be promoted
 through the existing Story + Sentence(source="passage") path later.
 
+The first run tokenizes and maps the parquet once into a corpus store
+(app/services/corpus_store.py, default data/corpus_store/hindawi-<category>);
+later runs only load the current knowledge state and re-rank every window in
+one vectorized pass. Rebuild with --rebuild after changing --min/--max-words.
+
 Usage:
     DATABASE_URL=sqlite:///data/alif.db \
       python3 scripts/rank_hindawi_passages.py --parquet /tmp/hindawi.parquet
 
+    # Re-rank from the existing store (no parquet needed)
+    python3 scripts/rank_hindawi_passages.py --limit 20
+
     python3 scripts/rank_hindawi_passages.py \
       --db /opt/alif/backend/data/alif.db \
       --parquet /tmp/hindawi.parquet \
@@ -22,6 +30,7 @@ import argparse
 import json
 import os
 import sys
+import time
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -349,39 +358,45 @@ def _clean_bare(surface: str, runtime) -> str:
     )
 
 
-def sentence_coverage(
-    text: str,
-    lookup,
-    context: LemmaContext,
-    runtime,
-    proper_names: set[str] | None = None,
-) -> SentenceCoverage:
+def sentence_tokens(text: str, lookup, runtime) -> list[int | str]:
+    """Content tokens of one sentence: the mapped lemma_id, or the bare
+    surface when unmapped. Function words and one-letter tokens are dropped.
+    This is the expensive, knowledge-independent step the corpus store saves."""
     mappings = runtime["map_tokens_to_lemmas"](
         tokens=runtime["tokenize_display"](text),
         lemma_lookup=lookup,
         target_lemma_id=0,
         target_bare="",
-        proper_names=proper_names,
     )
+    tokens: list[int | str] = []
+    for mapping in mappings:
+        bare = _clean_bare(mapping.surface_form, runtime)
+        if not bare or len(bare) <= 1:
+            continue
+        if mapping.is_function_word or runtime["_is_function_word"](bare):
+            continue
+        tokens.append(mapping.lemma_id if mapping.lemma_id is not None else bare)
+    return tokens
+
+
+def coverage_from_tokens(
+    text: str, tokens: list[int | str], context: LemmaContext
+) -> SentenceCoverage:
     coverage = SentenceCoverage(
         text=text,
         content_tokens=0,
         known_tokens=0,
         active_tokens=0,
     )
-    for mapping in mappings:
-        bare = _clean_bare(mapping.surface_form, runtime)
-        if not bare or len(bare) <= 1:
+    for token in tokens:
+        if isinstance(token, str):
+            coverage.content_tokens += 1
+            coverage.unmapped[token] += 1
             continue
-        if mapping.is_function_word or runtime["_is_function_word"](bare):
-            continue
-        canonical = context.canonical_id(mapping.lemma_id)
-        if canonical and context.is_skipped(canonical):
+        canonical = context.canonical_id(token)
+        if context.is_skipped(canonical):
             continue
         coverage.content_tokens += 1
-        if canonical is None:
-            coverage.unmapped[bare] += 1
-            continue
         if canonical in context.known_ids:
             coverage.known_tokens += 1
         if canonical in context.active_ids:
@@ -391,59 +406,124 @@ def sentence_coverage(
     return coverage
 
 
-def rank_books(
-    books,
+def sentence_coverage(
+    text: str,
     lookup,
     context: LemmaContext,
     runtime,
+) -> SentenceCoverage:
+    return coverage_from_tokens(text, sentence_tokens(text, lookup, runtime), context)
+
+
+def lemma_masks(context: LemmaContext):
+    from app.services.corpus_store import LemmaMasks
+
+    return LemmaMasks.from_sets(
+        context.canonical_next,
+        context.active_ids,
+        context.known_ids,
+        (
+            lid for lid, info in context.infos.items()
+            if (info.word_category or "standard") in SKIP_CATEGORIES
+        ),
+        size=max(context.infos, default=-1) + 1,
+    )
+
+
+def build_store(
+    books,
+    lookup,
+    runtime,
+    store_path: Path,
     *,
-    sentence_count: int,
-    min_words: int,
-    max_words: int,
-    title_filter: str | None,
-    min_active_pct: float,
-    max_unmapped_pct: float,
-) -> list[PassageWindow]:
-    all_windows: list[PassageWindow] = []
-    extract_sentences = runtime["extract_sentences"]
+    params: dict[str, Any],
+):
+    """Tokenize and map every extracted sentence once and save the store."""
+    from app.services.corpus_store import CorpusStoreBuilder
 
+    extract_sentences = runtime["extract_sentences"]
+    builder = CorpusStoreBuilder(params=params)
     for _, book in books.iterrows():
-        title = str(book.get("title") or "")
-        if title_filter and title_filter not in title:
-            continue
         raw_sentences = extract_sentences(
             str(book.get("text") or ""),
-            min_words=min_words,
-            max_words=max_words,
+            min_words=params["min_words"],
+            max_words=params["max_words"],
         )
-        if len(raw_sentences) < sentence_count:
-            continue
-        covered = [
-            sentence_coverage(text, lookup, context, runtime)
-            for text in raw_sentences
-        ]
-        covered = [s for s in covered if s.content_tokens > 0]
-        for window in build_windows(
-            title=title,
+        builder.add_book(
+            title=str(book.get("title") or ""),
             author=str(book.get("author") or ""),
-            sentences=covered,
-            sentence_count=sentence_count,
-        ):
-            if window.active_pct < min_active_pct:
-                continue
-            if window.unmapped_pct > max_unmapped_pct:
-                continue
-            all_windows.append(window)
+            sentences=(
+                (text, sentence_tokens(text, lookup, runtime))
+                for text in raw_sentences
+            ),
+            source="hindawi",
+        )
+    return builder.save(store_path)
 
-    all_windows.sort(key=lambda w: w.score(), reverse=True)
-    return all_windows
+
+def resolve_new_surfaces(store, lookup, runtime) -> int:
+    """Map surfaces that were unmapped at build time through the current
+    lookup, so lemmas imported since the build count without a rebuild."""
+    resolved = {}
+    for surface in store.surfaces:
+        tokens = sentence_tokens(surface, lookup, runtime)
+        if len(tokens) == 1 and not isinstance(tokens[0], str):
+            resolved[surface] = tokens[0]
+    return store.remap_surfaces(resolved)
+
+
+def rank_store(
+    store,
+    context: LemmaContext,
+    *,
+    sentence_count: int,
+    title_filter: str | None,
+    min_active_pct: float,
+    max_unmapped_pct: float,
+    limit: int | None = None,
+) -> list[PassageWindow]:
+    import numpy as np
+
+    from app.services.corpus_store import rank_windows
+
+    book_filter = None
+    if title_filter:
+        book_filter = np.array([title_filter in b["title"] for b in store.books], dtype=bool)
+    ranked = rank_windows(
+        store,
+        lemma_masks(context),
+        sentence_count=sentence_count,
+        min_active_pct=min_active_pct,
+        max_unmapped_pct=max_unmapped_pct,
+        book_filter=book_filter,
+        limit=limit,
+    )
+    windows = []
+    for book_idx, start_index, sentence_ids in zip(ranked.book, ranked.start_index, ranked.sentences):
+        book = store.books[int(book_idx)]
+        windows.append(PassageWindow(
+            title=book["title"],
+            author=book["author"],
+            start_index=int(start_index),
+            sentences=[
+                coverage_from_tokens(store.text(int(i)), store.sentence_tokens(int(i)), context)
+                for i in sentence_ids
+            ],
+        ))
+    return windows
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Rank Hindawi children's-book passage windows by current lemma knowledge"
     )
-    parser.add_argument("--parquet", required=True, help="Path to Hindawi parquet")
+    parser.add_argument("--parquet", help="Path to Hindawi parquet (needed to build the store)")
+    parser.add_argument(
+        "--store",
+        help="Corpus store directory (default: data/corpus_store/hindawi-<category>)",
+    )
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Re-tokenize the parquet even if the store exists")
     parser.add_argument("--db", help="SQLite DB path; overrides DATABASE_URL")
     parser.add_argument("--category", default="children", help="Category filter")
     parser.add_argument("--title", help="Restrict to book titles containing this text")
@@ -464,28 +544,62 @@ def main() -> None:
 
     _configure_database(args.db)
     runtime = _load_runtime(disable_camel=args.disable_camel)
+    from app.services.corpus_store import CorpusStore
 
-    try:
-        import pandas as pd
-    except ImportError as exc:
-        raise SystemExit("pandas/pyarrow are required to read the Hindawi parquet") from exc
-
+    store_path = Path(args.store) if args.store else (
+        Path(__file__).resolve().parents[1] / "data" / "corpus_store" / f"hindawi-{args.category}"
+    )
     lookup, context = _load_context(runtime)
-    df = pd.read_parquet(args.parquet)
-    books = df[df["category"].str.contains(args.category, case=False, na=False)]
+    max_lemma_id = max(context.infos, default=0)
+    params = {
+        "category": args.category,
+        "min_words": args.min_words,
+        "max_words": args.max_words,
+        "camel": not args.disable_camel,
+        "max_lemma_id": max_lemma_id,
+    }
 
-    windows = rank_books(
-        books,
-        lookup,
+    if args.rebuild or not (store_path / "meta.json").exists():
+        if not args.parquet:
+            raise SystemExit(f"No corpus store at {store_path}; pass --parquet to build it")
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise SystemExit("pandas/pyarrow are required to read the Hindawi parquet") from exc
+        df = pd.read_parquet(args.parquet)
+        books = df[df["category"].str.contains(args.category, case=False, na=False)]
+        started = time.perf_counter()
+        store = build_store(books, lookup, runtime, store_path, params=params)
+        print(
+            f"Built corpus store {store_path}: {store.sentence_count} sentences, "
+            f"{len(store.tokens)} tokens in {time.perf_counter() - started:.1f}s",
+            file=sys.stderr,
+        )
+    else:
+        store = CorpusStore.load(store_path)
+        built = store.meta["params"]
+        if (built.get("min_words"), built.get("max_words")) != (args.min_words, args.max_words):
+            print(
+                f"Note: store was built with --min-words {built.get('min_words')} "
+                f"--max-words {built.get('max_words')}; pass --rebuild to change them",
+                file=sys.stderr,
+            )
+        if max_lemma_id > (built.get("max_lemma_id") or 0):
+            resolved = resolve_new_surfaces(store, lookup, runtime)
+            print(f"Resolved {resolved} surfaces via lemmas added since the build", file=sys.stderr)
+
+    started = time.perf_counter()
+    windows = rank_store(
+        store,
         context,
-        runtime,
         sentence_count=max(3, min(5, args.sentence_count)),
-        min_words=args.min_words,
-        max_words=args.max_words,
         title_filter=args.title,
         min_active_pct=args.min_active_pct,
         max_unmapped_pct=args.max_unmapped_pct,
-    )[: args.limit]
+        limit=args.limit,
+    )
+    print(f"Ranked {store.sentence_count} sentences in {time.perf_counter() - started:.3f}s",
+          file=sys.stderr)
 
     rows = [window_to_dict(w, context, include_text=args.include_text) for w in windows]
     if args.json:
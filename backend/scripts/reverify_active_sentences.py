@@ -5,6 +5,8 @@ Usage:
                                                           [--batch-size 15]
                                                           [--limit N]
                                                           [--sentence-id ID]
+                                                          [--all]
+                                                          [--concurrency 4]
 
 Walks the entire active-reviewable corpus (the reviewability gate cohort),
 batch-verifies every sentence via the current verifier + vocabulary, applies
@@ -13,8 +15,12 @@ repaired even by the frequency-gated proposal path. Hidden sentences are appende
 ``data/logs/mapping_reverify_failures_<date>.jsonl`` for offline triage.
 
 Run as a maintenance sweep when you want confidence that every visible
-sentence has been checked. Free via Claude CLI; ~15-20 minutes for the
-~1700-sentence corpus.
+sentence has been checked. Sentences whose verifier inputs (mappings,
+referenced lemma glosses, verifier version) are unchanged since their last
+clean pass are skipped unless ``--all`` is given; explicit ``--sentence-id``
+rows are always re-checked. LLM batches run ``--concurrency`` at a time.
+Free via Claude CLI; a first full pass over ~1700 sentences takes a few
+minutes at the default concurrency, repeat passes only pay for what changed.
 """
 
 from __future__ import annotations
@@ -42,6 +48,11 @@ def main() -> None:
                         help="Optional cap on number of sentences to verify (for spot checks).")
     parser.add_argument("--sentence-id", type=int, action="append", default=None,
                         help="Restrict to specific sentence IDs (repeatable).")
+    parser.add_argument("--all", action="store_true",
+                        help="Re-check sentences whose verifier inputs are unchanged.")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="LLM batches in flight at once "
+                             "(default ALIF_IMPORT_LLM_CONCURRENCY or 4).")
     args = parser.parse_args()
 
     ids: list[int] | None = None
@@ -57,12 +68,18 @@ def main() -> None:
             db.close()
         ids = all_ids[: args.limit]
 
-    print(f"Starting reverify (dry_run={args.dry_run}, batch_size={args.batch_size})")
+    only_changed = not (args.all or args.sentence_id)
+    print(
+        f"Starting reverify (dry_run={args.dry_run}, batch_size={args.batch_size}, "
+        f"only_changed={only_changed}, concurrency={args.concurrency or 'default'})"
+    )
     t0 = time.perf_counter()
     stats = reverify_all_active_sentences(
         batch_size=args.batch_size,
         sentence_ids=ids,
         dry_run=args.dry_run,
+        only_changed=only_changed,
+        concurrency=args.concurrency,
     )
     elapsed = time.perf_counter() - t0
 
@@ -77,6 +94,7 @@ def main() -> None:
             log_activity(
                 db, "manual_action",
                 f"Reverify sweep: {stats.sentences_attempted} attempted, "
+                f"{stats.sentences_unchanged} unchanged, "
                 f"{stats.sentences_passed} passed, "
                 f"{stats.sentences_corrected} corrected, "
                 f"{stats.sentences_unfixable} unfixable ({stats.positions_nulled} positions NULL'd)",
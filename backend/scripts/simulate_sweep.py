@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Monte Carlo sweep: many student profiles × seeds in parallel.
+
+Clones the source DB into memory per worker (SQLite backup API), runs every
+profile × seed across a process pool, streams all DaySnapshot rows into one
+CSV/Parquet file, and prints mean + 95% CI per profile for each metric.
+
+Usage:
+    python3 scripts/simulate_sweep.py --days 30 --profiles beginner realistic strong --seeds 20
+    python3 scripts/simulate_sweep.py --days 30 --profiles calibrated --seeds 40 \\
+        --db ~/alif-backups/alif_20260710.db --out /tmp/claude/sweep.parquet --workers 8
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ["ALIF_SKIP_MIGRATIONS"] = "1"
+os.environ["TESTING"] = "1"
+
+from datetime import datetime, timezone
+
+from app.simulation.db_setup import find_latest_backup
+from app.simulation.reporter import print_sweep_summary, write_sweep_summary_csv
+from app.simulation.student import PROFILES
+from app.simulation.sweep import run_sweep, summarize_sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel multi-seed simulation sweep")
+    parser.add_argument("--days", type=int, required=True, help="Number of days per run")
+    parser.add_argument(
+        "--profiles", nargs="+", choices=list(PROFILES.keys()), required=True,
+        help="Student behavior profiles",
+    )
+    parser.add_argument("--seeds", type=int, default=20, help="Seeds per profile (default: 20)")
+    parser.add_argument("--seed-start", type=int, default=42, help="First seed (default: 42)")
+    parser.add_argument("--db", type=str, help="Path to DB backup (default: latest from ~/alif-backups/)")
+    parser.add_argument(
+        "--out", type=str, default="/tmp/claude/sim_sweep.csv",
+        help="Snapshot rows, .csv or .parquet (default: /tmp/claude/sim_sweep.csv)",
+    )
+    parser.add_argument("--summary-csv", type=str, help="Write the CI table to this CSV")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--start-date", type=str,
+        help="Simulation start date YYYY-MM-DD (default: day after the backup's latest review)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    db_path = args.db or find_latest_backup()
+    start_date = None
+    if args.start_date:
+        start_date = datetime.strptime(args.start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+
+    total = len(args.profiles) * args.seeds
+    print(f"Source DB: {db_path}")
+    print(f"{total} runs: {args.profiles} × {args.seeds} seeds × {args.days} days → {args.out}")
+    started = time.monotonic()
+
+    def progress(run, done, total):
+        elapsed = time.monotonic() - started
+        print(f"  [{done}/{total}] {run.profile} seed={run.seed} ({elapsed:.0f}s)", flush=True)
+
+    rows = run_sweep(
+        db_path, args.profiles, seeds, args.days,
+        start_date=start_date, out_path=args.out, workers=args.workers,
+        on_run_done=progress,
+    )
+    summary = summarize_sweep(rows)
+    print_sweep_summary(summary, runs_per_profile=args.seeds)
+    if args.summary_csv:
+        write_sweep_summary_csv(summary, args.summary_csv)
+    print(f"Rows written to {args.out} in {time.monotonic() - started:.0f}s")
+
+
+if __name__ == "__main__":
+    main()
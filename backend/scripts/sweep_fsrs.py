@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Sweep FSRS parameter vectors × desired retentions over review_log.
+
+Loads non-acquisition reviews once into columnar arrays (alif_core.replay)
+and evaluates every (parameters, desired_retention) pair in parallel:
+log-loss and binned calibration RMSE of pre-review retrievability, plus the
+scheduler-intended interval distribution. Replaces hand-rolled py-fsrs loops
+for retention/parameter comparisons; 50k reviews × 100 sets runs in seconds.
+
+Usage:
+    python3 scripts/sweep_fsrs.py --db PATH
+    python3 scripts/sweep_fsrs.py --db PATH --retention 0.85 0.9 0.95 \\
+        --vectors candidates.json --perturb 50 --json out.json
+
+``--vectors`` is a JSON object ``{"name": [21 floats], ...}``. The installed
+library defaults and the production scheduler are always included.
+Read-only. Exploratory: do not deploy a winner without the rolling-origin
+validation in research/alif-learning-system-proposal-2026-07-25.md.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from alif_core import FsrsParams
+from alif_core.replay import INTERVAL_BUCKETS, ReviewColumns, perturbed_parameters, sweep
+from fsrs import Scheduler
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+DEFAULT_RETENTIONS = (0.85, 0.88, 0.90, 0.92, 0.94, 0.95, 0.96, 0.97)
+
+
+def _parse_ts(value: str) -> float:
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def load_review_columns(db_path: Path) -> ReviewColumns:
+    """Non-acquisition FSRS reviews as columns, one SELECT."""
+    conn = sqlite3.connect(f"file:{db_path.resolve()}?mode=ro&immutable=1", uri=True)
+    try:
+        rows = conn.execute(
+            """
+            SELECT lemma_id, rating, reviewed_at
+            FROM review_log
+            WHERE (is_acquisition = 0 OR is_acquisition IS NULL)
+              AND rating BETWEEN 1 AND 4
+              AND lemma_id IS NOT NULL
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+    return ReviewColumns.from_events(
+        [r[0] for r in rows], [r[1] for r in rows], [_parse_ts(r[2]) for r in rows]
+    )
+
+
+def build_param_sets(
+    vectors: dict[str, list[float]],
+    retentions: list[float],
+    *,
+    perturb: int = 0,
+    scale: float = 0.1,
+    seed: int = 0,
+) -> tuple[list[str], list[FsrsParams]]:
+    """Cartesian product of named vectors (plus perturbations of the first)
+    and retentions. Un-fuzzed so results are deterministic."""
+    named = dict(vectors)
+    if perturb:
+        base = next(iter(named.values()))
+        for i, w in enumerate(perturbed_parameters(base, perturb, scale=scale, seed=seed)):
+            named[f"perturb-{i:03d}"] = list(w)
+    labels, sets = [], []
+    for name, w in named.items():
+        for dr in retentions:
+            labels.append(name)
+            sets.append(FsrsParams(parameters=tuple(w), desired_retention=dr, enable_fuzzing=False))
+    return labels, sets
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--db", type=Path, default=Path("/tmp/claude/alif_fresh.db"))
+    ap.add_argument("--retention", type=float, nargs="+", default=list(DEFAULT_RETENTIONS))
+    ap.add_argument("--vectors", type=Path, help="JSON {name: [21 weights]}")
+    ap.add_argument("--perturb", type=int, default=0, help="random vectors around the first one")
+    ap.add_argument("--scale", type=float, default=0.1, help="log-normal perturbation sigma")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--json", type=Path, help="write every result here")
+    args = ap.parse_args(argv)
+
+    if not args.db.exists():
+        raise SystemExit(f"DB not found: {args.db}")
+
+    from app.services.fsrs_service import scheduler as production
+
+    vectors = {
+        "production": list(production.parameters),
+        "library-default": list(Scheduler().parameters),
+    }
+    if args.vectors:
+        vectors.update(json.loads(args.vectors.read_text()))
+
+    started = time.perf_counter()
+    cols = load_review_columns(args.db)
+    loaded = time.perf_counter()
+    labels, sets = build_param_sets(
+        vectors, args.retention, perturb=args.perturb, scale=args.scale, seed=args.seed
+    )
+    results = sweep(cols, sets, workers=args.workers)
+    finished = time.perf_counter()
+    for label, result in zip(labels, results):
+        result["name"] = label
+
+    print(
+        f"{len(cols)} reviews / {cols.n_cards} lemmas loaded in {loaded - started:.2f}s; "
+        f"{len(sets)} parameter sets evaluated in {finished - loaded:.2f}s"
+    )
+    # Predictions don't depend on retention; rank vectors by fit once each.
+    ranked = sorted(
+        {r["name"]: r for r in results if r["log_loss"] is not None}.values(),
+        key=lambda r: r["log_loss"],
+    )
+    print(f"\n{'vector':<18}{'log-loss':>10}{'RMSE(bins)':>12}{'pred':>8}{'obs':>8}")
+    print("-" * 56)
+    for r in ranked[: args.top]:
+        print(
+            f"{r['name']:<18}{r['log_loss']:>10.4f}{r['rmse_bins']:>12.4f}"
+            f"{r['mean_predicted']:>8.3f}{r['observed_recall']:>8.3f}"
+        )
+
+    print("\n== Intended-interval distribution, production vector ==")
+    header = "".join(f"{label:>9}" for label, _, _ in INTERVAL_BUCKETS)
+    print(f"{'retention':<10}{header}{'median':>9}")
+    for r in results:
+        if r["name"] != "production":
+            continue
+        counts = "".join(f"{r['interval_distribution'][label]:>9}" for label, _, _ in INTERVAL_BUCKETS)
+        print(f"{r['desired_retention']:<10.2f}{counts}{r['median_interval_days']:>9.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+        print(f"\nWrote {len(results)} results to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -915,6 +915,8 @@ def step_backfill_sentences(
             validate_multi_target_sentences_batch,
             write_multi_target_sentence,
         )
+        from app.services.sentence_fingerprint import shared_index, stored_duplicate_exists
+
         groups = group_words_for_multi_target(words_needing)
         if backoff_recovery_words:
             groups = _augment_groups_with_recovery(groups, backoff_recovery_words)
@@ -967,10 +969,14 @@ def step_backfill_sentences(
         )
 
         # Phase 1c: write validated sentences (pure DB, milliseconds).
+        pool = shared_index()
         for mres, mappings in validated:
             if total >= budget:
                 break
-            sent = write_multi_target_sentence(db, mres, mappings)
+            if stored_duplicate_exists(db, mres.arabic) or not pool.claim(mres.arabic):
+                print("    ✗ Multi-target sentence near-duplicates the pool, skipped")
+                continue
+            write_multi_target_sentence(db, mres, mappings)
             total += 1
             words_processed += 1
             for lid in mres.target_lemma_ids:
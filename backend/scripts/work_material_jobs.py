@@ -4,9 +4,15 @@
 RETIRED from the production cron 2026-06-16 (no longer invoked by
 deploy/alif-update-material.sh). See plan_material_jobs.py and
 research/experiment-log.md 2026-06-16. Kept dormant/reusable.
+
+Jobs run concurrently through MaterialJobExecutor
+(app/services/material_job_executor.py): per-kind pools
+(--concurrency sentence_shard=N, default 3), round-robin leasing across kinds, short
+leases extended by a heartbeat, and a per-kind throughput/latency report.
 """
 
 import argparse
+import json
 import os
 import socket
 import sys
@@ -24,9 +30,10 @@ from app.services.material_generator import (
     _release_material_update_lock,
     _try_acquire_material_update_lock,
 )
+from app.services.material_job_executor import MaterialJobExecutor
 from app.services.material_job_planner import KIND_SENTENCE_SHARD
-from app.services.material_job_worker import process_material_job
-from app.services.material_jobs import STATUS_QUEUED, lease_material_jobs_locked
+from app.services.material_job_worker import DEFAULT_KIND_CONCURRENCY, default_pools
+from app.services.material_jobs import STATUS_QUEUED
 
 
 def _env_int(name: str, default: int) -> int:
@@ -56,14 +63,36 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--max-jobs",
         type=int,
-        default=_env_int("ALIF_MATERIAL_WORKER_MAX_JOBS", 1),
-        help="Maximum jobs to lease and execute in this process",
+        default=_env_int("ALIF_MATERIAL_WORKER_MAX_JOBS", 0),
+        help="Maximum jobs to lease in this process (0 = drain the queue)",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=_env_int("ALIF_MATERIAL_WORKER_MAX_SECONDS", 0) or None,
+        help="Stop leasing after this many seconds (in-flight jobs still finish)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        action="append",
+        default=[],
+        metavar="KIND=N",
+        help=(
+            "Concurrent jobs for one kind (repeatable). Defaults: "
+            + ", ".join(f"{k}={v}" for k, v in DEFAULT_KIND_CONCURRENCY.items())
+        ),
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=_env_int("ALIF_MATERIAL_WORKER_MAX_WORKERS", 0) or None,
+        help="Global cap on concurrent jobs across kinds (default: sum of per-kind limits)",
     )
     parser.add_argument(
         "--lease-seconds",
         type=int,
-        default=_env_int("ALIF_MATERIAL_JOB_LEASE_SECONDS", 1800),
-        help="Lease duration before another worker may reclaim the job",
+        default=_env_int("ALIF_MATERIAL_JOB_LEASE_SECONDS", 300),
+        help="Lease duration; extended by a heartbeat every third of it while the job runs",
     )
     parser.add_argument(
         "--retry-delay-seconds",
@@ -73,6 +102,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--model", default=os.environ.get("ALIF_MATERIAL_MODEL", "claude_sonnet"))
     parser.add_argument("--worker-id", default=None)
+    parser.add_argument("--json", action="store_true", help="Print the metrics report as JSON")
     parser.add_argument(
         "--no-lock",
         action="store_true",
@@ -94,6 +124,17 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _parse_concurrency(values: list[str]) -> dict[str, int]:
+    limits = {}
+    for value in values:
+        kind, _, count = value.partition("=")
+        try:
+            limits[kind.strip()] = int(count)
+        except ValueError:
+            raise SystemExit(f"--concurrency expects KIND=N, got {value!r}") from None
+    return limits
+
+
 def _default_worker_id() -> str:
     return f"{socket.gethostname()}:{os.getpid()}"
 
@@ -113,7 +154,7 @@ def main() -> int:
                     MaterialJob.status == STATUS_QUEUED,
                 )
                 .order_by(MaterialJob.priority.asc(), MaterialJob.created_at.asc())
-                .limit(max(1, args.max_jobs))
+                .limit(args.max_jobs or 50)
                 .all()
             )
             print(f"Queued sentence shard jobs: {len(jobs)}")
@@ -137,35 +178,36 @@ def main() -> int:
                 print("Another material update is active; skipping material job worker.")
                 return 0
 
-        processed = 0
-        while processed < max(0, args.max_jobs):
-            jobs = lease_material_jobs_locked(
-                db,
-                worker_id=worker_id,
-                kinds=[KIND_SENTENCE_SHARD],
-                limit=1,
-                lease_seconds=args.lease_seconds,
-            )
-            if not jobs:
-                if processed == 0:
-                    print("No queued material jobs.")
-                break
-            job = jobs[0]
-            payload = job.payload_json or {}
-            print(
-                f"  Running job={job.id} priority={job.priority} "
-                f"lemmas={payload.get('lemma_ids') or []}"
-            )
-            updated = process_material_job(
-                db,
-                job,
+        executor = MaterialJobExecutor(
+            default_pools(
                 model=args.model,
                 retry_delay_seconds=args.retry_delay_seconds,
-            )
-            print(f"    status={updated.status} result={updated.result_json or {}}")
-            processed += 1
-        if processed:
-            print(f"Processed {processed} material job(s) as {worker_id}")
+                concurrency=_parse_concurrency(args.concurrency),
+            ),
+            worker_id=worker_id,
+            max_workers=args.max_workers,
+            lease_seconds=args.lease_seconds,
+        )
+        report = executor.run(max_jobs=args.max_jobs or None, max_seconds=args.max_seconds)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            leased = sum(k["leased"] for k in report["kinds"].values())
+            if not leased:
+                print("No queued material jobs.")
+            for kind, stats in report["kinds"].items():
+                if not stats["leased"]:
+                    continue
+                print(
+                    f"  {kind}: leased={stats['leased']} done={stats['done']} "
+                    f"requeued={stats['requeued']} failed={stats['failed']} "
+                    f"errors={stats['errors']} lost_leases={stats['lost_leases']} "
+                    f"wait p50/p95={stats['wait_p50_s']}/{stats['wait_p95_s']}s "
+                    f"run p50/p95={stats['run_p50_s']}/{stats['run_p95_s']}s "
+                    f"({stats['jobs_per_hour']} jobs/h)"
+                )
+            if leased:
+                print(f"Processed {leased} material job(s) as {worker_id} in {report['elapsed_s']}s")
         return 0
     finally:
         db.close()
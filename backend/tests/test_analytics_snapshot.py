@@ -0,0 +1,87 @@
+"""Tests for the snapshot-backed deep-analytics endpoint."""
+
+from datetime import datetime, timedelta, timezone
+
+from app import clock
+from app.models import AnalyticsSnapshot, Lemma, ReviewLog, Root, UserLemmaKnowledge
+from app.routers.stats import DEEP_ANALYTICS_SECTIONS
+from app.services.analytics_snapshot import read_snapshot, refresh_sections
+from tests.conftest import count_queries
+
+# Mid-hour, so no clock bucket rolls over during a test.
+_NOW = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+
+
+def _seed(db):
+    db.add(Root(root_id=1, root="ك.ت.ب", core_meaning_en="writing"))
+    for lemma_id in (1, 2):
+        db.add(Lemma(lemma_id=lemma_id, lemma_ar=f"w{lemma_id}", lemma_ar_bare=f"w{lemma_id}",
+                     pos="noun", gloss_en=f"word {lemma_id}", root_id=1))
+    db.add(UserLemmaKnowledge(lemma_id=1, knowledge_state="known", times_seen=4, times_correct=3))
+    db.commit()
+
+
+def _review(db, rating=3):
+    db.add(ReviewLog(lemma_id=1, rating=rating, reviewed_at=_NOW - timedelta(minutes=5)))
+    db.commit()
+
+
+class TestPartialRefresh:
+    def test_only_sections_reading_changed_tables_recompute(self, db_session):
+        _seed(db_session)
+        with clock.frozen_at(_NOW):
+            read_snapshot(db_session, DEEP_ANALYTICS_SECTIONS)
+            assert refresh_sections(db_session, DEEP_ANALYTICS_SECTIONS) == []
+
+            _review(db_session)
+            refreshed = set(refresh_sections(db_session, DEEP_ANALYTICS_SECTIONS))
+
+        assert {"retention_7d", "transitions_today", "insights"} <= refreshed
+        assert not refreshed & {
+            "root_coverage", "struggling_words", "stability_distribution",
+            "comprehension_7d", "recent_sessions", "book_coverage",
+        }
+
+    def test_clock_bucket_expires_windowed_sections(self, db_session):
+        _seed(db_session)
+        with clock.frozen_at(_NOW):
+            read_snapshot(db_session, DEEP_ANALYTICS_SECTIONS)
+        with clock.frozen_at(_NOW + timedelta(hours=1)):
+            stale = set(read_snapshot(db_session, DEEP_ANALYTICS_SECTIONS).stale)
+
+        assert "retention_30d" in stale
+        assert "root_coverage" not in stale
+
+
+class TestEndpoint:
+    def test_serves_snapshot_until_refreshed(self, client, db_session):
+        _seed(db_session)
+        with clock.frozen_at(_NOW):
+            first = client.get("/api/stats/deep-analytics").json()
+            assert first["retention_7d"]["total_reviews"] == 0
+            assert first["stale_sections"] == []
+            assert first["snapshot_computed_at"]
+
+            _review(db_session)
+            with count_queries(db_session) as queries:
+                stale = client.get("/api/stats/deep-analytics").json()
+            assert stale["retention_7d"]["total_reviews"] == 0
+            assert "retention_7d" in stale["stale_sections"]
+
+            refresh_sections(db_session, DEEP_ANALYTICS_SECTIONS)
+            fresh = client.get("/api/stats/deep-analytics").json()
+
+        assert queries["count"] <= 3
+        assert fresh["retention_7d"]["total_reviews"] == 1
+        assert fresh["stale_sections"] == []
+
+    def test_reshaped_payload_is_recomputed(self, client, db_session):
+        _seed(db_session)
+        client.get("/api/stats/deep-analytics")
+        db_session.get(AnalyticsSnapshot, "root_coverage").payload = {"old": "shape"}
+        db_session.commit()
+
+        resp = client.get("/api/stats/deep-analytics")
+
+        assert resp.status_code == 200
+        assert resp.json()["root_coverage"]["total_roots"] == 1
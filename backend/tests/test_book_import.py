@@ -421,6 +421,133 @@ class TestImportBookEndToEnd:
         mock_cover.assert_not_called()
 
 
+class TestStreamedBookImport:
+    PAGES = {
+        b"p1": "ذَهَبَ الوَلَدُ.",
+        b"p2": "ذَهَبَ الوَلَدُ إِلَى البَيْتِ.",
+        b"p3": "الوَلَدُ فِي البَيْتِ.",
+    }
+
+    def _patches(self, fail_on_page=None):
+        def ocr(chunk):
+            if fail_on_page in chunk:
+                raise RuntimeError("OCR provider down")
+            return [self.PAGES[page] for page in chunk]
+
+        return [
+            patch("app.services.book_import_service.extract_cover_metadata",
+                  return_value={"title_ar": "الوَلَد"}),
+            patch("app.services.book_import_service.ocr_pages_parallel", side_effect=ocr),
+            patch("app.services.book_import_service.cleanup_and_segment",
+                  side_effect=lambda text: [{"arabic": text}]),
+            patch("app.services.book_import_service.translate_sentences",
+                  side_effect=lambda sents: [{**s, "english": "en"} for s in sents]),
+            patch("app.services.book_import_service._import_unknown_words", return_value=[]),
+            patch("app.services.sentence_validator.verify_and_correct_mappings_llm",
+                  return_value=[]),
+        ]
+
+    def _run(self, db, fail_on_page=None, **kwargs):
+        from contextlib import ExitStack
+
+        from app.services.book_import_service import import_book
+
+        with ExitStack() as stack:
+            for p in self._patches(fail_on_page):
+                stack.enter_context(p)
+            return import_book(db, b"cover", list(self.PAGES), chunk_pages=1, **kwargs)
+
+    def test_chunks_match_single_pass_numbering(self, db_session):
+        _create_lemma(db_session, "ذَهَبَ", "ذهب", "go", "verb", 50, "ذ.ه.ب")
+        _create_lemma(db_session, "وَلَد", "ولد", "boy", "noun", 80, "و.ل.د")
+        db_session.commit()
+
+        story, _ = self._run(db_session)
+
+        assert story.status == "active"
+        assert "import_cursor" not in (story.metadata_json or {})
+        assert story.body_ar == ". ".join(self.PAGES.values())
+        words = db_session.query(StoryWord).filter_by(story_id=story.id).order_by(StoryWord.position).all()
+        assert [w.position for w in words] == list(range(len(words)))
+        assert [w.sentence_index for w in words] == [0, 0, 1, 1, 1, 1, 2, 2, 2]
+        assert [w.page_number for w in words] == [1, 1, 2, 2, 2, 2, 3, 3, 3]
+        pages = [s.page_number for s in db_session.query(Sentence).filter_by(story_id=story.id)]
+        assert sorted(pages) == [1, 2, 3]
+
+    def test_interrupted_import_resumes_from_cursor(self, db_session):
+        with pytest.raises(RuntimeError):
+            self._run(db_session, fail_on_page=b"p3")
+
+        db_session.rollback()
+        story = db_session.query(Story).filter_by(source="book_ocr").one()
+        assert story.status == "generating"
+        assert story.metadata_json["import_cursor"]["pages_done"] == 2
+
+        resumed, _ = self._run(db_session, resume_story_id=story.id)
+
+        assert resumed.id == story.id and resumed.status == "active"
+        words = db_session.query(StoryWord).filter_by(story_id=story.id).order_by(StoryWord.position).all()
+        assert [w.position for w in words] == list(range(9))
+        assert words[-1].page_number == 3
+        assert db_session.query(Sentence).filter_by(story_id=story.id).count() == 3
+
+    def test_resume_after_sentences_committed_keeps_text_and_lemmas(self, db_session):
+        from contextlib import ExitStack
+
+        from app.services import book_import_service
+        from app.services.book_import_service import import_book
+
+        real_create = book_import_service.create_book_sentences
+        crashed = []
+
+        def unknown_words(db, story, lemma_lookup, story_words=None):
+            if crashed or not any(w.page_number == 3 for w in story_words):
+                return []
+            lemma = Lemma(lemma_ar="بَيْت", lemma_ar_bare="بيت", gloss_en="house",
+                          source="story_import", source_story_id=story.id)
+            db.add(lemma)
+            db.commit()
+            return [lemma.lemma_id]
+
+        def create_then_crash(db, story, sentences, *args, **kwargs):
+            created = real_create(db, story, sentences, *args, **kwargs)
+            if sentences[0]["page_number"] == 3 and not crashed:
+                crashed.append(True)
+                raise RuntimeError("worker killed")
+            return created
+
+        def run(**kwargs):
+            with ExitStack() as stack:
+                for p in self._patches():
+                    stack.enter_context(p)
+                stack.enter_context(patch.object(
+                    book_import_service, "_import_unknown_words", side_effect=unknown_words))
+                stack.enter_context(patch.object(
+                    book_import_service, "create_book_sentences", side_effect=create_then_crash))
+                return import_book(db_session, b"cover", list(self.PAGES), chunk_pages=1, **kwargs)
+
+        with pytest.raises(RuntimeError):
+            run()
+        db_session.rollback()
+        story = db_session.query(Story).filter_by(source="book_ocr").one()
+        assert story.body_ar == ". ".join(list(self.PAGES.values())[:2])
+        house = db_session.query(Lemma).filter_by(lemma_ar_bare="بيت").one()
+
+        resumed, new_ids = run(resume_story_id=story.id)
+
+        assert resumed.body_ar == ". ".join(self.PAGES.values())
+        assert new_ids == [house.lemma_id]
+        assert house.source == "book"
+        assert db_session.query(Sentence).filter_by(
+            story_id=story.id, is_active=True
+        ).count() == 3
+
+    def test_resume_rejects_finished_story(self, db_session):
+        story, _ = self._run(db_session)
+        with pytest.raises(ValueError, match="not a resumable"):
+            self._run(db_session, resume_story_id=story.id)
+
+
 class TestBookSentenceSourceBonus:
     def test_book_sentences_get_higher_score(self):
         """Verify that book-sourced sentences get a 1.3x scoring bonus."""
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("alif_core")
+
+import numpy as np  # noqa: E402
+from fsrs import Card, Rating, Scheduler  # noqa: E402
+
+from app.models import Lemma, UserLemmaKnowledge  # noqa: E402
+from app.services import card_store  # noqa: E402
+from app.services.fsrs_service import scheduler, submit_review  # noqa: E402
+
+
+def _seed(db, n):
+    lemmas = [Lemma(lemma_ar=f"كلمة{i}", lemma_ar_bare=f"كلمة{i}", gloss_en=f"w{i}") for i in range(n)]
+    db.add_all(lemmas)
+    db.flush()
+    for lemma in lemmas:
+        db.add(UserLemmaKnowledge(
+            lemma_id=lemma.lemma_id, knowledge_state="learning",
+            fsrs_card_json=Card().to_dict(), source="study",
+        ))
+    db.commit()
+    return [l.lemma_id for l in lemmas]
+
+
+def test_params_follow_fsrs_service_scheduler():
+    assert card_store.FSRS_PARAMS.desired_retention == scheduler.desired_retention
+    assert card_store.FSRS_PARAMS.parameters == tuple(scheduler.parameters)
+    assert card_store.ASSISTED_LAPSE_PARAMS.relearning_steps == ()
+
+
+def test_round_trip_preserves_submit_review_cards(db_session):
+    lemma_ids = _seed(db_session, 3)
+    for lid in lemma_ids:
+        submit_review(db_session, lid, rating_int=3)
+    before = {
+        k.lemma_id: dict(k.fsrs_card_json)
+        for k in db_session.query(UserLemmaKnowledge).all()
+    }
+
+    store = card_store.load(db_session)
+    card_store.write(db_session, store)
+    db_session.commit()
+
+    after = {
+        k.lemma_id: Card.from_dict(k.fsrs_card_json).to_dict()
+        for k in db_session.query(UserLemmaKnowledge).all()
+    }
+    assert after == {lid: Card.from_dict(c).to_dict() for lid, c in before.items()}
+
+
+def test_batch_apply_matches_unfuzzed_scheduler(db_session):
+    lemma_ids = _seed(db_session, 5)
+    at = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    ratings = [1, 2, 3, 4, 3]
+
+    store = card_store.load(db_session)
+    store.apply_reviews(card_store.FSRS_PARAMS, store.index_of(lemma_ids), np.array(ratings), at.timestamp())
+    card_store.write(db_session, store)
+    db_session.commit()
+
+    reference = Scheduler(parameters=scheduler.parameters, desired_retention=0.95, enable_fuzzing=False)
+    for lid, rating in zip(lemma_ids, ratings):
+        expected, _ = reference.review_card(Card(), Rating(rating), review_datetime=at)
+        ulk = db_session.query(UserLemmaKnowledge).filter_by(lemma_id=lid).one()
+        got = Card.from_dict(ulk.fsrs_card_json)
+        assert got.state == expected.state
+        assert got.stability == pytest.approx(expected.stability)
+        assert abs(got.due - expected.due) < timedelta(seconds=1)
@@ -1,5 +1,6 @@
 """Tests for AI chat endpoints."""
 
+import json
 from unittest.mock import patch
 
 from app.models import ChatMessage
@@ -115,6 +116,96 @@ class TestAskQuestion:
             assert "Sentence: الولد يقرأ كتابًا" in prompt
 
 
+def _stub_stream(tokens, fail_after=None, prompts=None):
+    """Stand-in for stream_completion: an async generator over ``tokens``."""
+    async def stream(prompt, **kwargs):
+        if prompts is not None:
+            prompts.append(prompt)
+        for i, token in enumerate(tokens):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("provider dropped the stream")
+            yield token
+    return stream
+
+
+def _sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestAskQuestionStream:
+    def test_streams_tokens_and_persists_once(self, client, db_session):
+        with patch("app.routers.chat.stream_completion",
+                   _stub_stream(["The word ", "kitāb ", "means book."])):
+            resp = client.post("/api/chat/ask/stream", json={
+                "question": "What does kitab mean?",
+                "context": "Reviewing word: كتاب (book)",
+                "screen": "review",
+            })
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _sse_events(resp.text)
+        assert [name for name, _ in events] == ["start", "token", "token", "token", "done"]
+        conv_id = events[0][1]["conversation_id"]
+        assert "".join(data["text"] for name, data in events if name == "token") == (
+            "The word kitāb means book."
+        )
+        assert events[-1][1] == {
+            "conversation_id": conv_id,
+            "answer": "The word kitāb means book.",
+        }
+
+        msgs = db_session.query(ChatMessage).filter(
+            ChatMessage.conversation_id == conv_id
+        ).order_by(ChatMessage.created_at.asc()).all()
+        assert [(m.role, m.content) for m in msgs] == [
+            ("user", "What does kitab mean?"),
+            ("assistant", "The word kitāb means book."),
+        ]
+        assert msgs[0].context_summary == "Reviewing word: كتاب (book)"
+
+    def test_stream_continues_existing_conversation(self, client, db_session):
+        with patch("app.routers.chat.generate_completion") as mock_llm:
+            mock_llm.return_value = {"content": "Answer 1"}
+            conv_id = client.post("/api/chat/ask", json={
+                "question": "What is a root?",
+                "screen": "learn",
+            }).json()["conversation_id"]
+
+        prompts = []
+        with patch("app.routers.chat.stream_completion",
+                   _stub_stream(["Answer 2"], prompts=prompts)):
+            resp = client.post("/api/chat/ask/stream", json={
+                "question": "Give me an example",
+                "conversation_id": conv_id,
+                "screen": "learn",
+            })
+
+        assert _sse_events(resp.text)[0][1]["conversation_id"] == conv_id
+        assert "What is a root?" in prompts[0]
+        assert "Answer 1" in prompts[0]
+        assert db_session.query(ChatMessage).filter(
+            ChatMessage.conversation_id == conv_id
+        ).count() == 4
+
+    def test_failed_stream_reports_error_and_persists_nothing(self, client, db_session):
+        with patch("app.routers.chat.stream_completion",
+                   _stub_stream(["partial ", "answer"], fail_after=1)):
+            resp = client.post("/api/chat/ask/stream", json={
+                "question": "Will this fail?",
+                "screen": "review",
+            })
+
+        events = _sse_events(resp.text)
+        assert [name for name, _ in events] == ["start", "token", "error"]
+        assert "dropped" in events[-1][1]["detail"]
+        assert db_session.query(ChatMessage).count() == 0
+
+
 class TestListConversations:
     def test_returns_conversations(self, client, db_session):
         with patch("app.routers.chat.generate_completion") as mock_llm:
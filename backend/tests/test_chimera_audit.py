@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import pytest
 
-from app.models import ActivityLog, Lemma
+from app.models import ActivityLog, ChimeraAuditResult, Lemma, Root
+from app.services import chimera_audit
 from app.services.chimera_audit import (
     ChimeraCandidate,
     check_and_alert,
@@ -145,3 +146,114 @@ def test_check_and_alert_returns_candidates(db_session):
     db_session.commit()
     cands = check_and_alert(db_session)
     assert any(c.lemma_id == lem.lemma_id for c in cands)
+
+
+def _count_structural_calls(monkeypatch):
+    calls = {"count": 0}
+    original = chimera_audit._structural_finding
+
+    def wrapper(*args, **kwargs):
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(chimera_audit, "_structural_finding", wrapper)
+    return calls
+
+
+def test_unchanged_lemmas_are_not_reaudited(db_session, monkeypatch):
+    flagged = Lemma(lemma_ar="تَشَجَّعَ", lemma_ar_bare="شجع", gloss_en="x", pos="verb")
+    clean = Lemma(lemma_ar="كَتَبَ", lemma_ar_bare="كتب", gloss_en="to write", pos="verb")
+    db_session.add_all([flagged, clean])
+    db_session.commit()
+    calls = _count_structural_calls(monkeypatch)
+
+    first = find_chimera_candidates(db_session)
+    assert calls["count"] == 2
+    second = find_chimera_candidates(db_session)
+    assert calls["count"] == 2
+    assert second == first
+
+    # A gloss edit is not a D1..D5 input; a bare fix is.
+    clean.gloss_en = "to write down"
+    flagged.lemma_ar_bare = "تشجع"
+    db_session.commit()
+    third = find_chimera_candidates(db_session)
+    assert calls["count"] == 3
+    assert not any(c.lemma_id == flagged.lemma_id for c in third)
+
+
+def test_variant_and_deleted_lemmas_are_pruned(db_session):
+    canonical = Lemma(lemma_ar="غَازٍ", lemma_ar_bare="غاز", gloss_en="raider")
+    other = Lemma(lemma_ar="اِنْكَسَرَ", lemma_ar_bare="كسر", gloss_en="x", pos="verb")
+    db_session.add_all([canonical, other])
+    db_session.commit()
+    assert len(find_chimera_candidates(db_session)) == 2
+
+    canonical.canonical_lemma_id = other.lemma_id
+    db_session.commit()
+    assert [c.lemma_id for c in find_chimera_candidates(db_session)] == [other.lemma_id]
+    assert db_session.query(ChimeraAuditResult).count() == 1
+
+
+def test_read_only_scan_matches_stored_findings_without_writing(db_session):
+    flagged = Lemma(lemma_ar="تَشَجَّعَ", lemma_ar_bare="شجع", gloss_en="x", pos="verb")
+    clean = Lemma(lemma_ar="كَتَبَ", lemma_ar_bare="كتب", gloss_en="to write", pos="verb")
+    db_session.add_all([flagged, clean])
+    db_session.commit()
+
+    dry = find_chimera_candidates(db_session, persist=False)
+    assert db_session.query(ChimeraAuditResult).count() == 0
+    assert dry == find_chimera_candidates(db_session)
+
+
+def test_d6_verdicts_are_stored_and_rechecked_on_change(db_session, monkeypatch):
+    from app.services import lemma_enrichment
+
+    db_session.add(Root(root_id=1, root="ت.و.ب"))
+    lem = Lemma(
+        lemma_ar="تَوْب", lemma_ar_bare="توب", gloss_en="repentance", root_id=1,
+        etymology_json={"derivation": "From English 'laptop' (portable computer)"},
+    )
+    db_session.add(lem)
+    db_session.commit()
+    monkeypatch.setattr(chimera_audit, "_read_etym_checkpoint", lambda: 0)
+    checked: list[list[int]] = []
+
+    def fake_verify(candidates, _roots):
+        checked.append([l.lemma_id for l, _ in candidates])
+        return {l.lemma_id for l, _ in candidates}
+
+    monkeypatch.setattr(lemma_enrichment, "verify_etymology_coherence_batch", fake_verify)
+
+    first = check_and_alert(db_session)
+    second = check_and_alert(db_session)
+    assert checked == [[lem.lemma_id]]
+    assert [c.category for c in first] == [c.category for c in second] == ["D6"]
+
+    lem.etymology_json = {"derivation": "From English 'tablet'"}
+    db_session.commit()
+    check_and_alert(db_session)
+    assert checked == [[lem.lemma_id], [lem.lemma_id]]
+
+
+def test_d6_llm_failure_is_retried(db_session, monkeypatch):
+    from app.services import lemma_enrichment
+
+    db_session.add(Root(root_id=1, root="ت.و.ب"))
+    lem = Lemma(
+        lemma_ar="تَوْب", lemma_ar_bare="توب", gloss_en="repentance", root_id=1,
+        etymology_json={"derivation": "From English 'laptop'"},
+    )
+    db_session.add(lem)
+    db_session.commit()
+    monkeypatch.setattr(chimera_audit, "_read_etym_checkpoint", lambda: 0)
+    results = iter([None, set()])
+    monkeypatch.setattr(
+        lemma_enrichment, "verify_etymology_coherence_batch",
+        lambda candidates, _roots: next(results),
+    )
+
+    check_and_alert(db_session)
+    assert db_session.get(ChimeraAuditResult, lem.lemma_id).etymology_hash is None
+    assert check_and_alert(db_session) == []
+    assert db_session.get(ChimeraAuditResult, lem.lemma_id).etymology_hash is not None
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+
+from app import clock
+
+
+def test_frozen_at_pins_and_restores():
+    at = datetime(2026, 3, 1, 9, 30)
+    before = clock.now()
+    with clock.frozen_at(at):
+        assert clock.now() == at.replace(tzinfo=timezone.utc)
+        assert clock.utcnow() == at
+        with clock.frozen_at(at + timedelta(hours=1)):
+            assert clock.utcnow() == at + timedelta(hours=1)
+        assert clock.utcnow() == at
+    assert clock.now() - before < timedelta(minutes=1)
+
+
+def test_honors_at_only_when_given():
+    @clock.honors_at
+    def stamp(at=None):
+        return clock.now()
+
+    at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    assert stamp(at=at) == at
+    assert stamp() != at
+
+
+def test_honors_positional_at():
+    @clock.honors_at
+    def stamp(db, at=None):
+        return clock.now()
+
+    at = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    assert stamp(None, at) == at
+    assert stamp(None) != at
@@ -19,10 +19,12 @@ from app.services.grammar_service import (
     seed_grammar_features,
     get_all_features,
     get_user_progress,
+    get_grammar_state,
     get_unlocked_features,
     record_grammar_exposure,
     grammar_pattern_score,
 )
+from tests.conftest import count_queries
 
 
 class TestComputeComfort:
@@ -218,6 +220,54 @@ class TestGrammarPatternScore:
         assert after < before
 
 
+class TestGrammarState:
+    def _known_words(self, db, n):
+        root = Root(root="ك.ت.ب", core_meaning_en="writing")
+        db.add(root)
+        db.flush()
+        for i in range(n):
+            lemma = Lemma(
+                lemma_ar=f"s{i}", lemma_ar_bare=f"s{i}",
+                root_id=root.root_id, pos="noun", gloss_en=f"s {i}",
+            )
+            db.add(lemma)
+            db.flush()
+            db.add(UserLemmaKnowledge(lemma_id=lemma.lemma_id, knowledge_state="learning"))
+        db.commit()
+
+    def test_scoring_from_snapshot_runs_no_sql(self, db_session):
+        seed_grammar_features(db_session)
+        record_grammar_exposure(db_session, "singular", correct=True)
+        state = get_grammar_state(db_session)
+
+        with count_queries(db_session) as counter:
+            scores = [state.pattern_score(["singular", "present"]) for _ in range(200)]
+
+        assert counter["count"] == 0
+        assert scores[0] == grammar_pattern_score(db_session, ["singular", "present"])
+
+    def test_snapshot_reused_until_knowledge_changes(self, db_session):
+        seed_grammar_features(db_session)
+        first = get_grammar_state(db_session)
+        assert get_grammar_state(db_session) is first
+        assert "feminine" not in first.unlocked
+
+        self._known_words(db_session, 10)
+        after = get_grammar_state(db_session)
+        assert after is not first
+        assert after.total_words == 10
+        assert "feminine" in after.unlocked
+
+    def test_exposure_write_invalidates_snapshot(self, db_session):
+        seed_grammar_features(db_session)
+        before = get_grammar_state(db_session)
+        record_grammar_exposure(db_session, "present", correct=True)
+
+        after = get_grammar_state(db_session)
+        assert "present" not in before.comfort
+        assert after.comfort["present"] > 0
+
+
 class TestExpandedGrammarFeatures:
     def test_all_tier_features_exist_in_seed(self, db_session):
         seed_keys = {key for _, key, _, _, _, _ in SEED_FEATURES}
@@ -548,3 +548,190 @@ class TestBulkSyncEndpoint:
         ) == 2
         db_session.refresh(retry_story)
         assert retry_story.status == "completed"
+
+
+class TestBatchedSync:
+    """`/sync` applies sentence reviews through submit_sentence_reviews_batch."""
+
+    def _review(self, cid, sentence_id, lemma_id, signal="understood", created_at=None):
+        item = {
+            "type": "sentence",
+            "client_review_id": cid,
+            "payload": {
+                "sentence_id": sentence_id,
+                "primary_lemma_id": lemma_id,
+                "comprehension_signal": signal,
+                "session_id": "batch-sess",
+            },
+        }
+        if created_at:
+            item["created_at"] = created_at
+        return item
+
+    def test_batch_matches_sequential_application(self, client, db_session):
+        from tests.conftest import count_commits
+
+        _seed_word(db_session, 1, "كتاب", "book")
+        _seed_word(db_session, 2, "ولد", "boy")
+        _seed_sentence(db_session, 1, "الكتاب", "the book", target_lemma_id=1, word_ids=[1])
+        _seed_sentence(db_session, 2, "الولد", "the boy", target_lemma_id=2, word_ids=[2])
+        db_session.commit()
+        signals = ["understood", "no_idea", "understood"] * 10
+
+        for n, signal in enumerate(signals):
+            submit_sentence_review(
+                db_session, sentence_id=1, primary_lemma_id=1,
+                comprehension_signal=signal, client_review_id=f"seq-{n}",
+            )
+        with count_commits(db_session) as commits:
+            resp = client.post("/api/review/sync", json={"reviews": [
+                self._review(f"bat-{n}", 2, 2, signal) for n, signal in enumerate(signals)
+            ]})
+
+        assert [r["status"] for r in resp.json()["results"]] == ["ok"] * len(signals)
+        # 30 reviews in chunks of 25, not one commit per review.
+        assert commits["count"] <= 4
+        db_session.expire_all()
+        seq, bat = (
+            db_session.query(UserLemmaKnowledge).filter_by(lemma_id=lid).one()
+            for lid in (1, 2)
+        )
+        assert (bat.times_seen, bat.times_correct, bat.knowledge_state) == (
+            seq.times_seen, seq.times_correct, seq.knowledge_state,
+        )
+        assert db_session.query(SentenceReviewLog).filter_by(sentence_id=2).count() == len(signals)
+
+    def test_in_batch_and_stored_duplicates(self, client, db_session):
+        _seed_word(db_session, 1, "كتاب", "book")
+        _seed_sentence(db_session, 1, "الكتاب", "the book", target_lemma_id=1, word_ids=[1])
+        db_session.commit()
+        submit_sentence_review(
+            db_session, sentence_id=1, primary_lemma_id=1,
+            comprehension_signal="understood", client_review_id="dup-stored",
+        )
+
+        resp = client.post("/api/review/sync", json={"reviews": [
+            self._review("dup-stored", 1, 1),
+            self._review("dup-new", 1, 1),
+            self._review("dup-new", 1, 1),
+        ]})
+
+        assert [r["status"] for r in resp.json()["results"]] == ["duplicate", "ok", "duplicate"]
+        assert db_session.query(SentenceReviewLog).count() == 2
+
+    def test_applies_in_client_timestamp_order(self, client, db_session):
+        _seed_word(db_session, 1, "كتاب", "book")
+        _seed_sentence(db_session, 1, "الكتاب", "the book", target_lemma_id=1, word_ids=[1])
+        db_session.commit()
+
+        resp = client.post("/api/review/sync", json={"reviews": [
+            self._review("late", 1, 1, created_at="2026-10-01T10:05:00Z"),
+            self._review("early", 1, 1, created_at="2026-10-01T10:00:00Z"),
+        ]})
+
+        assert [r["client_review_id"] for r in resp.json()["results"]] == ["late", "early"]
+        applied = [
+            log.client_review_id
+            for log in db_session.query(SentenceReviewLog).order_by(SentenceReviewLog.id)
+        ]
+        assert applied == ["early", "late"]
+
+    def test_failing_review_does_not_sink_its_chunk(self, client, db_session, monkeypatch):
+        _seed_word(db_session, 1, "كتاب", "book")
+        _seed_sentence(db_session, 1, "الكتاب", "the book", target_lemma_id=1, word_ids=[1])
+        db_session.commit()
+        real_submit = sentence_review_service.submit_sentence_review
+
+        def flaky_submit(db, **kwargs):
+            if kwargs.get("client_review_id") == "boom":
+                raise RuntimeError("boom")
+            return real_submit(db, **kwargs)
+
+        monkeypatch.setattr(sentence_review_service, "submit_sentence_review", flaky_submit)
+
+        resp = client.post("/api/review/sync", json={"reviews": [
+            self._review("fine-1", 1, 1),
+            self._review("boom", 1, 1),
+            self._review("fine-2", 1, 1),
+        ]})
+
+        results = {r["client_review_id"]: r for r in resp.json()["results"]}
+        assert results["fine-1"]["status"] == "ok"
+        assert results["fine-2"]["status"] == "ok"
+        assert results["boom"] == {"client_review_id": "boom", "status": "error", "error": "boom"}
+        assert db_session.query(SentenceReviewLog).count() == 2
+
+    def test_mixed_batch_applies_in_client_timestamp_order(self, client, db_session, monkeypatch):
+        import app.services.quran_service as quran_service
+
+        _seed_word(db_session, 1, "كتاب", "book")
+        _seed_sentence(db_session, 1, "الكتاب", "the book", target_lemma_id=1, word_ids=[1])
+        db_session.commit()
+        seen_at_verse: list[int] = []
+
+        def recording_verse_review(db, verse_id, rating, session_id=None):
+            ulk = db.query(UserLemmaKnowledge).filter_by(lemma_id=1).one()
+            seen_at_verse.append(ulk.times_seen)
+            return {}
+
+        monkeypatch.setattr(quran_service, "submit_verse_review", recording_verse_review)
+        verse = {
+            "type": "verse",
+            "client_review_id": "verse",
+            "payload": {"verse_id": 1, "rating": 3, "session_id": "batch-sess"},
+            "created_at": "2026-10-01T10:02:00Z",
+        }
+
+        resp = client.post("/api/review/sync", json={"reviews": [
+            self._review("after", 1, 1, created_at="2026-10-01T10:04:00Z"),
+            verse,
+            self._review("first", 1, 1, created_at="2026-10-01T10:00:00Z"),
+            self._review("second", 1, 1, created_at="2026-10-01T10:01:00Z"),
+        ]})
+
+        assert [r["client_review_id"] for r in resp.json()["results"]] == [
+            "after", "verse", "first", "second",
+        ]
+        assert [r["status"] for r in resp.json()["results"]] == ["ok"] * 4
+        # The two earlier sentence reviews landed before the verse, the later one after.
+        assert seen_at_verse == [5 + 2]
+        db_session.expire_all()
+        assert db_session.query(UserLemmaKnowledge).filter_by(lemma_id=1).one().times_seen == 5 + 3
+        applied = [
+            log.client_review_id
+            for log in db_session.query(SentenceReviewLog).order_by(SentenceReviewLog.id)
+        ]
+        assert applied == ["first", "second", "after"]
+
+    def test_sync_reads_review_logs_and_sentences_once_per_chunk(self, client, db_session):
+        from sqlalchemy import event
+
+        for lid, word in ((1, "كتاب"), (2, "ولد"), (3, "بيت")):
+            _seed_word(db_session, lid, word, f"word {lid}")
+        _seed_sentence(db_session, 1, "كتاب الولد", "the boy's book", target_lemma_id=1, word_ids=[1, 2])
+        _seed_sentence(db_session, 2, "بيت الولد", "the boy's house", target_lemma_id=3, word_ids=[3, 2])
+        db_session.commit()
+        selects: list[str] = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        signals = ["understood", "partial", "no_idea"] * 20
+        event.listen(db_session.bind, "before_cursor_execute", _record)
+        try:
+            resp = client.post("/api/review/sync", json={"reviews": [
+                self._review(f"q-{n}", 1 + n % 2, 1 + 2 * (n % 2), signal)
+                for n, signal in enumerate(signals)
+            ]})
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", _record)
+
+        assert [r["status"] for r in resp.json()["results"]] == ["ok"] * 60
+        # 60 reviews of 2 words each. Per chunk of 25: one word-level
+        # idempotency lookup and one history load for the leech window, and
+        # one Sentence load -- not one of each per word / per review.
+        chunks = 3
+        assert sum("FROM review_log" in s for s in selects) <= 2 * chunks
+        assert sum("FROM sentences" in s for s in selects) <= chunks
+        assert db_session.query(ReviewLog).count() == 120
@@ -0,0 +1,147 @@
+"""Tests for the knowledge version counter and ETag-cached aggregate endpoints."""
+
+from datetime import datetime
+
+from app import clock
+from app.models import Lemma, ReviewLog, Root, Sentence, UserLemmaKnowledge
+from app.routers import roots as roots_router
+from app.routers import stats as stats_router
+from app.services.knowledge_version import (
+    STATS_CACHE_WINDOW_SECONDS,
+    _etag,
+    current_version,
+    table_versions,
+)
+
+
+def _seed(db):
+    db.add(Root(root_id=1, root="ك.ت.ب", core_meaning_en="writing"))
+    db.add_all([
+        Lemma(lemma_id=1, lemma_ar="كِتَاب", lemma_ar_bare="كتاب", pos="noun",
+              gloss_en="book", root_id=1, wazn="fiʿāl"),
+        Lemma(lemma_id=2, lemma_ar="كَاتِب", lemma_ar_bare="كاتب", pos="noun",
+              gloss_en="writer", root_id=1, wazn="fāʿil"),
+    ])
+    db.commit()
+
+
+def _count_calls(monkeypatch, module, name):
+    calls = {"count": 0}
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+class TestVersionBumps:
+    def test_tracked_writes_bump(self, db_session):
+        _seed(db_session)
+        v0 = current_version(db_session)
+
+        db_session.add(UserLemmaKnowledge(lemma_id=1, knowledge_state="acquiring"))
+        db_session.commit()
+        v1 = current_version(db_session)
+        db_session.add(ReviewLog(lemma_id=1, rating=3, reviewed_at=clock.utcnow()))
+        db_session.commit()
+        v2 = current_version(db_session)
+        db_session.get(Lemma, 2).gloss_en = "author"
+        db_session.commit()
+        v3 = current_version(db_session)
+
+        assert v0 < v1 < v2 < v3
+
+    def test_sentence_display_churn_does_not_bump(self, db_session):
+        _seed(db_session)
+        db_session.add(Sentence(id=1, arabic_text="هذا كتاب", target_lemma_id=1))
+        db_session.commit()
+        before = current_version(db_session)
+
+        sentence = db_session.get(Sentence, 1)
+        sentence.times_shown = 5
+        sentence.last_reading_shown_at = clock.utcnow()
+        db_session.commit()
+        assert current_version(db_session) == before
+
+        sentence.is_active = False
+        db_session.commit()
+        assert current_version(db_session) > before
+
+    def test_table_versions_track_each_table(self, db_session):
+        _seed(db_session)
+        before = table_versions(db_session)
+
+        db_session.add(ReviewLog(lemma_id=1, rating=3, reviewed_at=clock.utcnow()))
+        db_session.commit()
+        after = table_versions(db_session)
+
+        assert after["review_log"] == before["review_log"] + 1
+        assert {t: v for t, v in after.items() if t != "review_log"} == {
+            t: v for t, v in before.items() if t != "review_log"
+        }
+
+
+class TestEtagCaching:
+    def test_not_modified_without_activity(self, client, db_session, monkeypatch):
+        _seed(db_session)
+        calls = _count_calls(monkeypatch, roots_router, "list_root_progress")
+
+        first = client.get("/api/roots")
+        etag = first.headers["etag"]
+        again = client.get("/api/roots", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert again.status_code == 304
+        assert again.content == b""
+        assert calls["count"] == 1
+
+    def test_cache_serves_repeat_requests(self, client, db_session, monkeypatch):
+        _seed(db_session)
+        calls = _count_calls(monkeypatch, roots_router, "_get_root")
+
+        first = client.get("/api/roots/1")
+        second = client.get("/api/roots/1")
+
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+        assert calls["count"] == 1
+
+    def test_review_invalidates(self, client, db_session):
+        _seed(db_session)
+        first = client.get("/api/roots")
+        assert first.json()[0]["known_words"] == 0
+
+        db_session.add(UserLemmaKnowledge(lemma_id=1, knowledge_state="learning"))
+        db_session.commit()
+        resp = client.get("/api/roots", headers={"If-None-Match": first.headers["etag"]})
+
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != first.headers["etag"]
+        assert resp.json()[0]["known_words"] == 1
+
+    def test_clock_window_rotates_etag(self):
+        with clock.frozen_at(datetime(2026, 3, 1, 10, 0, 5)):
+            first = _etag(7, STATS_CACHE_WINDOW_SECONDS)
+        with clock.frozen_at(datetime(2026, 3, 1, 10, 0, 30)):
+            same = _etag(7, STATS_CACHE_WINDOW_SECONDS)
+        with clock.frozen_at(datetime(2026, 3, 1, 10, 5)):
+            later = _etag(7, STATS_CACHE_WINDOW_SECONDS)
+            unwindowed = _etag(7, None)
+
+        assert first == same
+        assert later != first
+        assert unwindowed == _etag(7, None)
+
+    def test_query_params_key_the_cache(self, client, db_session, monkeypatch):
+        _seed(db_session)
+        calls = _count_calls(monkeypatch, stats_router, "_compute_analytics")
+        # No clock bucket, so a minute boundary mid-test can't add a miss.
+        monkeypatch.setattr(stats_router, "STATS_CACHE_WINDOW_SECONDS", None)
+
+        for days in (7, 30, 7):
+            assert client.get("/api/stats/analytics", params={"days": days}).status_code == 200
+
+        assert calls["count"] == 2
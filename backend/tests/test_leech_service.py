@@ -676,6 +676,56 @@ def test_reintro_episode_can_suspend_after_five_fresh_failures(db_session):
     assert ulk.knowledge_state == "suspended"
 
 
+def test_check_single_word_leech_with_preloaded_review_logs(db_session):
+    from tests.conftest import count_queries
+
+    lemma = _create_lemma(db_session)
+    now = datetime.now(timezone.utc)
+    started = now - timedelta(hours=8)
+    ulk = UserLemmaKnowledge(
+        lemma_id=lemma.lemma_id,
+        knowledge_state="acquiring",
+        acquisition_box=1,
+        acquisition_started_at=started,
+        acquisition_episode_kind=ACQUISITION_EPISODE_LEECH_REINTRO,
+        leech_count=1,
+        times_seen=15,
+        times_correct=3,
+    )
+    db_session.add(ulk)
+    # Pre-episode successes and a quiz success must not mask the fresh
+    # failures, exactly as in the query path.
+    for i in range(5):
+        db_session.add(ReviewLog(
+            lemma_id=lemma.lemma_id,
+            rating=3,
+            reviewed_at=started - timedelta(hours=i + 1),
+        ))
+    db_session.add(ReviewLog(
+        lemma_id=lemma.lemma_id,
+        rating=3,
+        review_mode="quiz",
+        reviewed_at=now,
+    ))
+    for i, rating in enumerate([1, 1, 3, 1, 1]):
+        db_session.add(ReviewLog(
+            lemma_id=lemma.lemma_id,
+            rating=rating,
+            reviewed_at=started + timedelta(hours=i + 1),
+        ))
+    db_session.commit()
+    review_logs = db_session.query(ReviewLog).filter_by(lemma_id=lemma.lemma_id).all()
+    db_session.refresh(ulk)
+
+    with count_queries(db_session) as queries:
+        assert check_single_word_leech(
+            db_session, lemma.lemma_id, ulk=ulk, review_logs=review_logs,
+        ) is True
+    assert ulk.knowledge_state == "suspended"
+    # Only the Lemma / core-rank lookups of the suspension itself remain.
+    assert queries["count"] <= 2
+
+
 def test_tier_e_graduation_does_not_immediately_resuspend_reintroduced_leech(
     db_session,
 ):
@@ -9,9 +9,11 @@ from app.services.listening import (
     _get_word_listening_confidence,
     score_sentence_for_listening,
     get_listening_candidates,
+    load_listening_confidence,
     MIN_LISTENING_STABILITY_DAYS,
 )
 from app.services.fsrs_service import create_new_card
+from tests.conftest import count_queries
 
 
 def _make_card_json(stability_days=30.0, due_offset_hours=-1):
@@ -196,6 +198,73 @@ class TestListeningCandidates:
         candidates = get_listening_candidates(db_session, min_confidence=0.6)
         assert len(candidates) == 0
 
+    def test_picks_best_sentence_per_lemma(self, db_session):
+        _seed_word(db_session, 1, "كتاب", "book", stability=30.0, times_seen=15, due_hours=-2)
+        _seed_word(db_session, 2, "ولد", "boy", stability=60.0, times_seen=20, times_correct=20)
+        _seed_word(db_session, 3, "قرأ", "read", stability=10.0, times_seen=15, due_hours=-1)
+
+        _seed_sentence(db_session, 1, "قرأ الكتاب", "read the book",
+                      target_lemma_id=1, word_lemma_ids=[3, 1])
+        _seed_sentence(db_session, 2, "الولد الكتاب", "the boy's book",
+                      target_lemma_id=1, word_lemma_ids=[2, 1])
+        _seed_sentence(db_session, 3, "الولد قرأ", "the boy read",
+                      target_lemma_id=3, word_lemma_ids=[2, 3])
+        db_session.commit()
+
+        candidates = get_listening_candidates(db_session, min_confidence=0.6)
+
+        # Due order: lemma 1 was due first; its stronger sentence wins.
+        assert [(c["lemma_id"], c["sentence"]["id"]) for c in candidates] == [(1, 2), (3, 3)]
+        assert candidates[0]["listening_confidence"] == score_sentence_for_listening(
+            db_session, 2, target_lemma_id=1,
+        )["confidence"]
+
+    def test_confidence_table_matches_per_word_scoring(self, db_session):
+        _, k1 = _seed_word(db_session, 1, "كتاب", "book", stability=60.0, times_seen=20)
+        _, k2 = _seed_word(db_session, 2, "ولد", "boy", state="lapsed")
+        _, k3 = _seed_word(db_session, 3, "قرأ", "read", stability=3.0, times_seen=5)
+        db_session.commit()
+
+        table = load_listening_confidence(db_session)
+
+        assert table == {
+            1: _get_word_listening_confidence(k1),
+            2: _get_word_listening_confidence(k2),
+            3: _get_word_listening_confidence(k3),
+        }
+        assert load_listening_confidence(db_session, [2]) == {2: 0.1}
+
+    def test_query_count_constant_as_corpus_grows(self, db_session):
+        next_id = {"lemma": 1, "sentence": 1}
+
+        def grow(n_lemmas, sentences_per_lemma):
+            for _ in range(n_lemmas):
+                lid = next_id["lemma"]
+                next_id["lemma"] += 1
+                _seed_word(db_session, lid, f"w{lid}", f"w{lid}",
+                           stability=30.0, times_seen=15)
+                for _ in range(sentences_per_lemma):
+                    sid = next_id["sentence"]
+                    next_id["sentence"] += 1
+                    _seed_sentence(db_session, sid, f"s{sid}", f"s{sid}",
+                                  target_lemma_id=lid,
+                                  word_lemma_ids=[None, lid, max(1, lid - 1)])
+            db_session.commit()
+
+        def queries_for_candidates():
+            with count_queries(db_session) as queries:
+                candidates = get_listening_candidates(db_session, limit=10)
+            return queries["count"], candidates
+
+        grow(12, 2)
+        small, small_candidates = queries_for_candidates()
+        grow(40, 6)
+        large, large_candidates = queries_for_candidates()
+
+        assert len(small_candidates) == len(large_candidates) == 10
+        assert small == large
+        assert large <= 5
+
 
 # --- API endpoint tests ---
 
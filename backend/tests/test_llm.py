@@ -5,6 +5,7 @@ Tests prompt construction and fallback behavior with mocked litellm.
 
 from unittest.mock import MagicMock, patch
 
+import asyncio
 import inspect
 import time
 
@@ -22,6 +23,7 @@ from app.services.llm import (
     review_sentences_quality,
     rerank_sentences_by_naturalness,
     sentence_quality_review_input,
+    stream_completion,
 )
 
 
@@ -132,6 +134,57 @@ def test_all_providers_fail_raises(mock_cli, mock_codex, mock_key, mock_completi
         generate_completion("test prompt")
 
 
+
+def _stream_response(deltas, fail_after=None):
+    async def chunks():
+        for i, delta in enumerate(deltas):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("connection reset")
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = delta
+            yield chunk
+    return chunks()
+
+
+async def _collect(stream):
+    return [delta async for delta in stream]
+
+
+@patch("app.services.llm.litellm.acompletion")
+@patch("app.services.llm._get_api_key")
+def test_stream_completion_falls_back_before_first_token(mock_key, mock_acompletion):
+    mock_key.return_value = "fake-key"
+    mock_acompletion.side_effect = [
+        Exception("openai down"),
+        _stream_response(["مرحبا", None, " world"]),
+    ]
+
+    deltas = asyncio.run(_collect(stream_completion("test prompt")))
+
+    assert deltas == ["مرحبا", " world"]
+    models = [c.kwargs["model"] for c in mock_acompletion.call_args_list]
+    assert models == ["gpt-5.2", "claude-haiku-4-5"]
+    assert all(c.kwargs["stream"] for c in mock_acompletion.call_args_list)
+
+
+@patch("app.services.llm.litellm.acompletion")
+@patch("app.services.llm._get_api_key")
+def test_stream_completion_does_not_restart_mid_stream(mock_key, mock_acompletion):
+    mock_key.return_value = "fake-key"
+    mock_acompletion.return_value = _stream_response(["one", "two"], fail_after=1)
+    seen = []
+
+    async def consume():
+        async for delta in stream_completion("test prompt", model_override="anthropic"):
+            seen.append(delta)
+
+    with pytest.raises(LLMError, match="stream interrupted"):
+        asyncio.run(consume())
+    assert seen == ["one"]
+    assert mock_acompletion.call_count == 1
+
+
 @patch("app.services.llm._generate_via_claude_cli")
 def test_explicit_claude_sonnet_override(mock_cli):
     """model_override='claude_sonnet' should use CLI with sonnet."""
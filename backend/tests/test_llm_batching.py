@@ -0,0 +1,102 @@
+import threading
+import time
+
+from app.services.llm_batching import (
+    estimate_tokens,
+    map_batches,
+    plan_batches,
+    run_keyed_batches,
+)
+
+
+def test_plan_batches_respects_token_budget_and_item_cap():
+    items = ["a" * 30, "b" * 30, "c" * 30, "d" * 300, "e", "f", "g"]
+
+    batches = plan_batches(
+        items, cost=estimate_tokens, max_tokens=25, max_items=2,
+    )
+
+    # 11 tokens each for the first three; the 101-token item sits alone.
+    assert batches == [
+        ["a" * 30, "b" * 30],
+        ["c" * 30],
+        ["d" * 300],
+        ["e", "f"],
+        ["g"],
+    ]
+    assert [x for batch in batches for x in batch] == items
+
+
+def test_map_batches_runs_concurrently_and_keeps_order():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def call(batch):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return sum(batch)
+
+    out = map_batches(call, [[1], [2, 3], [4], [5, 6]], concurrency=4)
+
+    assert out == [1, 5, 4, 11]
+    assert state["peak"] > 1
+
+
+def test_map_batches_retries_then_returns_exception_in_place():
+    attempts: dict[int, int] = {}
+
+    def call(batch):
+        attempts[batch[0]] = attempts.get(batch[0], 0) + 1
+        if batch[0] == 2:
+            raise RuntimeError("provider down")
+        if batch[0] == 3 and attempts[3] == 1:
+            raise RuntimeError("transient")
+        return batch[0] * 10
+
+    out = map_batches(call, [[1], [2], [3]], concurrency=3, retries=1)
+
+    assert out[0] == 10
+    assert isinstance(out[1], RuntimeError)
+    assert out[2] == 30
+    assert attempts == {1: 1, 2: 2, 3: 2}
+
+
+def test_run_keyed_batches_retries_only_missing_items():
+    seen: list[list[int]] = []
+
+    def call(batch):
+        seen.append(list(batch))
+        # First pass drops every odd item; the retry answers everything.
+        if len(seen) == 1:
+            return {item: item * 2 for item in batch if item % 2 == 0}
+        return {item: item * 2 for item in batch}
+
+    out = run_keyed_batches(
+        [1, 2, 3, 4],
+        call,
+        key=lambda item: item,
+        cost=lambda item: 1,
+        max_tokens=10,
+        concurrency=1,
+        retries=1,
+    )
+
+    assert out == {1: 2, 2: 4, 3: 6, 4: 8}
+    assert seen == [[1, 2, 3, 4], [1, 3]]
+
+
+def test_run_keyed_batches_leaves_unanswered_items_absent():
+    out = run_keyed_batches(
+        ["x", "y"],
+        lambda batch: {"x": "ok"},
+        key=lambda item: item,
+        cost=lambda item: 1,
+        max_tokens=1,
+        retries=2,
+    )
+
+    assert out == {"x": "ok"}
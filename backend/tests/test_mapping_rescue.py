@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from unittest.mock import patch
 
@@ -1227,3 +1228,83 @@ def test_secondary_multi_target_correction_keeps_primary_target(
     assert stats.sentences_flagged == 1
     assert stats.sentences_corrected == 1
     assert stats.targets_repaired == 0
+
+
+def test_reverify_skips_sentences_with_unchanged_fingerprint(
+    db_session,
+    patched_verifier,
+):
+    lem = _lemma(db_session, "كِتاب", "book")
+    sent = _stale_sentence(db_session, [lem.lemma_id], target_id=lem.lemma_id)
+    db_session.commit()
+
+    calls: list[int] = []
+
+    def counting(inputs, lemma_map):
+        calls.append(len(inputs))
+        return _no_issues(inputs, lemma_map)
+
+    patched_verifier(counting)
+    first = mapping_rescue.reverify_all_active_sentences(sentence_ids=[sent.id])
+    db_session.expire_all()
+    assert first.sentences_passed == 1
+    assert db_session.get(Sentence, sent.id).mappings_verified_fingerprint
+
+    second = mapping_rescue.reverify_all_active_sentences(sentence_ids=[sent.id])
+    assert calls == [1]
+    assert second.sentences_unchanged == 1
+    assert second.sentences_attempted == 0
+
+    forced = mapping_rescue.reverify_all_active_sentences(
+        sentence_ids=[sent.id], only_changed=False,
+    )
+    assert calls == [1, 1]
+    assert forced.sentences_passed == 1
+
+
+def test_reverify_rechecks_after_gloss_change(db_session, patched_verifier):
+    lem = _lemma(db_session, "كِتاب", "book")
+    sent = _stale_sentence(db_session, [lem.lemma_id], target_id=lem.lemma_id)
+    db_session.commit()
+
+    patched_verifier(_no_issues)
+    mapping_rescue.reverify_all_active_sentences(sentence_ids=[sent.id])
+    db_session.expire_all()
+    before = db_session.get(Sentence, sent.id).mappings_verified_fingerprint
+
+    db_session.get(Lemma, lem.lemma_id).gloss_en = "book; volume"
+    db_session.commit()
+    stats = mapping_rescue.reverify_all_active_sentences(sentence_ids=[sent.id])
+
+    db_session.expire_all()
+    assert stats.sentences_unchanged == 0
+    assert stats.sentences_passed == 1
+    assert db_session.get(Sentence, sent.id).mappings_verified_fingerprint != before
+
+
+def test_reverify_runs_llm_batches_concurrently(db_session, patched_verifier):
+    lem = _lemma(db_session, "كِتاب", "book")
+    ids = [
+        _stale_sentence(db_session, [lem.lemma_id], target_id=lem.lemma_id).id
+        for _ in range(6)
+    ]
+    db_session.commit()
+
+    # Three single-sentence batches must be in flight at once to pass.
+    barrier = threading.Barrier(3, timeout=10)
+
+    def gated(inputs, lemma_map):
+        barrier.wait()
+        return _no_issues(inputs, lemma_map)
+
+    patched_verifier(gated)
+    stats = mapping_rescue.reverify_all_active_sentences(
+        sentence_ids=ids, batch_size=1, concurrency=3,
+    )
+
+    db_session.expire_all()
+    assert stats.batches_run == 6
+    assert stats.sentences_passed == 6
+    assert all(
+        db_session.get(Sentence, sid).mappings_verified_at > STALE for sid in ids
+    )
@@ -0,0 +1,134 @@
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from app.services.material_daemon import MaterialDaemon, Phase, default_phases
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / f"{name}.py"
+    path.write_text(body)
+    return str(path)
+
+
+@pytest.fixture
+def daemon_factory():
+    made = []
+
+    def make(phases, **kwargs):
+        daemon = MaterialDaemon(phases, warm_modules=(), **kwargs)
+        made.append(daemon)
+        return daemon
+
+    yield make
+    for daemon in made:
+        daemon.stop()
+
+
+def test_default_phases_mirror_cron_wrapper(monkeypatch):
+    monkeypatch.setenv("ALIF_DEFICIT_REFILL_BUDGET", "7")
+    monkeypatch.setenv("ALIF_MATERIAL_MAINTENANCE_TIMEOUT_SECONDS", "120")
+    phases = default_phases()
+    assert [p.name for p in phases] == [
+        "rotate_stale_sentences",
+        "update_material_maintenance",
+        "refill_due_deficit",
+        "maintain_short_story_supply",
+    ]
+    assert phases[1].timeout_seconds == 120
+    assert "--max-step-a-sentences" in phases[1].argv
+    assert dict(phases[2].env)["ALIF_DEFICIT_REFILL_BUDGET"] == "7"
+
+
+def test_cycle_records_status_timeouts_and_env(tmp_path, daemon_factory):
+    out = tmp_path / "budget.txt"
+    phases = [
+        Phase("ok", _script(tmp_path, "ok", (
+            "import os, sys\n"
+            f"open({str(out)!r}, 'w').write(os.environ['BUDGET'] + ' ' + ' '.join(sys.argv[1:]))\n"
+        )), argv=("--limit", "3"), timeout_seconds=30, env=(("BUDGET", "5"),)),
+        Phase("failed", _script(tmp_path, "failed", "raise SystemExit(2)\n"), timeout_seconds=30),
+        Phase("slow", _script(tmp_path, "slow", "import time\ntime.sleep(30)\n"), timeout_seconds=1),
+        Phase("crash", _script(tmp_path, "crash", "raise RuntimeError('boom')\n"), timeout_seconds=30),
+    ]
+    daemon = daemon_factory(phases)
+    results = {r.name: r for r in daemon.run_cycle("test")}
+
+    assert out.read_text() == "5 --limit 3"
+    assert results["ok"].status == "ok" and results["ok"].cpu_seconds is not None
+    assert (results["failed"].status, results["failed"].exit_code) == ("failed", 2)
+    assert results["slow"].status == "timeout" and results["slow"].wall_seconds < 15
+    assert results["crash"].status == "failed"
+
+    status = daemon.status()
+    assert status["cycles"] == 1 and status["last_cycle_reason"] == "test"
+    assert [p["last"]["status"] for p in status["phases"]] == ["ok", "failed", "timeout", "failed"]
+    metrics = daemon.metrics()
+    assert 'alif_material_phase_runs_total{phase="slow",status="timeout"} 1' in metrics
+    assert "alif_material_cycles_total 1" in metrics
+
+
+def test_nudge_respects_cooldown(tmp_path, daemon_factory):
+    daemon = daemon_factory(
+        [Phase("noop", _script(tmp_path, "noop", "pass\n"), timeout_seconds=30)],
+        interval=3600, nudge_cooldown=3600,
+    )
+    assert daemon.nudge("first") is True
+    daemon.run_cycle("first")
+    assert daemon.nudge("too soon") is False
+    assert daemon.status()["nudges_deferred"] == 1
+
+
+def test_http_nudge_wakes_serve_loop(tmp_path, daemon_factory):
+    marker = tmp_path / "ran.txt"
+    daemon = daemon_factory(
+        [Phase("touch", _script(tmp_path, "touch", f"open({str(marker)!r}, 'a').write('x')\n"),
+               timeout_seconds=30)],
+        interval=3600, nudge_cooldown=0,
+    )
+    server = daemon.make_http_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    loop = threading.Thread(target=daemon.serve_forever, kwargs={"run_immediately": False}, daemon=True)
+    loop.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        req = urllib.request.Request(f"{base}/nudge", method="POST",
+                                     headers={"X-Alif-Nudge-Reason": "session_end"})
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            assert json.load(resp) == {"accepted": True}
+        for _ in range(100):
+            if daemon.status()["cycles"]:
+                break
+            threading.Event().wait(0.1)
+        with urllib.request.urlopen(f"{base}/status", timeout=5) as resp:
+            status = json.load(resp)
+        assert status["cycles"] == 1 and status["last_cycle_reason"] == "session_end"
+        assert marker.read_text() == "x"
+    finally:
+        daemon.stop()
+        loop.join(5)
+        server.shutdown()
+
+
+def test_forkserver_restarts_only_when_lemmas_move(monkeypatch):
+    import multiprocessing.forkserver
+
+    from app.services import material_daemon
+
+    stops = []
+    monkeypatch.setattr(multiprocessing.forkserver._forkserver, "_stop", lambda: stops.append(1))
+    daemon = MaterialDaemon([], warm_modules=(material_daemon.PRELOAD_MODULE,))
+    signatures = iter([(1, 10, 10), (1, 10, 10), (2, 10, 10), None])
+    monkeypatch.setattr(daemon, "_lemma_signature", lambda: next(signatures))
+
+    # First cycle records what the fresh forkserver warms at.
+    assert daemon.refresh_forkserver() is False
+    assert daemon.refresh_forkserver() is False
+    assert daemon.refresh_forkserver() is True
+    # An unreadable signature leaves the forkserver alone.
+    assert daemon.refresh_forkserver() is False
+    assert stops == [1]
+    assert daemon.status()["forkserver_restarts"] == 1
+    assert "alif_material_forkserver_restarts_total 1" in daemon.metrics()
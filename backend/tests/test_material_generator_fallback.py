@@ -252,6 +252,61 @@ def test_batch_generation_stores_quality_approved_sentence(db_session, monkeypat
     assert stored.quality_reason == "ok"
 
 
+def test_concurrent_batches_overlap_llm_calls_and_serialize_writes(db_session, monkeypatch):
+    import threading
+
+    from app.services import sentence_fingerprint
+
+    monkeypatch.setenv("ALIF_USE_LEGACY_BATCH", "0")
+    _seed_batch_quality_word(db_session)
+    generated_sentence = SimpleNamespace(
+        target_index=0,
+        arabic="الكِتَابُ جَدِيدٌ.",
+        english="The book is new.",
+        transliteration="al-kitabu jadidun.",
+    )
+    # Every worker must be inside its LLM call at once to pass the barrier.
+    in_llm = threading.Barrier(3, timeout=10)
+    write_lock_held: list[bool] = []
+    real_shared_index = sentence_fingerprint.shared_index
+
+    def generate(*args, **kwargs):
+        in_llm.wait()
+        return [generated_sentence]
+
+    def shared_index():
+        write_lock_held.append(material_generator._sentence_write_lock.locked())
+        return real_shared_index()
+
+    monkeypatch.setattr(material_generator, "shared_index", shared_index)
+    results = []
+    with (
+        patch("app.services.material_generator._generate_via_self_correct", side_effect=generate),
+        patch("app.services.sentence_validator.batch_verify_sentences", return_value=[{"disambiguation": [], "issues": []}]),
+        patch("app.services.llm.review_sentences_quality", return_value=[
+            SentenceReviewResult(natural=True, translation_correct=True, reason="ok"),
+        ]),
+    ):
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    material_generator.batch_generate_material([1], count_per_word=1)
+                )
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+    assert not in_llm.broken
+    assert write_lock_held == [True, True, True]
+    # The same sentence from three shards is stored once.
+    assert sorted(r["generated"] for r in results) == [0, 0, 1]
+    assert db_session.query(Sentence).count() == 1
+
+
 def test_single_word_generation_discards_only_invalid_verifier_row(
     db_session,
     monkeypatch,
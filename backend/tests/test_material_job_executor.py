@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from app.models import MaterialJob
+from app.services.material_job_executor import KindPool, MaterialJobExecutor
+from app.services.material_jobs import (
+    STATUS_DONE,
+    complete_material_job,
+    enqueue_material_job,
+    fail_material_job,
+)
+
+
+@pytest.fixture(autouse=True)
+def _lease_lock(monkeypatch, tmp_path):
+    monkeypatch.setenv("ALIF_MATERIAL_JOB_LEASE_LOCK", str(tmp_path / "lease.lock"))
+
+
+class _Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def handler(self, seconds, outcome="done"):
+        def run(db, job):
+            with self.lock:
+                self.running[job.kind] = self.running.get(job.kind, 0) + 1
+                self.peak[job.kind] = max(self.peak.get(job.kind, 0), self.running[job.kind])
+            time.sleep(seconds)
+            with self.lock:
+                self.running[job.kind] -= 1
+            if outcome == "raise":
+                raise RuntimeError("boom")
+            if outcome == "fail":
+                return fail_material_job(db, job, error="nope")
+            return complete_material_job(db, job, result={"ok": True})
+
+        return run
+
+
+def test_executor_runs_kinds_concurrently_within_pool_limits(db_session):
+    for i in range(6):
+        enqueue_material_job(db_session, kind="sentence_shard", payload={"i": i}, priority=0)
+    for i in range(2):
+        enqueue_material_job(db_session, kind="tts", payload={"i": i}, priority=90)
+    enqueue_material_job(db_session, kind="mapping", payload={}, max_attempts=1)
+
+    tracker = _Tracker()
+    executor = MaterialJobExecutor(
+        [
+            KindPool("sentence_shard", tracker.handler(0.2), concurrency=3),
+            KindPool("tts", tracker.handler(0.2), concurrency=1),
+            KindPool("mapping", tracker.handler(0.05, outcome="fail"), concurrency=1),
+        ],
+        worker_id="test-worker",
+        poll_seconds=0.05,
+    )
+    started = time.monotonic()
+    report = executor.run()
+    elapsed = time.monotonic() - started
+
+    assert tracker.peak == {"sentence_shard": 3, "tts": 1, "mapping": 1}
+    assert elapsed < 1.0  # 6 x 0.2s shards alone would take 1.2s serially
+    kinds = report["kinds"]
+    assert (kinds["sentence_shard"]["done"], kinds["tts"]["done"]) == (6, 2)
+    assert kinds["mapping"]["failed"] == 1
+    assert kinds["sentence_shard"]["run_p50_s"] >= 0.2
+    db_session.expire_all()
+    assert db_session.query(MaterialJob).filter(MaterialJob.status == STATUS_DONE).count() == 8
+
+
+def test_executor_heartbeat_extends_leases_and_counts_errors(db_session):
+    job = enqueue_material_job(db_session, kind="sentence_shard", payload={})
+    seen = {}
+
+    def slow(db, leased):
+        seen["initial"] = leased.lease_until
+        time.sleep(0.6)
+        db.refresh(leased)
+        seen["later"] = leased.lease_until
+        raise RuntimeError("boom")
+
+    executor = MaterialJobExecutor(
+        [KindPool("sentence_shard", slow, concurrency=1)],
+        worker_id="test-worker",
+        lease_seconds=2,
+        heartbeat_seconds=0.1,
+        poll_seconds=0.05,
+    )
+    report = executor.run(max_jobs=1)
+
+    assert seen["later"] > seen["initial"]
+    assert report["kinds"]["sentence_shard"]["errors"] == 1
+    assert report["kinds"]["sentence_shard"]["lost_leases"] == 0
+    db_session.refresh(job)
+    assert job.lease_owner == "test-worker"  # still leased; expiry requeues it
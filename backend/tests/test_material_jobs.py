@@ -8,8 +8,10 @@ from app.services.material_jobs import (
     STATUS_RUNNING,
     complete_material_job,
     enqueue_material_job,
+    extend_material_job_leases,
     fail_material_job,
     lease_material_jobs,
+    lease_material_jobs_fair,
     lease_material_jobs_locked,
     release_material_job_lease_lock,
     release_expired_leases,
@@ -246,3 +248,51 @@ def test_fail_retries_until_max_attempts(db_session):
     assert job.status == STATUS_FAILED
     assert job.completed_at is not None
     assert job.last_error == "permanent"
+
+
+def test_fair_lease_round_robins_kinds_within_capacity(db_session):
+    for i in range(5):
+        enqueue_material_job(db_session, kind="sentence_shard", payload={"i": i}, priority=0, now=_now())
+    for i in range(2):
+        enqueue_material_job(db_session, kind="tts", payload={"i": i}, priority=90, now=_now())
+
+    leased = lease_material_jobs_fair(
+        db_session,
+        worker_id="worker-a",
+        capacity={"sentence_shard": 3, "tts": 3},
+        limit=3,
+        start=1,
+        now=_now(),
+    )
+    # A priority-0 flood of one kind doesn't take every slot.
+    assert [job.kind for job in leased] == ["tts", "sentence_shard", "tts"]
+
+    leased = lease_material_jobs_fair(
+        db_session,
+        worker_id="worker-a",
+        capacity={"sentence_shard": 2, "tts": 3},
+        now=_now(),
+    )
+    assert [job.kind for job in leased] == ["sentence_shard", "sentence_shard"]
+    assert all(job.status == STATUS_RUNNING for job in leased)
+
+
+def test_extend_leases_only_for_jobs_still_owned(db_session):
+    for i in range(3):
+        enqueue_material_job(db_session, kind="sentence_shard", payload={"i": i}, now=_now())
+    mine = lease_material_jobs(db_session, worker_id="worker-a", limit=2, lease_seconds=60, now=_now())
+    other = lease_material_jobs(db_session, worker_id="worker-b", lease_seconds=60, now=_now())[0]
+    complete_material_job(db_session, mine[1], now=_now())
+
+    later = _now() + timedelta(seconds=30)
+    extended = extend_material_job_leases(
+        db_session,
+        [mine[0].id, mine[1].id, other.id],
+        worker_id="worker-a",
+        lease_seconds=60,
+        now=later,
+    )
+
+    assert extended == {mine[0].id}
+    db_session.refresh(mine[0])
+    assert mine[0].lease_until.replace(tzinfo=None) == (later + timedelta(seconds=60)).replace(tzinfo=None)
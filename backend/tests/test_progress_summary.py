@@ -0,0 +1,149 @@
+"""Tests for the trigger-maintained root_progress / pattern_progress tables."""
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.models import Lemma, Root, UserLemmaKnowledge
+from app.services.progress_summary import (
+    SORTS,
+    list_pattern_progress,
+    list_root_progress,
+    rebuild_progress,
+)
+from tests.conftest import count_queries
+
+_COLUMNS = (
+    "total_words, encountered_count, acquiring_count, learning_count, known_count, "
+    "lapsed_count, suspended_count, covered_words, known_ratio"
+)
+
+
+def _snapshot(db):
+    return (
+        db.execute(text(f"SELECT root_id, {_COLUMNS} FROM root_progress ORDER BY root_id")).all(),
+        db.execute(text(f"SELECT wazn, {_COLUMNS} FROM pattern_progress ORDER BY wazn")).all(),
+    )
+
+
+def _seed(db, n_roots=6):
+    """Root i gets i+1 lemmas across three wazns; the first i are reviewed."""
+    lemma_id = 0
+    for i in range(1, n_roots + 1):
+        db.add(Root(root_id=i, root=f"r{i}", core_meaning_en=f"meaning {i}"))
+        for j in range(i + 1):
+            lemma_id += 1
+            db.add(Lemma(lemma_id=lemma_id, lemma_ar=f"w{lemma_id}", lemma_ar_bare=f"w{lemma_id}",
+                         pos="noun", root_id=i, wazn=f"p{j % 3}", wazn_meaning=f"pattern {j % 3}"))
+            if j < i:
+                db.add(UserLemmaKnowledge(
+                    lemma_id=lemma_id, knowledge_state=("known", "acquiring", "lapsed")[j % 3],
+                    last_reviewed=datetime(2026, 5, i, 12, j),
+                ))
+    db.commit()
+
+
+class TestIncrementalMaintenance:
+    def test_triggers_match_rebuild(self, db_session):
+        _seed(db_session)
+
+        ulk = db_session.query(UserLemmaKnowledge).filter_by(lemma_id=1).one()
+        ulk.knowledge_state = "suspended"
+        db_session.add(UserLemmaKnowledge(lemma_id=2, knowledge_state="learning"))
+        moved = db_session.get(Lemma, 4)
+        moved.root_id, moved.wazn = 1, "p9"
+        db_session.get(Lemma, 5).canonical_lemma_id = 6
+        db_session.delete(db_session.query(UserLemmaKnowledge).filter_by(lemma_id=7).one())
+        db_session.delete(db_session.query(UserLemmaKnowledge).filter_by(lemma_id=8).one())
+        db_session.delete(db_session.get(Lemma, 8))
+        db_session.delete(db_session.get(Lemma, 9))
+        db_session.add(Lemma(lemma_id=100, lemma_ar="x", lemma_ar_bare="x", pos="noun",
+                             root_id=6, wazn="p0"))
+        db_session.commit()
+
+        incremental = _snapshot(db_session)
+        rebuild_progress(db_session)
+        assert _snapshot(db_session) == incremental
+
+    def test_state_change_moves_counts(self, db_session):
+        _seed(db_session, n_roots=1)
+        before = {r["root_id"]: r for r in list_root_progress(db_session)}[1]
+        assert before["state_counts"]["known"] == 1 and before["known_words"] == 1
+
+        ulk = db_session.query(UserLemmaKnowledge).filter_by(lemma_id=1).one()
+        ulk.knowledge_state = "lapsed"
+        ulk.last_reviewed = datetime(2026, 6, 1)
+        db_session.commit()
+
+        after = list_root_progress(db_session)[0]
+        assert after["state_counts"]["known"] == 0
+        assert after["state_counts"]["lapsed"] == 1
+        assert after["known_words"] == 0
+        assert after["coverage_pct"] == 0.0
+        assert after["last_activity_at"] == "2026-06-01T00:00:00"
+
+
+class TestListing:
+    def test_keyset_pages_match_full_listing(self, db_session):
+        _seed(db_session)
+        for sort in SORTS:
+            full = [r["root_id"] for r in list_root_progress(db_session, sort=sort)]
+            paged, after = [], None
+            while True:
+                page = list_root_progress(db_session, sort=sort, limit=4, after=after)
+                paged += [r["root_id"] for r in page]
+                if len(page) < 4:
+                    break
+                after = page[-1]["root_id"]
+            assert paged == full, sort
+
+            wazns = [p["wazn"] for p in list_pattern_progress(db_session, sort=sort)]
+            first = list_pattern_progress(db_session, sort=sort, limit=1)
+            rest = list_pattern_progress(db_session, sort=sort, after=first[0]["wazn"])
+            assert [p["wazn"] for p in first + rest] == wazns, sort
+
+    def test_default_sort_matches_legacy_order(self, db_session):
+        _seed(db_session)
+        rows = list_root_progress(db_session)
+        keys = [(-r["known_words"], -r["total_words"]) for r in rows]
+        assert keys == sorted(keys)
+
+    def test_recent_sort_puts_unreviewed_last(self, db_session):
+        _seed(db_session, n_roots=3)
+        db_session.add(Root(root_id=9, root="r9"))
+        db_session.add(Lemma(lemma_id=90, lemma_ar="z", lemma_ar_bare="z", pos="noun", root_id=9))
+        db_session.commit()
+
+        assert [r["root_id"] for r in list_root_progress(db_session, sort="recent")] == [3, 2, 1, 9]
+
+    def test_listing_query_count_is_constant(self, db_session):
+        _seed(db_session, n_roots=2)
+        with count_queries(db_session) as small:
+            list_root_progress(db_session)
+        db_session.add_all(Root(root_id=100 + i, root=f"x{i}") for i in range(20))
+        db_session.add_all(
+            Lemma(lemma_id=1000 + i, lemma_ar="y", lemma_ar_bare="y", pos="noun", root_id=100 + i)
+            for i in range(20)
+        )
+        db_session.commit()
+        with count_queries(db_session) as large:
+            list_root_progress(db_session)
+
+        assert small["count"] == large["count"] == 1
+
+
+class TestEndpoints:
+    def test_paginated_roots_endpoint(self, client, db_session):
+        _seed(db_session)
+
+        first = client.get("/api/roots", params={"limit": 2}).json()
+        second = client.get("/api/roots", params={"limit": 2, "after": first[-1]["root_id"]}).json()
+
+        full = client.get("/api/roots").json()
+        assert [r["root_id"] for r in first + second] == [r["root_id"] for r in full[:4]]
+
+    def test_bad_sort_and_cursor(self, client, db_session):
+        _seed(db_session)
+
+        assert client.get("/api/roots", params={"sort": "alphabetical"}).status_code == 400
+        assert client.get("/api/patterns", params={"after": "nope"}).status_code == 400
@@ -0,0 +1,90 @@
+"""Tests for indexed verse scheduling and the maintained backlog counter."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.models import Lemma, QuranicVerse
+from app.services import quran_service
+from app.services.quran_service import (
+    MAX_NON_UNDERSTOOD_BACKLOG,
+    _count_backlog,
+    get_verse_backlog,
+    select_verse_cards,
+    submit_verse_review,
+)
+from tests.conftest import count_queries
+
+
+def _verses(db, n, **fields):
+    start = db.query(QuranicVerse).count()
+    verses = [
+        QuranicVerse(
+            surah=1 + (start + i) // 200, ayah=1 + (start + i) % 200,
+            arabic_text="بِسْمِ", english_translation="In the name",
+            lemmatized_at=datetime(2026, 1, 1), **fields,
+        )
+        for i in range(n)
+    ]
+    db.add_all(verses)
+    db.commit()
+    return verses
+
+
+def test_backlog_counter_tracks_reviews(db_session, monkeypatch):
+    monkeypatch.setattr(quran_service, "log_interaction", lambda **_kw: None)
+    _verses(db_session, 2, srs_level=3, last_rating="partially",
+            next_due=datetime(2026, 1, 2))
+    learning = _verses(db_session, 3, srs_level=7, last_rating="got_it",
+                       next_due=datetime(2026, 1, 2))
+    assert get_verse_backlog(db_session) == 2
+
+    for verse, rating in [
+        (learning[0], "not_yet"),
+        (learning[0], "partially"),
+        (learning[1], "partially"),
+        (learning[0], "got_it"),
+        (learning[2], "got_it"),  # graduates
+        (learning[1], "not_yet"),
+    ]:
+        submit_verse_review(db_session, verse.id, rating)
+        assert get_verse_backlog(db_session) == _count_backlog(db_session)
+
+    assert get_verse_backlog(db_session) == 3
+
+
+def test_scheduling_queries_use_indexes(db_session):
+    _verses(db_session, 50, srs_level=0)
+
+    def plan(sql):
+        rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return " ".join(str(r[-1]) for r in rows)
+
+    due = plan(
+        "SELECT id FROM quranic_verses WHERE next_due IS NOT NULL AND next_due <= '2026-10-19' "
+        "AND srs_level >= 1 AND srs_level <= 7 ORDER BY next_due LIMIT 3"
+    )
+    queue = plan(
+        "SELECT id FROM quranic_verses WHERE srs_level = 0 AND lemmatized_at IS NOT NULL "
+        "ORDER BY surah, ayah LIMIT 1"
+    )
+    assert "ix_quranic_verses_due" in due
+    assert "ix_quranic_verses_queue" in queue
+    assert "TEMP B-TREE" not in due + queue
+
+
+def test_idle_selection_is_bounded(db_session):
+    _verses(db_session, MAX_NON_UNDERSTOOD_BACKLOG, srs_level=2, last_rating="not_yet",
+            next_due=datetime.utcnow() + timedelta(days=1))
+    _verses(db_session, 400, srs_level=0)
+    db_session.add_all(
+        Lemma(lemma_ar=f"w{i}", lemma_ar_bare=f"w{i}", pos="noun") for i in range(50)
+    )
+    db_session.commit()
+    get_verse_backlog(db_session)
+
+    with count_queries(db_session) as counter:
+        assert select_verse_cards(db_session) == []
+
+    # due scan, backlog row, daily cap, look-ahead probe — no lemma load
+    assert counter["count"] <= 4
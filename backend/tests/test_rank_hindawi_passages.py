@@ -89,3 +89,69 @@ def test_build_windows_keeps_consecutive_sentence_offsets():
         ["1", "2", "3"],
         ["2", "3", "4"],
     ]
+
+
+def test_store_ranking_matches_per_window_reference(tmp_path):
+    import random
+
+    from app.services.corpus_store import CorpusStore, CorpusStoreBuilder
+    from scripts.rank_hindawi_passages import coverage_from_tokens, rank_store
+
+    rng = random.Random(7)
+    infos = {
+        lid: LemmaInfo(lemma_id=lid, arabic=f"l{lid}", bare=f"l{lid}", gloss="", pos="noun",
+                       word_category="proper_name" if lid % 17 == 0 else None,
+                       canonical_lemma_id=lid - 1 if lid % 11 == 0 else None)
+        for lid in range(1, 60)
+    }
+    states = {lid: rng.choice(["known", "learning", "acquiring", "encountered", "new"])
+              for lid in range(1, 60) if rng.random() < 0.7}
+    context = LemmaContext(infos, states)
+
+    def token():
+        if rng.random() < 0.1:
+            return rng.choice(["غريب", "مجهول", "نادر"])
+        return rng.randint(1, 65)  # a few ids beyond the lemma table
+
+    books = []
+    builder = CorpusStoreBuilder()
+    for b in range(6):
+        sentences = [(f"b{b}s{i}", [token() for _ in range(rng.randint(0, 9))])
+                     for i in range(rng.randint(2, 15))]
+        books.append(sentences)
+        builder.add_book(f"book {b}", "author", sentences)
+    builder.save(tmp_path)
+    store = CorpusStore.load(tmp_path)
+
+    reference = []
+    for b, sentences in enumerate(books):
+        covered = [coverage_from_tokens(text, tokens, context) for text, tokens in sentences]
+        covered = [s for s in covered if s.content_tokens > 0]
+        for window in build_windows(f"book {b}", "author", covered, sentence_count=3):
+            if window.active_pct >= 0.3 and window.unmapped_pct <= 0.2:
+                reference.append(window)
+    reference.sort(key=lambda w: w.score(), reverse=True)
+
+    ranked = rank_store(store, context, sentence_count=3, title_filter=None,
+                        min_active_pct=0.3, max_unmapped_pct=0.2)
+
+    assert reference
+    assert [window_to_dict(w, context, include_text=True) for w in ranked] == [
+        window_to_dict(w, context, include_text=True) for w in reference
+    ]
+    assert [w.score() for w in ranked] == [w.score() for w in reference]
+
+
+def test_store_remaps_surfaces_resolved_after_build(tmp_path):
+    from app.services.corpus_store import CorpusStore, CorpusStoreBuilder
+
+    builder = CorpusStoreBuilder(params={"min_words": 5})
+    builder.add_book("t", "a", [("s0", [3, "جديد", "مجهول"]), ("s1", ["جديد"])])
+    store = builder.save(tmp_path)
+    assert store.sentence_tokens(0) == [3, "جديد", "مجهول"]
+
+    store = CorpusStore.load(tmp_path)
+    assert store.meta["params"] == {"min_words": 5}
+    assert store.remap_surfaces({"جديد": 9}) == 1
+    assert store.sentence_tokens(0) == [3, 9, "مجهول"]
+    assert store.lemma_tokens().tolist() == [3, 9, -1, 9]
@@ -145,6 +145,20 @@ class TestBookCoverage:
         assert book.covered_tokens == 10
         assert book.gap_tokens == 0
 
+    def test_bare_form_edit_refreshes_function_word_flag(self, db_session, tmp_path):
+        word = _lemma(db_session, "someword")
+        db_session.commit()
+        self._write_tokenmap(
+            tmp_path, mapped={word.lemma_id: 5}, unmapped={}, total=5, function=0
+        )
+        assert compute_book_coverage(db_session, benchmarks_dir=tmp_path)[0].gap_tokens == 5
+
+        word.lemma_ar_bare = "في"  # now a function word
+        db_session.commit()
+        book = compute_book_coverage(db_session, benchmarks_dir=tmp_path)[0]
+        assert book.covered_tokens == 5
+        assert book.gap_tokens == 0
+
     def test_bookifier_cohort_funnel(self, db_session, tmp_path):
         box1 = _lemma(db_session, "cohort1")
         _ulk(db_session, box1.lemma_id, "acquiring", box=1, source="bookifier")
@@ -0,0 +1,163 @@
+"""Tests for write-behind sentence review ingestion."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import ReviewJournalEntry, ReviewLog, SentenceReviewLog
+from app.services.review_journal import (
+    ReviewJournalWriter,
+    append_review,
+    apply_pending_reviews,
+    pending_review_count,
+)
+from tests.test_sentence_review import _seed_sentence, _seed_word
+
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    monkeypatch.setenv("ALIF_REVIEW_WRITE_BEHIND", "1")
+
+
+@pytest.fixture
+def seeded(db_session):
+    _seed_word(db_session, 1, "كتاب", "book")
+    _seed_word(db_session, 2, "ولد", "boy")
+    _seed_sentence(db_session, 1, "الولد الكتاب", "boy book",
+                   target_lemma_id=1, word_ids=[2, 1])
+    db_session.commit()
+    return db_session
+
+
+def _payload(**overrides):
+    payload = {
+        "sentence_id": 1,
+        "primary_lemma_id": 1,
+        "comprehension_signal": "understood",
+        "session_id": "journal-test",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_submit_is_journaled_and_applied_before_next_session(client, seeded, write_behind):
+    resp = client.post("/api/review/submit-sentence", json={
+        **_payload(), "client_review_id": "wb-1",
+    })
+
+    assert resp.status_code == 200
+    assert resp.json()["queued"] is True
+    assert seeded.query(ReviewLog).count() == 0
+    entry = seeded.query(ReviewJournalEntry).one()
+    assert (entry.status, entry.source) == ("pending", "submit")
+
+    assert client.get("/api/review/next-sentences?limit=5").status_code == 200
+
+    seeded.expire_all()
+    assert entry.status == "applied"
+    logs = seeded.query(ReviewLog).filter(ReviewLog.session_id == "journal-test").all()
+    assert {log.lemma_id for log in logs} == {1, 2}
+
+
+def test_sync_journals_dedupes_and_rejects_invalid_payloads(client, seeded, write_behind):
+    body = {"reviews": [
+        {"type": "sentence", "client_review_id": "wb-sync-1", "payload": _payload()},
+        {"type": "sentence", "client_review_id": "wb-sync-2", "payload": {"sentence_id": 1}},
+    ]}
+
+    first = client.post("/api/review/sync", json=body).json()["results"]
+    again = client.post("/api/review/sync", json=body).json()["results"]
+
+    assert [r["status"] for r in first] == ["ok", "error"]
+    assert [r["status"] for r in again] == ["duplicate", "error"]
+    assert seeded.query(ReviewJournalEntry).count() == 1
+    assert apply_pending_reviews(seeded) == 1
+    assert seeded.query(SentenceReviewLog).filter_by(client_review_id="wb-sync-1").count() == 1
+
+
+def test_entries_apply_in_order_at_their_receipt_time(seeded):
+    received = datetime(2026, 10, 1, 12, 0, 0)
+    for i in range(3):
+        append_review(
+            seeded,
+            _payload(comprehension_signal="no_idea" if i == 1 else "understood"),
+            client_review_id=f"wb-order-{i}",
+            received_at=received + timedelta(minutes=i),
+        )
+
+    assert apply_pending_reviews(seeded) == 3
+
+    logs = seeded.query(SentenceReviewLog).order_by(SentenceReviewLog.id).all()
+    assert [log.client_review_id for log in logs] == [
+        "wb-order-0", "wb-order-1", "wb-order-2",
+    ]
+    assert [log.comprehension for log in logs] == ["understood", "no_idea", "understood"]
+    assert [log.reviewed_at.replace(tzinfo=None) for log in logs] == [
+        received + timedelta(minutes=i) for i in range(3)
+    ]
+    primary = (
+        seeded.query(ReviewLog)
+        .filter(ReviewLog.lemma_id == 1)
+        .order_by(ReviewLog.id)
+        .all()
+    )
+    assert [log.rating for log in primary] == [3, 1, 3]
+
+
+def test_bad_entry_fails_alone(seeded):
+    append_review(seeded, _payload(), client_review_id="wb-ok-1")
+    append_review(seeded, {"sentence_id": 1}, client_review_id="wb-bad")
+    append_review(seeded, _payload(), client_review_id="wb-ok-2")
+
+    assert apply_pending_reviews(seeded) == 3
+
+    statuses = dict(
+        seeded.query(ReviewJournalEntry.client_review_id, ReviewJournalEntry.status).all()
+    )
+    assert statuses == {"wb-ok-1": "applied", "wb-bad": "failed", "wb-ok-2": "applied"}
+    bad = seeded.query(ReviewJournalEntry).filter_by(client_review_id="wb-bad").one()
+    assert "primary_lemma_id" in bad.last_error
+    assert seeded.query(SentenceReviewLog).filter(
+        SentenceReviewLog.client_review_id.like("wb-ok-%")
+    ).count() == 2
+
+
+def test_writer_thread_drains_the_journal(seeded):
+    append_review(seeded, _payload(), client_review_id="wb-writer")
+    writer = ReviewJournalWriter(poll_seconds=0.05)
+    writer.start()
+    try:
+        deadline = time.monotonic() + 5
+        while pending_review_count(seeded) and time.monotonic() < deadline:
+            time.sleep(0.05)
+            seeded.rollback()
+    finally:
+        writer.stop()
+
+    assert pending_review_count(seeded) == 0
+    assert seeded.query(SentenceReviewLog).filter_by(client_review_id="wb-writer").count() == 1
+
+
+def test_reads_skip_the_apply_lock_when_write_behind_is_off(client, seeded, monkeypatch):
+    from app.services import review_journal
+
+    monkeypatch.delenv("ALIF_REVIEW_WRITE_BEHIND", raising=False)
+
+    class NoLock:
+        def __enter__(self):
+            raise AssertionError("apply lock taken on the default path")
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(review_journal, "_apply_lock", NoLock())
+    assert client.get("/api/review/next-sentences?limit=5").status_code == 200
+
+    # Leftovers from a write-behind run are still drained.
+    monkeypatch.setattr(review_journal, "_apply_lock", threading.Lock())
+    append_review(seeded, _payload(), client_review_id="left-1", source="submit")
+    seeded.commit()
+    assert client.get("/api/review/next-sentences?limit=5").status_code == 200
+    assert pending_review_count(seeded) == 0
@@ -0,0 +1,137 @@
+"""Tests for the FTS5 search index and /api/search."""
+
+from sqlalchemy import text
+
+from app.models import Lemma, Sentence, Story
+from app.services.search_index import (
+    build_match_query,
+    fold_arabic,
+    rebuild_search_index,
+    search,
+)
+from app.services.sentence_validator import normalize_arabic
+
+
+def _seed(db):
+    db.add_all([
+        Lemma(lemma_id=1, lemma_ar="كِتَابٌ", lemma_ar_bare="كتاب", pos="noun", gloss_en="book"),
+        Lemma(lemma_id=2, lemma_ar="مَدْرَسَة", lemma_ar_bare="مدرسة", pos="noun", gloss_en="school"),
+        Lemma(lemma_id=3, lemma_ar="كَتَبَ", lemma_ar_bare="كتب", pos="verb", gloss_en="to write"),
+    ])
+    db.add_all([
+        Sentence(id=1, arabic_text="قَرَأَ الوَلَدُ الكِتَابَ", english_translation="The boy read the book.",
+                 target_lemma_id=1),
+        Sentence(id=2, arabic_text="ذَهَبْتُ إِلَى المَدْرَسَةِ", english_translation="I went to school.",
+                 target_lemma_id=2),
+    ])
+    db.add(Story(id=1, title_ar="في المَكْتَبَة", title_en="At the library",
+                 body_ar="وَجَدَ أَحْمَدُ كِتَابًا جَدِيدًا", body_en="Ahmad found a new book.",
+                 source="generated"))
+    db.commit()
+
+
+def _hits(result):
+    return [(hit["kind"], hit["id"]) for hit in result["results"]]
+
+
+class TestFolding:
+    def test_fold_matches_normalize_arabic(self):
+        samples = [
+            "كِتَابٌ", "إِلَى المَدْرَسَةِ", "ٱلرَّحْمَٰنِ", "هُۥ", "آمَنَ", "عـــربي",
+            "الصَّلَوٰةَ", "Café book",
+        ]
+        for sample in samples:
+            assert fold_arabic(sample) == normalize_arabic(sample)
+
+    def test_trigger_folds_like_python(self, db_session):
+        _seed(db_session)
+        indexed = db_session.execute(
+            text("SELECT arabic FROM search_fts WHERE rowid = :rowid"), {"rowid": 1 * 4 + 2},
+        ).scalar()
+        assert indexed == fold_arabic("قَرَأَ الوَلَدُ الكِتَابَ")
+
+    def test_match_query_quotes_tokens_and_prefixes_last(self):
+        assert build_match_query('الكِتَاب "OR" school') == '"الكتاب" "OR" "school"*'
+        assert build_match_query("to") == '"to"'
+        assert build_match_query("  ؟! ") is None
+
+
+class TestSearch:
+    def test_diacritic_insensitive_across_kinds(self, db_session):
+        _seed(db_session)
+
+        assert _hits(search(db_session, "الكتاب")) == [("sentence", 1)]
+        # Prefix match: كتاب* also finds the story's accusative كِتَابًا.
+        assert set(_hits(search(db_session, "كِتَاب"))) == {("lemma", 1), ("story", 1)}
+        assert _hits(search(db_session, "كتابا")) == [("story", 1)]
+        assert set(_hits(search(db_session, "book"))) == {("lemma", 1), ("sentence", 1), ("story", 1)}
+
+    def test_prefix_and_kind_filter(self, db_session):
+        _seed(db_session)
+
+        assert set(_hits(search(db_session, "كتا"))) == {("lemma", 1), ("story", 1)}
+        assert _hits(search(db_session, "كت")) == []
+        assert _hits(search(db_session, "schoo", kinds=["sentence"])) == [("sentence", 2)]
+
+    def test_pagination(self, db_session):
+        _seed(db_session)
+
+        first = search(db_session, "book", limit=2)
+        rest = search(db_session, "book", limit=2, offset=2)
+
+        assert first["has_more"] is True
+        assert rest["has_more"] is False
+        assert len(_hits(first)) == 2 and len(_hits(rest)) == 1
+        assert set(_hits(first)).isdisjoint(_hits(rest))
+
+    def test_triggers_follow_updates_and_deletes(self, db_session):
+        _seed(db_session)
+
+        sentence = db_session.get(Sentence, 2)
+        sentence.english_translation = "I walked to the university."
+        db_session.delete(db_session.get(Lemma, 1))
+        db_session.commit()
+
+        assert _hits(search(db_session, "school")) == [("lemma", 2)]
+        assert _hits(search(db_session, "university")) == [("sentence", 2)]
+        assert ("lemma", 1) not in _hits(search(db_session, "كتاب"))
+
+    def test_rebuild_restores_index(self, db_session):
+        _seed(db_session)
+        db_session.execute(text("DELETE FROM search_fts"))
+        db_session.commit()
+        assert search(db_session, "book")["results"] == []
+
+        assert rebuild_search_index(db_session) == 6
+        assert len(search(db_session, "book")["results"]) == 3
+
+    def test_search_uses_fts_index(self, db_session):
+        _seed(db_session)
+        plan = db_session.execute(
+            text("EXPLAIN QUERY PLAN SELECT rowid FROM search_fts WHERE search_fts MATCH :q"),
+            {"q": '"book"'},
+        ).all()
+        assert any("VIRTUAL TABLE INDEX" in row[-1] for row in plan)
+
+
+class TestSearchEndpoint:
+    def test_search_endpoint(self, client, db_session):
+        _seed(db_session)
+
+        resp = client.get("/api/search", params={"q": "school"})
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["has_more"] is False
+        lemma = next(r for r in data["results"] if r["kind"] == "lemma")
+        assert lemma["id"] == 2
+        assert lemma["arabic"] == "مَدْرَسَة"
+        assert lemma["english"] == "school"
+        assert "[school]" in lemma["snippet"]
+
+    def test_search_endpoint_kind_filter(self, client, db_session):
+        _seed(db_session)
+
+        resp = client.get("/api/search", params=[("q", "book"), ("kind", "story")])
+
+        assert [(r["kind"], r["id"]) for r in resp.json()["results"]] == [("story", 1)]
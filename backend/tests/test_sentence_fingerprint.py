@@ -0,0 +1,128 @@
+import threading
+
+from sqlalchemy import text
+
+from app.models import Sentence
+from app.services.sentence_fingerprint import (
+    NearDuplicateIndex,
+    backfill_fingerprints,
+    estimated_jaccard,
+    fingerprints_near_duplicate,
+    load_index,
+    minhash_signature,
+    shared_index,
+    stored_duplicate_exists,
+    text_fingerprint,
+)
+from app.services.sentence_selector import _is_text_near_duplicate
+
+
+def test_fingerprint_strips_diacritics_alef_and_punctuation():
+    assert text_fingerprint("أَكَلَ  الوَلَدُ، التُّفّاحَةَ.") == "اكل الولد التفاحة"
+    assert text_fingerprint(None) == ""
+
+
+def test_minhash_is_stable_and_tracks_similarity():
+    a = text_fingerprint("ذهب الولد الى المدرسة في الصباح الباكر")
+    b = text_fingerprint("ذهب الولد الى المدرسة في الصباح")
+    c = text_fingerprint("تحب البنت قراءة الكتب الجميلة كل مساء")
+    assert minhash_signature(a) == minhash_signature(a)
+    assert estimated_jaccard(minhash_signature(a), minhash_signature(b)) > 0.5
+    assert estimated_jaccard(minhash_signature(a), minhash_signature(c)) < 0.3
+
+
+def test_index_finds_near_duplicates_and_ignores_unrelated():
+    index = NearDuplicateIndex()
+    index.add_text(1, "ذَهَبَ الوَلَدُ إِلَى المَدْرَسَةِ فِي الصَّبَاحِ")
+    index.add_text(2, "تحب البنت قراءة الكتب الجميلة كل مساء")
+    assert index.near_duplicates("ذهب الولد الى المدرسة في الصباح.") == {1}
+    assert index.has_near_duplicate("ذهب الولد إلى المدرسة في الصباحِ")
+    assert not index.has_near_duplicate("يلعب الأطفال في الحديقة بعد الظهر")
+
+
+def test_index_agrees_with_selector_rule():
+    texts = [
+        "ذهب الولد الى المدرسة في الصباح",
+        "ذهب الولد الى المدرسة في المساء",
+        "ذهبت البنت الى المدرسة في الصباح",
+        "تحب البنت قراءة الكتب الجميلة كل مساء",
+        "يلعب الأطفال في الحديقة بعد الظهر",
+    ]
+    index = NearDuplicateIndex()
+    for i, text in enumerate(texts):
+        index.add_text(i, text)
+    for i, text in enumerate(texts):
+        others = [t for j, t in enumerate(texts) if j != i]
+        found = index.near_duplicates(text) - {i}
+        assert bool(found) == _is_text_near_duplicate(text, others)
+        for j in found:
+            assert fingerprints_near_duplicate(text_fingerprint(text), text_fingerprint(texts[j]))
+
+
+def test_model_derives_fingerprint_and_backfill_fills_raw_rows(db_session):
+    sent = Sentence(arabic_text="الكِتَابُ عَلَى الطَّاوِلَةِ", is_active=True)
+    db_session.add(sent)
+    db_session.flush()
+    assert sent.text_fingerprint == "الكتاب على الطاولة"
+    assert len(sent.text_minhash) == 64
+
+    raw = Sentence(arabic_text="القلم في الحقيبة", is_active=True)
+    db_session.add(raw)
+    db_session.flush()
+    raw.text_fingerprint = None
+    raw.text_minhash = None
+    db_session.flush()
+
+    assert backfill_fingerprints(db_session) == 1
+    assert raw.text_fingerprint == "القلم في الحقيبة"
+    index = load_index(db_session)
+    assert index.near_duplicates("القلمُ في الحقيبةِ") == {raw.id}
+
+
+def test_claim_admits_each_text_once_across_threads():
+    index = NearDuplicateIndex()
+    results = []
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        results.append(index.claim("ذهب الولد الى المدرسة في الصباح"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == [False, False, False, True]
+    assert not index.claim("ذَهَبَ الوَلَدُ إِلَى المَدْرَسَةِ فِي الصَّبَاحِ")
+
+
+def test_raw_sql_edit_resets_fingerprint(db_session):
+    sent = Sentence(arabic_text="الكتاب على الطاولة", is_active=True)
+    db_session.add(sent)
+    db_session.commit()
+
+    db_session.execute(
+        text("UPDATE sentences SET arabic_text = 'القلم في الحقيبة' WHERE id = :id"),
+        {"id": sent.id},
+    )
+    db_session.commit()
+    db_session.refresh(sent)
+
+    assert sent.text_fingerprint is None
+    assert not stored_duplicate_exists(db_session, "الكتاب على الطاولة")
+    assert load_index(db_session).near_duplicates("القلم في الحقيبة") == {sent.id}
+    backfill_fingerprints(db_session)
+    assert stored_duplicate_exists(db_session, "القلمُ في الحقيبةِ")
+
+
+def test_shared_index_extends_with_new_rows(db_session):
+    db_session.add(Sentence(arabic_text="الكتاب على الطاولة", is_active=True))
+    db_session.commit()
+    index = shared_index()
+    assert index.has_near_duplicate("الكتاب على الطاولة")
+
+    db_session.add(Sentence(arabic_text="القلم في الحقيبة", is_active=True))
+    db_session.commit()
+    assert shared_index() is index
+    assert index.has_near_duplicate("القلم في الحقيبة")
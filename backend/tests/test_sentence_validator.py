@@ -964,6 +964,40 @@ class TestBuildLemmaLookup:
         assert lookup[normalize_alef("أكل")] == 5  # "اكل"
 
 
+class TestComprehensiveLookupCache:
+    @pytest.fixture(autouse=True)
+    def _cache(self):
+        from app.services import sentence_validator
+
+        sentence_validator.enable_comprehensive_lookup_cache()
+        yield
+        sentence_validator.enable_comprehensive_lookup_cache(False)
+
+    def test_reuses_lookup_until_lemmas_written(self, db_session):
+        from app.models import Lemma
+        from app.services.sentence_validator import build_comprehensive_lemma_lookup
+        from tests.conftest import count_queries
+
+        book = Lemma(lemma_ar="كِتَاب", lemma_ar_bare="كتاب", gloss_en="book", pos="noun")
+        db_session.add(book)
+        db_session.commit()
+
+        first = build_comprehensive_lemma_lookup(db_session)
+        first["خنجر"] = 999  # callers may extend their copy
+        with count_queries(db_session) as queries:
+            second = build_comprehensive_lemma_lookup(db_session)
+        assert queries["count"] == 2  # signature only, no lemma load
+        assert second["كتاب"] == book.lemma_id
+        assert "خنجر" not in second
+        assert second is not first
+
+        book.lemma_ar_bare = "دفتر"
+        db_session.commit()
+        third = build_comprehensive_lemma_lookup(db_session)
+        assert "كتاب" not in third
+        assert third["دفتر"] == book.lemma_id
+
+
 class TestBuildLemmaLookupInflectedForms:
     """Test that inflected forms from forms_json are indexed in the lookup."""
 
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from app.models import Lemma, Root, Sentence, SentenceWord, UserLemmaKnowledge
+from app.models import Lemma, ReviewLog, Root, Sentence, SentenceWord, UserLemmaKnowledge
 from app.services.fsrs_service import create_new_card
 from app.services.sentence_eligibility import MAPPING_VERIFICATION_HARDENED_AT
 from app.simulation.runner import run_simulation
@@ -265,3 +265,146 @@ class TestSimulationBasic:
         # Can't easily re-run on same session (state changed),
         # but we can verify the snapshots are deterministic length
         assert len(snap1) == 3
+
+    def test_schedule_metrics_match_per_card_fsrs(self, db_session):
+        """The card-store pass agrees with parsing each card through py-fsrs."""
+        pytest.importorskip("alif_core")
+        from fsrs import Card
+
+        from app.services.fsrs_service import parse_json_column, scheduler
+
+        _seed_simulation_data(db_session)
+        snapshots = run_simulation(
+            db_session,
+            days=5,
+            profile=STRONG,
+            start_date=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        )
+        at = datetime(2026, 3, 6, tzinfo=timezone.utc)
+        horizon = at + timedelta(days=1)
+
+        def aware(dt):
+            return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+        due, recall = 0, []
+        for ulk in db_session.query(UserLemmaKnowledge).all():
+            if ulk.knowledge_state not in ("acquiring", "learning", "known", "lapsed"):
+                continue
+            card_json = parse_json_column(ulk.fsrs_card_json)
+            if ulk.acquisition_box:
+                next_due = ulk.acquisition_next_due
+                due += next_due is None or aware(next_due) <= horizon
+            elif card_json:
+                card = Card.from_dict(card_json)
+                due += card.due <= horizon
+                if card.stability and card.last_review:
+                    recall.append(scheduler.get_card_retrievability(card, at))
+
+        final = snapshots[-1]
+        assert final.due_next_day == due
+        if recall:
+            assert final.mean_retrievability == pytest.approx(sum(recall) / len(recall), abs=1e-3)
+
+
+def _seeded_source_db(tmp_path):
+    """File-backed copy of the synthetic data, as a sweep source backup."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database import Base
+
+    path = tmp_path / "alif_source.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        _seed_simulation_data(db)
+    engine.dispose()
+    return path
+
+
+class TestSimulationSweep:
+    def test_memory_clone_is_isolated_from_source(self, tmp_path):
+        from app.simulation.db_setup import create_memory_simulation_db
+
+        source = _seeded_source_db(tmp_path)
+        engine, SessionFactory = create_memory_simulation_db(source)
+        with SessionFactory() as db:
+            db.query(UserLemmaKnowledge).delete()
+            db.commit()
+        engine.dispose()
+
+        engine, SessionFactory = create_memory_simulation_db(source)
+        with SessionFactory() as db:
+            assert db.query(UserLemmaKnowledge).count() == 20
+        engine.dispose()
+
+    def test_sweep_streams_rows_and_summarizes(self, tmp_path):
+        import csv
+
+        from app.simulation.sweep import run_sweep, summarize_sweep
+
+        source = _seeded_source_db(tmp_path)
+        out = tmp_path / "sweep.csv"
+        rows = run_sweep(
+            source, ["beginner", "strong"], [1, 2], days=3,
+            start_date=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            out_path=out, workers=2,
+        )
+        assert len(rows) == 2 * 2 * 3
+        assert [(r["profile"], r["seed"], r["day"]) for r in rows[:3]] == [
+            ("beginner", 1, 1), ("beginner", 1, 2), ("beginner", 1, 3),
+        ]
+        with open(out) as f:
+            assert len(list(csv.DictReader(f))) == len(rows)
+
+        summary = summarize_sweep(rows)
+        known = summary["strong"]["known_final"]
+        assert known["n"] == 2
+        assert known["ci_low"] <= known["mean"] <= known["ci_high"]
+        assert summary["beginner"]["reviews_submitted_total"]["mean"] >= 0
+
+    def test_same_seed_same_rows_across_workers(self, tmp_path):
+        from app.simulation.sweep import run_sweep
+
+        source = _seeded_source_db(tmp_path)
+        kwargs = dict(days=3, start_date=datetime(2026, 3, 1, tzinfo=timezone.utc))
+        serial = run_sweep(source, ["beginner"], [7, 8], workers=1, **kwargs)
+        parallel = run_sweep(source, ["beginner"], [7, 8], workers=2, **kwargs)
+        assert serial == parallel
+
+
+class TestSimulationClock:
+    def test_injected_clock_matches_freezegun(self, tmp_path):
+        """Passing ``at=`` through the review path reproduces a
+        freezegun-driven run exactly: same snapshots, same card state."""
+        from dataclasses import asdict
+
+        from app.simulation.db_setup import create_memory_simulation_db
+
+        source = _seeded_source_db(tmp_path)
+        results = []
+        for use_freezegun in (True, False):
+            engine, SessionFactory = create_memory_simulation_db(source)
+            with SessionFactory() as db:
+                snapshots = run_simulation(
+                    db, days=5, profile=BEGINNER,
+                    start_date=datetime(2026, 3, 1, tzinfo=timezone.utc),
+                    seed=11, freezegun=use_freezegun,
+                )
+                cards = [
+                    (k.lemma_id, k.knowledge_state, k.fsrs_card_json,
+                     k.acquisition_box, k.acquisition_next_due, k.last_reviewed)
+                    for k in db.query(UserLemmaKnowledge).order_by(UserLemmaKnowledge.lemma_id)
+                ]
+                reviewed_at = [
+                    r.reviewed_at for r in db.query(ReviewLog).order_by(ReviewLog.id)
+                ]
+            engine.dispose()
+            results.append(([asdict(s) for s in snapshots], cards, reviewed_at))
+
+        frozen, injected = results
+        assert frozen[0] == injected[0]
+        assert frozen[1] == injected[1]
+        assert frozen[2] == injected[2]
+        assert injected[2]
+        assert all(datetime(2026, 3, 1) <= t < datetime(2026, 3, 6) for t in injected[2])
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.startup_profile import HEAVY_MODULES
+
+BACKEND = Path(__file__).resolve().parent.parent
+# Generous: ~1.3s locally after lazy-loading litellm/CAMeL/httpx, ~5.5s before.
+MAX_IMPORT_SECONDS = float(os.environ.get("ALIF_MAX_IMPORT_SECONDS", "4.0"))
+
+
+def _importtime(module: str) -> dict[str, int]:
+    """Cumulative import microseconds per module from `python -X importtime`."""
+    env = {**os.environ, "ALIF_SKIP_MIGRATIONS": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cum, name = line[len("import time:"):].split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum)
+    return cumulative
+
+
+def test_app_import_skips_heavy_dependencies_and_stays_fast():
+    timings = _importtime("app.main")
+    loaded = [m for m in HEAVY_MODULES if m in timings]
+    assert loaded == [], f"app.main eagerly imports {loaded}"
+    seconds = timings["app.main"] / 1e6
+    slowest = sorted(timings.items(), key=lambda kv: -kv[1])[:10]
+    assert seconds < MAX_IMPORT_SECONDS, f"app.main import took {seconds:.2f}s: {slowest}"
+
+
+def test_debug_startup_reports_timings(client):
+    data = client.get("/api/debug/startup").json()
+    assert data["app_import_seconds"] > 0
+    assert set(data["heavy_modules_loaded"]) == set(HEAVY_MODULES)
+
+
+def test_lifespan_survives_migration_timeout_and_trigger_failures(monkeypatch, db_session, caplog):
+    import asyncio
+
+    from app import main
+    from app.services import progress_summary, search_index
+
+    def timeout(*args, **kwargs):
+        raise subprocess.TimeoutExpired(cmd="alembic", timeout=30)
+
+    def boom(conn):
+        raise RuntimeError("trigger DDL failed")
+
+    monkeypatch.delenv("ALIF_SKIP_MIGRATIONS", raising=False)
+    monkeypatch.setattr(subprocess, "run", timeout)
+    monkeypatch.setattr(search_index, "install_search_index", boom)
+    monkeypatch.setattr(progress_summary, "install_progress_triggers", boom)
+
+    async def start_and_stop():
+        async with main.lifespan(main.app):
+            pass
+
+    asyncio.run(start_and_stop())
+    assert "Alembic timed out" in caplog.text
+    assert caplog.text.count("Startup boom failed") == 2
@@ -0,0 +1,62 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("alif_core")
+
+from scripts.sweep_fsrs import build_param_sets, load_review_columns, main  # noqa: E402
+
+
+def _write_log(path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE review_log (id INTEGER PRIMARY KEY, lemma_id INTEGER, "
+        "rating INTEGER, reviewed_at TEXT, is_acquisition BOOLEAN)"
+    )
+    t0 = datetime(2026, 5, 1, 8, 0)
+    rows = []
+    for lemma_id in range(1, 21):
+        for i, gap in enumerate((0, 1, 3, 9, 25)):
+            rating = 1 if (lemma_id + i) % 7 == 0 else 3
+            rows.append((lemma_id, rating, (t0 + timedelta(days=gap)).isoformat(), 0))
+    rows.append((1, 3, t0.isoformat(), 1))   # acquisition review: excluded
+    rows.append((2, 0, t0.isoformat(), 0))   # unrecognized rating: excluded
+    conn.executemany(
+        "INSERT INTO review_log (lemma_id, rating, reviewed_at, is_acquisition) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_loader_filters_to_fsrs_reviews(tmp_path):
+    db = tmp_path / "alif.db"
+    _write_log(db)
+    cols = load_review_columns(db)
+    assert len(cols) == 100
+    assert cols.n_cards == 20
+    assert len(cols.waves) == 5
+    assert cols.t[0] == datetime(2026, 5, 1, 8, 0, tzinfo=timezone.utc).timestamp()
+
+
+def test_param_sets_are_vectors_times_retentions():
+    labels, sets = build_param_sets(
+        {"a": [0.5] * 21, "b": [0.4] * 21}, [0.9, 0.95], perturb=3
+    )
+    assert len(sets) == 10
+    assert labels.count("a") == 2
+    assert all(not p.enable_fuzzing for p in sets)
+
+
+def test_main_writes_every_result(tmp_path, capsys):
+    db = tmp_path / "alif.db"
+    _write_log(db)
+    out = tmp_path / "sweep.json"
+    assert main(["--db", str(db), "--retention", "0.9", "0.95", "--workers", "1", "--json", str(out)]) == 0
+    results = json.loads(out.read_text())
+    assert {r["name"] for r in results} == {"production", "library-default"}
+    assert len(results) == 4
+    assert all(r["evaluated"] == 80 for r in results)
+    assert "log-loss" in capsys.readouterr().out
@@ -88,3 +88,10 @@ def test_bare_ya_before_alif_is_glide():
 def test_bare_waw_before_alif_is_glide():
     """damma + waw + alif (no diacritic on waw) is consonant w, not long ū."""
     assert transliterate_arabic("مَارِهُوانَا") == "mārihuwānā"
+
+
+def test_repeated_words_transliterate_identically():
+    """Per-word results are cached; a repeated word and whitespace runs
+    must still give the same output as a single occurrence."""
+    once = transliterate_arabic("الكِتَابُ")
+    assert transliterate_arabic("الكِتَابُ  \n الكِتَابُ") == f"{once} {once}"
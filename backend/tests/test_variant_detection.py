@@ -4,9 +4,11 @@ from unittest.mock import patch
 
 import pytest
 
-from app.models import Lemma
+from app.models import Lemma, VariantLexIndex
 from app.services.variant_detection import (
+    detect_changed_variants,
     detect_definite_variants,
+    detect_variants,
     mark_variants,
     _gloss_overlap,
     _has_enclitic,
@@ -118,6 +120,116 @@ class TestMarkVariants:
         assert count == 0
 
 
+_FAKE_ANALYSES = {
+    "كتابه": [{"lex": "كِتاب", "enc0": "3ms_poss"}],
+    "كتاب": [{"lex": "كِتاب", "enc0": "0"}],
+    "الكتاب": [{"lex": "كِتاب", "enc0": "0"}],
+    "بيت": [{"lex": "بَيْت", "enc0": "0"}],
+}
+
+
+@pytest.fixture
+def fake_camel():
+    calls = []
+
+    def analyze(word):
+        calls.append(word)
+        return _FAKE_ANALYSES.get(word, [])
+
+    with patch("app.services.variant_detection.CAMEL_AVAILABLE", True), \
+            patch("app.services.morphology.analyze_word_camel", side_effect=analyze):
+        yield calls
+
+
+class TestChangedVariantSweep:
+    def test_detects_and_stamps_dirty_lemmas(self, db_session, fake_camel):
+        _seed_lemma(db_session, 1, "كتاب", "book")
+        _seed_lemma(db_session, 2, "كتابه", "his book")
+        _seed_lemma(db_session, 3, "الكتاب", "the book")
+        db_session.commit()
+
+        variants = detect_changed_variants(db_session)
+        assert {(v[0], v[1], v[2]) for v in variants} == {
+            (2, 1, "possessive"), (3, 1, "inflected"),
+        }
+        assert db_session.query(VariantLexIndex).filter_by(lemma_id=2).one().lex_norm == "كتاب"
+
+        fake_camel.clear()
+        assert detect_changed_variants(db_session) == []
+        assert fake_camel == []
+
+    def test_new_base_rechecks_existing_words_via_index(self, db_session, fake_camel):
+        _seed_lemma(db_session, 2, "كتابه", "his book")
+        _seed_lemma(db_session, 4, "بيت", "house")
+        db_session.commit()
+        assert detect_changed_variants(db_session) == []
+
+        fake_camel.clear()
+        _seed_lemma(db_session, 1, "كتاب", "book")
+        db_session.commit()
+        variants = detect_changed_variants(db_session)
+        assert [(v[0], v[1]) for v in variants] == [(2, 1)]
+        assert fake_camel == ["كتاب"]  # only the new lemma is analysed
+
+    def test_gloss_edit_marks_lemma_dirty(self, db_session, fake_camel):
+        base = _seed_lemma(db_session, 1, "كتاب", "book")
+        _seed_lemma(db_session, 4, "بيت", "house")
+        db_session.commit()
+        detect_changed_variants(db_session)
+        db_session.commit()
+        assert base.variants_checked_at is not None
+
+        base.gloss_en = "book"  # unchanged value keeps the stamp
+        assert base.variants_checked_at is not None
+        base.gloss_en = "volume"
+        assert base.variants_checked_at is None
+        assert base.variant_analyses_json is not None
+        base.lemma_ar = "كِتاب"
+        assert base.variant_analyses_json is None
+
+    def test_full_sweep_matches_indexed_lookup(self, db_session, fake_camel):
+        _seed_lemma(db_session, 1, "كتاب", "book")
+        _seed_lemma(db_session, 2, "كتابه", "his book")
+        db_session.commit()
+
+        assert [(v[0], v[1]) for v in detect_variants(db_session)] == [(2, 1)]
+        assert [(v[0], v[1]) for v in detect_variants(db_session, lemma_ids=[1])] == []
+
+    def test_detect_variants_is_read_only(self, db_session, fake_camel):
+        _seed_lemma(db_session, 1, "كتاب", "book")
+        _seed_lemma(db_session, 2, "كتابه", "his book")
+        db_session.commit()
+
+        assert [(v[0], v[1]) for v in detect_variants(db_session)] == [(2, 1)]
+        assert not db_session.dirty and not db_session.new
+        assert db_session.query(VariantLexIndex).count() == 0
+
+    def test_llm_phase_runs_after_index_commit(self, db_session, fake_camel):
+        from app.database import SessionLocal
+
+        _seed_lemma(db_session, 1, "كتاب", "book")
+        _seed_lemma(db_session, 2, "كتابه", "his book")
+        db_session.commit()
+        seen = {}
+
+        def fake_llm(batch, **kwargs):
+            other = SessionLocal()
+            try:
+                seen["indexed"] = other.query(VariantLexIndex).count()
+                other.add(Lemma(lemma_id=9, lemma_ar="بيت", lemma_ar_bare="بيت"))
+                other.commit()  # the writer lock is free
+            finally:
+                other.close()
+            return [{"id": c["id"], "is_variant": True, "reason": "ok"} for c in batch]
+
+        with patch("app.services.variant_detection.evaluate_variants_llm",
+                   side_effect=fake_llm):
+            variants = detect_changed_variants(db_session, use_llm=True)
+
+        assert seen["indexed"] > 0
+        assert [(v[0], v[1]) for v in variants] == [(2, 1)]
+
+
 class TestBuildLlmBatchPrompt:
     def test_prompt_contains_candidates(self):
         candidates = [
@@ -189,6 +301,18 @@ class TestEvaluateVariantsLlm:
         assert results[0]["is_variant"] is False
         assert results[0]["reason"] == ""
 
+    def test_preloaded_cache_is_used_and_extended(self):
+        cand = {"id": 0, "word_ar": "سعيدة", "word_gloss": "happy (f.)", "word_pos": "adj",
+                "base_ar": "سعيد", "base_gloss": "happy", "base_pos": "adj"}
+        cache = {}
+        with patch("app.services.llm.generate_completion",
+                    return_value={"results": [{"id": 0, "is_variant": True, "reason": "fem"}]}) as mock_llm:
+            evaluate_variants_llm([cand], cache=cache)
+            results = evaluate_variants_llm([cand], cache=cache)
+        mock_llm.assert_called_once()
+        assert cache[("سعيدة", "سعيد")]["is_variant"] is True
+        assert results[0]["reason"] == "fem (cached)"
+
     def test_cache_saves_and_reuses(self, db_session):
         """Decisions are cached in variant_decisions table."""
         from app.models import VariantDecision
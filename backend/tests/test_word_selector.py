@@ -12,11 +12,15 @@ from app.services.word_selector import (
     _root_familiarity_score_batch,
     _days_since_introduced,
     _days_since_introduced_batch,
-    _grammar_pattern_score_batch,
     _is_noise_lemma,
 )
 from app.services.acquisition_service import DAILY_INTRO_CAP
-from app.services.grammar_service import grammar_pattern_score
+from app.services.grammar_service import (
+    GrammarState,
+    compute_comfort,
+    get_grammar_state,
+    grammar_pattern_score,
+)
 
 
 def _create_root(db, root_text, meaning="test"):
@@ -831,9 +835,16 @@ class TestBatchScoringMatchesPerItem:
             .all()
         )
         exposure_map = {key: exp for key, exp in rows}
+        expected = [
+            max(1.0 - compute_comfort(e.times_seen, e.times_correct, e.last_seen_at), 0.1)
+            if (e := exposure_map.get(key)) else 1.0
+            for key in features if key in unlocked_set
+        ]
+        expected_score = sum(expected) / len(expected) if expected else 0.1
 
-        batch = _grammar_pattern_score_batch(features, unlocked_set, exposure_map)
-        assert abs(per_item - batch) < 1e-6
+        snapshot = get_grammar_state(db_session).pattern_score(features)
+        assert abs(per_item - expected_score) < 1e-6
+        assert abs(snapshot - expected_score) < 1e-6
 
 
 class TestBatchScoringEdgeCases:
@@ -855,20 +866,29 @@ class TestBatchScoringEdgeCases:
         days = _days_since_introduced_batch(42, {}, now)
         assert days == 999.0
 
+    @staticmethod
+    def _grammar_state(unlocked=(), comfort=None):
+        return GrammarState(
+            current_tier=0, total_words=0,
+            unlocked_features=tuple(unlocked), unlocked=frozenset(unlocked),
+            comfort=comfort or {}, introduced=frozenset(),
+            computed_at=datetime.now(timezone.utc),
+        )
+
     def test_grammar_no_features(self):
-        score = _grammar_pattern_score_batch(None, set(), {})
+        score = self._grammar_state().pattern_score(None)
         assert score == 0.1
 
     def test_grammar_empty_list(self):
-        score = _grammar_pattern_score_batch([], set(), {})
+        score = self._grammar_state().pattern_score([])
         assert score == 0.1
 
     def test_grammar_no_unlocked(self):
-        score = _grammar_pattern_score_batch(["present"], set(), {})
+        score = self._grammar_state().pattern_score(["present"])
         assert score == 0.1
 
     def test_grammar_unlocked_no_exposure(self):
-        score = _grammar_pattern_score_batch(["present"], {"present"}, {})
+        score = self._grammar_state(["present"]).pattern_score(["present"])
         assert score == 1.0
 
 
@@ -13,6 +13,12 @@
 #   3. refill the due-coverage deficit (R4, 2026-06-16)
 #   4. maintain a selectable supply of embedded short stories
 #
+# The same phases can instead run in the resident material daemon
+# (backend/scripts/material_daemon.py, deploy/alif-material-daemon.service),
+# which keeps imports warm and can be nudged by the API after sessions. While
+# the daemon answers on ALIF_MATERIAL_DAEMON_URL (default 127.0.0.1:3011),
+# this pass is skipped.
+#
 # The material_jobs queue (plan/work) was retired 2026-06-16: it never drained
 # (a rescue-word flood starved everything else — ~3 jobs done/week against ~70
 # enqueued/day), while warm_sentence_cache (live, post-session) already does the
@@ -80,6 +86,14 @@ run_phase() {
   return "$status"
 }
 
+# The optional resident daemon (deploy/alif-material-daemon.service) runs the
+# same phases warm; don't duplicate its pass while it is answering.
+DAEMON_URL="${ALIF_MATERIAL_DAEMON_URL:-http://127.0.0.1:3011}"
+if curl -fsS --max-time 3 "$DAEMON_URL/status" > /dev/null 2>&1; then
+  echo "[$TIMESTAMP] Material daemon active at $DAEMON_URL; skipping cron pass" >> "$LOG"
+  exit 0
+fi
+
 echo "[$TIMESTAMP] Material cron start" >> "$LOG"
 
 run_phase "rotate_stale_sentences.py" "$VENV" scripts/rotate_stale_sentences.py
@@ -203,6 +203,7 @@ async function flushQueueInternal(): Promise<{ synced: number; failed: number }>
             type: entry.type,
             payload: entry.payload,
             client_review_id: entry.client_review_id,
+            created_at: entry.created_at,
           })),
         }),
       });
@@ -915,6 +915,8 @@ export interface DeepAnalytics {
   acquisition_pipeline?: AcquisitionPipeline;
   insights?: InsightsData;
   book_coverage?: BookCoverage[];
+  snapshot_computed_at?: string | null;
+  stale_sections?: string[];
 }
 
 export interface StoryWordMeta {
@@ -1158,6 +1160,11 @@ export interface TopicInfo {
 
 // --- Root & Pattern Explore types ---
 
+export type ProgressStateCounts = Record<
+  "new" | "encountered" | "acquiring" | "learning" | "known" | "lapsed" | "suspended",
+  number
+>;
+
 export interface RootListItem {
   root_id: number;
   root: string;
@@ -1165,6 +1172,8 @@ export interface RootListItem {
   total_words: number;
   known_words: number;
   coverage_pct: number;
+  state_counts: ProgressStateCounts;
+  last_activity_at: string | null;
   has_enrichment: boolean;
 }
 
@@ -1217,6 +1226,8 @@ export interface PatternListItem {
   total_words: number;
   known_words: number;
   coverage_pct: number;
+  state_counts: ProgressStateCounts;
+  last_activity_at: string | null;
   has_enrichment: boolean;
 }
 
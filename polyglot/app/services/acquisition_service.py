@@ -212,8 +212,14 @@ def _is_collateral_acquisition(ulk: UserLemmaKnowledge) -> bool:
     return ulk.knowledge_origin == ORIGIN_COLLATERAL or ulk.source == "collateral"
 
 
-def _reviews_span_calendar_days(db: Session, lemma_id: int, min_days: int) -> bool:
-    """Check if acquisition reviews for a word span at least N UTC calendar days."""
+def _reviews_span_calendar_days(
+    db: Session, lemma_id: int, min_days: int, *, current: datetime | None = None,
+) -> bool:
+    """Check if acquisition reviews for a word span at least N UTC calendar days.
+
+    ``current`` is the review being applied right now; it counts even when
+    its ReviewLog row hasn't been flushed yet (batched page review).
+    """
     reviews = (
         db.query(ReviewLog.reviewed_at)
         .filter(
@@ -223,6 +229,8 @@ def _reviews_span_calendar_days(db: Session, lemma_id: int, min_days: int) -> bo
         .all()
     )
     dates = set()
+    if current is not None:
+        dates.add((current if current.tzinfo else current.replace(tzinfo=timezone.utc)).date())
     for (reviewed_at,) in reviews:
         if reviewed_at:
             dt = reviewed_at
@@ -370,6 +378,9 @@ def submit_acquisition_review(
     client_review_id: Optional[str] = None,
     sentence_id: Optional[int] = None,
     commit: bool = True,
+    *,
+    knowledge: Optional[UserLemmaKnowledge] = None,
+    flush: bool = True,
 ) -> dict:
     """Apply a review to a word that's in the acquisition phase.
 
@@ -390,11 +401,15 @@ def submit_acquisition_review(
     state (defensive — should rarely happen in practice).
 
     Variant lemmas are redirected to their canonical at function entry per
-    Hard Invariant #9.
+    Hard Invariant #9. Batch callers may pass the pre-loaded canonical
+    ``knowledge`` row and ``flush=False`` (see `fsrs_service.submit_review`).
     """
     from app.services.canonical_resolution import resolve_canonical_lemma_id
 
-    lemma_id = resolve_canonical_lemma_id(db, lemma_id)
+    if knowledge is not None:
+        lemma_id = knowledge.lemma_id
+    else:
+        lemma_id = resolve_canonical_lemma_id(db, lemma_id)
 
     if client_review_id:
         existing = (
@@ -418,11 +433,13 @@ def submit_acquisition_review(
 
     now = datetime.now(timezone.utc)
 
-    ulk = (
-        db.query(UserLemmaKnowledge)
-        .filter(UserLemmaKnowledge.lemma_id == lemma_id)
-        .first()
-    )
+    ulk = knowledge
+    if ulk is None:
+        ulk = (
+            db.query(UserLemmaKnowledge)
+            .filter(UserLemmaKnowledge.lemma_id == lemma_id)
+            .first()
+        )
     if not ulk or ulk.knowledge_state != "acquiring":
         logger.warning(
             "submit_acquisition_review called for non-acquiring lemma %s (state=%s); "
@@ -435,7 +452,7 @@ def submit_acquisition_review(
             response_ms=response_ms, session_id=session_id,
             review_mode=review_mode, comprehension_signal=comprehension_signal,
             client_review_id=client_review_id, sentence_id=sentence_id,
-            commit=commit,
+            commit=commit, knowledge=ulk, flush=flush,
         )
 
     old_box = ulk.acquisition_box or 1
@@ -540,7 +557,9 @@ def submit_acquisition_review(
             and (ulk.acquisition_box or 1) >= 3
             and new_times_seen >= GRADUATION_MIN_REVIEWS
             and accuracy >= GRADUATION_MIN_ACCURACY
-            and _reviews_span_calendar_days(db, ulk.lemma_id, GRADUATION_MIN_CALENDAR_DAYS)
+            and _reviews_span_calendar_days(
+                db, ulk.lemma_id, GRADUATION_MIN_CALENDAR_DAYS, current=now,
+            )
         ):
             graduated = True
             grad_tier = 3
@@ -599,7 +618,7 @@ def submit_acquisition_review(
     db.add(log_entry)
     if commit:
         db.commit()
-    else:
+    elif flush:
         db.flush()
 
     next_due = ""
@@ -54,3 +54,31 @@ def resolve_canonical_via_map(
             return current_id
         current_id = next_id
     return current_id
+
+
+def resolve_canonical_lemma_ids(db: Session, lemma_ids) -> dict[int, int]:
+    """Batch form of `resolve_canonical_lemma_id` — one query per chain hop.
+
+    Returns ``{lemma_id: canonical_id}`` for every input id. Page-scale
+    callers (the page-advance review, bulk-known marking) resolve a few
+    hundred lemmas at once; this keeps that at ~1-2 queries instead of one
+    per lemma.
+    """
+    canonical_by_id: dict[int, int | None] = {}
+    frontier = {lid for lid in lemma_ids if lid is not None}
+    requested = set(frontier)
+    while frontier:
+        rows = (
+            db.query(Lemma.lemma_id, Lemma.canonical_lemma_id)
+            .filter(Lemma.lemma_id.in_(frontier))
+            .all()
+        )
+        for lid, canonical_id in rows:
+            canonical_by_id[lid] = canonical_id
+        frontier = {
+            cid for _, cid in rows
+            if cid is not None and cid not in canonical_by_id
+        }
+    return {
+        lid: resolve_canonical_via_map(lid, canonical_by_id) for lid in requested
+    }
@@ -88,31 +88,63 @@ def propagate_known_via_cognate(db: Session, lemma_id: int, *, commit: bool = Tr
     per Hard Invariant #9. Pass ``commit=False`` to enrol within a caller's
     transaction (e.g. the batched page-review, which commits once).
     """
-    from app.services.canonical_resolution import resolve_canonical_lemma_id
+    propagate_known_via_cognates(db, [lemma_id], commit=commit)
 
-    lemma = db.get(Lemma, lemma_id)
-    if not lemma or not lemma.cognate_lemma_id:
-        return
-    target_id = resolve_canonical_lemma_id(db, lemma.cognate_lemma_id)
-    cognate_ulk = (
-        db.query(UserLemmaKnowledge)
-        .filter(UserLemmaKnowledge.lemma_id == target_id)
-        .first()
-    )
-    if cognate_ulk is not None:
-        return  # don't overwrite existing state
-    db.add(UserLemmaKnowledge(
-        lemma_id=target_id,
-        knowledge_state="encountered",
-        source="cognate_propagation",
-        knowledge_origin=ORIGIN_COGNATE_PROPAGATION,
-        introduced_at=datetime.now(timezone.utc),
-    ))
+
+def propagate_known_via_cognates(
+    db: Session, lemma_ids, *, commit: bool = True, flush: bool = True,
+) -> list[int]:
+    """Batch form of `propagate_known_via_cognate` for page-scale marking.
+
+    Loads the cognate links, their canonicals and any existing ULKs in a
+    fixed number of queries regardless of how many lemmas were marked, and
+    adds the new 'encountered' rows in one go. Returns the canonical ids that
+    received a new ULK.
+    """
+    from app.services.canonical_resolution import resolve_canonical_lemma_ids
+
+    lemma_ids = {lid for lid in lemma_ids if lid is not None}
+    if not lemma_ids:
+        return []
+    cognate_ids = {
+        cid for (cid,) in db.query(Lemma.cognate_lemma_id)
+        .filter(Lemma.lemma_id.in_(lemma_ids), Lemma.cognate_lemma_id.isnot(None))
+        .all()
+    }
+    if not cognate_ids:
+        return []
+    target_ids = set(resolve_canonical_lemma_ids(db, cognate_ids).values())
+    existing = {
+        lid for (lid,) in db.query(UserLemmaKnowledge.lemma_id)
+        .filter(UserLemmaKnowledge.lemma_id.in_(target_ids))
+        .all()
+    }
+    # A lemma marked known in this same batch may itself be the cognate target
+    # of another; its pending ULK is not in the DB yet when flush=False.
+    pending = {
+        obj.lemma_id for obj in db.new if isinstance(obj, UserLemmaKnowledge)
+    }
+    new_ids = sorted(target_ids - existing - pending)
+    if not new_ids:
+        return []
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        UserLemmaKnowledge(
+            lemma_id=target_id,
+            knowledge_state="encountered",
+            source="cognate_propagation",
+            knowledge_origin=ORIGIN_COGNATE_PROPAGATION,
+            introduced_at=now,
+        )
+        for target_id in new_ids
+    ])
     if commit:
         db.commit()
-    else:
+    elif flush:
         db.flush()
-    log.info("Propagated 'encountered' to cognate lemma_id=%d", target_id)
+    log.info("Propagated 'encountered' to %d cognate lemma(s): %s",
+             len(new_ids), new_ids[:20])
+    return new_ids
 
 
 # ─── External L1 cognates (LLM-based) ──────────────────────────────────────
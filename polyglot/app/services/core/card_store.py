@@ -0,0 +1,35 @@
+"""Polyglot adapter for the shared ``alif_core`` card store.
+
+`load()` reads every card once into an `alif_core.CardStore` (NumPy
+columns) and `write()` persists it with a single executemany. Scheduler
+parameters are read from `fsrs_service`, so array and per-review math share
+one source of truth. No app path calls it yet: the per-review path
+(`fsrs_service.submit_review`) keeps using py-fsrs objects.
+
+Requires ``pip install -e ../alif_core``.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+from alif_core import CardStore, FsrsParams
+from alif_core.orm import load_card_store, write_card_store
+from sqlalchemy.orm import Session
+
+from app.models import UserLemmaKnowledge
+from app.services import fsrs_service
+
+FSRS_PARAMS = FsrsParams.from_scheduler(fsrs_service.scheduler)
+
+
+def load(db: Session, lemma_ids: Iterable[int] | None = None) -> CardStore:
+    return load_card_store(db, UserLemmaKnowledge, lemma_ids)
+
+
+def write(db: Session, store: CardStore, rows=None) -> int:
+    """Flush pending ORM state first so the executemany isn't overwritten by a
+    later autoflush of stale objects, then expire the touched ULKs."""
+    db.flush()
+    n = write_card_store(db, UserLemmaKnowledge, store, rows)
+    db.expire_all()
+    return n
@@ -108,6 +108,9 @@ def submit_review(
     client_review_id: Optional[str] = None,
     sentence_id: Optional[int] = None,
     commit: bool = True,
+    *,
+    knowledge: Optional[UserLemmaKnowledge] = None,
+    flush: bool = True,
 ) -> dict:
     """Apply a learner rating to the FSRS card for `lemma_id`.
 
@@ -115,12 +118,20 @@ def submit_review(
     Hard Invariant #9 — the canonical is the unit of scheduling, and ULK
     rows must never grow on variants.
 
+    Batch callers (the page-advance review) pass the pre-loaded canonical
+    ``knowledge`` row and ``commit=False, flush=False``: the canonical lookup
+    and ULK query are skipped and the ReviewLog row stays pending until the
+    caller's single flush, so the whole page goes out as batched statements.
+
     Returns a dict with `lemma_id`, `new_state`, `next_due`. Sets `duplicate=True`
     when a matching `client_review_id` already exists.
     """
     from app.services.canonical_resolution import resolve_canonical_lemma_id
 
-    lemma_id = resolve_canonical_lemma_id(db, lemma_id)
+    if knowledge is not None:
+        lemma_id = knowledge.lemma_id
+    else:
+        lemma_id = resolve_canonical_lemma_id(db, lemma_id)
 
     if client_review_id:
         existing = (
@@ -142,11 +153,12 @@ def submit_review(
                 "duplicate": True,
             }
 
-    knowledge = (
-        db.query(UserLemmaKnowledge)
-        .filter(UserLemmaKnowledge.lemma_id == lemma_id)
-        .first()
-    )
+    if knowledge is None:
+        knowledge = (
+            db.query(UserLemmaKnowledge)
+            .filter(UserLemmaKnowledge.lemma_id == lemma_id)
+            .first()
+        )
     if not knowledge:
         knowledge = UserLemmaKnowledge(
             lemma_id=lemma_id,
@@ -210,7 +222,7 @@ def submit_review(
     db.add(log_entry)
     if commit:
         db.commit()
-    else:
+    elif flush:
         db.flush()
 
     return {
@@ -232,6 +244,8 @@ def record_scaffold_confirmation(
     client_review_id: Optional[str] = None,
     sentence_id: Optional[int] = None,
     credit_type: str = "collateral",
+    knowledge: Optional[UserLemmaKnowledge] = None,
+    flush: bool = True,
 ) -> dict:
     """Confirm an assumed-known scaffold lemma via collateral exposure.
 
@@ -246,7 +260,9 @@ def record_scaffold_confirmation(
 
     The caller resolves canonical + filters non-content/inactive before calling;
     this is the leaf write. Idempotent on `client_review_id`. Never commits —
-    the sentence-review caller commits once for the whole sentence.
+    the sentence-review caller commits once for the whole sentence. Batch
+    callers may pass the pre-loaded ``knowledge`` row and ``flush=False``
+    (see `submit_review`).
     """
     if client_review_id:
         existing = (
@@ -257,11 +273,12 @@ def record_scaffold_confirmation(
         if existing:
             return {"lemma_id": lemma_id, "new_state": "known", "next_due": "", "duplicate": True}
 
-    knowledge = (
-        db.query(UserLemmaKnowledge)
-        .filter(UserLemmaKnowledge.lemma_id == lemma_id)
-        .first()
-    )
+    if knowledge is None:
+        knowledge = (
+            db.query(UserLemmaKnowledge)
+            .filter(UserLemmaKnowledge.lemma_id == lemma_id)
+            .first()
+        )
     if not knowledge:
         return {"lemma_id": lemma_id, "new_state": "new", "next_due": "", "duplicate": False}
 
@@ -310,7 +327,8 @@ def record_scaffold_confirmation(
         },
     )
     db.add(log_entry)
-    db.flush()
+    if flush:
+        db.flush()
 
     return {
         "lemma_id": lemma_id,
@@ -31,11 +31,15 @@ from pathlib import Path
 
 from sqlalchemy.orm import Session
 
-from app.models import Lemma, Sentence, Story, Page, PageWord, PageReviewLog, UserLemmaKnowledge
+from app.models import (
+    Lemma, Sentence, Story, Page, PageWord, PageReviewLog, ReviewLog, UserLemmaKnowledge,
+)
 from app.services import body_clean as body_clean_svc
 from app.services import lemma_gloss
 from app.services import pdf_extract
-from app.services.cognate_detector import link_intra_greek_cognates, propagate_known_via_cognate
+from app.services.cognate_detector import (
+    link_intra_greek_cognates, propagate_known_via_cognate, propagate_known_via_cognates,
+)
 from app.services import lemma_quality
 from app.services.languages import (
     NLPProvider, ProviderUnavailable, Token, get_provider,
@@ -801,9 +805,9 @@ def bulk_mark_remaining_known(db: Session, story_id: int, page_number: int) -> i
 
     Returns the count of lemmas newly marked known.
 
-    Cognate propagation runs per-lemma via mark_lemma's existing hook —
-    bulk-marking a Modern Greek page also seeds Ancient cognates as
-    'encountered' bidirectionally.
+    Applies mark_lemma's 'known' transition to the whole page in one
+    transaction, including cognate propagation — bulk-marking a Modern Greek
+    page also seeds Ancient cognates as 'encountered' bidirectionally.
     """
     from app.services.lemma_quality import FUNCTION_WORD_SETS
 
@@ -873,16 +877,117 @@ def bulk_mark_remaining_known(db: Session, story_id: int, page_number: int) -> i
             if not eligible_ids:
                 return 0
 
-    # Bulk-mark via mark_lemma so cognate propagation runs uniformly
-    count = 0
+    # Same transition as mark_lemma(state="known"), computed for the whole
+    # page in memory: one canonical-resolution pass, one ULK/lemma load, one
+    # batched cognate propagation and a single commit — instead of a
+    # query+commit round trip (plus a propagation commit) per lemma.
+    from app.services.canonical_resolution import resolve_canonical_lemma_ids
+    from app.services.knowledge_lifecycle import ORIGIN_PRE_KNOWN, set_origin_if_missing
+
+    now = datetime.now(timezone.utc)
+    canonical_of = resolve_canonical_lemma_ids(db, eligible_ids)
+    canonical_ids = set(canonical_of.values())
+    noncontent = {
+        lid for (lid,) in db.query(Lemma.lemma_id)
+        .filter(
+            Lemma.lemma_id.in_(canonical_ids),
+            Lemma.word_category.in_(("function_word", "proper_name", "not_word")),
+        )
+        .all()
+    }
+    ulks = {
+        u.lemma_id: u for u in db.query(UserLemmaKnowledge)
+        .filter(UserLemmaKnowledge.lemma_id.in_(canonical_ids))
+        .all()
+    }
+
+    marked: list[int] = []
     for lid in eligible_ids:
-        if mark_lemma(db, lemma_id=lid, state="known", fetch_gloss=False) is not None:
-            count += 1
-    log.info("Bulk-marked %d lemmas as known on page %d of story %d",
+        canonical = canonical_of[lid]
+        if canonical in noncontent or canonical in marked:
+            continue
+        ulk = ulks.get(canonical)
+        if ulk is None:
+            db.add(_presumed_known_ulk(canonical, now))
+        else:
+            ulk.knowledge_state = "known"
+            set_origin_if_missing(ulk, ORIGIN_PRE_KNOWN)
+            if ulk.confirmed_at is None:
+                ulk.confirmed_at = now
+            ulk.clean_exposures = (ulk.clean_exposures or 0) + 1
+        marked.append(canonical)
+
+    with db.no_autoflush:
+        propagate_known_via_cognates(db, marked, commit=False, flush=False)
+    _bulk_write_pending(db)
+    db.commit()
+    count = len(marked)
+    log.info("Bulk-marked %d lemmas as known on page %d of story %d (1 commit)",
              count, page_number, story_id)
     return count
 
 
+def _bulk_write_pending(db: Session) -> None:
+    """Write the session's pending ULK / ReviewLog work as batched statements.
+
+    A plain flush issues one statement per touched word here: SQLite has no
+    insertmanyvalues sentinel, so ORM inserts that need their autoincrement
+    id back go out row by row, and pysqlite can't batch ORM updates. Nothing
+    in a page review reads these rows back before the commit, so they are
+    emitted as ORM bulk INSERTs and UPDATE-by-primary-key statements, one
+    executemany per (model, column set). Touched persistent rows are expired
+    so the session doesn't write them a second time.
+    """
+    from sqlalchemy import insert, inspect, update
+
+    def _changed_row(obj, *, new: bool) -> dict:
+        state = inspect(obj)
+        row = {} if new else {"id": obj.id}
+        for attr in state.mapper.column_attrs:
+            value = getattr(obj, attr.key)
+            if new:
+                if value is not None:
+                    row[attr.key] = value
+            elif state.attrs[attr.key].history.has_changes():
+                row[attr.key] = value
+        return row
+
+    inserts: dict[tuple, list[dict]] = {}
+    for obj in list(db.new):
+        if isinstance(obj, (ReviewLog, UserLemmaKnowledge)):
+            row = _changed_row(obj, new=True)
+            inserts.setdefault((type(obj), tuple(sorted(row))), []).append(row)
+            db.expunge(obj)
+
+    updates: dict[tuple, list[dict]] = {}
+    touched: list[UserLemmaKnowledge] = []
+    for obj in list(db.dirty):
+        if isinstance(obj, UserLemmaKnowledge) and db.is_modified(obj):
+            row = _changed_row(obj, new=False)
+            updates.setdefault(tuple(sorted(row)), []).append(row)
+            touched.append(obj)
+
+    with db.no_autoflush:
+        for (model, _keys), rows in inserts.items():
+            db.execute(insert(model), rows)
+        for rows in updates.values():
+            db.execute(update(UserLemmaKnowledge), rows)
+    for obj in touched:
+        db.expire(obj)
+
+
+def _presumed_known_ulk(lemma_id: int, now: datetime) -> UserLemmaKnowledge:
+    """A never-seen page word presumed known by reading-as-mapping, already
+    counted as one clean confirming exposure (the reader *is* the exposure)."""
+    from app.services.knowledge_lifecycle import ORIGIN_PRE_KNOWN
+
+    return UserLemmaKnowledge(
+        lemma_id=lemma_id, knowledge_state="known", introduced_at=now,
+        source="reading_intake", knowledge_origin=ORIGIN_PRE_KNOWN,
+        confirmed_at=now, clean_exposures=1,
+    )
+
+
 def apply_page_review(
     db: Session,
     story_id: int,
@@ -922,21 +1027,23 @@ def apply_page_review(
         learning/known/lapsed + card  -> submit_review(3)
         suspended / ignore            -> skip (don't resurrect a user decision)
 
-    Efficiency: ONE network request (the caller endpoint), batched ULK load,
-    and a SINGLE commit for the whole page (~150 words) — the write lock is
-    acquired once, briefly. The only slow step (LLM citation repair of ungated
-    lemmas) runs up front, before the write transaction.
+    Efficiency: ONE network request (the caller endpoint), one batched
+    canonical resolution + ULK load, every transition computed in memory with
+    no per-word flush, and a SINGLE commit for the whole page (~150 words) —
+    ULK updates and ReviewLog/cognate inserts go out as batched statements,
+    so the query count does not grow with page length and the write lock is
+    acquired once, briefly. The only slow step (LLM citation repair of
+    ungated lemmas) runs up front, before the write transaction.
 
     ``tapped_lemma_ids`` is the legacy pre-offline field (the union of red +
     yellow). It is honoured for exclusion only — kept so an already-queued old
     client still works — but new clients send the split red/yellow lists above.
     """
-    from app.services.canonical_resolution import resolve_canonical_lemma_id
+    from app.services.canonical_resolution import resolve_canonical_lemma_ids
     from app.services.fsrs_service import record_scaffold_confirmation, submit_review
     from app.services.acquisition_service import start_acquisition, submit_acquisition_review
-    from app.services.cognate_detector import propagate_known_via_cognate
     from app.services.knowledge_lifecycle import (
-        ORIGIN_MARKED_RECOGNIZED, ORIGIN_MARKED_UNKNOWN, ORIGIN_PRE_KNOWN,
+        ORIGIN_MARKED_RECOGNIZED, ORIGIN_MARKED_UNKNOWN,
         record_failure, set_origin_if_missing,
     )
     from app.services.lemma_quality import FUNCTION_WORD_SETS
@@ -1017,20 +1124,21 @@ def apply_page_review(
 
     # Resolve canonicals for content + restrict tap lists to content lemmas
     # (a function/proper-name tap is a no-op, mirroring mark_lemma's guard).
-    canonical_of = {l.lemma_id: resolve_canonical_lemma_id(db, l.lemma_id) for l in content}
-    content_canon: set[int] = set(canonical_of.values())
+    canonical_of = resolve_canonical_lemma_ids(
+        db,
+        [l.lemma_id for l in content] + unknown_ids + encountered_ids + legacy_tapped,
+    )
+    content_canon: set[int] = {canonical_of[l.lemma_id] for l in content}
 
     def _content_canon(raw_id: int) -> int | None:
-        c = resolve_canonical_lemma_id(db, raw_id)
+        c = canonical_of[raw_id]
         return c if c in content_canon else None
 
     red_canon = {c for c in (_content_canon(i) for i in unknown_ids) if c is not None}
     yellow_canon = {c for c in (_content_canon(i) for i in encountered_ids) if c is not None}
     yellow_canon -= red_canon  # a lemma can't be both; red wins
 
-    exclude_canon = red_canon | yellow_canon | {
-        resolve_canonical_lemma_id(db, i) for i in legacy_tapped
-    }
+    exclude_canon = red_canon | yellow_canon | {canonical_of[i] for i in legacy_tapped}
     exclude_raw = set(unknown_ids) | set(encountered_ids) | set(legacy_tapped)
 
     # Batch-load every relevant ULK in ONE query (content + taps). The state
@@ -1081,56 +1189,58 @@ def apply_page_review(
             set_origin_if_missing(prev, ORIGIN_MARKED_RECOGNIZED)
         marked_encountered += 1
 
-    # Green sweep over untapped content.
-    seen: set[int] = set(red_canon) | set(yellow_canon)
-    for l in content:
-        canonical = canonical_of[l.lemma_id]
-        if l.lemma_id in exclude_raw or canonical in exclude_canon:
-            continue
-        if canonical in seen:
-            continue
-        seen.add(canonical)
-        ulk = ulks.get(canonical)
-
-        if ulk is None:
-            # Never seen → presume known (reading-as-mapping) + confirm.
-            ulk = UserLemmaKnowledge(
-                lemma_id=canonical, knowledge_state="known", introduced_at=now,
-                source="reading_intake", knowledge_origin=ORIGIN_PRE_KNOWN,
-                confirmed_at=now, clean_exposures=1,
-            )
-            db.add(ulk)
-            ulks[canonical] = ulk
-            propagate_ids.append(canonical)
-            newly_known += 1
-            continue
-
-        state = ulk.knowledge_state
-        if state in ("suspended", "ignore"):
-            continue
-        if state == "known" and ulk.fsrs_card_json is None:
-            record_scaffold_confirmation(db, lemma_id=canonical, rating_int=3,
-                                         review_mode="reading", credit_type="collateral")
-            confirmed += 1
-        elif state == "acquiring":
-            submit_acquisition_review(db, lemma_id=canonical, rating_int=3,
-                                      review_mode="reading", commit=False)
-            reviewed += 1
-        elif state in ("learning", "known", "lapsed") and ulk.fsrs_card_json is not None:
-            submit_review(db, lemma_id=canonical, rating_int=3,
-                          review_mode="reading", commit=False)
-            reviewed += 1
-        elif state == "encountered":
-            ulk.knowledge_state = "known"
-            if ulk.confirmed_at is None:
-                ulk.confirmed_at = now
-            ulk.clean_exposures = (ulk.clean_exposures or 0) + 1
-            propagate_ids.append(canonical)
-            confirmed += 1
-
-    # Seed Modern↔Ancient cognates for everything newly known — commit-free.
-    for cid in propagate_ids:
-        propagate_known_via_cognate(db, cid, commit=False)
+    # No autoflush through the sweep: every ULK/ReviewLog change stays pending
+    # until _bulk_write_pending emits them as batched statements.
+    with db.no_autoflush:
+        # Green sweep over untapped content.
+        seen: set[int] = set(red_canon) | set(yellow_canon)
+        for l in content:
+            canonical = canonical_of[l.lemma_id]
+            if l.lemma_id in exclude_raw or canonical in exclude_canon:
+                continue
+            if canonical in seen:
+                continue
+            seen.add(canonical)
+            ulk = ulks.get(canonical)
+
+            if ulk is None:
+                # Never seen → presume known (reading-as-mapping) + confirm.
+                ulk = _presumed_known_ulk(canonical, now)
+                db.add(ulk)
+                ulks[canonical] = ulk
+                propagate_ids.append(canonical)
+                newly_known += 1
+                continue
+
+            state = ulk.knowledge_state
+            if state in ("suspended", "ignore"):
+                continue
+            if state == "known" and ulk.fsrs_card_json is None:
+                record_scaffold_confirmation(db, lemma_id=canonical, rating_int=3,
+                                             review_mode="reading", credit_type="collateral",
+                                             knowledge=ulk, flush=False)
+                confirmed += 1
+            elif state == "acquiring":
+                submit_acquisition_review(db, lemma_id=canonical, rating_int=3,
+                                          review_mode="reading", commit=False,
+                                          knowledge=ulk, flush=False)
+                reviewed += 1
+            elif state in ("learning", "known", "lapsed") and ulk.fsrs_card_json is not None:
+                submit_review(db, lemma_id=canonical, rating_int=3,
+                              review_mode="reading", commit=False,
+                              knowledge=ulk, flush=False)
+                reviewed += 1
+            elif state == "encountered":
+                ulk.knowledge_state = "known"
+                if ulk.confirmed_at is None:
+                    ulk.confirmed_at = now
+                ulk.clean_exposures = (ulk.clean_exposures or 0) + 1
+                propagate_ids.append(canonical)
+                confirmed += 1
+
+        # Seed Modern↔Ancient cognates for everything newly known — one batched
+        # pass, commit-free.
+        propagate_known_via_cognates(db, propagate_ids, commit=False, flush=False)
 
     if client_review_id:
         db.add(PageReviewLog(
@@ -1140,6 +1250,7 @@ def apply_page_review(
             marked_unknown=marked_unknown, marked_encountered=marked_encountered,
         ))
 
+    _bulk_write_pending(db)
     db.commit()  # single write-lock acquisition for the whole page
     log.info(
         "Page review story %d page %d: newly_known=%d confirmed=%d reviewed=%d "
@@ -300,3 +300,97 @@ def test_apply_page_review_latin(tmp_db):
         for lid in lemma_ids[1:]:
             u = db.query(UserLemmaKnowledge).filter_by(lemma_id=lid).one()
             assert u.knowledge_state == "known"
+
+
+# ─── Page-scale batching: cost must not grow with page length ───────────────
+
+def _seed_latin_page(db, story_title: str, n_words: int) -> tuple[Story, list[int]]:
+    """A processed Latin page of ``n_words`` distinct content lemmas. A third
+    are untouched, a third are FSRS-carded 'learning' words and a third are
+    card-less assumed-known scaffold, so every green-sweep branch is hit."""
+    from app.services.fsrs_service import create_new_card
+
+    if db.get(Language, "la") is None:
+        db.add(Language(code="la", name="Latin", script="latin",
+                        direction="ltr", accent_display="macrons_off"))
+    story = Story(language_code="la", source="paste", status="active",
+                  title=story_title, page_count=1)
+    db.add(story)
+    db.flush()
+    page = Page(story_id=story.id, page_number=1, body_src="...",
+                processed_at=datetime.now(timezone.utc), total_words=n_words)
+    db.add(page)
+    db.flush()
+    lemma_ids = []
+    for i in range(n_words):
+        form = f"{story_title.lower()}verbum{i}"
+        lemma = Lemma(language_code="la", lemma_form=form, lemma_bare=form,
+                      pos="noun", gloss_en=form, source="manual",
+                      gates_completed_at=datetime.now(timezone.utc))
+        db.add(lemma)
+        db.flush()
+        lemma_ids.append(lemma.lemma_id)
+        db.add(PageWord(page_id=page.id, position=i, surface_form=form,
+                        lemma_id=lemma.lemma_id))
+        if i % 3 == 1:
+            db.add(UserLemmaKnowledge(lemma_id=lemma.lemma_id, knowledge_state="learning",
+                                      fsrs_card_json=create_new_card(), source="manual"))
+        elif i % 3 == 2:
+            db.add(UserLemmaKnowledge(lemma_id=lemma.lemma_id, knowledge_state="known",
+                                      fsrs_card_json=None, source="bulk"))
+    db.commit()
+    return story, lemma_ids
+
+
+def _count_statements(db, fn):
+    from sqlalchemy import event
+
+    counter = {"n": 0}
+
+    def _after_execute(*args, **kwargs):
+        counter["n"] += 1
+
+    engine = db.get_bind()
+    event.listen(engine, "after_execute", _after_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "after_execute", _after_execute)
+    return counter["n"], result
+
+
+def test_apply_page_review_statement_count_flat_in_page_length(tmp_db):
+    with tmp_db() as db:
+        short, short_ids = _seed_latin_page(db, "Brevis", 6)
+        long, long_ids = _seed_latin_page(db, "Longa", 60)
+
+        n_short, res_short = _count_statements(
+            db, lambda: reading_intake.apply_page_review(db, short.id, 1, client_review_id="s-1"))
+        n_long, res_long = _count_statements(
+            db, lambda: reading_intake.apply_page_review(db, long.id, 1, client_review_id="l-1"))
+
+        assert res_long["newly_known"] == 20
+        assert res_long["reviewed"] == 20
+        assert res_long["confirmed"] == 20
+        assert n_long == n_short
+
+        from app.models import ReviewLog
+        assert db.query(ReviewLog).filter(ReviewLog.lemma_id.in_(long_ids)).count() == 40
+
+
+def test_bulk_mark_statement_count_flat_in_page_length(tmp_db):
+    with tmp_db() as db:
+        short, _ = _seed_latin_page(db, "Brevis", 6)
+        long, long_ids = _seed_latin_page(db, "Longa", 60)
+
+        n_short, _ = _count_statements(
+            db, lambda: reading_intake.bulk_mark_remaining_known(db, short.id, 1))
+        n_long, count = _count_statements(
+            db, lambda: reading_intake.bulk_mark_remaining_known(db, long.id, 1))
+
+        assert count == 20
+        assert n_long == n_short
+        marked = db.query(UserLemmaKnowledge).filter(
+            UserLemmaKnowledge.lemma_id.in_(long_ids[0::3])).all()
+        assert len(marked) == 20
+        assert all(u.knowledge_state == "known" and u.confirmed_at is not None for u in marked)
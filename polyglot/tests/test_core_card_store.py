@@ -0,0 +1,46 @@
+"""alif_core card store wired to polyglot's UserLemmaKnowledge."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("alif_core")
+
+import numpy as np  # noqa: E402
+
+from app.models import Lemma, UserLemmaKnowledge  # noqa: E402
+from app.services.core import card_store  # noqa: E402
+from app.services.fsrs_service import scheduler  # noqa: E402
+
+
+def test_acquisition_and_fsrs_rows_round_trip(tmp_db):
+    now = datetime(2026, 3, 1, 12, 0)
+    with tmp_db() as db:
+        lemmas = [
+            Lemma(language_code="el", lemma_form=f"λέξη{i}", lemma_bare=f"λεξη{i}", source="test")
+            for i in range(4)
+        ]
+        db.add_all(lemmas)
+        db.flush()
+        for lemma in lemmas:
+            db.add(UserLemmaKnowledge(
+                lemma_id=lemma.lemma_id, knowledge_state="acquiring", source="test",
+                acquisition_box=1, acquisition_next_due=now - timedelta(hours=1),
+            ))
+        db.commit()
+
+        assert card_store.FSRS_PARAMS.desired_retention == scheduler.desired_retention
+        store = card_store.load(db)
+        rows = store.index_of([l.lemma_id for l in lemmas])
+        store.apply_acquisition_reviews(
+            rows, np.array([3, 3, 1, 3]), np.array([1, 1, 0, 1]),
+            now.replace(tzinfo=timezone.utc).timestamp(),
+        )
+        card_store.write(db, store)
+        db.commit()
+
+        boxes = {
+            k.lemma_id: (k.acquisition_box, k.acquisition_next_due)
+            for k in db.query(UserLemmaKnowledge).all()
+        }
+        assert boxes[lemmas[0].lemma_id] == (2, now + timedelta(days=1))
+        assert boxes[lemmas[2].lemma_id] == (1, now + timedelta(minutes=5))